@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+  name: vault_profile
+  type: aggregate
+  author:
+    - Ansible Project
+  short_description: Summarizes the requests sent to Vault during a run
+  version_added: 7.2.0
+  description:
+    - At the end of a run, shows the number of requests the collection's lookups and modules sent to Vault,
+      the number of logins, hits and misses of the read cache, retries, and the 50th, 95th, and 99th percentile of the latency of requests,
+      for each mount and for each task.
+    - Requests sent by lookups are recorded in a file (see the I(stats_file) option).
+    - Enabling this callback turns on request recording for every lookup of the collection in the run.
+      If I(stats_file) isn't set, the callback sets the C(ANSIBLE_HASHI_VAULT_STATS_FILE) environment variable to a temporary file,
+      which the lookups inherit as their own I(stats_file) option, so each lookup call appends its requests to that file.
+    - Requests sent by modules are only counted when their C(stats) option is C(true). It can be set for all of the modules
+      of the collection with C(module_defaults), using the C(group/community.hashi_vault.vault) action group.
+    - Lookup records are matched to the task that was running when they were sent. With a strategy that runs several tasks at the same time,
+      like C(free), they may be counted for the wrong task.
+  requirements:
+    - enable in configuration
+  seealso:
+    - ref: Measuring requests to Vault <ansible_collections.community.hashi_vault.docsite.user_guide.measuring_requests_to_vault>
+      description: The collection User Guide section on measuring requests.
+  options:
+    stats_file:
+      description:
+        - Path to the file that lookups record their requests in.
+        - This is the same setting as the I(stats_file) option of the lookups.
+        - If it's not set, a temporary file is used, which is removed at the end of the run.
+          The path of the temporary file is exported in the C(ANSIBLE_HASHI_VAULT_STATS_FILE) environment variable for the rest of the run.
+        - A file that is set here is never removed.
+        - Only records added to the file during the run are counted.
+      type: path
+      env:
+        - name: ANSIBLE_HASHI_VAULT_STATS_FILE
+      ini:
+        - section: hashi_vault_collection
+          key: stats_file
+'''
+
+EXAMPLES = r'''
+# ansible.cfg
+# [defaults]
+# callbacks_enabled = community.hashi_vault.vault_profile
+
+# playbook.yml, to include requests sent by modules
+# - hosts: all
+#   module_defaults:
+#     group/community.hashi_vault.vault:
+#       stats: true
+'''
+
+import json
+import math
+import os
+import tempfile
+import time
+
+from ansible.plugins.callback import CallbackBase
+
+from ansible_collections.community.hashi_vault.plugins.module_utils._request_stats import HashiVaultRequestStats
+
+
+class CallbackModule(CallbackBase):
+    '''summarizes the requests sent to Vault during a run'''
+
+    CALLBACK_VERSION = 2.0
+    CALLBACK_TYPE = 'aggregate'
+    CALLBACK_NAME = 'community.hashi_vault.vault_profile'
+    CALLBACK_NEEDS_ENABLED = True
+
+    ENV_STATS_FILE = 'ANSIBLE_HASHI_VAULT_STATS_FILE'
+
+    PERCENTILES = (50, 95, 99)
+
+    def __init__(self, *args, **kwargs):
+        super(CallbackModule, self).__init__(*args, **kwargs)
+
+        self._stats_file = None
+        self._stats_file_offset = 0
+        self._temp_file = False
+
+        # (start time, task) of each task, in order, to match lookup records to the task that sent them
+        self._task_starts = []
+        self._current_task = None
+
+        # (task, record) of each request and cache lookup
+        self._records = []
+
+    def set_options(self, *args, **kwargs):
+        super(CallbackModule, self).set_options(*args, **kwargs)
+
+        stats_file = self.get_option('stats_file')
+        if self._temp_file:
+            # set again, after the temporary file was created and exported, which is then what stats_file comes from
+            if not stats_file or stats_file == self._stats_file:
+                return
+
+            # a stats_file of its own was set since, so the temporary file isn't needed anymore
+            self._remove_temp_file()
+
+        self._stats_file = stats_file
+        if self._stats_file:
+            try:
+                self._stats_file_offset = os.path.getsize(self._stats_file)
+            except OSError:
+                self._stats_file_offset = 0
+        else:
+            fd, self._stats_file = tempfile.mkstemp(prefix='ansible-hashi-vault-stats-', suffix='.jsonl')
+            os.close(fd)
+            self._temp_file = True
+
+            # worker processes inherit this, so the lookups they run record their requests in the file
+            os.environ[self.ENV_STATS_FILE] = self._stats_file
+
+    @staticmethod
+    def _get_task_label(task):
+        return task.get_name().strip() or task.action
+
+    def _start_task(self, task):
+        self._current_task = self._get_task_label(task)
+        self._task_starts.append((time.time(), self._current_task))
+
+    def v2_playbook_on_task_start(self, task, is_conditional):
+        self._start_task(task)
+
+    def v2_playbook_on_handler_task_start(self, task):
+        self._start_task(task)
+
+    def _add_result(self, result):
+        task = self._get_task_label(result._task)
+        results = result._result.get('results')
+        for item in (results if isinstance(results, list) else [result._result]):
+            if isinstance(item, dict):
+                for record in item.get('_vault_stats') or []:
+                    self._records.append((task, record))
+
+    def v2_runner_on_ok(self, result):
+        self._add_result(result)
+
+    def v2_runner_on_failed(self, result, ignore_errors=False):
+        self._add_result(result)
+
+    def _get_task_at(self, when):
+        task = None
+        for start, label in self._task_starts:
+            if start > when:
+                break
+            task = label
+        return task
+
+    def _read_stats_file(self):
+        try:
+            with open(self._stats_file) as f:
+                f.seek(self._stats_file_offset)
+                lines = f.readlines()
+        except (IOError, OSError):
+            return
+
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+
+            if isinstance(record, dict):
+                self._records.append((self._get_task_at(record.get('time', 0)), record))
+
+    @classmethod
+    def _percentile(cls, values, percentile):
+        '''returns a percentile of sorted values, by the nearest-rank method'''
+        return values[max(0, int(math.ceil(percentile / 100.0 * len(values))) - 1)]
+
+    def _format_table(self, title, groups):
+        lines = ['%-40s %8s %8s %8s %8s' % ((title, 'requests') + tuple('p%i' % p for p in self.PERCENTILES))]
+        for name in sorted(groups):
+            latencies = sorted(groups[name])
+            lines.append('%-40s %8i %s' % (
+                name, len(latencies), ' '.join('%7.3fs' % self._percentile(latencies, p) for p in self.PERCENTILES)
+            ))
+        return lines
+
+    def summarize(self):
+        '''returns the lines of the summary of the records'''
+        requests = [(task, r) for task, r in self._records if 'method' in r]
+        cache = [r['cache'] for task, r in self._records if 'cache' in r]
+
+        logins = sum(1 for task, r in requests if '/login' in '/' + r.get('path', ''))
+        retries = sum(r.get('retries') or 0 for task, r in requests)
+
+        mounts = {}
+        tasks = {}
+        for task, record in requests:
+            latency = record.get('latency') or 0
+            mounts.setdefault(HashiVaultRequestStats.get_mount(record.get('path', '')), []).append(latency)
+            tasks.setdefault(task or '(no task)', []).append(latency)
+
+        lines = ['requests: %i, logins: %i, retries: %i, cache hits: %i, cache misses: %i' % (
+            len(requests), logins, retries, cache.count('hit'), cache.count('miss'),
+        )]
+
+        if requests:
+            lines.append('')
+            lines.extend(self._format_table('mount', mounts))
+            lines.append('')
+            lines.extend(self._format_table('task', tasks))
+
+        return lines
+
+    def v2_playbook_on_stats(self, stats):
+        self._read_stats_file()
+
+        self._display.banner('VAULT PROFILE')
+        for line in self.summarize():
+            self._display.display(line)
+
+        if self._temp_file:
+            self._remove_temp_file()
+
+    def _remove_temp_file(self):
+        '''removes the temporary stats file this created, and its environment variable'''
+        try:
+            os.unlink(self._stats_file)
+        except OSError:
+            pass
+
+        if os.environ.get(self.ENV_STATS_FILE) == self._stats_file:
+            del os.environ[self.ENV_STATS_FILE]
+
+        self._temp_file = False
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+class ModuleDocFragment(object):
+
+    DOCUMENTATION = r'''
+options:
+  broker:
+    description:
+      - Whether to send requests to Vault through a broker process that is shared by all of the controller's worker processes.
+      - The broker is started on first use, and is reached over a Unix domain socket in a directory that only the current user can access.
+      - The broker keeps its connections to Vault open, and answers identical logins from different workers that are in flight
+        at the same time with a single request to Vault.
+      - With I(cache=true), the reads that lookups cache are also answered that way, and their responses are cached by the broker,
+        so that they're shared by all workers, instead of only within one task. With I(token_cache=true), the broker caches login responses too.
+      - Other reads are never shared, and neither are reads of dynamic credentials (paths with a C(creds) or C(sts) segment,
+        like C(database/creds/app)) or of C(auth/token/lookup-self), even with I(cache=true).
+      - The I(retries) option is applied by the broker, but I(retry_action=warn) has no effect, since the broker can't display warnings.
+    type: bool
+    default: false
+    version_added: 7.2.0
+  broker_idle_timeout:
+    description:
+      - The number of seconds after its last request that the broker exits.
+      - The broker also exits when the C(ansible-playbook) (or other) process it was started for exits.
+    type: int
+    default: 60
+    version_added: 7.2.0
+'''
+
+    PLUGINS = r'''
+options:
+  broker:
+    env:
+      - name: ANSIBLE_HASHI_VAULT_BROKER
+    ini:
+      - section: hashi_vault_collection
+        key: broker
+    vars:
+      - name: ansible_hashi_vault_broker
+  broker_idle_timeout:
+    env:
+      - name: ANSIBLE_HASHI_VAULT_BROKER_IDLE_TIMEOUT
+    ini:
+      - section: hashi_vault_collection
+        key: broker_idle_timeout
+    vars:
+      - name: ansible_hashi_vault_broker_idle_timeout
+'''
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+class ModuleDocFragment(object):
+
+    DOCUMENTATION = r'''
+options:
+  cache:
+    description:
+      - Whether to cache read responses in memory, and answer repeated reads from the cache.
+      - The cache is shared by all lookups in the same process, and is keyed by Vault address, namespace, token, operation, path, and version.
+        Reads made with a different token will not use each other's cached responses.
+      - Ansible runs each task in a new worker process, so a cached response can only be reused within the same task,
+        for example when the same lookup is templated several times, or in a loop, unless I(cache_plugin) is also set.
+      - Cached responses can be out of date with what's currently in Vault, for up to I(cache_ttl) seconds.
+    type: bool
+    default: false
+    version_added: 7.2.0
+  cache_ttl:
+    description:
+      - The maximum number of seconds a response is cached for.
+      - If a response has a positive C(lease_duration) that is shorter than this, the response is cached for its C(lease_duration) instead.
+    type: int
+    default: 60
+    version_added: 7.2.0
+  cache_max_entries:
+    description:
+      - The maximum number of responses held in the cache. When the cache is full, the least recently used responses are removed first.
+    type: int
+    default: 1000
+    version_added: 7.2.0
+  cache_max_bytes:
+    description:
+      - The maximum total size in bytes of the responses held in the cache. When the cache is full, the least recently used responses are removed first.
+    type: int
+    default: 10485760
+    version_added: 7.2.0
+  cache_plugin:
+    description:
+      - The name of an Ansible cache plugin, such as C(ansible.builtin.jsonfile) or C(community.general.redis), to also keep cached responses in,
+        so that they're shared by all worker processes, and by later runs, rather than only used within one task.
+      - Only used when I(cache=true). Responses are still cached in memory too, and the memory is checked first.
+      - Each response is encrypted with a key derived from the token it was read with, and kept under a name derived from the token
+        and the request, so it can only be found and read with the same token, and the cache plugin doesn't show which paths it holds.
+        So responses are only shared by runs that use the same token, for example with the C(token) auth method, or with I(token_cache_path).
+      - It can't be used without a token, for example with I(auth_method=none), since there's no secret to encrypt responses with.
+      - Responses expire from the cache plugin after the same time as from memory, set by I(cache_ttl).
+      - If the cache plugin can't be read or written, a warning is shown, and responses are read from Vault instead.
+      - Requires the C(cryptography) Python library, which is a dependency of C(ansible-core).
+    type: str
+    version_added: 7.2.0
+  cache_plugin_connection:
+    description:
+      - The connection of the I(cache_plugin), for example the directory of C(ansible.builtin.jsonfile),
+        or the address of the server for C(community.general.redis).
+      - If not set, the cache plugin's own setting is used, which is the same as the fact cache's C(fact_caching_connection).
+    type: str
+    version_added: 7.2.0
+  cache_plugin_prefix:
+    description:
+      - The prefix of the names that responses are kept under in the I(cache_plugin), to tell them apart from other entries, like facts.
+    type: str
+    default: hashi_vault_
+    version_added: 7.2.0
+'''
+
+    PLUGINS = r'''
+options:
+  cache:
+    env:
+      - name: ANSIBLE_HASHI_VAULT_CACHE
+    ini:
+      - section: hashi_vault_collection
+        key: cache
+    vars:
+      - name: ansible_hashi_vault_cache
+  cache_ttl:
+    env:
+      - name: ANSIBLE_HASHI_VAULT_CACHE_TTL
+    ini:
+      - section: hashi_vault_collection
+        key: cache_ttl
+    vars:
+      - name: ansible_hashi_vault_cache_ttl
+  cache_max_entries:
+    env:
+      - name: ANSIBLE_HASHI_VAULT_CACHE_MAX_ENTRIES
+    ini:
+      - section: hashi_vault_collection
+        key: cache_max_entries
+    vars:
+      - name: ansible_hashi_vault_cache_max_entries
+  cache_max_bytes:
+    env:
+      - name: ANSIBLE_HASHI_VAULT_CACHE_MAX_BYTES
+    ini:
+      - section: hashi_vault_collection
+        key: cache_max_bytes
+    vars:
+      - name: ansible_hashi_vault_cache_max_bytes
+  cache_plugin:
+    env:
+      - name: ANSIBLE_HASHI_VAULT_CACHE_PLUGIN
+    ini:
+      - section: hashi_vault_collection
+        key: cache_plugin
+    vars:
+      - name: ansible_hashi_vault_cache_plugin
+  cache_plugin_connection:
+    env:
+      - name: ANSIBLE_HASHI_VAULT_CACHE_PLUGIN_CONNECTION
+    ini:
+      - section: hashi_vault_collection
+        key: cache_plugin_connection
+    vars:
+      - name: ansible_hashi_vault_cache_plugin_connection
+  cache_plugin_prefix:
+    env:
+      - name: ANSIBLE_HASHI_VAULT_CACHE_PLUGIN_PREFIX
+    ini:
+      - section: hashi_vault_collection
+        key: cache_plugin_prefix
+    vars:
+      - name: ansible_hashi_vault_cache_plugin_prefix
+'''
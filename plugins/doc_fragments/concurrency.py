@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+class ModuleDocFragment(object):
+
+    DOCUMENTATION = r'''
+options:
+  max_concurrency:
+    description:
+      - The maximum number of requests for different terms that are sent to Vault at the same time.
+      - All requests use the same authenticated client, so there is still only one login.
+      - Results are always returned in the same order as the terms.
+      - If a request fails, the error for the first failing term is raised, and requests that have not started yet are cancelled.
+        Requests that were already running will still complete.
+      - The default of C(1) sends requests one at a time.
+    type: int
+    default: 1
+    version_added: 7.2.0
+'''
+
+    PLUGINS = r'''
+options:
+  max_concurrency:
+    env:
+      - name: ANSIBLE_HASHI_VAULT_MAX_CONCURRENCY
+    ini:
+      - section: hashi_vault_collection
+        key: max_concurrency
+    vars:
+      - name: ansible_hashi_vault_max_concurrency
+'''
+
+    # For lookups that send one plain request per term, which the async engine can send.
+    ENGINE = r'''
+options:
+  concurrency_engine:
+    description:
+      - How requests for different terms are sent at the same time, up to I(max_concurrency) of them.
+      - With C(threads), each request is sent with the C(hvac) client from its own thread.
+      - With C(async), all requests are sent from a single asyncio event loop with the C(aiohttp) Python library,
+        over at most I(max_concurrency) connections, without a thread for each request.
+        This scales better to thousands of requests. Requests that fail are retried according to the I(retries) option,
+        and all requests are sent before the first error, if any, is raised.
+      - C(async) requires the C(aiohttp) Python library.
+      - C(async) can't be used with a I(url) that has multiple addresses, with I(broker), or with I(circuit_breaker).
+    type: str
+    choices: [threads, async]
+    default: threads
+    version_added: 7.2.0
+'''
+
+    ENGINE_PLUGINS = r'''
+options:
+  concurrency_engine:
+    env:
+      - name: ANSIBLE_HASHI_VAULT_CONCURRENCY_ENGINE
+    ini:
+      - section: hashi_vault_collection
+        key: concurrency_engine
+    vars:
+      - name: ansible_hashi_vault_concurrency_engine
+'''
@@ -17,6 +17,12 @@ class ModuleDocFragment(object):
           - URL to the Vault service.
           - If not specified by any other means, the value of the C(VAULT_ADDR) environment variable will be used.
           - If C(VAULT_ADDR) is also not defined then an error will be raised.
+          - Since version 7.2.0, this can be the URLs of the nodes of a Vault cluster, separated by commas.
+            The role of each node is then learned from its C(sys/health) endpoint, writes are sent to the active node,
+            reads are spread across the performance standbys, and requests fail over to another node when one can't be reached.
+            See the collection User Guide for details.
+          - Since version 7.2.0, this can also be the path of the unix socket of a Vault Agent or Vault Proxy,
+            as a URL like C(unix:///run/vault-agent.sock).
         type: str
       proxies:
         description:
@@ -63,6 +69,11 @@ class ModuleDocFragment(object):
           - If this option is not specified or the number is C(0), then retries are disabled.
           - A number sets the total number of retries, and uses collection defaults for the other settings.
           - A dictionary value is used directly to initialize the C(Retry) class, so it can be used to fully customize retries.
+          - "A dictionary value can also contain these keys, which are handled by the collection rather than C(urllib3):
+            C(full_jitter) (boolean) picks each backoff time at random between zero and its exponential value,
+            and C(backoff_max) (number) caps the backoff time, with any version of C(urllib3)."
+          - The collection defaults use full jitter, with backoff times capped at 30 seconds.
+          - C(Retry-After) headers on C(413), C(429), and C(503) responses are respected, and take the place of the backoff time.
           - For detailed information on retries, see the collection User Guide.
         type: raw
         version_added: 1.3.0
@@ -76,6 +87,30 @@ class ModuleDocFragment(object):
           - warn
         default: warn
         version_added: 1.3.0
+      retry_deadline:
+        description:
+          - The most time, in seconds, to spend retrying a request, counted from its first failed attempt.
+          - Once the deadline has passed no more retries are made, and no backoff or C(Retry-After) wait goes past it.
+          - This has no effect if I(retries) are disabled.
+        type: float
+        version_added: 7.2.0
+      circuit_breaker:
+        description:
+          - Stops sending requests to a Vault address for a while after a number of consecutive requests to it have failed,
+            so that lookups and tasks fail immediately instead of each one waiting through its own timeouts and I(retries).
+          - A request fails if it can't connect or times out (after any I(retries)), or gets a C(502), C(503), or C(504) response,
+            such as the C(503) of a sealed Vault.
+          - Once the cooldown is over, a single request is sent as a probe. If it succeeds, requests are sent normally again,
+            and if it fails, requests are stopped for another cooldown.
+          - This option can be specified as a number (integer) or dictionary.
+          - If this option is not specified or the number is C(0), the circuit breaker is disabled.
+          - A number sets the number of consecutive failures (C(threshold)), and uses the defaults for the other settings.
+          - "A dictionary can set C(threshold) (default C(5)), C(cooldown) in seconds (default C(30)), and C(shared) (default C(false))."
+          - The state of each Vault address is shared by everything in the same Python process.
+            With C(shared=true) it's kept in a file in a private temporary directory instead, so that it's also shared with other processes of the same user,
+            such as other Ansible workers.
+        type: raw
+        version_added: 7.2.0
     '''
 
     PLUGINS = r'''
@@ -158,4 +193,20 @@ class ModuleDocFragment(object):
               version_added: 1.4.0
           vars:
             - name: ansible_hashi_vault_retry_action
+        retry_deadline:
+          env:
+            - name: ANSIBLE_HASHI_VAULT_RETRY_DEADLINE
+          ini:
+            - section: hashi_vault_collection
+              key: retry_deadline
+          vars:
+            - name: ansible_hashi_vault_retry_deadline
+        circuit_breaker:
+          env:
+            - name: ANSIBLE_HASHI_VAULT_CIRCUIT_BREAKER
+          ini:
+            - section: hashi_vault_collection
+              key: circuit_breaker
+          vars:
+            - name: ansible_hashi_vault_circuit_breaker
       '''
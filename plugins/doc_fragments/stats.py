@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+class ModuleDocFragment(object):
+
+    DOCUMENTATION = r'''
+options:
+  stats:
+    description:
+      - Whether to return a record of each request sent to Vault, as a list in the C(_vault_stats) key of the result.
+      - Each record is a dictionary of C(time) (when the request was sent, in seconds since the epoch), C(method), C(path), C(status),
+        C(latency) (in seconds, including any retries), C(retries), and C(bytes) (the size of the response body).
+      - C(path) is the path of the request, without the C(/v1/) prefix, where names that aren't part of the Vault API,
+        like the names of secrets, are replaced with C(*). For example C(secret/data/*) or C(auth/approle/login).
+    type: bool
+    default: false
+    version_added: 7.2.0
+'''
+
+    PLUGINS = r'''
+options:
+  stats_file:
+    description:
+      - Path to a file that a record of each request sent to Vault is appended to, as a line of JSON.
+      - Each record is a dictionary of C(time) (when the request was sent, in seconds since the epoch), C(method), C(path), C(status),
+        C(latency) (in seconds, including any retries), C(retries), C(bytes) (the size of the response body),
+        C(plugin) (the name of the plugin that sent it), and C(pid) (the ID of the process that sent it).
+      - C(path) is the path of the request, without the C(/v1/) prefix, where names that aren't part of the Vault API,
+        like the names of secrets, are replaced with C(*). For example C(secret/data/*) or C(auth/approle/login).
+      - For lookups with the I(cache) option, reads looked up in the read cache are also recorded, as a dictionary of C(time), C(path),
+        and C(cache) (either C(hit) or C(miss)), with C(plugin) and C(pid).
+      - The records of each call of a plugin are appended together, at the end of the call.
+      - The file is created readable only by its owner. Records from different processes are appended safely to the same file.
+      - The R(community.hashi_vault.vault_profile callback plugin,ansible_collections.community.hashi_vault.vault_profile_callback)
+        summarizes these records at the end of a run.
+    type: path
+    version_added: 7.2.0
+    env:
+      - name: ANSIBLE_HASHI_VAULT_STATS_FILE
+    ini:
+      - section: hashi_vault_collection
+        key: stats_file
+    vars:
+      - name: ansible_hashi_vault_stats_file
+'''
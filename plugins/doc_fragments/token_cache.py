@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+class ModuleDocFragment(object):
+
+    DOCUMENTATION = r'''
+options:
+  token_cache:
+    description:
+      - Whether to keep the token from a login in memory, and reuse it for later logins with the same auth method, credentials,
+        Vault address, and namespace, instead of logging in again.
+      - A cached token is reused until 10% of its lease (or 5 seconds, whichever is longer) is left.
+        Tokens that are limited to a number of uses are never cached.
+      - The cache is shared by everything in the same process. Ansible runs each task in a new worker process,
+        so a cached token can only be reused within the same task, for example when a lookup is templated several times, or in a loop.
+      - This has no effect with the C(token) and C(none) auth methods, which don't log in.
+    type: bool
+    default: false
+    version_added: 7.2.0
+  token_cache_path:
+    description:
+      - Path to a file in which to also keep the token cache, so that tokens can be reused by later runs while they are valid.
+      - Each entry in the file is encrypted with a key derived from the credentials it was made with, so it can only be read by
+        someone who can already log in with them. The file is created readable only by its owner.
+      - The credentials are used as they're found when logging in, so for example the contents of the certificate and key files
+        are used with the C(cert) auth method, the AWS credentials from a profile, the environment, or an instance role are used with C(aws_iam),
+        and the token from a service principal or managed identity is used with C(azure). When they change, a new login is made.
+      - Can't be used with a login that has no secret credential to derive the key from, such as C(approle) without I(secret_id).
+      - A token read from the file is checked with a C(lookup-self) request before it's used, so a token that was revoked is replaced with a new login.
+      - Only used when I(token_cache=true).
+      - Requires the C(cryptography) Python library, which is a dependency of C(ansible-core).
+    type: path
+    version_added: 7.2.0
+'''
+
+    PLUGINS = r'''
+options:
+  token_cache:
+    env:
+      - name: ANSIBLE_HASHI_VAULT_TOKEN_CACHE
+    ini:
+      - section: hashi_vault_collection
+        key: token_cache
+    vars:
+      - name: ansible_hashi_vault_token_cache
+  token_cache_path:
+    env:
+      - name: ANSIBLE_HASHI_VAULT_TOKEN_CACHE_PATH
+    ini:
+      - section: hashi_vault_collection
+        key: token_cache_path
+    vars:
+      - name: ansible_hashi_vault_token_cache_path
+'''
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+class ModuleDocFragment(object):
+
+    DOCUMENTATION = r'''
+options:
+  trace_file:
+    description:
+      - Path to a file that a trace of the module's requests to Vault is appended to, as OpenTelemetry spans in the OTLP JSON format.
+      - The file is written on the host the module runs on.
+      - Each run of the module appends one line, with a parent span for the run, and a child span for each login,
+        each HTTP request, and each failed attempt of a request that was retried.
+      - If the C(TRACEPARENT) environment variable of the module is a W3C C(traceparent) value,
+        the spans are part of that trace, as children of its span.
+      - The file is created readable only by its owner.
+    type: path
+    version_added: 7.2.0
+'''
+
+    PLUGINS = r'''
+options:
+  trace_file:
+    description:
+      - Path to a file that a trace of the plugin's requests to Vault is appended to, as OpenTelemetry spans in the OTLP JSON format.
+      - Each call of the plugin appends one line, with a parent span for the call, and a child span for each login,
+        each HTTP request, and each failed attempt of a request that was retried.
+      - If the C(TRACEPARENT) environment variable is a W3C C(traceparent) value, the spans are part of that trace, as children of its span.
+      - The file is created readable only by its owner. Lines from different processes are appended safely to the same file.
+    type: path
+    version_added: 7.2.0
+    env:
+      - name: ANSIBLE_HASHI_VAULT_TRACE_FILE
+    ini:
+      - section: hashi_vault_collection
+        key: trace_file
+    vars:
+      - name: ansible_hashi_vault_trace_file
+'''
@@ -40,11 +40,19 @@ DOCUMENTATION = """
     - As of community.hashi_vault 0.1.0, only the latest version of a secret is returned when specifying a KV v2 path.
     - As of community.hashi_vault 0.1.0, all options can be supplied via term string (space delimited key=value pairs) or by parameters (see examples).
     - As of community.hashi_vault 0.1.0, when I(secret) is the first option in the term string, C(secret=) is not required (see examples).
+    - As of community.hashi_vault 7.2.0, terms that resolve to the same connection and authentication options share a single
+      Vault login, rather than logging in once per term.
   extends_documentation_fragment:
     - community.hashi_vault.connection
     - community.hashi_vault.connection.plugins
+    - community.hashi_vault.broker
+    - community.hashi_vault.broker.plugins
     - community.hashi_vault.auth
     - community.hashi_vault.auth.plugins
+    - community.hashi_vault.stats.plugins
+    - community.hashi_vault.trace.plugins
+    - community.hashi_vault.token_cache
+    - community.hashi_vault.token_cache.plugins
   options:
     secret:
       description: Vault path to the secret being requested in the format C(path[:field]).
@@ -242,11 +250,15 @@ _raw:
   elements: dict
 """
 
+import json
+
 from ansible.errors import AnsibleError
 from ansible.utils.display import Display
 
 from ansible_collections.community.hashi_vault.plugins.plugin_utils._hashi_vault_lookup_base import HashiVaultLookupBase
 from ansible_collections.community.hashi_vault.plugins.module_utils._hashi_vault_common import HashiVaultValueError
+from ansible_collections.community.hashi_vault.plugins.module_utils._connection_options import HashiVaultConnectionOptions
+from ansible_collections.community.hashi_vault.plugins.module_utils._authenticator import HashiVaultAuthenticator
 
 display = Display()
 
@@ -256,6 +268,10 @@ class LookupModule(HashiVaultLookupBase):
 
         ret = []
 
+        # Each term can carry its own connection and auth options, but terms that end up with the same
+        # effective options share one authenticated client, so we only log in once per distinct set.
+        clients = {}
+
         for term in terms:
             opts = kwargs.copy()
             opts.update(self.parse_kev_term(term, first_unqualified='secret', plugin_name='hashi_vault'))
@@ -264,18 +280,31 @@ class LookupModule(HashiVaultLookupBase):
             self.process_deprecations()
             self.process_options()
 
-            client_args = self.connection_options.get_hvac_connection_options()
-            self.client = self.helper.get_vault_client(**client_args)
+            client_key = self.get_client_key()
 
             try:
-                self.authenticator.authenticate(self.client)
-            except (NotImplementedError, HashiVaultValueError) as e:
-                raise AnsibleError(e)
+                self.client = clients[client_key]
+            except KeyError:
+                client_args = self.connection_options.get_hvac_connection_options()
+                self.client = self.helper.get_vault_client(**client_args)
+
+                try:
+                    self.authenticator.authenticate(self.client)
+                except (NotImplementedError, HashiVaultValueError) as e:
+                    raise AnsibleError(e)
+
+                clients[client_key] = self.client
 
             ret.extend(self.get())
 
         return ret
 
+    def get_client_key(self):
+        '''returns a key that identifies the effective connection and auth options of the current term'''
+        option_names = HashiVaultConnectionOptions.OPTIONS + list(HashiVaultAuthenticator.ARGSPEC)
+
+        return json.dumps(self._options_adapter.get_options(*option_names), sort_keys=True, default=str)
+
     def process_options(self):
         '''performs deep validation and value loading for options'''
 
@@ -29,10 +29,22 @@ seealso:
 extends_documentation_fragment:
   - community.hashi_vault.connection
   - community.hashi_vault.connection.plugins
+  - community.hashi_vault.broker
+  - community.hashi_vault.broker.plugins
   - community.hashi_vault.auth
   - community.hashi_vault.auth.plugins
+  - community.hashi_vault.stats.plugins
+  - community.hashi_vault.trace.plugins
+  - community.hashi_vault.token_cache
+  - community.hashi_vault.token_cache.plugins
   - community.hashi_vault.engine_mount
   - community.hashi_vault.engine_mount.plugins
+  - community.hashi_vault.concurrency
+  - community.hashi_vault.concurrency.plugins
+  - community.hashi_vault.concurrency.engine
+  - community.hashi_vault.concurrency.engine_plugins
+  - community.hashi_vault.cache
+  - community.hashi_vault.cache.plugins
 options:
   _terms:
     description:
@@ -42,6 +54,20 @@ options:
     required: True
   engine_mount_point:
     default: kv
+  recursive:
+    description:
+      - If C(true), each term is a path prefix, and every secret under it is read, rather than a single secret.
+      - The secrets are found by listing the prefix, and every folder below it. Use an empty term to read every secret in the mount.
+      - The result for each term is then a dictionary with the path of each secret as its key (relative to I(engine_mount_point),
+        like a term), and the same result that reading only that secret would return as its value.
+      - All the lists and reads use a single login. With I(max_concurrency) greater than C(1), the folders at each depth
+        are listed at the same time, and so are the secrets read.
+      - The lists and reads always use the C(threads) I(concurrency_engine).
+      - Secrets that are deleted after they're listed are left out of the result.
+      - This needs the C(list) capability on the prefix and the folders below it, as well as C(read) on the secrets.
+    type: bool
+    default: false
+    version_added: 7.2.0
 '''
 
 EXAMPLES = r'''
@@ -92,6 +118,14 @@ EXAMPLES = r'''
     msg: '{{ item }}'
   loop: "{{ query('community.hashi_vault.vault_kv1_get', *paths, auth_method='userpass', username=user, password=pwd) }}"
 
+- name: Read every secret under app/ with a single Vault login, listing folders and reading secrets 10 at a time
+  ansible.builtin.set_fact:
+    app_secrets: "{{ lookup('community.hashi_vault.vault_kv1_get', 'app/', recursive=true, max_concurrency=10) }}"
+
+- name: Display the password of app/db, which is one of the secrets that were read
+  ansible.builtin.debug:
+    msg: "{{ app_secrets['app/db'].secret.password }}"
+
 - name: Perform multiple kv1 reads with a single Vault login in a loop (via with_), display values only
   vars:
     ansible_hashi_vault_auth_method: userpass
@@ -109,6 +143,8 @@ RETURN = r'''
 _raw:
   description:
     - The result of the read(s) against the given path(s).
+    - With I(recursive=true), there is a dictionary for each term instead, with the path of each secret under it as its key,
+      and what is described here for that secret as its value.
   type: list
   elements: dict
   contains:
@@ -160,6 +196,7 @@ from ansible.utils.display import Display
 
 from ansible_collections.community.hashi_vault.plugins.plugin_utils._hashi_vault_lookup_base import HashiVaultLookupBase
 from ansible_collections.community.hashi_vault.plugins.module_utils._hashi_vault_common import HashiVaultValueError
+from ansible_collections.community.hashi_vault.plugins.module_utils._async_engine import HashiVaultAsyncOperation
 
 display = Display()
 
@@ -178,6 +215,7 @@ class LookupModule(HashiVaultLookupBase):
         hvac_exceptions = self.helper.get_hvac().exceptions
 
         engine_mount_point = self._options_adapter.get_option('engine_mount_point')
+        recursive = self._options_adapter.get_option_default('recursive', False)
 
         try:
             self.authenticator.validate()
@@ -185,9 +223,18 @@ class LookupModule(HashiVaultLookupBase):
         except (NotImplementedError, HashiVaultValueError) as e:
             raise AnsibleError(e)
 
-        for term in terms:
+        def _cache_path(term):
+            return '%s/%s' % (engine_mount_point, term)
+
+        def _fetch(term):
+            return client.secrets.kv.v1.read_secret(path=term, mount_point=engine_mount_point)
+
+        def _operation(term):
+            return HashiVaultAsyncOperation.read(_cache_path(term), raise_on_missing=True)
+
+        def _handle(term, get_result):
             try:
-                raw = client.secrets.kv.v1.read_secret(path=term, mount_point=engine_mount_point)
+                raw = get_result()
             except hvac_exceptions.Forbidden as e:
                 raise AnsibleError("Forbidden: Permission Denied to path ['%s']." % term) from e
             except hvac_exceptions.InvalidPath as e:
@@ -201,6 +248,35 @@ class LookupModule(HashiVaultLookupBase):
             metadata = raw.copy()
             data = metadata.pop('data')
 
-            ret.append(dict(raw=raw, data=data, secret=data, metadata=metadata))
+            return dict(raw=raw, data=data, secret=data, metadata=metadata)
+
+        def _get(term):
+            return _handle(term, lambda: self.cached_read(client, 'kv1_get', _cache_path(term), lambda: _fetch(term)))
+
+        def _get_existing(path):
+            # a secret can be deleted after it's listed
+            try:
+                return _get(path)
+            except AnsibleError as e:
+                if isinstance(e.__cause__, hvac_exceptions.InvalidPath):
+                    return None
+                raise
+
+        def _list(path):
+            try:
+                return client.secrets.kv.v1.list_secrets(path=path, mount_point=engine_mount_point)['data']['keys']
+            except hvac_exceptions.Forbidden as e:
+                raise AnsibleError("Forbidden: Permission Denied to list path ['%s']." % path) from e
+            except hvac_exceptions.InvalidPath as e:
+                raise AnsibleError("Invalid or missing path ['%s'] to list. Check the path, or that there are secrets under it." % path) from e
+
+        if not recursive:
+            ret.extend(self.map_requests(client, terms, _fetch, _operation, _handle, cache_method='kv1_get', cache_path=_cache_path))
+            return ret
+
+        for term in terms:
+            paths = self.list_tree(lambda folders: self.map_terms(client, _list, folders), term)
+            secrets = self.map_terms(client, _get_existing, paths)
+            ret.append(dict((path, secret) for path, secret in zip(paths, secrets) if secret is not None))
 
         return ret
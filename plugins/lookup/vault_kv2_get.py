@@ -29,10 +29,22 @@ seealso:
 extends_documentation_fragment:
   - community.hashi_vault.connection
   - community.hashi_vault.connection.plugins
+  - community.hashi_vault.broker
+  - community.hashi_vault.broker.plugins
   - community.hashi_vault.auth
   - community.hashi_vault.auth.plugins
+  - community.hashi_vault.stats.plugins
+  - community.hashi_vault.trace.plugins
+  - community.hashi_vault.token_cache
+  - community.hashi_vault.token_cache.plugins
   - community.hashi_vault.engine_mount
   - community.hashi_vault.engine_mount.plugins
+  - community.hashi_vault.concurrency
+  - community.hashi_vault.concurrency.plugins
+  - community.hashi_vault.concurrency.engine
+  - community.hashi_vault.concurrency.engine_plugins
+  - community.hashi_vault.cache
+  - community.hashi_vault.cache.plugins
 options:
   _terms:
     description:
@@ -43,8 +55,60 @@ options:
   engine_mount_point:
     default: secret
   version:
-    description: Specifies the version to return. If not set the latest version is returned.
+    description:
+      - Specifies the version to return. If not set the latest version is returned.
+      - Cannot be used with I(recursive=true).
     type: int
+  recursive:
+    description:
+      - If C(true), each term is a path prefix, and every secret under it is read, rather than a single secret.
+      - The secrets are found by listing the prefix, and every folder below it. Use an empty term to read every secret in the mount.
+      - The result for each term is then a dictionary with the path of each secret as its key (relative to I(engine_mount_point),
+        like a term), and the same result that reading only that secret would return as its value.
+      - All the lists and reads use a single login. With I(max_concurrency) greater than C(1), the folders at each depth
+        are listed at the same time, and so are the secrets read.
+      - The lists and reads always use the C(threads) I(concurrency_engine).
+      - Secrets whose latest version is deleted or destroyed are left out of the result.
+      - This needs the C(list) capability on the metadata of the prefix and the folders below it, as well as C(read) on the secrets.
+    type: bool
+    default: false
+    version_added: 7.2.0
+  cache_revalidate:
+    description:
+      - When I(cache=true), whether to check that a cached secret is still the current version of the secret before it's used,
+        and only read the whole secret again if it isn't.
+      - The check is a smaller request that returns the secret's current version but none of its data (see I(revalidate_with)),
+        so this is much cheaper than I(cache=false) for large secrets, while never returning an out of date secret.
+      - A cached secret that's still current is then cached again for I(cache_ttl) seconds.
+      - If the check fails, for example because the token can't read the secret's metadata, the whole secret is read instead.
+      - Not used when I(version) is set, because a specific version of a secret doesn't change.
+    type: bool
+    default: false
+    version_added: 7.2.0
+    env:
+      - name: ANSIBLE_HASHI_VAULT_CACHE_REVALIDATE
+    ini:
+      - section: hashi_vault_collection
+        key: cache_revalidate
+    vars:
+      - name: ansible_hashi_vault_cache_revalidate
+  revalidate_with:
+    description:
+      - How to find the current version of a secret, when I(cache_revalidate=true).
+      - C(metadata) reads the secret's metadata, which needs the C(read) capability on C(<engine_mount_point>/metadata/<path>).
+      - C(subkeys) reads the top level keys of the secret, without their values, which needs the C(read) capability
+        on C(<engine_mount_point>/subkeys/<path>), and Vault 1.10 or later.
+    type: str
+    choices: [metadata, subkeys]
+    default: metadata
+    version_added: 7.2.0
+    env:
+      - name: ANSIBLE_HASHI_VAULT_REVALIDATE_WITH
+    ini:
+      - section: hashi_vault_collection
+        key: revalidate_with
+    vars:
+      - name: ansible_hashi_vault_revalidate_with
 '''
 
 EXAMPLES = r'''
@@ -73,6 +137,11 @@ EXAMPLES = r'''
     that:
       - response.metadata.version == 5
 
+- name: Read a large kv2 secret several times, only reading it again when there's a new version of it
+  ansible.builtin.debug:
+    msg: "{{ lookup('community.hashi_vault.vault_kv2_get', 'certs/bundle', cache=true, cache_revalidate=true)['secret'] }}"
+  loop: "{{ range(3) | list }}"
+
 - name: Perform multiple kv2 reads with a single Vault login, showing the secrets
   vars:
     paths:
@@ -92,6 +161,20 @@ EXAMPLES = r'''
     msg: '{{ item }}'
   loop: "{{ query('community.hashi_vault.vault_kv2_get', *paths, auth_method='userpass', username=user, password=pwd) }}"
 
+- name: Perform many kv2 reads with a single Vault login, sending up to 10 requests at a time
+  vars:
+    paths: "{{ range(300) | map('regex_replace', '^', 'app/config/') | list }}"
+  ansible.builtin.set_fact:
+    configs: "{{ query('community.hashi_vault.vault_kv2_get', *paths, max_concurrency=10) | map(attribute='secret') | list }}"
+
+- name: Read every secret under app/ with a single Vault login, listing folders and reading secrets 10 at a time
+  ansible.builtin.set_fact:
+    app_secrets: "{{ lookup('community.hashi_vault.vault_kv2_get', 'app/', recursive=true, max_concurrency=10) }}"
+
+- name: Display the password of app/db, which is one of the secrets that were read
+  ansible.builtin.debug:
+    msg: "{{ app_secrets['app/db'].secret.password }}"
+
 - name: Perform multiple kv2 reads with a single Vault login in a loop (via with_), display values only
   vars:
     ansible_hashi_vault_auth_method: userpass
@@ -110,6 +193,8 @@ RETURN = r'''
 _raw:
   description:
     - The result of the read(s) against the given path(s).
+    - With I(recursive=true), there is a dictionary for each term instead, with the path of each secret under it as its key,
+      and what is described here for that secret as its value.
   type: list
   elements: dict
   contains:
@@ -168,11 +253,13 @@ _raw:
         version: 2
 '''
 
-from ansible.errors import AnsibleError
+from ansible.errors import AnsibleError, AnsibleOptionsError
 from ansible.utils.display import Display
 
 from ansible_collections.community.hashi_vault.plugins.plugin_utils._hashi_vault_lookup_base import HashiVaultLookupBase
 from ansible_collections.community.hashi_vault.plugins.module_utils._hashi_vault_common import HashiVaultValueError
+from ansible_collections.community.hashi_vault.plugins.module_utils._kv2_version import HashiVaultKv2Version
+from ansible_collections.community.hashi_vault.plugins.module_utils._async_engine import HashiVaultAsyncOperation
 
 display = Display()
 
@@ -192,6 +279,12 @@ class LookupModule(HashiVaultLookupBase):
 
         version = self._options_adapter.get_option_default('version')
         engine_mount_point = self._options_adapter.get_option('engine_mount_point')
+        recursive = self._options_adapter.get_option_default('recursive', False)
+        cache_revalidate = self._options_adapter.get_option_default('cache_revalidate', False)
+        revalidate_with = self._options_adapter.get_option_default('revalidate_with', 'metadata')
+
+        if recursive and version is not None:
+            raise AnsibleOptionsError("version can't be used with recursive=true.")
 
         try:
             self.authenticator.validate()
@@ -199,9 +292,28 @@ class LookupModule(HashiVaultLookupBase):
         except (NotImplementedError, HashiVaultValueError) as e:
             raise AnsibleError(e)
 
-        for term in terms:
+        def _is_current(term, cached):
+            # if the version can't be checked, the full read will show why
             try:
-                raw = client.secrets.kv.v2.read_secret_version(path=term, version=version, mount_point=engine_mount_point)
+                return HashiVaultKv2Version.is_current(client, term, engine_mount_point, cached['data']['metadata']['version'], revalidate_with)
+            except hvac_exceptions.VaultError:
+                return False
+
+        def _cache_path(term):
+            return '%s/%s' % (engine_mount_point, term)
+
+        def _fetch(term):
+            return client.secrets.kv.v2.read_secret_version(path=term, version=version, mount_point=engine_mount_point)
+
+        def _operation(term):
+            params = None if version is None else dict(version=version)
+            return HashiVaultAsyncOperation.read('%s/data/%s' % (engine_mount_point, term), params=params, raise_on_missing=True)
+
+        revalidate = _is_current if cache_revalidate and version is None else None
+
+        def _handle(term, get_result):
+            try:
+                raw = get_result()
             except hvac_exceptions.Forbidden as e:
                 raise AnsibleError("Forbidden: Permission Denied to path ['%s']." % term) from e
             except hvac_exceptions.InvalidPath as e:
@@ -213,6 +325,41 @@ class LookupModule(HashiVaultLookupBase):
             metadata = data['metadata']
             secret = data['data']
 
-            ret.append(dict(raw=raw, data=data, secret=secret, metadata=metadata))
+            return dict(raw=raw, data=data, secret=secret, metadata=metadata)
+
+        def _get(term):
+            return _handle(term, lambda: self.cached_read(
+                client, 'kv2_get', _cache_path(term), lambda: _fetch(term), version=version,
+                revalidate=None if revalidate is None else (lambda cached: revalidate(term, cached)),
+            ))
+
+        def _get_existing(path):
+            # a secret that's listed but whose latest version is deleted can't be read
+            try:
+                return _get(path)
+            except AnsibleError as e:
+                if isinstance(e.__cause__, hvac_exceptions.InvalidPath):
+                    return None
+                raise
+
+        def _list(path):
+            try:
+                return client.secrets.kv.v2.list_secrets(path=path, mount_point=engine_mount_point)['data']['keys']
+            except hvac_exceptions.Forbidden as e:
+                raise AnsibleError("Forbidden: Permission Denied to list path ['%s']." % path) from e
+            except hvac_exceptions.InvalidPath as e:
+                raise AnsibleError("Invalid or missing path ['%s'] to list. Check the path, or that there are secrets under it." % path) from e
+
+        if not recursive:
+            ret.extend(self.map_requests(
+                client, terms, _fetch, _operation, _handle,
+                cache_method='kv2_get', cache_path=_cache_path, version=version, revalidate=revalidate,
+            ))
+            return ret
+
+        for term in terms:
+            paths = self.list_tree(lambda folders: self.map_terms(client, _list, folders), term)
+            secrets = self.map_terms(client, _get_existing, paths)
+            ret.append(dict((path, secret) for path, secret in zip(paths, secrets) if secret is not None))
 
         return ret
@@ -21,13 +21,63 @@ DOCUMENTATION = """
   extends_documentation_fragment:
     - community.hashi_vault.connection
     - community.hashi_vault.connection.plugins
+    - community.hashi_vault.broker
+    - community.hashi_vault.broker.plugins
     - community.hashi_vault.auth
     - community.hashi_vault.auth.plugins
+    - community.hashi_vault.stats.plugins
+    - community.hashi_vault.trace.plugins
+    - community.hashi_vault.token_cache
+    - community.hashi_vault.token_cache.plugins
+    - community.hashi_vault.concurrency
+    - community.hashi_vault.concurrency.plugins
+    - community.hashi_vault.concurrency.engine
+    - community.hashi_vault.concurrency.engine_plugins
+    - community.hashi_vault.cache
+    - community.hashi_vault.cache.plugins
   options:
     _terms:
       description: Vault path(s) to be listed.
       type: str
       required: true
+    recursive:
+      description:
+        - If C(true), each term is listed, and then every folder below it, breadth first, and the result for each term is a flat,
+          sorted list of the full paths of everything found under it, rather than the raw result of a single list.
+        - Keys that end in a slash are folders. They're listed in turn, rather than being part of the result,
+          unless they are below I(max_depth).
+        - The folders at each depth are listed at the same time, up to I(max_concurrency) of them, with the I(concurrency_engine).
+        - All the lists use a single login.
+      type: bool
+      default: false
+      version_added: 7.2.0
+    max_depth:
+      description:
+        - With I(recursive=true), the number of depths to list. C(1) lists only the term.
+        - The paths of folders below that depth are part of the result instead, with a trailing slash.
+        - If not set, there is no limit.
+      type: int
+      version_added: 7.2.0
+    include:
+      description:
+        - With I(recursive=true), only paths that match at least one of these glob patterns are part of the result.
+        - The patterns are matched against the path relative to the term, for example C(app/db) for C(secret/metadata/app/db)
+          when the term is C(secret/metadata). C(*) matches any characters, including C(/).
+        - Folders are still listed when they don't match, since paths below them may match.
+      type: list
+      elements: str
+      default: []
+      version_added: 7.2.0
+    exclude:
+      description:
+        - With I(recursive=true), paths that match any of these glob patterns are not part of the result.
+        - The patterns are matched the same way as those of I(include).
+        - The path of a folder that is matched has a trailing slash, for example C(app/old/). A folder that matches is not listed,
+          so the requests to list it and the folders below it are not sent.
+      type: list
+      elements: str
+      default: []
+      version_added: 7.2.0
 """
 
 EXAMPLES = """
@@ -113,6 +163,29 @@ EXAMPLES = """
       - "Dictionary: {{ credentials_dict }}"
       - "List: {{ credentials_list }}"
 
+- name: Read every secret with a single login instead, including secrets in sub-folders, reading up to 10 secrets at a time
+  ansible.builtin.set_fact:
+    vpn_users: "{{ lookup('community.hashi_vault.vault_kv2_get', '', recursive=true, max_concurrency=10, engine_mount_point='vpn-users') }}"
+  no_log: true
+
+- name: Create the same dictionary as above from the secrets that were read, which are keyed by their paths
+  ansible.builtin.set_fact:
+    credentials_dict: "{{ dict(vpn_users.keys() | zip(vpn_users.values() | map(attribute='secret') | map(attribute='password'))) }}"
+  no_log: true
+
+- name: List the paths of all the secrets in a kv2 mount, listing up to 10 folders at a time
+  ansible.builtin.debug:
+    msg: "{{ lookup('community.hashi_vault.vault_list', 'secret/metadata', recursive=true, max_concurrency=10) }}"
+  # the result is a list like ['secret/metadata/app/api', 'secret/metadata/app/db', 'secret/metadata/other']
+
+- name: List the paths of the secrets under app, two levels deep at most, leaving out anything under app/old and secrets named tmp
+  ansible.builtin.debug:
+    msg: "{{ lookup('community.hashi_vault.vault_list', 'secret/metadata/app', recursive=true, max_depth=2, exclude=['old/', '*/tmp']) }}"
+
+- name: List the paths of the secrets whose name ends in .pem
+  ansible.builtin.debug:
+    msg: "{{ lookup('community.hashi_vault.vault_list', 'secret/metadata', recursive=true, include=['*.pem']) }}"
+
 - name: List all userpass users and output the token policies for each user
   ansible.builtin.debug:
     msg: "{{ lookup('community.hashi_vault.vault_read', 'auth/userpass/users/' + item).data.token_policies }}"
@@ -123,15 +196,19 @@ RETURN = """
 _raw:
   description:
     - The raw result of the read against the given path.
+    - With I(recursive=true), a sorted list of the full paths found under the path instead.
   type: list
-  elements: dict
+  elements: raw
 """
 
-from ansible.errors import AnsibleError
+from fnmatch import fnmatchcase
+
+from ansible.errors import AnsibleError, AnsibleOptionsError
 from ansible.utils.display import Display
 
 from ansible_collections.community.hashi_vault.plugins.plugin_utils._hashi_vault_lookup_base import HashiVaultLookupBase
 from ansible_collections.community.hashi_vault.plugins.module_utils._hashi_vault_common import HashiVaultValueError
+from ansible_collections.community.hashi_vault.plugins.module_utils._async_engine import HashiVaultAsyncOperation
 
 display = Display()
 
@@ -155,15 +232,39 @@ class LookupModule(HashiVaultLookupBase):
         except (NotImplementedError, HashiVaultValueError) as e:
             raise AnsibleError(e)
 
-        for term in terms:
+        def _list(term, get_result):
             try:
-                data = client.list(term)
+                data = get_result()
             except hvac_exceptions.Forbidden:
                 raise AnsibleError("Forbidden: Permission Denied to path '%s'." % term)
 
             if data is None:
                 raise AnsibleError("The path '%s' doesn't seem to exist." % term)
 
-            ret.append(data)
+            return data
+
+        if not self._options_adapter.get_option_default('recursive', False):
+            ret.extend(self.map_requests(client, terms, client.list, HashiVaultAsyncOperation.list, _list, cache_method='list'))
+            return ret
+
+        max_depth = self._options_adapter.get_option_default('max_depth')
+        include = self._options_adapter.get_option_default('include') or []
+        exclude = self._options_adapter.get_option_default('exclude') or []
+
+        if max_depth is not None and max_depth < 1:
+            raise AnsibleOptionsError("max_depth must be 1 or greater, got: %r" % max_depth)
+
+        def _list_folders(folders):
+            results = self.map_requests(client, folders, client.list, HashiVaultAsyncOperation.list, _list, cache_method='list')
+            return [result['data']['keys'] for result in results]
+
+        def _matches(base, path, patterns):
+            relative = path[len(base) + 1:] if base else path
+            return any(fnmatchcase(relative, pattern) for pattern in patterns)
+
+        for term in terms:
+            base = term.strip('/')
+            paths = self.list_tree(_list_folders, base, max_depth=max_depth, skip=lambda path: _matches(base, path, exclude))
+            ret.append([path for path in paths if not _matches(base, path, exclude) and (not include or _matches(base, path, include))])
 
         return ret
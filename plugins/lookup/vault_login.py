@@ -34,8 +34,12 @@ DOCUMENTATION = """
   extends_documentation_fragment:
     - community.hashi_vault.connection
     - community.hashi_vault.connection.plugins
+    - community.hashi_vault.broker
+    - community.hashi_vault.broker.plugins
     - community.hashi_vault.auth
     - community.hashi_vault.auth.plugins
+    - community.hashi_vault.stats.plugins
+    - community.hashi_vault.trace.plugins
   options:
     _terms:
       description: This is unused and any terms supplied will be ignored.
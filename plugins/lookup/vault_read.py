@@ -23,8 +23,20 @@ DOCUMENTATION = """
   extends_documentation_fragment:
     - community.hashi_vault.connection
     - community.hashi_vault.connection.plugins
+    - community.hashi_vault.broker
+    - community.hashi_vault.broker.plugins
     - community.hashi_vault.auth
     - community.hashi_vault.auth.plugins
+    - community.hashi_vault.stats.plugins
+    - community.hashi_vault.trace.plugins
+    - community.hashi_vault.token_cache
+    - community.hashi_vault.token_cache.plugins
+    - community.hashi_vault.concurrency
+    - community.hashi_vault.concurrency.plugins
+    - community.hashi_vault.concurrency.engine
+    - community.hashi_vault.concurrency.engine_plugins
+    - community.hashi_vault.cache
+    - community.hashi_vault.cache.plugins
   options:
     _terms:
       description: Vault path(s) to be read.
@@ -86,6 +98,7 @@ from ansible.utils.display import Display
 
 from ansible_collections.community.hashi_vault.plugins.plugin_utils._hashi_vault_lookup_base import HashiVaultLookupBase
 from ansible_collections.community.hashi_vault.plugins.module_utils._hashi_vault_common import HashiVaultValueError
+from ansible_collections.community.hashi_vault.plugins.module_utils._async_engine import HashiVaultAsyncOperation
 
 display = Display()
 
@@ -109,15 +122,17 @@ class LookupModule(HashiVaultLookupBase):
         except (NotImplementedError, HashiVaultValueError) as e:
             raise AnsibleError(e)
 
-        for term in terms:
+        def _read(term, get_result):
             try:
-                data = client.read(term)
+                data = get_result()
             except hvac_exceptions.Forbidden:
                 raise AnsibleError("Forbidden: Permission Denied to path '%s'." % term)
 
             if data is None:
                 raise AnsibleError("The path '%s' doesn't seem to exist." % term)
 
-            ret.append(data)
+            return data
+
+        ret.extend(self.map_requests(client, terms, client.read, HashiVaultAsyncOperation.read, _read, cache_method='read'))
 
         return ret
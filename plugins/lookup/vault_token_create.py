@@ -33,8 +33,14 @@ DOCUMENTATION = """
   extends_documentation_fragment:
     - community.hashi_vault.connection
     - community.hashi_vault.connection.plugins
+    - community.hashi_vault.broker
+    - community.hashi_vault.broker.plugins
     - community.hashi_vault.auth
     - community.hashi_vault.auth.plugins
+    - community.hashi_vault.stats.plugins
+    - community.hashi_vault.trace.plugins
+    - community.hashi_vault.token_cache
+    - community.hashi_vault.token_cache.plugins
     - community.hashi_vault.token_create
     - community.hashi_vault.wrapping
     - community.hashi_vault.wrapping.plugins
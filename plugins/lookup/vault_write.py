@@ -33,10 +33,20 @@ DOCUMENTATION = """
   extends_documentation_fragment:
     - community.hashi_vault.connection
     - community.hashi_vault.connection.plugins
+    - community.hashi_vault.broker
+    - community.hashi_vault.broker.plugins
     - community.hashi_vault.auth
     - community.hashi_vault.auth.plugins
+    - community.hashi_vault.stats.plugins
+    - community.hashi_vault.trace.plugins
+    - community.hashi_vault.token_cache
+    - community.hashi_vault.token_cache.plugins
     - community.hashi_vault.wrapping
     - community.hashi_vault.wrapping.plugins
+    - community.hashi_vault.concurrency
+    - community.hashi_vault.concurrency.plugins
+    - community.hashi_vault.concurrency.engine
+    - community.hashi_vault.concurrency.engine_plugins
   options:
     _terms:
       description: Vault path(s) to be written to.
@@ -124,6 +134,8 @@ from ansible.utils.display import Display
 
 from ..plugin_utils._hashi_vault_lookup_base import HashiVaultLookupBase
 from ..module_utils._hashi_vault_common import HashiVaultValueError
+from ..module_utils._async_engine import HashiVaultAsyncOperation
+from ..module_utils._json_adapter import HashiVaultJSONAdapter
 
 display = Display()
 
@@ -150,18 +162,21 @@ class LookupModule(HashiVaultLookupBase):
         except (NotImplementedError, HashiVaultValueError) as e:
             raise AnsibleError(e) from e
 
-        for term in terms:
+        def _fetch(term):
             try:
-                try:
-                    # TODO: write_data will eventually turn back into write
-                    # see: https://github.com/hvac/hvac/issues/1034
-                    response = client.write_data(path=term, wrap_ttl=wrap_ttl, data=data)
-                except AttributeError as e:
-                    # https://github.com/ansible-collections/community.hashi_vault/issues/389
-                    if "path" in data or "wrap_ttl" in data:
-                        raise AnsibleError("To use 'path' or 'wrap_ttl' as data keys, use hvac >= 1.2") from e
-                    else:
-                        response = client.write(path=term, wrap_ttl=wrap_ttl, **data)
+                # TODO: write_data will eventually turn back into write
+                # see: https://github.com/hvac/hvac/issues/1034
+                return client.write_data(path=term, wrap_ttl=wrap_ttl, data=data)
+            except AttributeError as e:
+                # https://github.com/ansible-collections/community.hashi_vault/issues/389
+                if "path" in data or "wrap_ttl" in data:
+                    raise AnsibleError("To use 'path' or 'wrap_ttl' as data keys, use hvac >= 1.2") from e
+                else:
+                    return client.write(path=term, wrap_ttl=wrap_ttl, **data)
+
+        def _write(term, get_result):
+            try:
+                response = get_result()
             except hvac_exceptions.Forbidden as e:
                 raise AnsibleError("Forbidden: Permission Denied to path '%s'." % term) from e
             except hvac_exceptions.InvalidPath as e:
@@ -170,20 +185,17 @@ class LookupModule(HashiVaultLookupBase):
                 raise AnsibleError("Internal Server Error: %s" % str(e)) from e
 
             # https://github.com/hvac/hvac/issues/797
-            # HVAC returns a raw response object when the body is not JSON.
-            # That includes 204 responses, which are successful with no body.
-            # So we will try to detect that and a act accordingly.
-            # A better way may be to implement our own adapter for this
-            # collection, but it's a little premature to do that.
-            if hasattr(response, 'json') and callable(response.json):
-                if response.status_code == 204:
-                    output = {}
-                else:
-                    display.warning('Vault returned status code %i and an unparsable body.' % response.status_code)
-                    output = response.content
-            else:
-                output = response
+            # HashiVaultJSONAdapter returns 204 responses (successful with no body) as an empty dict,
+            # but the raw response object is still returned when a body is not JSON.
+            output, unparsable = HashiVaultJSONAdapter.get_data(response)
+            if unparsable:
+                display.warning('Vault returned status code %i and an unparsable body.' % response.status_code)
+
+            return output
+
+        def _operation(term):
+            return HashiVaultAsyncOperation.write(term, data=data, wrap_ttl=wrap_ttl)
 
-            ret.append(output)
+        ret.extend(self.map_requests(client, terms, _fetch, _operation, _write))
 
         return ret
@@ -0,0 +1,343 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Ansible Project
+# Simplified BSD License (see LICENSES/BSD-2-Clause.txt or https://opensource.org/licenses/BSD-2-Clause)
+# SPDX-License-Identifier: BSD-2-Clause
+
+'''Python versions supported: >=3.8'''
+
+# FOR INTERNAL COLLECTION USE ONLY
+# The interfaces in this file are meant for use within the community.hashi_vault collection
+# and may not remain stable to outside uses. Changes may be made in ANY release, even a bugfix release.
+# See also: https://github.com/ansible/community/issues/539#issuecomment-780839686
+# Please open an issue if you have questions about this.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import asyncio
+import json
+import random
+import time
+
+from email.utils import parsedate_to_datetime
+from importlib.util import find_spec
+
+from ansible_collections.community.hashi_vault.plugins.module_utils._hashi_vault_common import HashiVaultValueError
+from ansible_collections.community.hashi_vault.plugins.module_utils._ssl_context import HashiVaultSSLContextCache
+from ansible_collections.community.hashi_vault.plugins.module_utils._unix_socket import HashiVaultUnixSocketAdapter
+
+# aiohttp takes a noticeable time to import, so it's only imported when a HashiVaultAsyncEngine is created
+HAS_AIOHTTP = find_spec('aiohttp') is not None
+aiohttp = None
+
+
+def _import_aiohttp():
+    global aiohttp
+
+    if aiohttp is None:
+        import aiohttp
+
+
+class HashiVaultAsyncOperation():
+    '''
+    A request for HashiVaultAsyncEngine to send
+
+    params are added to the query string. A read or list of a path that doesn't exist returns None, like hvac's client.read(),
+    unless raise_on_missing is True, when it raises InvalidPath, like the methods of hvac's secrets engines.
+    '''
+
+    def __init__(self, method, path, data=None, wrap_ttl=None, params=None, raise_on_missing=False):
+        self.method = method
+        self.path = path
+        self.data = data
+        self.wrap_ttl = wrap_ttl
+        self.params = params
+        self.raise_on_missing = raise_on_missing
+
+    @classmethod
+    def read(cls, path, params=None, raise_on_missing=False):
+        return cls('GET', path, params=params, raise_on_missing=raise_on_missing)
+
+    @classmethod
+    def list(cls, path):
+        return cls('LIST', path)
+
+    @classmethod
+    def write(cls, path, data=None, wrap_ttl=None):
+        return cls('POST', path, data, wrap_ttl)
+
+    def __repr__(self):
+        return 'HashiVaultAsyncOperation(%r, %r)' % (self.method, self.path)
+
+
+class HashiVaultAsyncEngine():
+    '''
+    Sends a batch of requests to Vault with bounded concurrency, on one asyncio event loop.
+
+    Requests are sent through at most max_concurrency connections, which are kept open for the whole batch.
+    Results match those of the hvac client: a read or list returns the response data as a dict,
+    or None if the path doesn't exist, and a write returns the response data, or None if there is none.
+    Errors are raised as the same hvac exceptions (Forbidden, InvalidPath, and so on).
+
+    Retries follow the processed retries connection option, and retry_deadline, with the same defaults;
+    total, backoff_factor, backoff_max, full_jitter, status_forcelist, allowed_methods, and respect_retry_after_header are honored.
+    As with urllib3, a 413, 429, or 503 response with a Retry-After header is retried even if its status isn't in status_forcelist.
+
+    Requests all go to the one url. It doesn't support the multiple addresses, broker, or circuit breaker of an hvac client,
+    so callers must not use it when those are set.
+
+    If stats is a HashiVaultRequestStats, each request that gets a response is recorded in it.
+    Likewise, if tracer is a HashiVaultTracer, each request that gets a response is traced as a span, with its failed attempts.
+    '''
+
+    # honored the same way urllib3 does by default
+    RETRY_AFTER_STATUSES = frozenset([413, 429, 503])
+
+    def __init__(
+        self, url, token=None, namespace=None, verify=True, timeout=None, proxies=None,
+        retries=None, retry_deadline=None, max_concurrency=10, on_retry=None, stats=None, tracer=None,
+    ):
+        if not HAS_AIOHTTP:
+            raise HashiVaultValueError("The aiohttp Python library is required for the async concurrency engine.")
+
+        try:
+            _import_aiohttp()
+        except ImportError as e:
+            raise HashiVaultValueError("The aiohttp Python library is required for the async concurrency engine, but it could not be imported: %s" % e)
+
+        if max_concurrency < 1:
+            raise HashiVaultValueError("max_concurrency must be 1 or greater, got: %r" % max_concurrency)
+
+        self.url = url.rstrip('/')
+        self.token = token
+        self.namespace = namespace
+        self.verify = verify
+        self.timeout = timeout
+        self.proxies = proxies or {}
+        self.retries = retries or {}
+        self.retry_deadline = retry_deadline
+        self.max_concurrency = max_concurrency
+        self.on_retry = on_retry
+        self.stats = stats
+        self.tracer = tracer
+
+    @classmethod
+    def from_client(cls, client, client_args, **kwargs):
+        '''
+        returns an engine that sends requests to the same address, with the same token and namespace, as an hvac client
+
+        client_args are the kwargs the client was created with, from HashiVaultConnectionOptions.get_hvac_connection_options(),
+        for the verify, timeout, and proxies settings.
+        '''
+        return cls(
+            url=client.url,
+            token=client.token,
+            namespace=client.adapter.namespace,
+            verify=client_args.get('verify', True),
+            timeout=client_args.get('timeout'),
+            proxies=client_args.get('proxies'),
+            **kwargs
+        )
+
+    def _get_ssl(self):
+        if self.verify is False:
+            return False
+        if isinstance(self.verify, str):
+            return HashiVaultSSLContextCache.get(self.verify)
+        return None
+
+    def _get_connector(self):
+        # a unix socket URL from HashiVaultUnixSocketAdapter is sent to the socket, with a placeholder host
+        if self.url.startswith(HashiVaultUnixSocketAdapter.SCHEME + '://'):
+            return aiohttp.UnixConnector(path=HashiVaultUnixSocketAdapter.get_socket_path(self.url), limit=self.max_concurrency), 'http://localhost'
+
+        kwargs = dict(limit=self.max_concurrency)
+        ssl_option = self._get_ssl()
+        if ssl_option is not None:
+            kwargs['ssl'] = ssl_option
+
+        return aiohttp.TCPConnector(**kwargs), self.url
+
+    def _get_headers(self):
+        headers = {'X-Vault-Request': 'true'}
+        if self.token:
+            headers['X-Vault-Token'] = self.token
+        if self.namespace:
+            headers['X-Vault-Namespace'] = self.namespace
+        return headers
+
+    def _can_retry(self, method):
+        allowed = self.retries.get('allowed_methods', self.retries.get('method_whitelist'))
+        return allowed is None or method in allowed
+
+    def _get_backoff(self, failures):
+        backoff = self.retries.get('backoff_factor', 0) * (2 ** (failures - 1))
+
+        backoff_max = self.retries.get('backoff_max')
+        if backoff_max is not None:
+            backoff = min(backoff, backoff_max)
+
+        if self.retries.get('full_jitter'):
+            backoff = random.uniform(0, backoff)
+
+        return max(0, backoff)
+
+    @staticmethod
+    def _get_retry_after(headers):
+        value = headers.get('Retry-After')
+        if value is None:
+            return None
+
+        try:
+            return max(0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            return max(0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _raise_for_error(method, url, status, text):
+        # mirrors hvac's own adapter, so errors are the same as from a client
+        from hvac import utils as hvac_utils
+
+        errors = parsed = None
+        try:
+            parsed = json.loads(text)
+            errors = parsed.get('errors')
+        except (AttributeError, ValueError):
+            pass
+
+        if errors is None:
+            errors = text
+
+        hvac_utils.raise_for_error(method, url, status, None, errors=errors, text=text, json=parsed)
+
+    async def _send(self, session, base_url, operation):
+        method = operation.method
+        path = operation.path.lstrip('/')
+        while '//' in path:
+            path = path.replace('//', '/')
+
+        url = '%s/v1/%s' % (base_url, path)
+        proxy = self.proxies.get(url.split('://', 1)[0])
+        headers = {'X-Vault-Wrap-TTL': str(operation.wrap_ttl)} if operation.wrap_ttl else None
+
+        total = self.retries.get('total', 0) or 0
+        status_forcelist = self.retries.get('status_forcelist') or ()
+        can_retry = self._can_retry(method)
+        respect_retry_after = self.retries.get('respect_retry_after_header', True)
+
+        tries = failures = 0
+        deadline_at = None
+        started = time.monotonic()
+        size = 0
+
+        # (start, end, status, error) of each failed attempt, for the tracer
+        attempts = []
+        attempt_start = time.time_ns()
+
+        while True:
+            retry_after = None
+            tries += 1
+            try:
+                async with session.request(method, url, params=operation.params, json=operation.data, headers=headers, proxy=proxy) as response:
+                    status = response.status
+                    body = await response.read()
+                    size = len(body)
+                    text = body.decode(response.get_encoding(), 'replace')
+                    if respect_retry_after and status in self.RETRY_AFTER_STATUSES and response.headers.get('Retry-After'):
+                        retry_after = self._get_retry_after(response.headers)
+                error = None
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                status = text = None
+                error = e
+
+            # like urllib3, a Retry-After header makes its statuses retryable on their own
+            should_retry = error is not None or status in status_forcelist or retry_after is not None
+            if not should_retry:
+                break
+
+            if deadline_at is None and self.retry_deadline is not None:
+                deadline_at = time.monotonic() + self.retry_deadline
+
+            remaining_time = None if deadline_at is None else deadline_at - time.monotonic()
+
+            failures += 1
+            if not can_retry or failures > total or (remaining_time is not None and remaining_time <= 0):
+                if error is not None:
+                    raise error
+                break
+
+            if self.on_retry is not None:
+                self.on_retry(total - failures + 1)
+
+            attempts.append((attempt_start, time.time_ns(), status, error))
+
+            delay = retry_after if retry_after else self._get_backoff(failures)
+            if remaining_time is not None:
+                delay = min(delay, remaining_time)
+
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            attempt_start = time.time_ns()
+
+        if self.stats is not None:
+            self.stats.record(method, url, status, time.monotonic() - started, retries=tries - 1, size=size)
+
+        if self.tracer is not None:
+            self.tracer.record_request(method, url, status, attempts[0][0] if attempts else attempt_start, time.time_ns(), size=size, attempts=attempts)
+
+        if status == 404 and method in ('GET', 'LIST') and not operation.raise_on_missing:
+            # like hvac's client.read() and client.list()
+            return None
+
+        if status >= 400:
+            self._raise_for_error(method, url, status, text)
+
+        if not text:
+            return None
+
+        try:
+            return json.loads(text)
+        except ValueError:
+            return None
+
+    async def run_async(self, operations, return_exceptions=False):
+        '''
+        sends the requests for operations, returning their results in the same order
+
+        If return_exceptions is True, the exception for each failed operation is returned in place of its result.
+        Otherwise the exception for the earliest failed operation is raised, and operations that haven't finished are cancelled.
+        '''
+        connector, base_url = self._get_connector()
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers=self._get_headers()) as session:
+            async def _bounded(operation):
+                async with semaphore:
+                    return await self._send(session, base_url, operation)
+
+            tasks = [asyncio.ensure_future(_bounded(operation)) for operation in operations]
+
+            if return_exceptions:
+                return await asyncio.gather(*tasks, return_exceptions=True)
+
+            try:
+                return [await task for task in tasks]
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+    def run(self, operations, return_exceptions=False):
+        '''runs run_async() on a new event loop, and returns its results'''
+        operations = list(operations)
+        if not operations:
+            return []
+
+        return asyncio.run(self.run_async(operations, return_exceptions=return_exceptions))
@@ -22,6 +22,7 @@ class HashiVaultAuthMethodApprole(HashiVaultAuthMethodBase):
 
     NAME = 'approle'
     OPTIONS = ['role_id', 'secret_id', 'mount_point']
+    TOKEN_CACHE_SECRETS = ('secret_id',)
 
     def __init__(self, option_adapter, warning_callback, deprecate_callback):
         super(HashiVaultAuthMethodApprole, self).__init__(option_adapter, warning_callback, deprecate_callback)
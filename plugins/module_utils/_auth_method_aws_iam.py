@@ -33,6 +33,7 @@ class HashiVaultAuthMethodAwsIam(HashiVaultAuthMethodBase):
         'aws_iam_server_id',
         'role_id',
     ]
+    TOKEN_CACHE_SECRETS = ('aws_secret_key',)
 
     def __init__(self, option_adapter, warning_callback, deprecate_callback):
         super(HashiVaultAuthMethodAwsIam, self).__init__(option_adapter, warning_callback, deprecate_callback)
@@ -86,6 +87,18 @@ class HashiVaultAuthMethodAwsIam(HashiVaultAuthMethodBase):
 
         self._auth_aws_iam_login_params = params
 
+    def get_token_cache_credentials(self):
+        # the credentials may come from a profile, the environment, or an instance role, rather than the options
+        credentials = super(HashiVaultAuthMethodAwsIam, self).get_token_cache_credentials()
+        params = self._auth_aws_iam_login_params
+        credentials.update(
+            aws_access_key=params['access_key'],
+            aws_secret_key=params['secret_key'],
+            aws_security_token=params.get('session_token'),
+        )
+
+        return credentials
+
     def authenticate(self, client, use_token=True):
         params = self._auth_aws_iam_login_params
         try:
@@ -33,6 +33,7 @@ class HashiVaultAuthMethodAzure(HashiVaultAuthMethodBase):
         'azure_client_secret',
         'azure_resource',
     ]
+    TOKEN_CACHE_SECRETS = ('jwt',)
 
     def __init__(self, option_adapter, warning_callback, deprecate_callback):
         super(HashiVaultAuthMethodAzure, self).__init__(
@@ -99,6 +100,13 @@ class HashiVaultAuthMethodAzure(HashiVaultAuthMethodBase):
 
         self._auth_azure_login_params = params
 
+    def get_token_cache_credentials(self):
+        # without a jwt option, the jwt comes from a service principal or managed identity
+        credentials = super(HashiVaultAuthMethodAzure, self).get_token_cache_credentials()
+        credentials['jwt'] = self._auth_azure_login_params['jwt']
+
+        return credentials
+
     def authenticate(self, client, use_token=True):
         params = self._auth_azure_login_params
         response = client.auth.azure.login(use_token=use_token, **params)
@@ -6,7 +6,7 @@
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
-from ansible_collections.community.hashi_vault.plugins.module_utils._hashi_vault_common import HashiVaultAuthMethodBase
+from ansible_collections.community.hashi_vault.plugins.module_utils._hashi_vault_common import HashiVaultAuthMethodBase, HashiVaultValueError
 
 
 class HashiVaultAuthMethodCert(HashiVaultAuthMethodBase):
@@ -14,6 +14,7 @@ class HashiVaultAuthMethodCert(HashiVaultAuthMethodBase):
 
     NAME = "cert"
     OPTIONS = ["cert_auth_public_key", "cert_auth_private_key", "mount_point", "role_id"]
+    TOKEN_CACHE_SECRETS = ("cert_auth_private_key",)
 
     def __init__(self, option_adapter, warning_callback, deprecate_callback):
         super(HashiVaultAuthMethodCert, self).__init__(option_adapter, warning_callback, deprecate_callback)
@@ -21,6 +22,20 @@ class HashiVaultAuthMethodCert(HashiVaultAuthMethodBase):
     def validate(self):
         self.validate_by_required_fields("cert_auth_public_key", "cert_auth_private_key")
 
+    def get_token_cache_credentials(self):
+        # the options are only the paths of the certificate and key, so the login is identified by what's in the files
+        credentials = super(HashiVaultAuthMethodCert, self).get_token_cache_credentials()
+
+        for option in ("cert_auth_public_key", "cert_auth_private_key"):
+            path = credentials[option]
+            try:
+                with open(path, "r") as f:
+                    credentials[option] = dict(path=path, contents=f.read())
+            except (IOError, OSError) as e:
+                raise HashiVaultValueError("Unable to read %s '%s': %s" % (option, path, e))
+
+        return credentials
+
     def authenticate(self, client, use_token=True):
         options = self._options.get_filled_options(*self.OPTIONS)
 
@@ -22,6 +22,7 @@ class HashiVaultAuthMethodGcp(HashiVaultAuthMethodBase):
 
     NAME = 'gcp'
     OPTIONS = ['jwt', 'role_id', 'mount_point']
+    TOKEN_CACHE_SECRETS = ('jwt',)
 
     def __init__(self, option_adapter, warning_callback, deprecate_callback):
         super(HashiVaultAuthMethodGcp, self).__init__(option_adapter, warning_callback, deprecate_callback)
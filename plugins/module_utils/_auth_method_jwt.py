@@ -22,6 +22,7 @@ class HashiVaultAuthMethodJwt(HashiVaultAuthMethodBase):
 
     NAME = 'jwt'
     OPTIONS = ['jwt', 'role_id', 'mount_point']
+    TOKEN_CACHE_SECRETS = ('jwt',)
 
     def __init__(self, option_adapter, warning_callback, deprecate_callback):
         super(HashiVaultAuthMethodJwt, self).__init__(option_adapter, warning_callback, deprecate_callback)
@@ -22,6 +22,7 @@ class HashiVaultAuthMethodLdap(HashiVaultAuthMethodBase):
 
     NAME = 'ldap'
     OPTIONS = ['username', 'password', 'mount_point']
+    TOKEN_CACHE_SECRETS = ('password',)
 
     def __init__(self, option_adapter, warning_callback, deprecate_callback):
         super(HashiVaultAuthMethodLdap, self).__init__(option_adapter, warning_callback, deprecate_callback)
@@ -14,17 +14,9 @@
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
-# please keep this list in alphabetical order of auth method name
-from ansible_collections.community.hashi_vault.plugins.module_utils._auth_method_approle import HashiVaultAuthMethodApprole
-from ansible_collections.community.hashi_vault.plugins.module_utils._auth_method_aws_iam import HashiVaultAuthMethodAwsIam
-from ansible_collections.community.hashi_vault.plugins.module_utils._auth_method_azure import HashiVaultAuthMethodAzure
-from ansible_collections.community.hashi_vault.plugins.module_utils._auth_method_cert import HashiVaultAuthMethodCert
-from ansible_collections.community.hashi_vault.plugins.module_utils._auth_method_gcp import HashiVaultAuthMethodGcp
-from ansible_collections.community.hashi_vault.plugins.module_utils._auth_method_jwt import HashiVaultAuthMethodJwt
-from ansible_collections.community.hashi_vault.plugins.module_utils._auth_method_ldap import HashiVaultAuthMethodLdap
-from ansible_collections.community.hashi_vault.plugins.module_utils._auth_method_none import HashiVaultAuthMethodNone
-from ansible_collections.community.hashi_vault.plugins.module_utils._auth_method_token import HashiVaultAuthMethodToken
-from ansible_collections.community.hashi_vault.plugins.module_utils._auth_method_userpass import HashiVaultAuthMethodUserpass
+from ansible_collections.community.hashi_vault.plugins.module_utils._hashi_vault_common import HashiVaultValueError
+from ansible_collections.community.hashi_vault.plugins.module_utils._token_cache import HashiVaultTokenCache
+from ansible_collections.community.hashi_vault.plugins.module_utils._token_cache_file import HashiVaultTokenCacheFile
 
 
 class HashiVaultAuthenticator():
@@ -65,34 +57,67 @@ class HashiVaultAuthenticator():
         cert_auth_public_key=dict(type='path'),
     )
 
+    # these methods don't log in, so there is nothing to cache
+    _UNCACHED_METHODS = frozenset(['none', 'token'])
+
     def __init__(self, option_adapter, warning_callback, deprecate_callback):
         self._options = option_adapter
-        self._selector = {
-            # please keep this list in alphabetical order of auth method name
-            # so that it's easier to scan and see at a glance that a given auth method is present or absent
-            'approle': HashiVaultAuthMethodApprole(option_adapter, warning_callback, deprecate_callback),
-            'aws_iam': HashiVaultAuthMethodAwsIam(option_adapter, warning_callback, deprecate_callback),
-            'azure': HashiVaultAuthMethodAzure(option_adapter, warning_callback, deprecate_callback),
-            'cert': HashiVaultAuthMethodCert(option_adapter, warning_callback, deprecate_callback),
-            'gcp': HashiVaultAuthMethodGcp(option_adapter, warning_callback, deprecate_callback),
-            'jwt': HashiVaultAuthMethodJwt(option_adapter, warning_callback, deprecate_callback),
-            'ldap': HashiVaultAuthMethodLdap(option_adapter, warning_callback, deprecate_callback),
-            'none': HashiVaultAuthMethodNone(option_adapter, warning_callback, deprecate_callback),
-            'token': HashiVaultAuthMethodToken(option_adapter, warning_callback, deprecate_callback),
-            'userpass': HashiVaultAuthMethodUserpass(option_adapter, warning_callback, deprecate_callback),
-        }
+
+        # the auth method objects that have been used, by name; see _get_method_object()
+        self._selector = {}
 
         self.warn = warning_callback
         self.deprecate = deprecate_callback
 
+        # if set to a HashiVaultTracer, each login is traced as a span
+        self.tracer = None
+
+    @staticmethod
+    def _get_method_class(method):
+        '''
+        returns the class of an auth method, importing it the first time, or None if there's no such auth method
+
+        The imports are written out, rather than made from the name, so that Ansible finds them to send with modules.
+        '''
+        # please keep this list in alphabetical order of auth method name
+        # so that it's easier to scan and see at a glance that a given auth method is present or absent
+        if method == 'approle':
+            from ansible_collections.community.hashi_vault.plugins.module_utils._auth_method_approle import HashiVaultAuthMethodApprole as method_class
+        elif method == 'aws_iam':
+            from ansible_collections.community.hashi_vault.plugins.module_utils._auth_method_aws_iam import HashiVaultAuthMethodAwsIam as method_class
+        elif method == 'azure':
+            from ansible_collections.community.hashi_vault.plugins.module_utils._auth_method_azure import HashiVaultAuthMethodAzure as method_class
+        elif method == 'cert':
+            from ansible_collections.community.hashi_vault.plugins.module_utils._auth_method_cert import HashiVaultAuthMethodCert as method_class
+        elif method == 'gcp':
+            from ansible_collections.community.hashi_vault.plugins.module_utils._auth_method_gcp import HashiVaultAuthMethodGcp as method_class
+        elif method == 'jwt':
+            from ansible_collections.community.hashi_vault.plugins.module_utils._auth_method_jwt import HashiVaultAuthMethodJwt as method_class
+        elif method == 'ldap':
+            from ansible_collections.community.hashi_vault.plugins.module_utils._auth_method_ldap import HashiVaultAuthMethodLdap as method_class
+        elif method == 'none':
+            from ansible_collections.community.hashi_vault.plugins.module_utils._auth_method_none import HashiVaultAuthMethodNone as method_class
+        elif method == 'token':
+            from ansible_collections.community.hashi_vault.plugins.module_utils._auth_method_token import HashiVaultAuthMethodToken as method_class
+        elif method == 'userpass':
+            from ansible_collections.community.hashi_vault.plugins.module_utils._auth_method_userpass import HashiVaultAuthMethodUserpass as method_class
+        else:
+            return None
+
+        return method_class
+
     def _get_method_object(self, method=None):
+        '''returns the object of an auth method, which is only created (and its module_utils imported) when it's first used'''
         if method is None:
             method = self._options.get_option('auth_method')
 
-        try:
-            o_method = self._selector[method]
-        except KeyError:
-            raise NotImplementedError("auth method '%s' is not implemented in HashiVaultAuthenticator" % method)
+        o_method = self._selector.get(method)
+        if o_method is None:
+            method_class = self._get_method_class(method)
+            if method_class is None:
+                raise NotImplementedError("auth method '%s' is not implemented in HashiVaultAuthenticator" % method)
+
+            o_method = self._selector[method] = method_class(self._options, self.warn, self.deprecate)
 
         return o_method
 
@@ -102,4 +127,86 @@ class HashiVaultAuthenticator():
 
     def authenticate(self, *args, **kwargs):
         method = self._get_method_object(kwargs.pop('method', None))
-        return method.authenticate(*args, **kwargs)
+
+        if self.tracer is not None:
+            with self.tracer.span('login', {'vault.auth.method': method.NAME}):
+                return self._authenticate(method, *args, **kwargs)
+
+        return self._authenticate(method, *args, **kwargs)
+
+    def _authenticate(self, method, *args, **kwargs):
+        if not self._options.get_option_default('token_cache', False) or method.NAME in self._UNCACHED_METHODS:
+            return method.authenticate(*args, **kwargs)
+
+        return self._authenticate_cached(method, *args, **kwargs)
+
+    def _get_token_cache_login(self, method, client):
+        credentials = method.get_token_cache_credentials()
+        if 'mount_point' not in credentials:
+            credentials['mount_point'] = self._options.get_option_default('mount_point')
+
+        return (method.NAME, client.url, client.adapter.namespace, credentials)
+
+    def _get_token_cache_file(self):
+        path = self._options.get_option_default('token_cache_path')
+        if not path:
+            return None
+
+        return HashiVaultTokenCacheFile(path)
+
+    def _validate_cached_token(self, client, response):
+        '''checks with Vault that a token from the token cache file is still valid, since it may have been revoked'''
+        from hvac import exceptions
+
+        token = client.token
+        client.token = response['auth']['client_token']
+        try:
+            client.auth.token.lookup_self()
+        except (exceptions.Forbidden, exceptions.InvalidPath, exceptions.InvalidRequest):
+            return False
+        finally:
+            client.token = token
+
+        return True
+
+    def _authenticate_cached(self, method, client, use_token=True, **kwargs):
+        '''authenticates with a cached login response if there is a usable one, otherwise logs in and caches the response'''
+        login = self._get_token_cache_login(method, client)
+        key = HashiVaultTokenCache.make_key(*login)
+        cache_file = self._get_token_cache_file()
+
+        # the file is only as safe as the key its entries are encrypted with, so that has to come from a secret
+        if cache_file is not None and not method.has_token_cache_secret(login[3]):
+            if not method.TOKEN_CACHE_SECRETS:
+                raise HashiVaultValueError(
+                    "token_cache_path can't be used with the %s auth method, which has no secret to encrypt cached tokens with."
+                    % method.NAME
+                )
+
+            raise HashiVaultValueError(
+                "token_cache_path can't be used with the %s auth method without %s, which cached tokens are encrypted with."
+                % (method.NAME, ' or '.join(method.TOKEN_CACHE_SECRETS))
+            )
+
+        response = HashiVaultTokenCache.get(key)
+
+        if response is None and cache_file is not None:
+            response, expires = cache_file.get(login)
+            if response is not None:
+                if self._validate_cached_token(client, response):
+                    HashiVaultTokenCache.set(key, response, expires)
+                else:
+                    cache_file.remove(login)
+                    response = None
+
+        if response is None:
+            response = method.authenticate(client, use_token=use_token, **kwargs)
+            expires = HashiVaultTokenCache.get_expiry(response)
+            if expires is not None:
+                HashiVaultTokenCache.set(key, response, expires)
+                if cache_file is not None:
+                    cache_file.set(login, response, expires)
+        elif use_token:
+            client.token = response['auth']['client_token']
+
+        return response
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Ansible Project
+# Simplified BSD License (see LICENSES/BSD-2-Clause.txt or https://opensource.org/licenses/BSD-2-Clause)
+# SPDX-License-Identifier: BSD-2-Clause
+
+'''Python versions supported: >=3.8'''
+
+# FOR INTERNAL COLLECTION USE ONLY
+# The interfaces in this file are meant for use within the community.hashi_vault collection
+# and may not remain stable to outside uses. Changes may be made in ANY release, even a bugfix release.
+# See also: https://github.com/ansible/community/issues/539#issuecomment-780839686
+# Please open an issue if you have questions about this.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import contextlib
+import fcntl
+import hashlib
+import json
+import math
+import os
+import threading
+import time
+
+try:
+    from requests.exceptions import ConnectionError as RequestsConnectionError, Timeout as RequestsTimeout
+    from requests.utils import urlparse
+except ImportError:
+    # requests is a dependency of hvac, which is checked for by HashiVaultHelper
+    RequestsConnectionError = RequestsTimeout = Exception
+
+from ansible_collections.community.hashi_vault.plugins.module_utils._private_directory import get_private_directory
+from ansible_collections.community.hashi_vault.plugins.module_utils._ssl_context import HashiVaultHTTPAdapter
+
+
+class HashiVaultCircuitOpenError(RequestsConnectionError):
+    '''raised instead of sending a request to a Vault address whose circuit breaker is open'''
+    pass
+
+
+class HashiVaultCircuitBreaker():
+    '''
+    A circuit breaker for one Vault address.
+
+    After threshold consecutive failed requests the breaker opens, and requests fail immediately for cooldown seconds.
+    After that, one request is let through as a probe: if it succeeds the breaker closes, and if it fails it opens again.
+
+    The state of each address is shared by everything in the process. With shared=True it's kept in a file instead,
+    so that it's also shared with other processes of the same user.
+    '''
+
+    _lock = threading.Lock()
+    _states = {}
+    _pid = None
+
+    _clock = time.time
+
+    def __init__(self, address, threshold, cooldown=30, shared=False):
+        self.address = address
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.shared = shared
+
+    @staticmethod
+    def get_address(url):
+        '''returns the address part (scheme, host, and port) of a URL'''
+        parsed = urlparse(url)
+        return '%s://%s' % (parsed.scheme, parsed.netloc)
+
+    @staticmethod
+    def _new_state():
+        return dict(failures=0, opened_at=None, probe_at=None)
+
+    def get_state_path(self):
+        '''returns the path of the file for a shared state, in a directory only the current user can use'''
+        name = hashlib.sha256(self.address.encode('utf-8')).hexdigest()[:32]
+        return os.path.join(get_private_directory(), 'circuit-%s.json' % name)
+
+    @contextlib.contextmanager
+    def _state(self):
+        '''yields the state of the address, which is saved when the block exits'''
+        if not self.shared:
+            cls = type(self)
+            with cls._lock:
+                if cls._pid != os.getpid():
+                    cls._states = {}
+                    cls._pid = os.getpid()
+
+                yield cls._states.setdefault(self.address, self._new_state())
+            return
+
+        fd = os.open(self.get_state_path(), os.O_RDWR | os.O_CREAT, 0o600)
+        with os.fdopen(fd, 'r+') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                try:
+                    state = json.load(f)
+                except ValueError:
+                    state = self._new_state()
+
+                yield state
+
+                f.seek(0)
+                f.truncate()
+                json.dump(state, f)
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def is_open(self):
+        '''whether requests are currently being refused'''
+        with self._state() as state:
+            return state['opened_at'] is not None and self._clock() - state['opened_at'] < self.cooldown
+
+    def before_request(self):
+        '''raises HashiVaultCircuitOpenError if a request should not be sent'''
+        with self._state() as state:
+            if state['opened_at'] is None:
+                return
+
+            now = self._clock()
+            remaining = state['opened_at'] + self.cooldown - now
+
+            # once the cooldown is over, one request at a time is let through as a probe,
+            # with another let through if a probe doesn't finish within a cooldown (for example because its process died)
+            if remaining <= 0 and (state['probe_at'] is None or now - state['probe_at'] >= self.cooldown):
+                state['probe_at'] = now
+                return
+
+        raise HashiVaultCircuitOpenError(
+            "The circuit breaker for %s is open after %i consecutive failures, requests are not being sent%s."
+            % (self.address, state['failures'], ' for another %i seconds' % math.ceil(remaining) if remaining > 0 else ' while a probe request is in progress')
+        )
+
+    def record_success(self):
+        with self._state() as state:
+            state.update(self._new_state())
+
+    def record_failure(self):
+        with self._state() as state:
+            state['failures'] += 1
+            state['probe_at'] = None
+
+            if state['opened_at'] is not None or state['failures'] >= self.threshold:
+                state['opened_at'] = self._clock()
+
+
+class HashiVaultCircuitBreakerAdapter(HashiVaultHTTPAdapter):
+    '''A HashiVaultHTTPAdapter that sends each request through the circuit breaker of its Vault address'''
+
+    # responses that mean Vault, or something in front of it, is unavailable
+    FAILURE_STATUSES = frozenset([502, 503, 504])
+
+    def __init__(self, circuit_breaker, **kwargs):
+        self.circuit_breaker = circuit_breaker
+        super(HashiVaultCircuitBreakerAdapter, self).__init__(**kwargs)
+
+    def get_circuit_breaker(self, url):
+        return HashiVaultCircuitBreaker(HashiVaultCircuitBreaker.get_address(url), **self.circuit_breaker)
+
+    def send(self, request, **kwargs):
+        breaker = self.get_circuit_breaker(request.url)
+        breaker.before_request()
+
+        try:
+            response = super(HashiVaultCircuitBreakerAdapter, self).send(request, **kwargs)
+        except (RequestsConnectionError, RequestsTimeout):
+            breaker.record_failure()
+            raise
+
+        if response.status_code in self.FAILURE_STATUSES:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+
+        return response
@@ -15,6 +15,8 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 import os
+import random
+import time
 
 from ansible.module_utils.common.text.converters import to_text
 
@@ -22,17 +24,29 @@ from ansible.module_utils.common.validation import (
     check_type_dict,
     check_type_str,
     check_type_bool,
+    check_type_float,
     check_type_int,
 )
 
-from ansible_collections.community.hashi_vault.plugins.module_utils._hashi_vault_common import HashiVaultOptionGroupBase
+from ansible_collections.community.hashi_vault.plugins.module_utils._hashi_vault_common import (
+    HashiVaultOptionGroupBase,
+    HashiVaultSessionPool,
+)
+
+from ansible_collections.community.hashi_vault.plugins.module_utils._circuit_breaker import HashiVaultCircuitBreakerAdapter
+from ansible_collections.community.hashi_vault.plugins.module_utils._ha_routing import HashiVaultHAAdapter, HashiVaultHARouter
+from ansible_collections.community.hashi_vault.plugins.module_utils._ssl_context import HashiVaultHTTPAdapter
+from ansible_collections.community.hashi_vault.plugins.module_utils._tracing import HashiVaultTracer
+from ansible_collections.community.hashi_vault.plugins.module_utils._unix_socket import (
+    HashiVaultUnixSocketAdapter,
+    HashiVaultUnixSocketCircuitBreakerAdapter,
+)
 
 # we implement retries via the urllib3 Retry class
 # https://github.com/ansible-collections/community.hashi_vault/issues/58
 HAS_RETRIES = False
 try:
     from requests import Session
-    from requests.adapters import HTTPAdapter
     try:
         # try for a standalone urllib3
         import urllib3
@@ -51,7 +65,9 @@ except ImportError:
 class HashiVaultConnectionOptions(HashiVaultOptionGroupBase):
     '''HashiVault option group class for connection options'''
 
-    OPTIONS = ['url', 'proxies', 'ca_cert', 'validate_certs', 'namespace', 'timeout', 'retries', 'retry_action']
+    OPTIONS = [
+        'url', 'proxies', 'ca_cert', 'validate_certs', 'namespace', 'timeout', 'retries', 'retry_action', 'retry_deadline', 'circuit_breaker',
+    ]
 
     ARGSPEC = dict(
         url=dict(type='str', default=None),
@@ -62,6 +78,8 @@ class HashiVaultConnectionOptions(HashiVaultOptionGroupBase):
         timeout=dict(type='int'),
         retries=dict(type='raw'),
         retry_action=dict(type='str', choices=['ignore', 'warn'], default='warn'),
+        retry_deadline=dict(type='float'),
+        circuit_breaker=dict(type='raw'),
     )
 
     _LATE_BINDING_ENV_VAR_OPTIONS = {
@@ -89,6 +107,16 @@ class HashiVaultConnectionOptions(HashiVaultOptionGroupBase):
             "allowed_methods" if HAS_RETRIES and hasattr(urllib3.util.Retry.DEFAULT, "allowed_methods") else "method_whitelist"
         ): None,  # None allows retries on all methods, including those which may not be considered idempotent, like POST
         'backoff_factor': 0.3,
+        # Backoff times are capped, and each one is picked at random between zero and its exponential value ("full jitter"),
+        # so that many workers retrying at the same time don't all hit a recovering Vault at the same moments.
+        'backoff_max': 30,
+        'full_jitter': True,
+    }
+
+    _CIRCUIT_BREAKER_DEFAULT_PARAMS = {
+        'threshold': 5,
+        'cooldown': 30,
+        'shared': False,
     }
 
     def __init__(self, option_adapter, retry_callback_generator=None):
@@ -107,8 +135,45 @@ class HashiVaultConnectionOptions(HashiVaultOptionGroupBase):
         hvopts['verify'] = self._conopt_verify
 
         retry_action = hvopts.pop('retry_action')
-        if 'retries' in hvopts:
-            hvopts['session'] = self._get_custom_requests_session(new_callback=self._retry_callback_generator(retry_action), **hvopts.pop('retries'))
+        retry_deadline = hvopts.pop('retry_deadline', None)
+        circuit_breaker = hvopts.pop('circuit_breaker', None)
+
+        # with the addresses of several nodes, hvac is given the first one, and the session routes each request to a node
+        nodes = HashiVaultHARouter.parse_urls(hvopts.get('url'))
+        if len(nodes) > 1:
+            hvopts['url'] = nodes[0]
+        else:
+            nodes = None
+
+        # a unix socket URL is changed into one that hvac can add paths to, and that only our sessions can send requests to
+        unix_url = HashiVaultUnixSocketAdapter.from_unix_url(hvopts.get('url'))
+        if unix_url is not None:
+            hvopts['url'] = unix_url
+
+        if 'retries' in hvopts or circuit_breaker or nodes or unix_url:
+            retries = hvopts.pop('retries', None)
+            if retries is not None and retry_deadline is not None:
+                retries = dict(retries, deadline=retry_deadline)
+
+            # Sessions with retries, a circuit breaker, or several nodes are pooled separately from the plain sessions pooled by HashiVaultHelper,
+            # since their configuration is part of the session's adapters.
+            # The retry callback of the session that was created first is the one that is kept.
+            key = HashiVaultSessionPool.make_key(
+                url=hvopts.get('url'),
+                nodes=nodes,
+                verify=self._conopt_verify,
+                proxies=hvopts.get('proxies'),
+                retries=retries,
+                retry_action=retry_action,
+                circuit_breaker=circuit_breaker,
+            )
+
+            hvopts['session'] = HashiVaultSessionPool.get_session(
+                key,
+                lambda: self._get_custom_requests_session(
+                    retries=retries, circuit_breaker=circuit_breaker, nodes=nodes, new_callback=self._retry_callback_generator(retry_action)
+                )
+            )
             hvopts['session'].verify = self._conopt_verify
 
         return hvopts
@@ -120,9 +185,38 @@ class HashiVaultConnectionOptions(HashiVaultOptionGroupBase):
         self._boolean_or_cacert()
         self._process_option_proxies()
         self._process_option_retries()
+        self._process_option_circuit_breaker()
+
+    def _get_custom_requests_session(self, retries=None, circuit_breaker=None, nodes=None, new_callback=None):
+        '''
+        returns a requests.Session to pass to hvac, with retries, a circuit breaker, and/or routing between the nodes of a cluster
 
-    def _get_custom_requests_session(self, **retry_kwargs):
-        '''returns a requests.Session to pass to hvac (or None)'''
+        The session can also send requests to unix sockets, with the URLs from HashiVaultUnixSocketAdapter.from_unix_url().
+        '''
+
+        adapter_kwargs = {}
+        if retries is not None:
+            adapter_kwargs['max_retries'] = self._get_retry(new_callback=new_callback, **retries)
+
+        if circuit_breaker:
+            adapter = HashiVaultCircuitBreakerAdapter(circuit_breaker, **adapter_kwargs)
+            unix_adapter = HashiVaultUnixSocketCircuitBreakerAdapter(circuit_breaker, **adapter_kwargs)
+        else:
+            adapter = HashiVaultHTTPAdapter(**adapter_kwargs)
+            unix_adapter = HashiVaultUnixSocketAdapter(**adapter_kwargs)
+
+        if nodes:
+            adapter = HashiVaultHAAdapter(nodes, adapter)
+
+        sess = Session()
+        sess.mount("https://", adapter)
+        sess.mount("http://", adapter)
+        sess.mount(HashiVaultUnixSocketAdapter.SCHEME + "://", unix_adapter)
+
+        return sess
+
+    def _get_retry(self, **retry_kwargs):
+        '''returns a Retry instance for the given retries settings'''
 
         if not HAS_RETRIES:
             # because hvac requires requests which requires urllib3 it's unlikely we'll ever reach this condition.
@@ -131,17 +225,86 @@ class HashiVaultConnectionOptions(HashiVaultOptionGroupBase):
         # This is defined here because Retry may not be defined if its import failed.
         # As mentioned above, that's very unlikely, but it'll fail sanity tests nonetheless if defined with other classes.
         class CallbackRetry(urllib3.util.Retry):
+            '''
+            A Retry that calls a callback on each retry, and adds some options of its own:
+
+            - full_jitter: pick each backoff time at random between zero and its exponential value
+            - backoff_max: the longest backoff time (handled here, since older urllib3 versions don't take it)
+            - deadline: the number of seconds, from the first failed attempt, after which no more retries are made
+
+            Each retry is also recorded with HashiVaultTracer.record_retry(), so it can be traced.
+            '''
             def __init__(self, *args, **kwargs):
                 self._newcb = kwargs.pop('new_callback')
+                self._full_jitter = kwargs.pop('full_jitter', False)
+                self._backoff_cap = kwargs.pop('backoff_max', None)
+                self._deadline = kwargs.pop('deadline', None)
+                self._deadline_at = kwargs.pop('deadline_at', None)
                 super(CallbackRetry, self).__init__(*args, **kwargs)
 
             def new(self, **kwargs):
                 if self._newcb is not None:
                     self._newcb(self)
 
+                HashiVaultTracer.record_retry(kwargs.get('history'))
+
                 kwargs['new_callback'] = self._newcb
+                kwargs['full_jitter'] = self._full_jitter
+                kwargs['backoff_max'] = self._backoff_cap
+                kwargs['deadline'] = self._deadline
+                kwargs['deadline_at'] = self._deadline_at
+
+                # new() is first called when the first attempt fails, so that's when the clock starts
+                if self._deadline is not None and self._deadline_at is None:
+                    kwargs['deadline_at'] = time.monotonic() + self._deadline
+
                 return super(CallbackRetry, self).new(**kwargs)
 
+            def _remaining(self):
+                if self._deadline_at is None:
+                    return None
+
+                return max(0, self._deadline_at - time.monotonic())
+
+            def is_exhausted(self):
+                return super(CallbackRetry, self).is_exhausted() or self._remaining() == 0
+
+            def get_backoff_time(self):
+                # only the consecutive errors count, not redirects
+                consecutive_errors = 0
+                for history in reversed(self.history):
+                    if history.redirect_location is not None:
+                        break
+                    consecutive_errors += 1
+
+                if consecutive_errors < 1:
+                    return 0
+
+                cap = self._backoff_cap if self._backoff_cap is not None else getattr(self, 'DEFAULT_BACKOFF_MAX', 120)
+                backoff = min(cap, self.backoff_factor * (2 ** (consecutive_errors - 1)))
+
+                if self._full_jitter:
+                    backoff = random.uniform(0, backoff)
+
+                return max(0, backoff)
+
+            def sleep(self, response=None):
+                # Retry-After (on 413, 429, and 503 responses) is respected over the backoff time,
+                # but neither of them is allowed to go past the deadline
+                delay = None
+                if self.respect_retry_after_header and response is not None:
+                    delay = self.get_retry_after(response)
+
+                if not delay:
+                    delay = self.get_backoff_time()
+
+                remaining = self._remaining()
+                if remaining is not None:
+                    delay = min(delay, remaining)
+
+                if delay > 0:
+                    time.sleep(delay)
+
         # We don't want the Retry class raising its own exceptions because that will prevent
         # hvac from raising its own on various response codes.
         # We set this here, rather than in the defaults, because if the caller sets their own
@@ -154,14 +317,7 @@ class HashiVaultConnectionOptions(HashiVaultOptionGroupBase):
             # needs urllib 1.15+ https://github.com/urllib3/urllib3/blob/main/CHANGES.rst#115-2016-04-06
             # but we should always have newer ones via requests, via hvac
 
-        retry = CallbackRetry(**retry_kwargs)
-
-        adapter = HTTPAdapter(max_retries=retry)
-        sess = Session()
-        sess.mount("https://", adapter)
-        sess.mount("http://", adapter)
-
-        return sess
+        return CallbackRetry(**retry_kwargs)
 
     def _process_option_retries(self):
         '''check if retries option is int or dict and interpret it appropriately'''
@@ -199,6 +355,49 @@ class HashiVaultConnectionOptions(HashiVaultOptionGroupBase):
 
         self._options.set_option('retries', retries)
 
+    def _process_option_circuit_breaker(self):
+        '''check if circuit_breaker option is int or dict and interpret it appropriately'''
+
+        breaker_opt = self._options.get_option('circuit_breaker')
+
+        if breaker_opt is None:
+            return
+
+        breaker = self._CIRCUIT_BREAKER_DEFAULT_PARAMS.copy()
+
+        try:
+            # on int, open after the specified number of consecutive failures, and use the defaults for everything else
+            # on zero, disable the circuit breaker
+            threshold = check_type_int(breaker_opt)
+
+            if threshold < 0:
+                raise ValueError("Circuit breaker threshold must be >= 0 (got %i)" % threshold)
+            elif threshold == 0:
+                breaker = None
+            else:
+                breaker['threshold'] = threshold
+
+        except TypeError:
+            try:
+                # on dict, override the defaults with the given values
+                breaker_dict = check_type_dict(breaker_opt)
+            except TypeError:
+                raise TypeError("circuit_breaker option must be interpretable as int or dict. Got: %r" % breaker_opt)
+
+            unknown = set(breaker_dict) - set(breaker)
+            if unknown:
+                raise ValueError("Unknown circuit_breaker settings: %s" % ', '.join(sorted(unknown)))
+
+            breaker.update(breaker_dict)
+            breaker['threshold'] = check_type_int(breaker['threshold'])
+            breaker['cooldown'] = check_type_float(breaker['cooldown'])
+            breaker['shared'] = check_type_bool(breaker['shared'])
+
+            if breaker['threshold'] < 1:
+                raise ValueError("Circuit breaker threshold must be >= 1 (got %i)" % breaker['threshold'])
+
+        self._options.set_option('circuit_breaker', breaker)
+
     def _process_option_proxies(self):
         '''check if 'proxies' option is dict or str and set it appropriately'''
 
@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Ansible Project
+# Simplified BSD License (see LICENSES/BSD-2-Clause.txt or https://opensource.org/licenses/BSD-2-Clause)
+# SPDX-License-Identifier: BSD-2-Clause
+
+'''Python versions supported: >=3.8'''
+
+# FOR INTERNAL COLLECTION USE ONLY
+# The interfaces in this file are meant for use within the community.hashi_vault collection
+# and may not remain stable to outside uses. Changes may be made in ANY release, even a bugfix release.
+# See also: https://github.com/ansible/community/issues/539#issuecomment-780839686
+# Please open an issue if you have questions about this.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import os
+import random
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from requests import Request
+    from requests.adapters import BaseAdapter
+    from requests.exceptions import ConnectionError as RequestsConnectionError, ConnectTimeout, Timeout as RequestsTimeout
+except ImportError:
+    # requests is a dependency of hvac, which is checked for by HashiVaultHelper
+    BaseAdapter = object
+    RequestsConnectionError = ConnectTimeout = RequestsTimeout = Exception
+
+try:
+    from urllib3.exceptions import NewConnectionError
+except ImportError:
+    try:
+        from requests.packages.urllib3.exceptions import NewConnectionError
+    except ImportError:
+        NewConnectionError = None
+
+from ansible_collections.community.hashi_vault.plugins.module_utils._circuit_breaker import HashiVaultCircuitOpenError
+from ansible_collections.community.hashi_vault.plugins.module_utils._ssl_context import HashiVaultHTTPAdapter
+
+
+class HashiVaultHARouter():
+    '''
+    Chooses which node of a Vault cluster a request is sent to.
+
+    The role of each node is learned from its sys/health endpoint, and kept for HEALTH_TTL seconds.
+    Writes go to the active node. Reads are spread at random across the performance standbys,
+    so that workers in different processes don't all pick the same one, and go to the active node if there are none.
+    The nodes that remain are tried after those, in case the cluster has changed since its health was checked.
+
+    The roles are shared by everything in the process.
+    '''
+
+    ACTIVE = 'active'
+    PERFORMANCE_STANDBY = 'performance_standby'
+    STANDBY = 'standby'
+    UNAVAILABLE = 'unavailable'
+
+    # https://developer.hashicorp.com/vault/api-docs/system/health
+    # other statuses mean the node is sealed, uninitialized, or a DR secondary, none of which can serve requests
+    ROLES_BY_STATUS = {
+        200: ACTIVE,
+        429: STANDBY,
+        473: PERFORMANCE_STANDBY,
+    }
+
+    READ_METHODS = frozenset(['GET', 'HEAD', 'LIST'])
+
+    HEALTH_TTL = 10
+
+    _lock = threading.Lock()
+    _roles = {}
+    _pid = None
+
+    _clock = time.monotonic
+
+    def __init__(self, nodes):
+        self.nodes = list(nodes)
+
+    @staticmethod
+    def parse_urls(url):
+        '''returns the list of addresses in a url option value, which can hold several separated by commas'''
+        if url is None:
+            return []
+
+        return [u.strip().rstrip('/') for u in url.split(',') if u.strip()]
+
+    @classmethod
+    def _get_roles(cls):
+        # called with the lock held
+        if cls._pid != os.getpid():
+            cls._roles = {}
+            cls._pid = os.getpid()
+
+        return cls._roles
+
+    def get_stale(self):
+        '''returns the nodes whose role is unknown, or was learned more than HEALTH_TTL seconds ago'''
+        now = self._clock()
+        with self._lock:
+            roles = self._get_roles()
+            return [n for n in self.nodes if n not in roles or now - roles[n][1] >= self.HEALTH_TTL]
+
+    def set_role(self, node, role):
+        with self._lock:
+            self._get_roles()[node] = (role, self._clock())
+
+    def get_role(self, node):
+        with self._lock:
+            return self._get_roles().get(node, (None, None))[0]
+
+    def get_candidates(self, method):
+        '''returns the nodes to try for a request, in order'''
+        by_role = {}
+        for node in self.nodes:
+            by_role.setdefault(self.get_role(node), []).append(node)
+
+        standbys = list(by_role.get(self.PERFORMANCE_STANDBY, []))
+        random.shuffle(standbys)
+
+        if method.upper() in self.READ_METHODS:
+            preferred = standbys + by_role.get(self.ACTIVE, [])
+        else:
+            preferred = by_role.get(self.ACTIVE, []) + standbys
+
+        # standbys forward requests to the active node, so they're worth a try before the nodes that are known to be down
+        rest = by_role.get(None, []) + by_role.get(self.STANDBY, []) + by_role.get(self.UNAVAILABLE, [])
+
+        return preferred + rest
+
+
+class HashiVaultHAAdapter(BaseAdapter):
+    '''
+    A requests transport adapter that sends each request for a Vault cluster to the node chosen by a HashiVaultHARouter,
+    through another adapter, and fails over to the next node when one can't be reached.
+    '''
+
+    HEALTH_TIMEOUT = 5
+
+    # a sealed node responds with 503, and so may a node that's in the middle of stepping down
+    FAILOVER_STATUSES = frozenset([503])
+
+    def __init__(self, nodes, adapter):
+        super(HashiVaultHAAdapter, self).__init__()
+        self.router = HashiVaultHARouter(nodes)
+        self.adapter = adapter
+        self._health_adapter = None
+
+    def get_health(self, node, verify=True, cert=None, proxies=None):
+        '''returns the role of a node, from the status of its sys/health endpoint'''
+        if self._health_adapter is None:
+            self._health_adapter = HashiVaultHTTPAdapter()
+
+        # health checks don't go through the adapter used for requests, so they're never retried,
+        # and they aren't sent in the namespace of the requests, since sys/health is only in the root namespace.
+        request = Request('GET', node + '/v1/sys/health').prepare()
+        try:
+            response = self._health_adapter.send(request, timeout=self.HEALTH_TIMEOUT, verify=verify, cert=cert, proxies=proxies)
+        except (RequestsConnectionError, RequestsTimeout):
+            return HashiVaultHARouter.UNAVAILABLE
+
+        response.close()
+        return HashiVaultHARouter.ROLES_BY_STATUS.get(response.status_code, HashiVaultHARouter.UNAVAILABLE)
+
+    def refresh(self, verify=True, cert=None, proxies=None):
+        '''checks the health of the nodes whose role is stale, all at once'''
+        stale = self.router.get_stale()
+        if not stale:
+            return
+
+        with ThreadPoolExecutor(max_workers=len(stale)) as executor:
+            roles = executor.map(lambda node: self.get_health(node, verify=verify, cert=cert, proxies=proxies), stale)
+            for node, role in zip(stale, roles):
+                self.router.set_role(node, role)
+
+    def get_node(self, url):
+        '''returns the node that a URL is for, or None if it isn't for any of them'''
+        for node in self.router.nodes:
+            if url == node or url.startswith(node + '/'):
+                return node
+
+        return None
+
+    @staticmethod
+    def _is_unsent(exc):
+        '''whether an exception means the request never reached Vault, so it can be sent to another node whatever it is'''
+        if isinstance(exc, (ConnectTimeout, HashiVaultCircuitOpenError)):
+            return True
+
+        reason = getattr(exc.args[0], 'reason', None) if exc.args else None
+        return NewConnectionError is not None and isinstance(reason, NewConnectionError)
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        kwargs = dict(stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+
+        origin = self.get_node(request.url)
+        if origin is None:
+            return self.adapter.send(request, **kwargs)
+
+        self.refresh(verify=verify, cert=cert, proxies=proxies)
+
+        is_read = request.method.upper() in HashiVaultHARouter.READ_METHODS
+        candidates = self.router.get_candidates(request.method)
+
+        for i, node in enumerate(candidates):
+            last = i == len(candidates) - 1
+
+            routed = request.copy()
+            routed.url = node + request.url[len(origin):]
+
+            try:
+                response = self.adapter.send(routed, **kwargs)
+            except (RequestsConnectionError, RequestsTimeout) as e:
+                self.router.set_role(node, HashiVaultHARouter.UNAVAILABLE)
+                # a write that might have reached Vault is not sent again
+                if last or not (is_read or self._is_unsent(e)):
+                    raise
+                continue
+
+            if response.status_code in self.FAILOVER_STATUSES and not last:
+                self.router.set_role(node, HashiVaultHARouter.UNAVAILABLE)
+                response.close()
+                continue
+
+            return response
+
+    def close(self):
+        self.adapter.close()
+        if self._health_adapter is not None:
+            self._health_adapter.close()
@@ -14,7 +14,14 @@
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
+import json
 import os
+import sys
+import threading
+
+from importlib.util import find_spec
+
+from ansible_collections.community.hashi_vault.plugins.module_utils._ssl_context import HashiVaultHTTPAdapter
 
 
 class HashiVaultValueError(ValueError):
@@ -29,14 +36,159 @@ class HashiVaultHVACError(ImportError):
         self.error = error
 
 
+class HashiVaultSessionPool():
+    '''
+    A process-wide registry of requests sessions, keyed by the connection options they were created for.
+
+    Reusing a session keeps its connection pool open between clients, so a new client can send its requests
+    over an existing keep-alive connection instead of paying for a new TCP and TLS handshake with Vault.
+    Clients themselves are never shared, because each one holds the token it was authenticated with.
+    '''
+
+    _lock = threading.Lock()
+    _sessions = {}
+    _pid = None
+
+    @staticmethod
+    def make_key(**options):
+        '''returns a hashable key from the given connection options'''
+        return json.dumps(options, sort_keys=True, default=str)
+
+    @classmethod
+    def get_session(cls, key, factory):
+        '''
+        returns the session registered under key, calling factory to create and register one if needed
+
+        :param key: a key from make_key()
+        :type key: str
+
+        :param factory: a callable that takes no arguments and returns a new requests.Session
+        :type factory: callable
+        '''
+        with cls._lock:
+            # open connections can't be shared with a forked process, so a child process starts with an empty pool.
+            # We don't close the inherited sessions, since their sockets still belong to the parent.
+            pid = os.getpid()
+            if cls._pid != pid:
+                cls._sessions = {}
+                cls._pid = pid
+
+            try:
+                return cls._sessions[key]
+            except KeyError:
+                session = cls._sessions[key] = factory()
+                return session
+
+    @classmethod
+    def ensure_pool_maxsize(cls, session, maxsize):
+        '''
+        grows the per-host connection pools of the session's adapters to hold at least maxsize connections
+
+        Pools that are already open are grown in place, so that the keep-alive connections they hold are kept.
+        Adapters that wrap another one in their adapter attribute, like HashiVaultHAAdapter, have that one grown instead,
+        and adapters with their own pools, like HashiVaultUnixSocketAdapter, return them from get_pools().
+        '''
+        seen = set()
+        for adapter in session.adapters.values():
+            # the same adapter can be mounted for several prefixes
+            while adapter is not None and id(adapter) not in seen:
+                seen.add(id(adapter))
+                cls._grow_adapter(adapter, maxsize)
+                adapter = getattr(adapter, 'adapter', None)
+
+    @classmethod
+    def _grow_adapter(cls, adapter, maxsize):
+        pool_maxsize = getattr(adapter, '_pool_maxsize', None)
+        if pool_maxsize is None or pool_maxsize >= maxsize:
+            return
+
+        # pools opened from now on, including those of proxy managers made later, are created with the new size
+        adapter._pool_maxsize = maxsize
+
+        for manager in [adapter.poolmanager] + list(getattr(adapter, 'proxy_manager', {}).values()):
+            manager.connection_pool_kw['maxsize'] = maxsize
+            cls._grow_pools(manager.pools, maxsize)
+
+        get_pools = getattr(adapter, 'get_pools', None)
+        if get_pools is not None:
+            for pool in get_pools():
+                cls._grow_pool(pool, maxsize)
+
+    @classmethod
+    def _grow_pools(cls, pools, maxsize):
+        # urllib3 finds a pool by a key that includes its size, so each open pool is grown, and moved to the key for the new size.
+        # Removing a pool from the container the usual way would close it, so the container's own dict is used instead.
+        with pools.lock:
+            container = pools._container
+            for pool_key in list(container):
+                if 'key_maxsize' not in getattr(pool_key, '_fields', ()):
+                    continue
+
+                new_key = pool_key._replace(key_maxsize=maxsize)
+                if new_key in container:
+                    continue
+
+                pool = container.pop(pool_key)
+                cls._grow_pool(pool, maxsize)
+                container[new_key] = pool
+
+    @staticmethod
+    def _grow_pool(pool, maxsize):
+        # a urllib3 pool is a queue that starts full of None placeholders, each of which can become a connection
+        queue = pool.pool
+        if queue is None:
+            return
+
+        with queue.mutex:
+            grow = maxsize - queue.maxsize
+            if grow <= 0:
+                return
+            queue.maxsize = maxsize
+
+        for i in range(grow):
+            queue.put_nowait(None)
+
+    @classmethod
+    def clear(cls):
+        '''closes and removes all sessions owned by this process'''
+        with cls._lock:
+            sessions = cls._sessions
+            cls._sessions = {}
+
+            if cls._pid == os.getpid():
+                for session in sessions.values():
+                    session.close()
+
+
 class HashiVaultHelper():
     def __init__(self):
-        try:
-            import hvac
-            self.hvac = hvac
-        except ImportError as e:
-            from ansible.module_utils.basic import missing_required_lib
-            raise HashiVaultHVACError(error=str(e), msg=missing_required_lib('hvac'))
+        # hvac takes a noticeable time to import, so it's only imported when it's first used,
+        # but whether it's installed is checked now, so that plugins and modules fail early without it
+        if 'hvac' not in sys.modules and find_spec('hvac') is None:
+            self._raise_hvac_error("No module named 'hvac'")
+
+        self._hvac = None
+
+        # request hooks and requests response hooks added to the clients created by get_vault_client() that use HashiVaultJSONAdapter
+        self.request_hooks = []
+        self.response_hooks = []
+
+    @staticmethod
+    def _raise_hvac_error(error):
+        from ansible.module_utils.basic import missing_required_lib
+        raise HashiVaultHVACError(error=error, msg=missing_required_lib('hvac'))
+
+    @property
+    def hvac(self):
+        if self._hvac is None:
+            try:
+                import hvac
+            except ImportError as e:
+                self._raise_hvac_error(str(e))
+
+            self._hvac = hvac
+
+        return self._hvac
 
     def get_hvac(self):
         return self.hvac
@@ -55,10 +207,30 @@ class HashiVaultHelper():
 
         :param hashi_vault_revoke_on_logout: if True revokes any current token on logout. Only used if a logout is performed. Not recommended.
         :type hashi_vault_revoke_on_logout: bool
+
+        If no session is included in kwargs, the client uses a session from HashiVaultSessionPool,
+        shared with other clients that have the same url, verify, cert, and proxies.
+
+        If no adapter is included in kwargs, the client uses HashiVaultJSONAdapter.
         '''
+        from ansible_collections.community.hashi_vault.plugins.module_utils._json_adapter import HashiVaultJSONAdapter
+
+        kwargs.setdefault('adapter', HashiVaultJSONAdapter)
+
+        if 'session' not in kwargs:
+            kwargs['session'] = self.get_pooled_session(
+                url=kwargs.get('url'),
+                verify=kwargs.get('verify'),
+                cert=kwargs.get('cert'),
+                proxies=kwargs.get('proxies'),
+            )
 
         client = self.hvac.Client(**kwargs)
 
+        if isinstance(client.adapter, HashiVaultJSONAdapter):
+            client.adapter.request_hooks.extend(self.request_hooks)
+            client.adapter.response_hooks.extend(self.response_hooks)
+
         # logout to prevent accidental use of inferred tokens
         # https://github.com/ansible-collections/community.hashi_vault/issues/13
         if hashi_vault_logout_inferred_token and 'token' not in kwargs:
@@ -66,6 +238,29 @@ class HashiVaultHelper():
 
         return client
 
+    def get_pooled_session(self, url=None, verify=None, cert=None, proxies=None):
+        '''returns a requests.Session from HashiVaultSessionPool for the given options'''
+
+        def _factory():
+            from requests import Session
+
+            session = Session()
+            adapter = HashiVaultHTTPAdapter()
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            # hvac prefers a truthy session.verify over its own verify parameter,
+            # so this must always be set, even to False or None.
+            session.verify = verify
+            session.cert = cert
+            if proxies:
+                session.proxies = proxies
+
+            return session
+
+        key = HashiVaultSessionPool.make_key(url=url, verify=verify, cert=cert, proxies=proxies)
+
+        return HashiVaultSessionPool.get_session(key, _factory)
+
 
 class HashiVaultOptionAdapter(object):
     '''
@@ -235,6 +430,9 @@ class HashiVaultOptionGroupBase:
 class HashiVaultAuthMethodBase(HashiVaultOptionGroupBase):
     '''Base class for individual auth method implementations'''
 
+    # the credentials from get_token_cache_credentials() that are secret; a token is only kept in a token cache file if one is set
+    TOKEN_CACHE_SECRETS = ()
+
     def __init__(self, option_adapter, warning_callback, deprecate_callback):
         super(HashiVaultAuthMethodBase, self).__init__(option_adapter)
         self._warner = warning_callback
@@ -248,6 +446,18 @@ class HashiVaultAuthMethodBase(HashiVaultOptionGroupBase):
         '''Authenticates against Vault, returns a token.'''
         raise NotImplementedError('authenticate must be implemented')
 
+    def get_token_cache_credentials(self):
+        '''
+        Returns a dict of the credentials a login is made with, after validate(), which identify the login in the token cache.
+        Tokens kept in a file are encrypted with a key derived from them, so methods that resolve their credentials
+        from somewhere other than their options (files, the environment) return the resolved values.
+        '''
+        return dict((name, self._options.get_option_default(name)) for name in self.OPTIONS)
+
+    def has_token_cache_secret(self, credentials):
+        '''Returns True if credentials from get_token_cache_credentials() hold a secret, which a token cache file can be encrypted with.'''
+        return any(credentials.get(name) for name in self.TOKEN_CACHE_SECRETS)
+
     def validate_by_required_fields(self, *field_names):
         missing = [field for field in field_names if self._options.get_option_default(field) is None]
 
@@ -12,6 +12,8 @@
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
+import os
+
 from ansible.module_utils.basic import AnsibleModule
 
 from ansible_collections.community.hashi_vault.plugins.module_utils._hashi_vault_common import (
@@ -21,9 +23,16 @@ from ansible_collections.community.hashi_vault.plugins.module_utils._hashi_vault
 )
 from ansible_collections.community.hashi_vault.plugins.module_utils._connection_options import HashiVaultConnectionOptions
 from ansible_collections.community.hashi_vault.plugins.module_utils._authenticator import HashiVaultAuthenticator
+from ansible_collections.community.hashi_vault.plugins.module_utils._request_stats import HashiVaultRequestStats
+from ansible_collections.community.hashi_vault.plugins.module_utils._tracing import HashiVaultTracer
 
 
 class HashiVaultModule(AnsibleModule):
+    ARGSPEC = dict(
+        stats=dict(type='bool', default=False),
+        trace_file=dict(type='path'),
+    )
+
     def __init__(self, *args, **kwargs):
         if 'hashi_vault_custom_retry_callback' in kwargs:
             callback = kwargs.pop('hashi_vault_custom_retry_callback')
@@ -44,14 +53,52 @@ class HashiVaultModule(AnsibleModule):
         self.connection_options = HashiVaultConnectionOptions(option_adapter=self.adapter, retry_callback_generator=callback)
         self.authenticator = HashiVaultAuthenticator(option_adapter=self.adapter, warning_callback=self.warn, deprecate_callback=self.deprecate)
 
+        self.request_stats = None
+        if self.params.get('stats'):
+            self.request_stats = HashiVaultRequestStats()
+            self.helper.response_hooks.append(self.request_stats.response_hook)
+
+        self.tracer = None
+        if self.params.get('trace_file'):
+            self.tracer = HashiVaultTracer(on_end=lambda document: HashiVaultTracer.write(self.params['trace_file'], document))
+            self.helper.request_hooks.append(self.tracer.request_hook)
+            self.helper.response_hooks.append(self.tracer.response_hook)
+            self.authenticator.tracer = self.tracer
+            self.tracer.start(self._name, {'ansible.plugin.type': 'module'}, traceparent=os.environ.get('TRACEPARENT'))
+
     @classmethod
     def generate_argspec(cls, **kwargs):
         spec = HashiVaultConnectionOptions.ARGSPEC.copy()
         spec.update(HashiVaultAuthenticator.ARGSPEC.copy())
+        spec.update(cls.ARGSPEC.copy())
         spec.update(**kwargs)
 
         return spec
 
+    def _add_request_stats(self, result):
+        '''adds the records of the requests sent to Vault to a module result, if the stats option is enabled'''
+        # this can be called from AnsibleModule.__init__, before request_stats is set
+        request_stats = getattr(self, 'request_stats', None)
+        if request_stats is not None:
+            result['_vault_stats'] = request_stats.get_records()
+
+    def _end_trace(self, error=None):
+        '''ends the trace of the module and writes it to the trace_file, if that option is set'''
+        # this can be called from AnsibleModule.__init__, before tracer is set
+        tracer = getattr(self, 'tracer', None)
+        if tracer is not None:
+            tracer.end(error=error)
+
+    def exit_json(self, **kwargs):
+        self._add_request_stats(kwargs)
+        self._end_trace()
+        super(HashiVaultModule, self).exit_json(**kwargs)
+
+    def fail_json(self, *args, **kwargs):
+        self._add_request_stats(kwargs)
+        self._end_trace(error=kwargs.get('msg', args[0] if args else 'failed'))
+        super(HashiVaultModule, self).fail_json(*args, **kwargs)
+
     def _generate_retry_callback(self, retry_action):
         '''returns a Retry callback function for modules'''
         def _on_retry(retry_obj):
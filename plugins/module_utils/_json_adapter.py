@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Ansible Project
+# Simplified BSD License (see LICENSES/BSD-2-Clause.txt or https://opensource.org/licenses/BSD-2-Clause)
+# SPDX-License-Identifier: BSD-2-Clause
+
+'''Python versions supported: >=3.8'''
+
+# FOR INTERNAL COLLECTION USE ONLY
+# The interfaces in this file are meant for use within the community.hashi_vault collection
+# and may not remain stable to outside uses. Changes may be made in ANY release, even a bugfix release.
+# See also: https://github.com/ansible/community/issues/539#issuecomment-780839686
+# Please open an issue if you have questions about this.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import json
+
+try:
+    from hvac.adapters import JSONAdapter, RawAdapter
+except ImportError:
+    # hvac is checked for by HashiVaultHelper
+    JSONAdapter = RawAdapter = object
+
+
+class HashiVaultJSONAdapter(JSONAdapter):
+    '''
+    The hvac adapter used for the clients of this collection.
+
+    Like hvac's JSONAdapter, a successful response is returned as the dict decoded from its JSON body,
+    and any other response is returned as the response object. The differences are:
+
+    - a 204 response (success with no body) is returned as an empty dict, rather than as the response object
+      (https://github.com/hvac/hvac/issues/797)
+    - the body is decoded once, straight from its bytes, rather than first being copied into a str
+    - request_hooks are called with (method, url, kwargs) before a request is sent; if one returns anything other than None,
+      that is returned instead of sending the request
+    - response_hooks are passed to requests as response hooks, so they're called with each response, including errors
+    '''
+
+    def __init__(self, *args, **kwargs):
+        super(HashiVaultJSONAdapter, self).__init__(*args, **kwargs)
+        self.request_hooks = []
+        self.response_hooks = []
+
+    def request(self, method, url, headers=None, raise_exception=True, **kwargs):
+        for hook in self.request_hooks:
+            result = hook(method, url, kwargs)
+            if result is not None:
+                return result
+
+        if self.response_hooks:
+            hooks = dict(kwargs.get('hooks') or {})
+            hooks['response'] = list(hooks.get('response') or []) + self.response_hooks
+            kwargs['hooks'] = hooks
+
+        # skips JSONAdapter.request, which would decode the body again
+        response = RawAdapter.request(self, method, url, headers=headers, raise_exception=raise_exception, **kwargs)
+
+        if response.status_code == 204:
+            return {}
+
+        if response.status_code == 200:
+            try:
+                return self.loads(response.content)
+            except ValueError:
+                pass
+
+        return response
+
+    @staticmethod
+    def loads(content):
+        '''decodes a JSON body'''
+        # faster libraries like orjson aren't used, since they turn integers wider than 64 bits into floats
+        return json.loads(content)
+
+    @staticmethod
+    def get_data(response):
+        '''
+        returns a tuple of the data of a client's response, and whether the response had a body that couldn't be parsed
+
+        A response from this adapter is already the data, but other adapters return the raw response for a body that isn't JSON,
+        and HashiVaultAsyncEngine returns None for a response with no body.
+        '''
+        if response is None:
+            return {}, False
+
+        if hasattr(response, 'json') and callable(response.json):
+            if response.status_code == 204:
+                return {}, False
+
+            return response.content, True
+
+        return response, False
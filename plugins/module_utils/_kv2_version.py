@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Ansible Project
+# Simplified BSD License (see LICENSES/BSD-2-Clause.txt or https://opensource.org/licenses/BSD-2-Clause)
+# SPDX-License-Identifier: BSD-2-Clause
+
+'''Python versions supported: >=3.8'''
+
+# FOR INTERNAL COLLECTION USE ONLY
+# The interfaces in this file are meant for use within the community.hashi_vault collection
+# and may not remain stable to outside uses. Changes may be made in ANY release, even a bugfix release.
+# See also: https://github.com/ansible/community/issues/539#issuecomment-780839686
+# Please open an issue if you have questions about this.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import re
+
+from datetime import datetime, timezone
+
+
+class HashiVaultKv2Version():
+    '''
+    Finds the current version of a KV version 2 secret without reading the secret's data,
+    so that a copy of the secret that's already held can be checked cheaply before it's used.
+    '''
+
+    METHODS = ('metadata', 'subkeys')
+
+    # Vault's timestamps are RFC 3339, with up to nanosecond precision, which datetime.fromisoformat can't parse before Python 3.11
+    _TIMESTAMP = re.compile(r'^(\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d)(?:\.(\d+))?(Z|[+-]\d\d:\d\d)$', re.IGNORECASE)
+
+    @classmethod
+    def parse_time(cls, value):
+        '''returns a Vault timestamp as an aware datetime, raises ValueError if it isn't one'''
+        match = cls._TIMESTAMP.match(value)
+        if match is None:
+            raise ValueError("not a Vault timestamp: %r" % (value,))
+
+        seconds, fraction, offset = match.groups()
+        if offset.upper() == 'Z':
+            offset = '+00:00'
+
+        return datetime.fromisoformat('%s.%s%s' % (seconds, (fraction or '').ljust(6, '0')[:6], offset))
+
+    @classmethod
+    def is_deleted(cls, metadata, now=None):
+        '''
+        returns True if the version described by metadata is destroyed, or deleted.
+        A version with delete_version_after set on its secret or mount gets its deletion_time when it's written,
+        so it's only deleted once that time has passed. A deletion_time that can't be parsed counts as deleted.
+        '''
+        if metadata.get('destroyed'):
+            return True
+
+        deletion_time = metadata.get('deletion_time')
+        if not deletion_time:
+            return False
+
+        try:
+            deletion_time = cls.parse_time(deletion_time)
+        except ValueError:
+            return True
+
+        return deletion_time <= (now or datetime.now(timezone.utc))
+
+    @classmethod
+    def read_current(cls, client, path, mount_point, method='metadata'):
+        '''
+        returns the metadata of the current version of a secret, like the metadata returned with the secret,
+        or None if the secret doesn't exist, or its current version is deleted or destroyed
+
+        :param method: 'metadata' reads the secret's metadata, which needs the read capability on its metadata path.
+          'subkeys' reads the secret's subkeys (only the top level of its keys, without their values),
+          which needs the read capability on its subkeys path, and Vault 1.10 or later.
+        '''
+        from hvac import exceptions, utils
+
+        try:
+            if method == 'metadata':
+                data = client.secrets.kv.v2.read_secret_metadata(path=path, mount_point=mount_point)['data']
+                number = data.get('current_version')
+                version = (data.get('versions') or {}).get(str(number))
+                if not number or version is None:
+                    return None
+
+                metadata = dict(version, custom_metadata=data.get('custom_metadata'), version=number)
+            elif method == 'subkeys':
+                url = utils.format_url('/v1/{mount_point}/subkeys/{path}', mount_point=mount_point, path=path)
+                metadata = client.adapter.get(url, params=dict(depth=1))['data']['metadata']
+            else:
+                raise ValueError("method must be one of %s, got: %r" % (', '.join(cls.METHODS), method))
+        except exceptions.InvalidPath:
+            return None
+
+        if cls.is_deleted(metadata):
+            return None
+
+        return metadata
+
+    @classmethod
+    def is_current(cls, client, path, mount_point, version, method='metadata'):
+        '''returns True if version is the current version of a secret, and it can still be read'''
+        metadata = cls.read_current(client, path, mount_point, method)
+
+        return metadata is not None and metadata.get('version') == version
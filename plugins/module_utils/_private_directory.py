@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Ansible Project
+# Simplified BSD License (see LICENSES/BSD-2-Clause.txt or https://opensource.org/licenses/BSD-2-Clause)
+# SPDX-License-Identifier: BSD-2-Clause
+
+'''Python versions supported: >=3.8'''
+
+# FOR INTERNAL COLLECTION USE ONLY
+# The interfaces in this file are meant for use within the community.hashi_vault collection
+# and may not remain stable to outside uses. Changes may be made in ANY release, even a bugfix release.
+# See also: https://github.com/ansible/community/issues/539#issuecomment-780839686
+# Please open an issue if you have questions about this.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import errno
+import os
+import stat
+import tempfile
+
+
+def get_private_directory():
+    '''
+    returns the path of a directory in the temporary directory that only the current user can use, creating it if needed,
+    for the files that the processes of the current user share, like the broker's socket and circuit breaker states
+
+    Raises OSError if the directory exists, but isn't a directory owned by the current user, and only accessible by them,
+    since another user could then read or replace the files in it.
+    '''
+    directory = os.path.join(tempfile.gettempdir(), 'ansible-hashi-vault-%i' % os.getuid())
+
+    try:
+        os.mkdir(directory, 0o700)
+    except OSError as e:
+        if e.errno != errno.EEXIST:
+            raise
+
+    st = os.lstat(directory)
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or stat.S_IMODE(st.st_mode) & 0o077:
+        raise OSError("The directory '%s' must be a directory owned by the current user, and only accessible by them." % directory)
+
+    return directory
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Ansible Project
+# Simplified BSD License (see LICENSES/BSD-2-Clause.txt or https://opensource.org/licenses/BSD-2-Clause)
+# SPDX-License-Identifier: BSD-2-Clause
+
+'''Python versions supported: >=3.8'''
+
+# FOR INTERNAL COLLECTION USE ONLY
+# The interfaces in this file are meant for use within the community.hashi_vault collection
+# and may not remain stable to outside uses. Changes may be made in ANY release, even a bugfix release.
+# See also: https://github.com/ansible/community/issues/539#issuecomment-780839686
+# Please open an issue if you have questions about this.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import hashlib
+import json
+import threading
+import time
+
+from collections import OrderedDict
+
+
+class HashiVaultReadCache():
+    '''
+    A bounded, expiring, in-memory cache of Vault read responses.
+
+    Entries are stored as serialized JSON, so that a cached response can't be changed by the caller,
+    and so that the size of each entry is known. When the cache holds more than max_entries entries,
+    or more than max_bytes bytes, the least recently used entries are evicted.
+    '''
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, max_entries=1000, max_bytes=10485760, clock=time.monotonic):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._bytes = 0
+
+    @classmethod
+    def get_instance(cls):
+        '''returns the cache shared by everything in this process'''
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+
+            return cls._instance
+
+    @staticmethod
+    def make_key(url, namespace, token, method, path, version=None):
+        '''
+        returns a cache key for a request
+
+        The token is only part of the key as a hash, so the cache never holds a usable token.
+        '''
+        token_id = None if token is None else hashlib.sha256(token.encode('utf-8')).hexdigest()
+
+        return json.dumps([url, namespace, token_id, method, path, version], default=str)
+
+    @staticmethod
+    def get_ttl(response, ttl):
+        '''
+        returns the number of seconds a response should be cached for
+
+        That is the response's lease_duration if it has a positive one and it's shorter than ttl, or ttl otherwise.
+        '''
+        try:
+            lease_duration = int(response.get('lease_duration') or 0)
+        except (AttributeError, TypeError, ValueError):
+            lease_duration = 0
+
+        if lease_duration > 0 and (ttl is None or lease_duration < ttl):
+            return lease_duration
+
+        return ttl
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def size(self):
+        '''the total size in bytes of all entries'''
+        return self._bytes
+
+    def configure(self, max_entries=None, max_bytes=None):
+        '''changes the limits of the cache, evicting entries if needed'''
+        with self._lock:
+            if max_entries is not None:
+                self.max_entries = max_entries
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+
+            self._evict()
+
+    def get(self, key):
+        '''returns the cached value for key, or None if it's missing or expired'''
+        with self._lock:
+            try:
+                expires, data = self._entries[key]
+            except KeyError:
+                return None
+
+            if expires <= self._clock():
+                self._remove(key)
+                return None
+
+            self._entries.move_to_end(key)
+
+        return json.loads(data)
+
+    def set(self, key, value, ttl):
+        '''
+        caches a value for ttl seconds
+
+        Values that can't be serialized as JSON, and values bigger than the whole cache, are not cached.
+        '''
+        if not ttl or ttl <= 0:
+            return
+
+        try:
+            data = json.dumps(value).encode('utf-8')
+        except (TypeError, ValueError):
+            return
+
+        if len(data) > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (self._clock() + ttl, data)
+            self._bytes += len(data)
+            self._evict()
+
+    def clear(self):
+        '''removes all entries'''
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _remove(self, key):
+        expires, data = self._entries.pop(key)
+        self._bytes -= len(data)
+
+    def _evict(self):
+        now = self._clock()
+        for key in [k for k, (expires, data) in self._entries.items() if expires <= now]:
+            self._remove(key)
+
+        while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+            key, (expires, data) = self._entries.popitem(last=False)
+            self._bytes -= len(data)
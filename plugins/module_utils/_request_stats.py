@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Ansible Project
+# Simplified BSD License (see LICENSES/BSD-2-Clause.txt or https://opensource.org/licenses/BSD-2-Clause)
+# SPDX-License-Identifier: BSD-2-Clause
+
+'''Python versions supported: >=3.8'''
+
+# FOR INTERNAL COLLECTION USE ONLY
+# The interfaces in this file are meant for use within the community.hashi_vault collection
+# and may not remain stable to outside uses. Changes may be made in ANY release, even a bugfix release.
+# See also: https://github.com/ansible/community/issues/539#issuecomment-780839686
+# Please open an issue if you have questions about this.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import fcntl
+import json
+import os
+import threading
+import time
+
+from urllib.parse import urlsplit
+
+
+class HashiVaultRequestStats():
+    '''
+    Keeps a record of each request sent to Vault.
+
+    Each record is a dict of:
+      time: when the request was sent, in seconds since the epoch
+      method: the HTTP method
+      path: the template of the request's path, with names chosen by users (like those of secrets) replaced by *; see get_path_template()
+      status: the HTTP status of the response
+      latency: the seconds from sending the request to receiving its response, including any retries
+      retries: the number of times the request was retried
+      bytes: the size of the response body
+
+    response_hook() records a requests response. It can be added to the response_hooks of a HashiVaultJSONAdapter.
+
+    record_cache() records a read that was looked up in a cache, as a dict of time, path, and cache (either hit or miss).
+
+    If on_record is given, it's called with each record as it's made.
+    If enabled is given, it's called before each record is made, and nothing is recorded while it returns a false value.
+    '''
+
+    # path segments that are part of the Vault API rather than names chosen by users, so they're kept in path templates
+    API_SEGMENTS = frozenset([
+        'acl', 'ca', 'capabilities', 'capabilities-self', 'cert', 'certs', 'config', 'create', 'create-orphan', 'creds', 'crl',
+        'data', 'decrypt', 'delete', 'destroy', 'encrypt', 'health', 'issue', 'keys', 'leader', 'leases', 'login', 'lookup',
+        'lookup-accessor', 'lookup-self', 'metadata', 'mounts', 'policies', 'policy', 'renew', 'renew-self', 'reset', 'revoke',
+        'revoke-self', 'rewrap', 'role', 'role-id', 'roles', 'rotate-role', 'rotate-root', 'seal-status', 'secret-id', 'sign',
+        'static-creds', 'static-roles', 'subkeys', 'token', 'undelete', 'unwrap', 'wrap', 'wrapping',
+    ])
+
+    def __init__(self, on_record=None, enabled=None):
+        self.on_record = on_record
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._records = []
+
+    @classmethod
+    def get_path_template(cls, url):
+        '''
+        returns the path of a request URL, without the /v1/ prefix and the query, and with names chosen by users replaced by *
+
+        The first segment (the mount, or sys, auth, and so on) and, for auth/, the second (the auth mount) are kept,
+        as are any segments in API_SEGMENTS. So secret/data/app/db becomes secret/data/*,
+        and auth/approle/login stays as it is.
+        '''
+        segments = [s for s in urlsplit(url).path.split('/') if s]
+        if segments[:1] == ['v1']:
+            segments = segments[1:]
+
+        keep = 2 if segments[:1] == ['auth'] else 1
+
+        template = []
+        for i, segment in enumerate(segments):
+            if i >= keep and segment not in cls.API_SEGMENTS:
+                segment = '*'
+                # consecutive names, as in a nested secret path, become one *
+                if template and template[-1] == '*':
+                    continue
+            template.append(segment)
+
+        return '/'.join(template)
+
+    def is_enabled(self):
+        '''returns whether records are being made'''
+        return self.enabled is None or bool(self.enabled())
+
+    def record(self, method, url, status, latency, retries=0, size=0):
+        '''records a request, returning the record, or None if recording isn't enabled'''
+        if not self.is_enabled():
+            return None
+
+        record = dict(
+            time=time.time() - latency,
+            method=method.upper(),
+            path=self.get_path_template(url),
+            status=status,
+            latency=latency,
+            retries=retries,
+            bytes=size,
+        )
+
+        return self._add(record)
+
+    def _add(self, record):
+        with self._lock:
+            self._records.append(record)
+
+        if self.on_record is not None:
+            self.on_record(record)
+
+        return record
+
+    def record_cache(self, path, hit):
+        '''records a read that was looked up in a cache, returning the record, or None if recording isn't enabled'''
+        if not self.is_enabled():
+            return None
+
+        return self._add(dict(
+            time=time.time(),
+            path=self.get_path_template(path),
+            cache='hit' if hit else 'miss',
+        ))
+
+    @staticmethod
+    def get_mount(path):
+        '''returns the mount of a path template: its first segment, or its first two for auth/'''
+        segments = path.split('/')
+        return '/'.join(segments[:2 if segments[0] == 'auth' else 1])
+
+    @staticmethod
+    def _get_retries(response):
+        retries = getattr(getattr(response, 'raw', None), 'retries', None)
+        history = getattr(retries, 'history', None)
+        return len(history) if history else 0
+
+    def response_hook(self, response, *args, **kwargs):
+        '''a requests response hook that records the request of a response'''
+        if not self.is_enabled():
+            return
+
+        self.record(
+            method=response.request.method,
+            url=response.request.url,
+            status=response.status_code,
+            latency=response.elapsed.total_seconds(),
+            retries=self._get_retries(response),
+            size=len(response.content or b''),
+        )
+
+    def get_records(self):
+        '''returns a list of the records made so far'''
+        with self._lock:
+            return list(self._records)
+
+    def pop_records(self):
+        '''returns a list of the records made so far, and forgets them'''
+        with self._lock:
+            records, self._records = self._records, []
+        return records
+
+    @staticmethod
+    def write(path, records):
+        '''appends records to a file, as a line of JSON each'''
+        if not records:
+            return
+
+        data = ''.join(json.dumps(record, sort_keys=True) + '\n' for record in records)
+
+        # the lock keeps lines from different processes from being interleaved
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+        with os.fdopen(fd, 'a') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.write(data)
+            finally:
+                f.flush()
+                fcntl.flock(f, fcntl.LOCK_UN)
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Ansible Project
+# Simplified BSD License (see LICENSES/BSD-2-Clause.txt or https://opensource.org/licenses/BSD-2-Clause)
+# SPDX-License-Identifier: BSD-2-Clause
+
+'''Python versions supported: >=3.8'''
+
+# FOR INTERNAL COLLECTION USE ONLY
+# The interfaces in this file are meant for use within the community.hashi_vault collection
+# and may not remain stable to outside uses. Changes may be made in ANY release, even a bugfix release.
+# See also: https://github.com/ansible/community/issues/539#issuecomment-780839686
+# Please open an issue if you have questions about this.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import os
+import threading
+
+try:
+    from requests.adapters import HTTPAdapter
+    from requests.utils import DEFAULT_CA_BUNDLE_PATH
+    try:
+        from urllib3.util.ssl_ import create_urllib3_context
+    except ImportError:
+        from requests.packages.urllib3.util.ssl_ import create_urllib3_context
+except ImportError:
+    # requests is a dependency of hvac, which is checked for by HashiVaultHelper
+    HTTPAdapter = object
+    DEFAULT_CA_BUNDLE_PATH = None
+
+
+class HashiVaultSSLContextCache():
+    '''
+    A process-wide cache of SSLContexts, one for each CA bundle (or directory) and client certificate.
+
+    Each context loads its CA bundle once, instead of each new connection loading it again,
+    which can take a while for a large bundle. A bundle that changes on disk gets a new context.
+    '''
+
+    _lock = threading.Lock()
+    _contexts = {}
+
+    @staticmethod
+    def _split_cert(cert):
+        if not cert:
+            return None, None
+        if isinstance(cert, str):
+            return cert, None
+        return cert[0], cert[1]
+
+    @classmethod
+    def get(cls, ca_cert, cert=None):
+        '''
+        returns the SSLContext for a CA bundle file or directory, and an optional client certificate
+
+        :param ca_cert: the path of a CA bundle file or directory
+        :type ca_cert: str
+
+        :param cert: a client certificate, in any of the forms requests accepts: a path, or a (cert, key) tuple
+        :type cert: str | tuple | None
+        '''
+        if not ca_cert or not os.path.exists(ca_cert):
+            raise OSError("Could not find a suitable TLS CA certificate bundle, invalid path: %s" % ca_cert)
+
+        cert_file, key_file = cls._split_cert(cert)
+        for path, description in ((cert_file, 'certificate'), (key_file, 'key')):
+            if path and not os.path.exists(path):
+                raise OSError("Could not find the TLS %s file, invalid path: %s" % (description, path))
+
+        key = (ca_cert, os.stat(ca_cert).st_mtime_ns, cert_file, key_file)
+
+        with cls._lock:
+            try:
+                return cls._contexts[key]
+            except KeyError:
+                pass
+
+            context = create_urllib3_context()
+            if os.path.isdir(ca_cert):
+                context.load_verify_locations(capath=ca_cert)
+            else:
+                context.load_verify_locations(cafile=ca_cert)
+
+            if cert_file:
+                context.load_cert_chain(cert_file, key_file)
+
+            cls._contexts[key] = context
+            return context
+
+    @classmethod
+    def clear(cls):
+        '''removes all contexts'''
+        with cls._lock:
+            cls._contexts = {}
+
+
+class HashiVaultHTTPAdapter(HTTPAdapter):
+    '''
+    An HTTPAdapter that verifies HTTPS connections with an SSLContext from HashiVaultSSLContextCache,
+    rather than have urllib3 load the CA bundle and client certificate again for every new connection.
+
+    This needs requests 2.32.0 or later. With older versions, it behaves like an HTTPAdapter.
+    '''
+
+    # the method this relies on to give urllib3 the context was added in requests 2.32.0
+    USES_SSL_CONTEXT = hasattr(HTTPAdapter, 'build_connection_pool_key_attributes')
+
+    def get_ssl_context(self, url, verify, cert=None):
+        '''returns the SSLContext for a request, or None if it doesn't use one'''
+        if not self.USES_SSL_CONTEXT or not verify or not url.lower().startswith('https'):
+            return None
+
+        return HashiVaultSSLContextCache.get(DEFAULT_CA_BUNDLE_PATH if verify is True else verify, cert)
+
+    def build_connection_pool_key_attributes(self, request, verify, cert=None):
+        host_params, pool_kwargs = super(HashiVaultHTTPAdapter, self).build_connection_pool_key_attributes(request, verify, cert)
+
+        context = self.get_ssl_context(request.url, verify, cert)
+        if context is not None:
+            # the context takes the place of these, and connection pools are kept separately for each context
+            for key in ('ca_certs', 'ca_cert_dir', 'cert_file', 'key_file'):
+                pool_kwargs.pop(key, None)
+            pool_kwargs['ssl_context'] = context
+
+        return host_params, pool_kwargs
+
+    def cert_verify(self, conn, url, verify, cert):
+        if self.get_ssl_context(url, verify, cert) is None:
+            return super(HashiVaultHTTPAdapter, self).cert_verify(conn, url, verify, cert)
+
+        # setting any of the paths on the connection pool would have urllib3 load them into the shared context again
+        conn.cert_reqs = 'CERT_REQUIRED'
+        conn.ca_certs = conn.ca_cert_dir = None
+        conn.cert_file = conn.key_file = None
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Ansible Project
+# Simplified BSD License (see LICENSES/BSD-2-Clause.txt or https://opensource.org/licenses/BSD-2-Clause)
+# SPDX-License-Identifier: BSD-2-Clause
+
+'''Python versions supported: >=3.8'''
+
+# FOR INTERNAL COLLECTION USE ONLY
+# The interfaces in this file are meant for use within the community.hashi_vault collection
+# and may not remain stable to outside uses. Changes may be made in ANY release, even a bugfix release.
+# See also: https://github.com/ansible/community/issues/539#issuecomment-780839686
+# Please open an issue if you have questions about this.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import copy
+import hashlib
+import json
+import threading
+import time
+
+
+class HashiVaultTokenCache():
+    '''
+    A process-wide cache of login responses, so that a token can be reused until shortly before it expires.
+
+    Entries are keyed by a hash of the auth method, the Vault address and namespace, and the auth method's options,
+    so the credentials themselves are never held in a key.
+    '''
+
+    # A cached token is not reused once less than this fraction of its lease, or MIN_MARGIN seconds, is left.
+    MARGIN_RATIO = 0.1
+    MIN_MARGIN = 5
+
+    _lock = threading.Lock()
+    _entries = {}
+    _clock = time.time
+
+    @staticmethod
+    def make_material(method, url, namespace, options):
+        '''returns the serialized identity of a login, from which keys are derived'''
+        return json.dumps([method, url, namespace, options], sort_keys=True, default=str).encode('utf-8')
+
+    @classmethod
+    def make_key(cls, method, url, namespace, options):
+        '''returns a cache key for a login'''
+        return hashlib.sha256(cls.make_material(method, url, namespace, options)).hexdigest()
+
+    @classmethod
+    def get_expiry(cls, response, issued=None):
+        '''
+        returns the time after which a login response's token should no longer be reused
+
+        Returns None if the response can't be cached: it has no token, or a token limited to a number of uses.
+        Returns float('inf') for a token that never expires.
+        '''
+        try:
+            auth = response['auth']
+            auth['client_token']
+        except (KeyError, TypeError):
+            return None
+
+        if auth.get('num_uses'):
+            return None
+
+        if issued is None:
+            issued = cls._clock()
+
+        lease_duration = auth.get('lease_duration') or 0
+        if lease_duration <= 0:
+            return float('inf')
+
+        margin = max(lease_duration * cls.MARGIN_RATIO, cls.MIN_MARGIN)
+        if lease_duration <= margin:
+            return None
+
+        return issued + lease_duration - margin
+
+    @classmethod
+    def get(cls, key):
+        '''returns a copy of the cached login response for key, or None if there isn't a usable one'''
+        with cls._lock:
+            try:
+                expires, response = cls._entries[key]
+            except KeyError:
+                return None
+
+            if expires <= cls._clock():
+                del cls._entries[key]
+                return None
+
+            return copy.deepcopy(response)
+
+    @classmethod
+    def set(cls, key, response, expires=None):
+        '''caches a login response, unless it can't be cached'''
+        if expires is None:
+            expires = cls.get_expiry(response)
+
+        if expires is None:
+            return
+
+        with cls._lock:
+            cls._entries[key] = (expires, copy.deepcopy(response))
+
+    @classmethod
+    def remove(cls, key):
+        '''removes the entry for key, if there is one'''
+        with cls._lock:
+            cls._entries.pop(key, None)
+
+    @classmethod
+    def clear(cls):
+        '''removes all entries'''
+        with cls._lock:
+            cls._entries = {}
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Ansible Project
+# Simplified BSD License (see LICENSES/BSD-2-Clause.txt or https://opensource.org/licenses/BSD-2-Clause)
+# SPDX-License-Identifier: BSD-2-Clause
+
+'''Python versions supported: >=3.8'''
+
+# FOR INTERNAL COLLECTION USE ONLY
+# The interfaces in this file are meant for use within the community.hashi_vault collection
+# and may not remain stable to outside uses. Changes may be made in ANY release, even a bugfix release.
+# See also: https://github.com/ansible/community/issues/539#issuecomment-780839686
+# Please open an issue if you have questions about this.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import base64
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+from ansible_collections.community.hashi_vault.plugins.module_utils._hashi_vault_common import HashiVaultValueError
+from ansible_collections.community.hashi_vault.plugins.module_utils._token_cache import HashiVaultTokenCache
+
+
+class HashiVaultTokenCacheFile():
+    '''
+    A token cache kept in a file, so that login responses can be reused by later runs.
+
+    Each entry is encrypted with a key derived from the login it came from (see HashiVaultTokenCache.make_material),
+    including its secret credentials as they were resolved by the auth method (see HashiVaultAuthMethodBase.get_token_cache_credentials),
+    so it can only be read by someone who already has the credentials to log in. Entries are found by an id derived
+    the same way, so the file doesn't show which logins it holds. The file is only readable by its owner.
+
+    The file is replaced atomically on every write. If two processes write at the same time, one of the entries
+    may be lost, which only means that login is done again next time.
+    '''
+
+    FORMAT_VERSION = 1
+    KDF_ITERATIONS = 100000
+    SALT_BYTES = 16
+
+    _clock = time.time
+
+    def __init__(self, path):
+        self.path = path
+
+    @classmethod
+    def derive(cls, salt, login):
+        '''returns the entry id and the encryption key for a login, a tuple of the arguments to HashiVaultTokenCache.make_material'''
+        material = HashiVaultTokenCache.make_material(*login)
+        derived = hashlib.pbkdf2_hmac('sha256', material, salt, cls.KDF_ITERATIONS, dklen=64)
+
+        return base64.b16encode(derived[32:]).decode('ascii').lower(), base64.urlsafe_b64encode(derived[:32])
+
+    @staticmethod
+    def _get_fernet(key):
+        try:
+            from cryptography.fernet import Fernet
+        except ImportError:
+            raise HashiVaultValueError("cryptography is required to keep the token cache in a file (token_cache_path).")
+
+        return Fernet(key)
+
+    def _load(self):
+        try:
+            with open(self.path, 'rb') as f:
+                data = json.load(f)
+            salt = base64.b64decode(data['salt'])
+            entries = data['entries']
+        except (IOError, OSError, ValueError, TypeError, KeyError):
+            return None, {}
+
+        if data.get('version') != self.FORMAT_VERSION or not isinstance(entries, dict):
+            return None, {}
+
+        return salt, entries
+
+    def _save(self, salt, entries):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        if not os.path.isdir(directory):
+            os.makedirs(directory, mode=0o700)
+
+        data = dict(version=self.FORMAT_VERSION, salt=base64.b64encode(salt).decode('ascii'), entries=entries)
+
+        # mkstemp creates the file readable and writable only by its owner
+        fd, temp = tempfile.mkstemp(dir=directory, prefix='.tmp-', suffix='.json')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f)
+            os.replace(temp, self.path)
+        except Exception:
+            os.unlink(temp)
+            raise
+
+    def _prune(self, entries):
+        now = self._clock()
+        return dict((k, v) for k, v in entries.items() if v.get('expires') is None or v['expires'] > now)
+
+    def get(self, login):
+        '''
+        returns a tuple of a login response and the time it expires (or float('inf') if it doesn't)
+
+        Returns (None, None) if there's no usable entry for the login.
+        '''
+        salt, entries = self._load()
+        if salt is None:
+            return None, None
+
+        entry_id, key = self.derive(salt, login)
+
+        entry = entries.get(entry_id)
+        if not isinstance(entry, dict):
+            return None, None
+
+        expires = entry.get('expires')
+        if expires is None:
+            expires = float('inf')
+
+        if expires <= self._clock():
+            return None, None
+
+        fernet = self._get_fernet(key)
+        from cryptography.fernet import InvalidToken
+
+        try:
+            response = json.loads(fernet.decrypt(entry['data'].encode('ascii')))
+        except (InvalidToken, KeyError, TypeError, ValueError, AttributeError):
+            return None, None
+
+        return response, expires
+
+    def set(self, login, response, expires):
+        '''saves a login response that expires at the given time, and removes expired entries'''
+        salt, entries = self._load()
+        if salt is None:
+            salt = os.urandom(self.SALT_BYTES)
+
+        entry_id, key = self.derive(salt, login)
+        data = self._get_fernet(key).encrypt(json.dumps(response).encode('utf-8')).decode('ascii')
+
+        entries = self._prune(entries)
+        entries[entry_id] = dict(expires=None if expires == float('inf') else expires, data=data)
+
+        self._save(salt, entries)
+
+    def remove(self, login):
+        '''removes the entry for a login, if there is one'''
+        salt, entries = self._load()
+        if salt is None:
+            return
+
+        entry_id, key = self.derive(salt, login)
+        if entry_id in entries:
+            del entries[entry_id]
+            self._save(salt, self._prune(entries))
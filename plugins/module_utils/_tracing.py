@@ -0,0 +1,302 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Ansible Project
+# Simplified BSD License (see LICENSES/BSD-2-Clause.txt or https://opensource.org/licenses/BSD-2-Clause)
+# SPDX-License-Identifier: BSD-2-Clause
+
+'''Python versions supported: >=3.8'''
+
+# FOR INTERNAL COLLECTION USE ONLY
+# The interfaces in this file are meant for use within the community.hashi_vault collection
+# and may not remain stable to outside uses. Changes may be made in ANY release, even a bugfix release.
+# See also: https://github.com/ansible/community/issues/539#issuecomment-780839686
+# Please open an issue if you have questions about this.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import binascii
+import contextlib
+import os
+import re
+import threading
+import time
+
+from ansible_collections.community.hashi_vault.plugins.module_utils._request_stats import HashiVaultRequestStats
+
+
+class HashiVaultTracer():
+    '''
+    Traces a call of a plugin or module as OpenTelemetry spans, exported in the OTLP JSON format.
+
+    start() begins the parent span of the call, and end() finishes it and returns the trace as an OTLP JSON document
+    (an ExportTraceServiceRequest), which is also passed to on_end, if given.
+
+    While the trace is started:
+      - request_hook() and response_hook() add a span for each HTTP request; they can be added to the hooks of a HashiVaultJSONAdapter
+      - record_request() adds a span for a request sent some other way, like by HashiVaultAsyncEngine
+      - span() is a context manager that adds a span for the code it wraps, like a login;
+        the spans of requests sent in the same thread while it's open are its children
+      - each failed attempt of a request that was retried is a child span of the request's span;
+        the attempts of requests sent by hvac are taken from record_retry()
+    '''
+
+    SCOPE_NAME = 'community.hashi_vault'
+
+    SPAN_KIND_INTERNAL = 1
+    SPAN_KIND_CLIENT = 3
+
+    STATUS_CODE_ERROR = 2
+
+    # https://www.w3.org/TR/trace-context/#traceparent-header
+    TRACEPARENT = re.compile(r'^[0-9a-f]{2}-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$')
+
+    # the retries of the request being sent in each thread, as (time, urllib3 RequestHistory) tuples
+    # this is shared by all tracers, since retries are recorded by sessions that are shared by plugins
+    _retries = threading.local()
+
+    def __init__(self, on_end=None):
+        self.on_end = on_end
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._trace_id = None
+        self._root = None
+        self._spans = []
+
+    @staticmethod
+    def _new_id(size):
+        return binascii.hexlify(os.urandom(size)).decode('ascii')
+
+    @classmethod
+    def parse_traceparent(cls, traceparent):
+        '''returns a tuple of the trace ID and parent span ID of a W3C traceparent value, or (None, None) if it isn't valid'''
+        match = cls.TRACEPARENT.match((traceparent or '').strip().lower())
+        if match is None or match.group(1) == '0' * 32 or match.group(2) == '0' * 16:
+            return None, None
+
+        return match.group(1), match.group(2)
+
+    @property
+    def started(self):
+        return self._root is not None
+
+    def _add_span(self, name, kind, start, parent_id, attributes=None):
+        span = dict(
+            name=name,
+            kind=kind,
+            span_id=self._new_id(8),
+            parent_id=parent_id,
+            start=start,
+            end=None,
+            attributes=dict(attributes or {}),
+            error=None,
+        )
+
+        with self._lock:
+            self._spans.append(span)
+
+        return span
+
+    @staticmethod
+    def _end_span(span, end, error=None):
+        span['end'] = max(end, span['start'])
+        if error is not None:
+            span['error'] = str(error) or type(error).__name__
+
+    def _get_stack(self):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _get_parent_id(self):
+        stack = self._get_stack()
+        return stack[-1]['span_id'] if stack else self._root['span_id']
+
+    def start(self, name, attributes=None, traceparent=None, start=None):
+        '''
+        starts a new trace, with a parent span for a call of a plugin or module
+
+        If traceparent is a W3C traceparent value, the spans are part of that trace, as children of its span.
+        If start is given, it's when the call started, in nanoseconds since the epoch, rather than now.
+        '''
+        trace_id, parent_id = self.parse_traceparent(traceparent)
+
+        with self._lock:
+            self._spans = []
+
+        self._local = threading.local()
+        self._trace_id = trace_id or self._new_id(16)
+        self._root = self._add_span(name, self.SPAN_KIND_INTERNAL, time.time_ns() if start is None else start, parent_id, attributes)
+
+        return self._root
+
+    def end(self, error=None):
+        '''ends the trace, and returns it as an OTLP JSON document, or None if it wasn't started'''
+        if self._root is None:
+            return None
+
+        self._end_span(self._root, time.time_ns(), error)
+        self._root = None
+
+        document = self.to_otlp()
+        if self.on_end is not None:
+            self.on_end(document)
+
+        return document
+
+    @contextlib.contextmanager
+    def span(self, name, attributes=None):
+        '''a context manager that adds a span for the code it wraps, if the trace is started'''
+        if self._root is None:
+            yield None
+            return
+
+        span = self._add_span(name, self.SPAN_KIND_INTERNAL, time.time_ns(), self._get_parent_id(), attributes)
+        stack = self._get_stack()
+        stack.append(span)
+
+        error = None
+        try:
+            yield span
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            stack.pop()
+            self._end_span(span, time.time_ns(), error)
+
+    def record_request(self, method, url, status, start, end, size=0, attempts=()):
+        '''
+        adds a span for a request, sent from start to end (in nanoseconds since the epoch)
+
+        attempts is a list of the failed attempts that were retried, as (start, end, status, error) tuples,
+        where status is None if the attempt got no response.
+        '''
+        if self._root is None:
+            return None
+
+        method = method.upper()
+        path = HashiVaultRequestStats.get_path_template(url)
+
+        attributes = {
+            'http.request.method': method,
+            'url.template': path,
+            'http.response.status_code': status,
+            'http.response.body.size': size,
+        }
+        if attempts:
+            attributes['http.request.resend_count'] = len(attempts)
+
+        span = self._add_span('%s %s' % (method, path), self.SPAN_KIND_CLIENT, start, self._get_parent_id(), attributes)
+        self._end_span(span, end, status if status is not None and status >= 400 else None)
+
+        for i, (attempt_start, attempt_end, attempt_status, attempt_error) in enumerate(attempts, 1):
+            attributes = {'vault.retry.attempt': i}
+            if attempt_status is not None:
+                attributes['http.response.status_code'] = attempt_status
+            if attempt_error is not None:
+                attributes['error.type'] = type(attempt_error).__name__
+
+            retry = self._add_span('retry', self.SPAN_KIND_INTERNAL, attempt_start, span['span_id'], attributes)
+            self._end_span(retry, attempt_end, attempt_error if attempt_error is not None else attempt_status)
+
+        return span
+
+    @classmethod
+    def record_retry(cls, history):
+        '''
+        records the retry of the request being sent in this thread, from the history of its urllib3 Retry
+
+        Retries are only recorded for a request whose request_hook() was called, so nothing is kept when no trace is started.
+        '''
+        retries = getattr(cls._retries, 'list', None)
+        if history and retries is not None:
+            retries.append((time.time_ns(), history[-1]))
+
+    @classmethod
+    def _pop_retries(cls):
+        retries = getattr(cls._retries, 'list', None) or []
+        cls._retries.list = None
+        return retries
+
+    def request_hook(self, method, url, kwargs):
+        '''a HashiVaultJSONAdapter request hook that starts recording the retries of a request, dropping any left over from an earlier one that failed'''
+        self._retries.list = []
+
+    def response_hook(self, response, *args, **kwargs):
+        '''a requests response hook that adds a span for the request of a response'''
+        end = time.time_ns()
+        start = end - int(response.elapsed.total_seconds() * 1e9)
+
+        attempts = []
+        attempt_start = start
+        for when, history in self._pop_retries():
+            attempts.append((attempt_start, when, history.status, history.error))
+            attempt_start = max(attempt_start, when)
+
+        self.record_request(
+            method=response.request.method,
+            url=response.request.url,
+            status=response.status_code,
+            start=start,
+            end=end,
+            size=len(response.content or b''),
+            attempts=attempts,
+        )
+
+    @staticmethod
+    def _get_value(value):
+        if isinstance(value, bool):
+            return {'boolValue': value}
+        if isinstance(value, int):
+            # 64 bit integers are strings in OTLP JSON
+            return {'intValue': str(value)}
+        if isinstance(value, float):
+            return {'doubleValue': value}
+        return {'stringValue': str(value)}
+
+    @classmethod
+    def _get_attributes(cls, attributes):
+        return [dict(key=key, value=cls._get_value(value)) for key, value in sorted(attributes.items()) if value is not None]
+
+    def to_otlp(self):
+        '''returns the spans of the trace as an OTLP JSON document'''
+        with self._lock:
+            spans = list(self._spans)
+
+        otlp_spans = []
+        for span in spans:
+            end = span['end'] if span['end'] is not None else time.time_ns()
+            otlp_span = dict(
+                traceId=self._trace_id,
+                spanId=span['span_id'],
+                name=span['name'],
+                kind=span['kind'],
+                startTimeUnixNano=str(span['start']),
+                endTimeUnixNano=str(end),
+                attributes=self._get_attributes(span['attributes']),
+                status={},
+            )
+
+            if span['parent_id'] is not None:
+                otlp_span['parentSpanId'] = span['parent_id']
+
+            if span['error'] is not None:
+                otlp_span['status'] = dict(code=self.STATUS_CODE_ERROR, message=span['error'])
+
+            otlp_spans.append(otlp_span)
+
+        resource = {
+            'service.name': self.SCOPE_NAME,
+            'process.pid': os.getpid(),
+        }
+
+        return dict(resourceSpans=[dict(
+            resource=dict(attributes=self._get_attributes(resource)),
+            scopeSpans=[dict(scope=dict(name=self.SCOPE_NAME), spans=otlp_spans)],
+        )])
+
+    @staticmethod
+    def write(path, document):
+        '''appends an OTLP JSON document to a file, as a line of JSON'''
+        HashiVaultRequestStats.write(path, [document])
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Ansible Project
+# Simplified BSD License (see LICENSES/BSD-2-Clause.txt or https://opensource.org/licenses/BSD-2-Clause)
+# SPDX-License-Identifier: BSD-2-Clause
+
+'''Python versions supported: >=3.8'''
+
+# FOR INTERNAL COLLECTION USE ONLY
+# The interfaces in this file are meant for use within the community.hashi_vault collection
+# and may not remain stable to outside uses. Changes may be made in ANY release, even a bugfix release.
+# See also: https://github.com/ansible/community/issues/539#issuecomment-780839686
+# Please open an issue if you have questions about this.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import socket
+import threading
+
+from urllib.parse import quote, unquote, urlsplit
+
+try:
+    from requests.adapters import HTTPAdapter
+    try:
+        from urllib3.connection import HTTPConnection
+        from urllib3.connectionpool import HTTPConnectionPool
+        from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+    except ImportError:
+        from requests.packages.urllib3.connection import HTTPConnection
+        from requests.packages.urllib3.connectionpool import HTTPConnectionPool
+        from requests.packages.urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+except ImportError:
+    # requests is a dependency of hvac, which is checked for by HashiVaultHelper
+    HTTPAdapter = HTTPConnection = HTTPConnectionPool = object
+
+from ansible_collections.community.hashi_vault.plugins.module_utils._circuit_breaker import HashiVaultCircuitBreakerAdapter
+
+
+class _UnixSocketHTTPConnection(HTTPConnection):
+    '''an HTTP connection over a unix domain socket'''
+
+    def __init__(self, *args, **kwargs):
+        self.socket_path = kwargs.pop('socket_path')
+        super(_UnixSocketHTTPConnection, self).__init__(*args, **kwargs)
+
+    def _new_conn(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+        # urllib3 may use a sentinel for its default timeout, which means no timeout here
+        if isinstance(self.timeout, (int, float)):
+            sock.settimeout(self.timeout)
+
+        try:
+            sock.connect(self.socket_path)
+        except socket.timeout:
+            sock.close()
+            raise ConnectTimeoutError(self, "Connection to %s timed out. (connect timeout=%s)" % (self.socket_path, self.timeout))
+        except OSError as e:
+            sock.close()
+            raise NewConnectionError(self, "Failed to establish a new connection to %s: %s" % (self.socket_path, e))
+
+        return sock
+
+
+class _UnixSocketHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _UnixSocketHTTPConnection
+
+
+class HashiVaultUnixSocketAdapter(HTTPAdapter):
+    '''
+    An HTTPAdapter that sends requests over unix domain sockets, for a Vault Agent or Vault Proxy listening on one.
+
+    Its URLs use the http+unix scheme, with the path of the socket, percent-encoded, in place of the host.
+    That keeps them valid http URLs, so that requests still adds query parameters to them.
+    '''
+
+    SCHEME = 'http+unix'
+
+    def __init__(self, **kwargs):
+        # HTTPAdapter.__init__ calls init_poolmanager
+        self._pools_lock = threading.Lock()
+        self._pools = {}
+        super(HashiVaultUnixSocketAdapter, self).__init__(**kwargs)
+
+    @classmethod
+    def from_unix_url(cls, url):
+        '''returns the http+unix URL for a unix:///path/to/socket URL, or None if it isn't one'''
+        if url is None or not url.startswith('unix://'):
+            return None
+
+        return '%s://%s' % (cls.SCHEME, quote(url[len('unix://'):].rstrip('/'), safe=''))
+
+    @staticmethod
+    def get_socket_path(url):
+        return unquote(urlsplit(url).netloc)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super(HashiVaultUnixSocketAdapter, self).init_poolmanager(*args, **kwargs)
+
+        # pools created with the previous settings are replaced as they're needed
+        self._clear_pools()
+
+    def _clear_pools(self):
+        with self._pools_lock:
+            pools = self._pools
+            self._pools = {}
+
+        for pool in pools.values():
+            pool.close()
+
+    def get_pools(self):
+        '''returns the connection pools that are open, one for each socket'''
+        with self._pools_lock:
+            return list(self._pools.values())
+
+    def _get_pool(self, url):
+        socket_path = self.get_socket_path(url)
+
+        with self._pools_lock:
+            try:
+                return self._pools[socket_path]
+            except KeyError:
+                pool = self._pools[socket_path] = _UnixSocketHTTPConnectionPool(
+                    'localhost', maxsize=self._pool_maxsize, block=self._pool_block, socket_path=socket_path
+                )
+                return pool
+
+    def get_connection_with_tls_context(self, request, verify, proxies=None, cert=None):
+        return self._get_pool(request.url)
+
+    def get_connection(self, url, proxies=None):
+        # used by requests versions older than 2.32
+        return self._get_pool(url)
+
+    def request_url(self, request, proxies):
+        # requests are never sent through a proxy
+        return request.path_url
+
+    def close(self):
+        super(HashiVaultUnixSocketAdapter, self).close()
+        self._clear_pools()
+
+
+class HashiVaultUnixSocketCircuitBreakerAdapter(HashiVaultCircuitBreakerAdapter, HashiVaultUnixSocketAdapter):
+    '''a HashiVaultUnixSocketAdapter with a circuit breaker'''
+    pass
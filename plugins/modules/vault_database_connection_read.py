@@ -29,6 +29,8 @@ extends_documentation_fragment:
   - community.hashi_vault.attributes.check_mode_read_only
   - community.hashi_vault.connection
   - community.hashi_vault.auth
+  - community.hashi_vault.stats
+  - community.hashi_vault.trace
   - community.hashi_vault.engine_mount
 options:
   connection_name:
@@ -32,6 +32,8 @@ extends_documentation_fragment:
   - community.hashi_vault.attributes.check_mode_read_only
   - community.hashi_vault.connection
   - community.hashi_vault.auth
+  - community.hashi_vault.stats
+  - community.hashi_vault.trace
   - community.hashi_vault.engine_mount
 options:
   engine_mount_point:
@@ -44,8 +46,30 @@ options:
     type: str
     required: True
   version:
-    description: Specifies the version to return. If not set the latest version is returned.
+    description:
+      - Specifies the version to return. If not set the latest version is returned.
+      - Cannot be used with I(cached_version).
+    type: int
+  cached_version:
+    description:
+      - The version of the secret that's already held, usually from the C(metadata) returned by an earlier run of this module.
+      - If it's still the current version of the secret, the secret isn't read again, and only I(unchanged) and I(metadata) are returned,
+        so that large secrets are only read when they change.
+      - The current version is found with a smaller request that returns none of the secret's data (see I(revalidate_with)).
+        If that request fails, for example because the token can't read the secret's metadata, the secret is read as if this wasn't set.
+      - Cannot be used with I(version).
     type: int
+    version_added: 7.2.0
+  revalidate_with:
+    description:
+      - How to find the current version of the secret, when I(cached_version) is set.
+      - C(metadata) reads the secret's metadata, which needs the C(read) capability on C(<engine_mount_point>/metadata/<path>).
+      - C(subkeys) reads the top level keys of the secret, without their values, which needs the C(read) capability
+        on C(<engine_mount_point>/subkeys/<path>), and Vault 1.10 or later.
+    type: str
+    choices: [metadata, subkeys]
+    default: metadata
+    version_added: 7.2.0
 '''
 
 EXAMPLES = r'''
@@ -81,12 +105,24 @@ EXAMPLES = r'''
   ansible.builtin.assert:
     that:
       - response.metadata.version == 5
+
+- name: Read a large kv2 secret only if it has changed since it was last read
+  community.hashi_vault.vault_kv2_get:
+    url: https://vault:8201
+    path: certs/bundle
+    cached_version: "{{ bundle.metadata.version | default(omit) }}"
+  register: check
+
+- name: Keep the new version of the secret, if it was read
+  ansible.builtin.set_fact:
+    bundle: "{{ check }}"
+  when: not check.unchanged
 '''
 
 RETURN = r'''
 raw:
   description: The raw result of the read against the given path.
-  returned: success
+  returned: success, unless I(unchanged=true)
   type: dict
   sample:
     auth: null
@@ -108,7 +144,7 @@ raw:
     wrap_info: null
 data:
   description: The C(data) field of raw result. This can also be accessed via C(raw.data).
-  returned: success
+  returned: success, unless I(unchanged=true)
   type: dict
   sample:
     data:
@@ -122,13 +158,15 @@ data:
       version: 2
 secret:
   description: The C(data) field within the C(data) field. Equivalent to C(raw.data.data).
-  returned: success
+  returned: success, unless I(unchanged=true)
   type: dict
   sample:
     Key1: value1
     Key2: value2
 metadata:
-  description: The C(metadata) field within the C(data) field. Equivalent to C(raw.data.metadata).
+  description:
+    - The C(metadata) field within the C(data) field. Equivalent to C(raw.data.metadata).
+    - With I(unchanged=true), the metadata of the current version of the secret, which is the same.
   returned: success
   type: dict
   sample:
@@ -137,6 +175,14 @@ metadata:
     deletion_time: ""
     destroyed: false
     version: 2
+unchanged:
+  description:
+    - Whether I(cached_version) is still the current version of the secret, in which case the secret wasn't read.
+    - Always C(false) when I(cached_version) isn't set.
+  returned: success
+  type: bool
+  sample: false
+  version_added: 7.2.0
 '''
 
 import traceback
@@ -145,6 +191,7 @@ from ansible.module_utils.common.text.converters import to_text
 
 from ansible_collections.community.hashi_vault.plugins.module_utils._hashi_vault_module import HashiVaultModule
 from ansible_collections.community.hashi_vault.plugins.module_utils._hashi_vault_common import HashiVaultValueError
+from ansible_collections.community.hashi_vault.plugins.module_utils._kv2_version import HashiVaultKv2Version
 
 
 def run_module():
@@ -152,16 +199,21 @@ def run_module():
         engine_mount_point=dict(type='str', default='secret'),
         path=dict(type='str', required=True),
         version=dict(type='int'),
+        cached_version=dict(type='int'),
+        revalidate_with=dict(type='str', choices=['metadata', 'subkeys'], default='metadata'),
     )
 
     module = HashiVaultModule(
         argument_spec=argspec,
+        mutually_exclusive=[['version', 'cached_version']],
         supports_check_mode=True
     )
 
     engine_mount_point = module.params.get('engine_mount_point')
     path = module.params.get('path')
     version = module.params.get('version')
+    cached_version = module.params.get('cached_version')
+    revalidate_with = module.params.get('revalidate_with')
 
     module.connection_options.process_connection_options()
     client_args = module.connection_options.get_hvac_connection_options()
@@ -174,6 +226,16 @@ def run_module():
     except (NotImplementedError, HashiVaultValueError) as e:
         module.fail_json(msg=to_text(e), exception=traceback.format_exc())
 
+    if cached_version is not None:
+        # if the version can't be checked, the full read will show why
+        try:
+            current = HashiVaultKv2Version.read_current(client, path, engine_mount_point, revalidate_with)
+        except hvac_exceptions.VaultError:
+            current = None
+
+        if current is not None and current.get('version') == cached_version:
+            module.exit_json(unchanged=True, metadata=current)
+
     try:
         raw = client.secrets.kv.v2.read_secret_version(path=path, version=version, mount_point=engine_mount_point)
     except hvac_exceptions.Forbidden as e:
@@ -187,7 +249,7 @@ def run_module():
     data = raw['data']
     metadata = data['metadata']
     secret = data['data']
-    module.exit_json(raw=raw, data=data, secret=secret, metadata=metadata)
+    module.exit_json(raw=raw, data=data, secret=secret, metadata=metadata, unchanged=False)
 
 
 def main():
@@ -28,6 +28,8 @@ DOCUMENTATION = """
     - community.hashi_vault.attributes.action_group
     - community.hashi_vault.connection
     - community.hashi_vault.auth
+    - community.hashi_vault.stats
+    - community.hashi_vault.trace
   notes:
     - "A login is a write operation (creating a token persisted to storage), so this module always reports C(changed=True),
       except when used with C(token) auth, because no new token is created in that case. For the purposes of Ansible playbooks however,
@@ -30,6 +30,8 @@ DOCUMENTATION = """
     - community.hashi_vault.attributes.action_group
     - community.hashi_vault.connection
     - community.hashi_vault.auth
+    - community.hashi_vault.stats
+    - community.hashi_vault.trace
     - community.hashi_vault.engine_mount
   attributes:
     check_mode:
@@ -29,6 +29,8 @@ DOCUMENTATION = """
     - community.hashi_vault.attributes.check_mode_read_only
     - community.hashi_vault.connection
     - community.hashi_vault.auth
+    - community.hashi_vault.stats
+    - community.hashi_vault.trace
   options:
     path:
       description: Vault path to be read.
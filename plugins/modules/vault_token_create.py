@@ -31,6 +31,8 @@ DOCUMENTATION = """
     - community.hashi_vault.attributes.action_group
     - community.hashi_vault.connection
     - community.hashi_vault.auth
+    - community.hashi_vault.stats
+    - community.hashi_vault.trace
     - community.hashi_vault.token_create
     - community.hashi_vault.wrapping
   notes:
@@ -39,6 +39,8 @@ DOCUMENTATION = """
     - community.hashi_vault.attributes.action_group
     - community.hashi_vault.connection
     - community.hashi_vault.auth
+    - community.hashi_vault.stats
+    - community.hashi_vault.trace
     - community.hashi_vault.wrapping
   options:
     path:
@@ -111,6 +113,7 @@ from ansible.module_utils.common.text.converters import to_text
 
 from ..module_utils._hashi_vault_module import HashiVaultModule
 from ..module_utils._hashi_vault_common import HashiVaultValueError
+from ..module_utils._json_adapter import HashiVaultJSONAdapter
 
 
 def run_module():
@@ -162,19 +165,11 @@ def run_module():
         module.fail_json(msg="Internal Server Error: %s" % to_text(e), exception=traceback.format_exc())
 
     # https://github.com/hvac/hvac/issues/797
-    # HVAC returns a raw response object when the body is not JSON.
-    # That includes 204 responses, which are successful with no body.
-    # So we will try to detect that and a act accordingly.
-    # A better way may be to implement our own adapter for this
-    # collection, but it's a little premature to do that.
-    if hasattr(response, 'json') and callable(response.json):
-        if response.status_code == 204:
-            output = {}
-        else:
-            module.warn('Vault returned status code %i and an unparsable body.' % response.status_code)
-            output = response.content
-    else:
-        output = response
+    # HashiVaultJSONAdapter returns 204 responses (successful with no body) as an empty dict,
+    # but the raw response object is still returned when a body is not JSON.
+    output, unparsable = HashiVaultJSONAdapter.get_data(response)
+    if unparsable:
+        module.warn('Vault returned status code %i and an unparsable body.' % response.status_code)
 
     module.exit_json(changed=True, data=output)
 
@@ -0,0 +1,567 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# FOR INTERNAL COLLECTION USE ONLY
+# The interfaces in this file are meant for use within the community.hashi_vault collection
+# and may not remain stable to outside uses. Changes may be made in ANY release, even a bugfix release.
+# See also: https://github.com/ansible/community/issues/539#issuecomment-780839686
+# Please open an issue if you have questions about this.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import base64
+import contextlib
+import errno
+import fcntl
+import hashlib
+import json
+import multiprocessing
+import os
+import socket
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+
+from concurrent.futures import Future
+
+from ansible_collections.community.hashi_vault.plugins.module_utils._hashi_vault_common import HashiVaultSessionPool
+from ansible_collections.community.hashi_vault.plugins.module_utils._connection_options import HashiVaultConnectionOptions
+from ansible_collections.community.hashi_vault.plugins.module_utils._ha_routing import HashiVaultHARouter
+from ansible_collections.community.hashi_vault.plugins.module_utils._private_directory import get_private_directory
+from ansible_collections.community.hashi_vault.plugins.module_utils._read_cache import HashiVaultReadCache
+from ansible_collections.community.hashi_vault.plugins.module_utils._ssl_context import HashiVaultHTTPAdapter
+from ansible_collections.community.hashi_vault.plugins.module_utils._token_cache import HashiVaultTokenCache
+from ansible_collections.community.hashi_vault.plugins.module_utils._unix_socket import HashiVaultUnixSocketAdapter
+
+try:
+    import requests
+    from requests.adapters import BaseAdapter
+    from requests.structures import CaseInsensitiveDict
+    from requests.utils import get_encoding_from_headers
+except ImportError:
+    # requests is a dependency of hvac, which is checked for by HashiVaultHelper
+    BaseAdapter = object
+
+
+# requests exceptions that are passed from the broker back to the worker as themselves, all others become ConnectionError
+_PASSED_EXCEPTIONS = ['ConnectTimeout', 'ReadTimeout', 'Timeout', 'SSLError', 'ProxyError', 'RetryError', 'ConnectionError']
+
+
+def _recv_all(sock):
+    chunks = []
+    while True:
+        chunk = sock.recv(65536)
+        if not chunk:
+            return b''.join(chunks)
+        chunks.append(chunk)
+
+
+class HashiVaultBrokerError(Exception):
+    pass
+
+
+class HashiVaultBroker():
+    '''
+    A process that makes Vault requests on behalf of the worker processes of one controller.
+
+    Workers send each HTTP request over a Unix domain socket (see HashiVaultBrokerAdapter). The broker sends it to Vault
+    with sessions that are kept open for the life of the broker, and answers identical logins, and identical reads that
+    the worker marked as shareable (see HashiVaultBrokerAdapter.shareable), that are in flight at the same time with
+    a single request to Vault. When the worker asks for it, responses to those reads and logins are also cached,
+    so workers that come later get the same token and the same responses.
+    '''
+
+    POOL_MAXSIZE = 50
+    POLL_INTERVAL = 0.5
+
+    # reads that are never shared, even when they're marked as shareable, because each one returns something new,
+    # like the dynamic credentials of the database and aws secrets engines, or is a check of a token that has to reach Vault
+    UNSHAREABLE_SEGMENTS = frozenset(['creds', 'sts'])
+    UNSHAREABLE_PATHS = frozenset(['/v1/auth/token/lookup-self'])
+
+    def __init__(self, socket_path, idle_timeout=60, owner_pid=None):
+        self.socket_path = socket_path
+        self.idle_timeout = idle_timeout
+        self.owner_pid = owner_pid
+        self.cache = HashiVaultReadCache()
+
+        self._lock = threading.Lock()
+        self._inflight = {}
+        self._last_request = time.monotonic()
+        self._server = None
+
+    @staticmethod
+    def is_login(method, url):
+        '''whether a request is a login, which is not a read, but can safely be shared by identical requests'''
+        path = requests.utils.urlparse(url).path.rstrip('/')
+        return method in ('POST', 'PUT') and '/v1/auth/' in path and ('/login' in path)
+
+    @staticmethod
+    def is_read(method):
+        return method in ('GET', 'LIST')
+
+    @classmethod
+    def is_shareable_read(cls, envelope):
+        '''whether a request is a read that the worker marked as shareable, and that can safely be shared by identical requests'''
+        if not (envelope.get('shareable') and cls.is_read(envelope.get('method', '').upper())):
+            return False
+
+        path = requests.utils.urlparse(envelope['url']).path.rstrip('/')
+        return path not in cls.UNSHAREABLE_PATHS and cls.UNSHAREABLE_SEGMENTS.isdisjoint(path.split('/'))
+
+    @staticmethod
+    def make_key(envelope):
+        '''returns a key identifying a request, hashed since it includes the token and any credentials in the body'''
+        material = json.dumps(
+            [envelope.get(k) for k in ('method', 'url', 'headers', 'body', 'verify', 'cert', 'proxies', 'retries', 'circuit_breaker', 'nodes')],
+            sort_keys=True, default=str
+        )
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    def get_session(self, envelope):
+        verify = envelope.get('verify')
+        cert = envelope.get('cert')
+        proxies = envelope.get('proxies')
+        retries = envelope.get('retries')
+        circuit_breaker = envelope.get('circuit_breaker')
+        nodes = envelope.get('nodes')
+        unix = envelope['url'].startswith(HashiVaultUnixSocketAdapter.SCHEME + '://')
+
+        def _factory():
+            if retries is not None or circuit_breaker or nodes or unix:
+                session = HashiVaultConnectionOptions(None)._get_custom_requests_session(retries=retries, circuit_breaker=circuit_breaker, nodes=nodes)
+            else:
+                session = requests.Session()
+                adapter = HashiVaultHTTPAdapter()
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+
+            HashiVaultSessionPool.ensure_pool_maxsize(session, self.POOL_MAXSIZE)
+            return session
+
+        key = HashiVaultSessionPool.make_key(
+            verify=verify, cert=cert, proxies=proxies, retries=retries, circuit_breaker=circuit_breaker, nodes=nodes, unix=unix,
+        )
+        return HashiVaultSessionPool.get_session(key, _factory)
+
+    def perform(self, envelope):
+        '''sends a request to Vault, returning a dict describing the response, or the error'''
+        session = self.get_session(envelope)
+
+        body = envelope.get('body')
+        if body is not None:
+            body = base64.b64decode(body)
+
+        # a (connect, read) timeout tuple becomes a list in JSON
+        timeout = envelope.get('timeout')
+        if isinstance(timeout, list):
+            timeout = tuple(timeout)
+
+        try:
+            response = session.request(
+                method=envelope['method'],
+                url=envelope['url'],
+                headers=envelope.get('headers'),
+                data=body,
+                timeout=timeout,
+                verify=envelope.get('verify'),
+                cert=envelope.get('cert'),
+                proxies=envelope.get('proxies'),
+                allow_redirects=False,
+            )
+        except requests.exceptions.RequestException as e:
+            error_type = type(e).__name__
+            if error_type not in _PASSED_EXCEPTIONS:
+                error_type = 'ConnectionError'
+            return dict(error=str(e), error_type=error_type)
+
+        return dict(
+            status=response.status_code,
+            reason=response.reason,
+            headers=dict(response.headers),
+            body=base64.b64encode(response.content).decode('ascii'),
+        )
+
+    def _wants_cache(self, envelope):
+        '''whether the worker asked for this kind of request to be cached'''
+        cache = envelope.get('cache') or {}
+
+        if self.is_read(envelope['method'].upper()):
+            return bool(cache.get('ttl'))
+
+        return bool(cache.get('token'))
+
+    def _get_cache_ttl(self, envelope, result):
+        '''returns the number of seconds a result may be cached for, or None if it shouldn't be cached'''
+        cache = envelope.get('cache') or {}
+
+        if not self._wants_cache(envelope) or result.get('status') != 200:
+            return None
+
+        try:
+            data = json.loads(base64.b64decode(result['body']))
+        except ValueError:
+            return None
+
+        if self.is_read(envelope['method'].upper()):
+            return self.cache.get_ttl(data, cache['ttl'])
+
+        now = time.time()
+        expires = HashiVaultTokenCache.get_expiry(data, issued=now)
+        if expires is None:
+            return None
+
+        return expires - now
+
+    def handle(self, envelope):
+        '''returns the result of a request, sharing it with any identical request already in flight if it can be shared'''
+        self._last_request = time.monotonic()
+
+        method = envelope.get('method', '').upper()
+        if not (self.is_shareable_read(envelope) or self.is_login(method, envelope['url'])):
+            return self.perform(envelope)
+
+        key = self.make_key(envelope)
+
+        if self._wants_cache(envelope):
+            result = self.cache.get(key)
+            if result is not None:
+                return result
+
+        with self._lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+
+        if not owner:
+            return future.result()
+
+        try:
+            result = self.perform(envelope)
+
+            cache = envelope.get('cache') or {}
+            self.cache.configure(max_entries=cache.get('max_entries'), max_bytes=cache.get('max_bytes'))
+            ttl = self._get_cache_ttl(envelope, result)
+            if ttl is not None:
+                self.cache.set(key, result, ttl)
+
+            future.set_result(result)
+            return result
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+
+    def _should_exit(self):
+        if self.owner_pid is not None:
+            try:
+                os.kill(self.owner_pid, 0)
+            except OSError as e:
+                if e.errno == errno.ESRCH:
+                    return True
+
+        return self.idle_timeout is not None and time.monotonic() - self._last_request > self.idle_timeout
+
+    def serve(self):
+        '''serves requests until the owner process exits, or no requests have come in for idle_timeout seconds'''
+        broker = self
+
+        class _Handler(socketserver.BaseRequestHandler):
+            def handle(self):
+                data = _recv_all(self.request)
+                if not data:
+                    # a connection without a request, see HashiVaultBroker.ping
+                    return
+
+                try:
+                    result = broker.handle(json.loads(data))
+                except Exception as e:
+                    result = dict(error='%s: %s' % (type(e).__name__, e), error_type='ConnectionError')
+
+                try:
+                    self.request.sendall(json.dumps(result).encode('utf-8'))
+                except (OSError, socket.error):
+                    # the worker went away
+                    pass
+
+        class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+            daemon_threads = True
+
+        old_umask = os.umask(0o077)
+        try:
+            self._server = _Server(self.socket_path, _Handler)
+        finally:
+            os.umask(old_umask)
+
+        thread = threading.Thread(target=self._server.serve_forever, kwargs=dict(poll_interval=self.POLL_INTERVAL))
+        thread.daemon = True
+        thread.start()
+
+        try:
+            while not self._should_exit():
+                time.sleep(self.POLL_INTERVAL)
+        finally:
+            self.shutdown()
+
+    def shutdown(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+            try:
+                os.unlink(self.socket_path)
+            except OSError:
+                pass
+
+    @staticmethod
+    def get_owner_pid():
+        '''
+        returns the pid of the controller process that a broker is shared for
+
+        Lookups usually run in a worker process, whose parent is the controller, but they can also run in the controller itself.
+        '''
+        parent = multiprocessing.parent_process()
+        return os.getpid() if parent is None else parent.pid
+
+    @staticmethod
+    def get_socket_path(owner_pid):
+        '''returns the socket path of the broker for a controller process, in a directory only the current user can use'''
+        try:
+            directory = get_private_directory()
+        except OSError as e:
+            raise HashiVaultBrokerError("Unable to use the broker directory: %s" % e) from e
+
+        return os.path.join(directory, 'broker-%i.sock' % owner_pid)
+
+    @staticmethod
+    def ping(socket_path):
+        '''whether a broker is listening on socket_path'''
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(1)
+            sock.connect(socket_path)
+            return True
+        except (OSError, socket.error):
+            return False
+        finally:
+            sock.close()
+
+    @classmethod
+    def ensure_started(cls, socket_path, idle_timeout, owner_pid, start_timeout=10):
+        '''starts a broker on socket_path, unless one is already running there'''
+        if cls.ping(socket_path):
+            return
+
+        # only one worker starts the broker, the others wait for it
+        with open(socket_path + '.lock', 'w') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                if cls.ping(socket_path):
+                    return
+
+                # a socket that nothing listens on was left behind by a broker that didn't exit cleanly
+                if os.path.exists(socket_path):
+                    os.unlink(socket_path)
+
+                cls.spawn(socket_path, idle_timeout, owner_pid)
+
+                deadline = time.monotonic() + start_timeout
+                while not cls.ping(socket_path):
+                    if time.monotonic() > deadline:
+                        raise HashiVaultBrokerError("The broker didn't start listening on '%s' within %i seconds." % (socket_path, start_timeout))
+                    time.sleep(0.05)
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    @staticmethod
+    def spawn(socket_path, idle_timeout, owner_pid):
+        '''starts a broker in a new, detached, python process'''
+        # the directory that contains ansible_collections, so the new interpreter can import this collection
+        collections_root = os.path.abspath(os.path.join(os.path.dirname(__file__), *(['..'] * 5)))
+
+        env = os.environ.copy()
+        env['PYTHONPATH'] = os.pathsep.join(p for p in (collections_root, env.get('PYTHONPATH')) if p)
+
+        code = 'from ansible_collections.community.hashi_vault.plugins.plugin_utils._hashi_vault_broker import main; main()'
+
+        with open(os.devnull, 'r+b') as devnull:
+            subprocess.Popen(
+                [sys.executable, '-c', code, socket_path, str(idle_timeout), str(owner_pid)],
+                stdin=devnull, stdout=devnull, stderr=devnull,
+                cwd='/', env=env, close_fds=True, start_new_session=True,
+            )
+
+
+class HashiVaultBrokerAdapter(BaseAdapter):
+    '''A requests transport adapter that sends requests through a HashiVaultBroker'''
+
+    # used to find the longest a request sent through the broker can take, see get_exchange_timeout()
+    DEFAULT_TIMEOUT = 30
+    BACKOFF_MAX = 120
+    EXCHANGE_MARGIN = 30
+
+    _local = threading.local()
+
+    def __init__(self, socket_path, retries=None, cache=None, circuit_breaker=None, nodes=None):
+        super(HashiVaultBrokerAdapter, self).__init__()
+        self.socket_path = socket_path
+        self.retries = retries
+        self.cache = cache
+        self.circuit_breaker = circuit_breaker
+        self.nodes = nodes
+
+    @classmethod
+    @contextlib.contextmanager
+    def shareable(cls):
+        '''
+        marks the reads sent by the current thread inside the context as safe for the broker to share with identical reads,
+        and to cache, because they return the same response each time, like the reads cached by HashiVaultLookupBase.cached_read()
+        '''
+        previous = getattr(cls._local, 'shareable', False)
+        cls._local.shareable = True
+        try:
+            yield
+        finally:
+            cls._local.shareable = previous
+
+    def get_exchange_timeout(self, timeout):
+        '''
+        returns the number of seconds to wait for the broker to answer a request, which is the longest the broker could take
+        to send it, with all of its retries, on all nodes, and a margin, so that a broker that stopped responding can't hang a worker
+        '''
+        if isinstance(timeout, (tuple, list)):
+            attempt = sum(t or self.DEFAULT_TIMEOUT for t in timeout)
+        else:
+            attempt = timeout or self.DEFAULT_TIMEOUT
+        attempt *= max(1, len(self.nodes or ()))
+
+        retries = self.retries or {}
+        total = retries.get('total')
+        if not isinstance(total, int) or isinstance(total, bool):
+            total = 0
+
+        if retries.get('deadline') is not None:
+            # no retry starts after the deadline
+            waiting = retries['deadline'] + attempt
+        else:
+            backoff = retries.get('backoff_factor') or 0
+            waiting = (total + 1) * attempt + sum(min(backoff * 2 ** i, self.BACKOFF_MAX) for i in range(total))
+
+        return waiting + self.EXCHANGE_MARGIN
+
+    def _exchange(self, envelope):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(self.get_exchange_timeout(envelope.get('timeout')))
+            sock.connect(self.socket_path)
+            sock.sendall(json.dumps(envelope).encode('utf-8'))
+            sock.shutdown(socket.SHUT_WR)
+            return json.loads(_recv_all(sock))
+        except (OSError, socket.error, ValueError) as e:
+            raise requests.exceptions.ConnectionError("Error communicating with the Vault broker at '%s': %s" % (self.socket_path, e))
+        finally:
+            sock.close()
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        body = request.body
+        if body is not None:
+            if not isinstance(body, bytes):
+                body = body.encode('utf-8')
+            body = base64.b64encode(body).decode('ascii')
+
+        envelope = dict(
+            method=request.method,
+            url=request.url,
+            headers=dict(request.headers),
+            body=body,
+            timeout=timeout,
+            verify=verify,
+            cert=cert,
+            proxies=proxies or None,
+            retries=self.retries,
+            circuit_breaker=self.circuit_breaker,
+            nodes=self.nodes,
+            cache=self.cache,
+            shareable=getattr(self._local, 'shareable', False),
+        )
+
+        result = self._exchange(envelope)
+
+        if 'error' in result:
+            exc = getattr(requests.exceptions, result.get('error_type'), requests.exceptions.ConnectionError)
+            raise exc(result['error'], request=request)
+
+        response = requests.models.Response()
+        response.status_code = result['status']
+        response.reason = result.get('reason')
+        response.headers = CaseInsensitiveDict(result.get('headers') or {})
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = base64.b64decode(result['body'])
+        response.url = request.url
+        response.request = request
+        response.connection = self
+
+        return response
+
+    def close(self):
+        pass
+
+
+class HashiVaultBrokerConnectionOptions(HashiVaultConnectionOptions):
+    '''connection options for plugins, which send requests through a HashiVaultBroker when the broker option is enabled'''
+
+    def get_hvac_connection_options(self):
+        hvopts = super(HashiVaultBrokerConnectionOptions, self).get_hvac_connection_options()
+
+        if not self._options.get_option_default('broker', False):
+            return hvopts
+
+        # the broker is shared by all of the controller's workers
+        owner_pid = HashiVaultBroker.get_owner_pid()
+        socket_path = HashiVaultBroker.get_socket_path(owner_pid)
+        HashiVaultBroker.ensure_started(socket_path, self._options.get_option_default('broker_idle_timeout', 60), owner_pid)
+
+        retries = self._options.get_option_default('retries')
+        retry_deadline = self._options.get_option_default('retry_deadline')
+        circuit_breaker = self._options.get_option_default('circuit_breaker')
+        if retries is not None and retry_deadline is not None:
+            retries = dict(retries, deadline=retry_deadline)
+
+        nodes = HashiVaultHARouter.parse_urls(self._options.get_option_default('url'))
+        if len(nodes) < 2:
+            nodes = None
+
+        cache = dict(
+            ttl=self._options.get_option_default('cache_ttl') if self._options.get_option_default('cache', False) else None,
+            max_entries=self._options.get_option_default('cache_max_entries'),
+            max_bytes=self._options.get_option_default('cache_max_bytes'),
+            token=bool(self._options.get_option_default('token_cache', False)),
+        )
+
+        def _factory():
+            session = requests.Session()
+            adapter = HashiVaultBrokerAdapter(socket_path, retries=retries, cache=cache, circuit_breaker=circuit_breaker, nodes=nodes)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            session.mount(HashiVaultUnixSocketAdapter.SCHEME + '://', adapter)
+            return session
+
+        key = HashiVaultSessionPool.make_key(broker=socket_path, retries=retries, cache=cache, circuit_breaker=circuit_breaker, nodes=nodes)
+        hvopts['session'] = HashiVaultSessionPool.get_session(key, _factory)
+        hvopts['session'].verify = hvopts['verify']
+
+        return hvopts
+
+
+def main():
+    socket_path, idle_timeout, owner_pid = sys.argv[1:4]
+    HashiVaultBroker(socket_path, idle_timeout=int(idle_timeout), owner_pid=int(owner_pid)).serve()
@@ -12,11 +12,19 @@
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
+import functools
+
 from ansible.errors import AnsibleError, AnsibleOptionsError
 from ansible.plugins.lookup import LookupBase
 from ansible.utils.display import Display
 
+from ..plugin_utils._hashi_vault_broker import HashiVaultBrokerAdapter
 from ..plugin_utils._hashi_vault_plugin import HashiVaultPlugin
+from ..plugin_utils._hashi_vault_shared_cache import HashiVaultSharedReadCache
+from ..module_utils._async_engine import HashiVaultAsyncEngine
+from ..module_utils._ha_routing import HashiVaultHARouter
+from ..module_utils._hashi_vault_common import HashiVaultValueError
+from ..module_utils._read_cache import HashiVaultReadCache
 
 display = Display()
 
@@ -27,6 +35,22 @@ class HashiVaultLookupBase(HashiVaultPlugin, LookupBase):
         HashiVaultPlugin.__init__(self)
         LookupBase.__init__(self, loader=loader, templar=templar, **kwargs)
 
+        # each lookup implements run() itself, so it's wrapped here to trace every call
+        self.run = self._traced(self.run)
+
+    def _traced(self, run):
+        '''returns run, wrapped so that each call is a call of the plugin for trace_call()'''
+        @functools.wraps(run)
+        def _run(terms, *args, **kwargs):
+            attributes = {'ansible.plugin.type': 'lookup'}
+            if isinstance(terms, list):
+                attributes['ansible.lookup.terms'] = len(terms)
+
+            with self.trace_call(attributes):
+                return run(terms, *args, **kwargs)
+
+        return _run
+
     def parse_kev_term(self, term, plugin_name, first_unqualified=None):
         '''parses a term string into a dictionary'''
         param_dict = {}
@@ -49,3 +73,213 @@ class HashiVaultLookupBase(HashiVaultPlugin, LookupBase):
             param_dict[key] = value
 
         return param_dict
+
+    def list_tree(self, list_folders, prefix, max_depth=None, skip=None):
+        '''
+        returns the paths of all the secrets under prefix, sorted, by listing it and every folder below it, breadth first
+
+        list_folders(paths) returns the keys listed at each of paths, in the same order, where the keys of folders end in a slash.
+        It's called once for each depth, with all the folders at that depth, so it can list them at the same time, like map_terms() does.
+
+        :param max_depth: if given, only that many depths are listed (1 lists only prefix),
+          and the paths of the folders below that are returned instead, with a trailing slash
+        :param skip: if given, a callable that takes the path of a folder, with a trailing slash,
+          and returns True if the folder should be neither listed nor returned
+        '''
+        paths = []
+        folders = [prefix.strip('/')]
+        depth = 0
+
+        while folders:
+            depth += 1
+            subfolders = []
+            for folder, keys in zip(folders, list_folders(folders)):
+                for key in keys:
+                    path = '%s/%s' % (folder, key) if folder else key
+                    if not key.endswith('/'):
+                        paths.append(path)
+                    elif skip is not None and skip(path):
+                        continue
+                    elif max_depth is not None and depth >= max_depth:
+                        paths.append(path)
+                    else:
+                        subfolders.append(path.rstrip('/'))
+
+            folders = subfolders
+
+        return sorted(paths)
+
+    def _get_read_cache(self):
+        '''returns the read cache, configured from the options, or None if the cache option is not enabled'''
+        if not self._options_adapter.get_option_default('cache', False):
+            return None
+
+        cache = HashiVaultReadCache.get_instance()
+        cache.configure(
+            max_entries=self._options_adapter.get_option_default('cache_max_entries'),
+            max_bytes=self._options_adapter.get_option_default('cache_max_bytes'),
+        )
+
+        cache_plugin = self._options_adapter.get_option_default('cache_plugin')
+        if cache_plugin:
+            # entries can't outlive cache_ttl, so it's also the cache plugin's timeout, which removes them from the plugin
+            cache = HashiVaultSharedReadCache.from_plugin(
+                cache,
+                cache_plugin,
+                connection=self._options_adapter.get_option_default('cache_plugin_connection'),
+                prefix=self._options_adapter.get_option_default('cache_plugin_prefix'),
+                timeout=self._options_adapter.get_option_default('cache_ttl'),
+            )
+
+        return cache
+
+    @staticmethod
+    def _make_read_cache_key(cache, client, method, path, version=None):
+        return cache.make_key(
+            url=client.url,
+            namespace=client.adapter.namespace,
+            token=client.token,
+            method=method,
+            path=path,
+            version=version,
+        )
+
+    def _set_read_cache(self, cache, key, result):
+        if isinstance(result, dict):
+            cache.set(key, result, ttl=cache.get_ttl(result, self._options_adapter.get_option_default('cache_ttl')))
+
+    def _get_read_cache_result(self, cache, key, path, revalidate=None):
+        '''returns (result, stale) for key, where result is None if it isn't cached, or stale is True if revalidate showed it isn't current'''
+        result = cache.get(key)
+        stale = result is not None and revalidate is not None and not revalidate(result)
+        if stale:
+            result = None
+        elif result is not None and revalidate is not None:
+            self._set_read_cache(cache, key, result)
+
+        self.request_stats.record_cache(path, hit=result is not None)
+
+        return result, stale
+
+    def cached_read(self, client, method, path, func, version=None, revalidate=None):
+        '''
+        returns the result of func(), from the read cache if the cache option is enabled
+
+        :param client: the authenticated client func uses, to identify the address, namespace, and token of the request
+        :param method: a name for the kind of read func does, to separate different reads of the same path
+        :param path: the path func reads
+        :param func: a callable taking no arguments that performs the read
+        :param version: the version of the secret func reads, if any
+        :param revalidate: if given, a callable that takes a cached result, and returns True if it's still current;
+          a cached result is only used if it is, and is then cached again, for as long as a new result would be
+        '''
+        cache = self._get_read_cache()
+        if cache is None:
+            return func()
+
+        key = self._make_read_cache_key(cache, client, method, path, version)
+
+        result, stale = self._get_read_cache_result(cache, key, path, revalidate)
+        if result is None:
+            if stale:
+                # the broker could have cached the same stale result, so it has to read it from Vault again
+                result = func()
+            else:
+                with HashiVaultBrokerAdapter.shareable():
+                    result = func()
+
+            self._set_read_cache(cache, key, result)
+
+        return result
+
+    def get_async_engine(self, client):
+        '''
+        returns a HashiVaultAsyncEngine that sends requests like client, with the retries and max_concurrency options,
+        and the verify, timeout, and proxies of the processed connection options
+        '''
+        retry_action = self._options_adapter.get_option_default('retry_action', 'warn')
+
+        # the engine sends every request straight to one address, so it can't honor these
+        unsupported = []
+        if len(HashiVaultHARouter.parse_urls(self._options_adapter.get_option_default('url'))) > 1:
+            unsupported.append('a url with multiple addresses')
+        if self._options_adapter.get_option_default('broker', False):
+            unsupported.append('broker')
+        if self._options_adapter.get_option_default('circuit_breaker'):
+            unsupported.append('circuit_breaker')
+
+        if unsupported:
+            raise AnsibleOptionsError("The async concurrency engine can't be used with %s." % ', '.join(unsupported))
+
+        try:
+            return HashiVaultAsyncEngine.from_client(
+                client,
+                self.connection_options.get_hvac_connection_options(),
+                retries=self._options_adapter.get_option_default('retries'),
+                retry_deadline=self._options_adapter.get_option_default('retry_deadline'),
+                max_concurrency=self._options_adapter.get_option_default('max_concurrency') or 1,
+                on_retry=lambda remaining: self._warn_retries_remaining(retry_action, remaining),
+                stats=self.request_stats,
+                tracer=self.tracer if self.tracer.started else None,
+            )
+        except HashiVaultValueError as e:
+            raise AnsibleOptionsError(str(e)) from e
+
+    def map_requests(self, client, terms, fetch, operation, handle, cache_method=None, cache_path=None, version=None, revalidate=None):
+        '''
+        returns handle(term, get_result) for each term, in the same order as terms
+
+        get_result is a callable taking no arguments that returns the result of the request for the term, or raises its error.
+
+        With the default threads concurrency engine, the request for a term is fetch(term), run by map_terms().
+        With the async engine, the requests are the HashiVaultAsyncOperation from operation(term) for each term,
+        all sent by a HashiVaultAsyncEngine before handle is called for any of them.
+
+        If cache_method is given, results are taken from and saved to the read cache as they are by cached_read(),
+        with cache_path(term) as the path if cache_path is given, or the term otherwise, and with version.
+        If revalidate is given, it's called as revalidate(term, result) for each cached result, like the revalidate of cached_read().
+        '''
+        def _get_path(term):
+            return term if cache_path is None else cache_path(term)
+
+        def _get_revalidate(term):
+            return None if revalidate is None else (lambda result: revalidate(term, result))
+
+        if self._options_adapter.get_option_default('concurrency_engine', 'threads') != 'async':
+            def _func(term):
+                if cache_method is None:
+                    return handle(term, lambda: fetch(term))
+                return handle(term, lambda: self.cached_read(
+                    client, cache_method, _get_path(term), lambda: fetch(term), version=version, revalidate=_get_revalidate(term),
+                ))
+
+            return self.map_terms(client, _func, terms)
+
+        engine = self.get_async_engine(client)
+        cache = None if cache_method is None else self._get_read_cache()
+
+        results = [None] * len(terms)
+        keys = {}
+        pending = []
+        for i, term in enumerate(terms):
+            if cache is not None:
+                keys[i] = self._make_read_cache_key(cache, client, cache_method, _get_path(term), version)
+                results[i] = self._get_read_cache_result(cache, keys[i], _get_path(term), _get_revalidate(term))[0]
+                if results[i] is not None:
+                    continue
+
+            pending.append(i)
+
+        for i, result in zip(pending, engine.run([operation(terms[i]) for i in pending], return_exceptions=True)):
+            results[i] = result
+            if cache is not None and not isinstance(result, BaseException):
+                self._set_read_cache(cache, keys[i], result)
+
+        def _getter(result):
+            def _get_result():
+                if isinstance(result, BaseException):
+                    raise result
+                return result
+            return _get_result
+
+        return [handle(term, _getter(result)) for term, result in zip(terms, results)]
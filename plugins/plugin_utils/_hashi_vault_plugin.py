@@ -12,6 +12,13 @@
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
+import contextlib
+import os
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+from ansible.errors import AnsibleOptionsError
 from ansible.plugins import AnsiblePlugin
 from ansible import constants as C
 from ansible.utils.display import Display
@@ -20,10 +27,13 @@ from ansible_collections.community.hashi_vault.plugins.module_utils._hashi_vault
     HashiVaultHelper,
     HashiVaultHVACError,
     HashiVaultOptionAdapter,
+    HashiVaultSessionPool,
 )
 
-from ansible_collections.community.hashi_vault.plugins.module_utils._connection_options import HashiVaultConnectionOptions
 from ansible_collections.community.hashi_vault.plugins.module_utils._authenticator import HashiVaultAuthenticator
+from ansible_collections.community.hashi_vault.plugins.module_utils._request_stats import HashiVaultRequestStats
+from ansible_collections.community.hashi_vault.plugins.module_utils._tracing import HashiVaultTracer
+from ansible_collections.community.hashi_vault.plugins.plugin_utils._hashi_vault_broker import HashiVaultBrokerConnectionOptions
 
 
 display = Display()
@@ -40,20 +50,137 @@ class HashiVaultPlugin(AnsiblePlugin):
             raise AnsibleError(exc.msg)
 
         self._options_adapter = HashiVaultOptionAdapter.from_ansible_plugin(self)
-        self.connection_options = HashiVaultConnectionOptions(self._options_adapter, self._generate_retry_callback)
+        self.connection_options = HashiVaultBrokerConnectionOptions(self._options_adapter, self._generate_retry_callback)
         self.authenticator = HashiVaultAuthenticator(self._options_adapter, display.warning, display.deprecated)
 
+        # requests are only recorded when there's a stats_file for them, and are written to it at the end of each call
+        self.request_stats = HashiVaultRequestStats(enabled=self._get_stats_file)
+        self.helper.response_hooks.append(self.request_stats.response_hook)
+
+        # the trace is started and ended by trace_call(), around each call of the plugin, only when trace_file is set
+        self.tracer = HashiVaultTracer(on_end=self._write_trace)
+        self._pending_trace = None
+
+    def set_options(self, *args, **kwargs):
+        super(HashiVaultPlugin, self).set_options(*args, **kwargs)
+
+        # a call that's being traced may only know whether trace_file is set once its options are
+        self._start_trace()
+
+    @contextlib.contextmanager
+    def trace_call(self, attributes):
+        '''
+        a context manager for a call of the plugin, that traces the code it wraps if the trace_file option is set,
+        and writes the records of the requests it sends to the stats_file
+
+        attributes are the attributes of the parent span. If the options aren't set when it's entered,
+        the trace is started by the set_options() call in the code it wraps, with the same start time.
+        '''
+        self._pending_trace = (attributes, time.time_ns())
+        self._start_trace()
+
+        error = None
+        try:
+            yield
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            self._pending_trace = None
+            self._end_trace(error)
+            self._write_request_stats()
+
+    def _start_trace(self):
+        if self._pending_trace is None or self.tracer.started or not self._options_adapter.get_option_default('trace_file'):
+            return
+
+        attributes, start = self._pending_trace
+        self.tracer.start(self._get_plugin_name(), attributes, traceparent=os.environ.get('TRACEPARENT'), start=start)
+
+        # the hooks are only added while there's a trace, so requests cost nothing extra otherwise
+        self.helper.request_hooks.append(self.tracer.request_hook)
+        self.helper.response_hooks.append(self.tracer.response_hook)
+        self.authenticator.tracer = self.tracer
+
+    def _end_trace(self, error=None):
+        if not self.tracer.started:
+            return
+
+        self.helper.request_hooks.remove(self.tracer.request_hook)
+        self.helper.response_hooks.remove(self.tracer.response_hook)
+        self.authenticator.tracer = None
+
+        self.tracer.end(error=error)
+
+    def _get_plugin_name(self):
+        return getattr(self, 'ansible_name', None) or getattr(self, '_load_name', None)
+
+    def _get_stats_file(self):
+        return self._options_adapter.get_option_default('stats_file')
+
+    def _write_request_stats(self):
+        '''appends the records of the requests made since it was last called to the stats_file, if that option is set'''
+        records = self.request_stats.pop_records()
+        path = self._get_stats_file()
+        if records and path:
+            plugin = self._get_plugin_name()
+            pid = os.getpid()
+            HashiVaultRequestStats.write(path, [dict(record, plugin=plugin, pid=pid) for record in records])
+
+    def _write_trace(self, document):
+        '''appends a trace to the trace_file, if that option is set'''
+        path = self._options_adapter.get_option_default('trace_file')
+        if path:
+            HashiVaultTracer.write(path, document)
+
+    def map_terms(self, client, func, terms):
+        '''
+        calls func(term) for each term and returns the results in the same order as terms
+
+        Up to max_concurrency calls run at the same time, all sharing client.
+        If any call raises, the exception from the earliest failing term is re-raised,
+        just as it would be if the terms were processed one at a time.
+        '''
+        max_concurrency = self._options_adapter.get_option_default('max_concurrency', 1)
+
+        if max_concurrency is None:
+            max_concurrency = 1
+        elif max_concurrency < 1:
+            raise AnsibleOptionsError("max_concurrency must be 1 or greater, got: %r" % max_concurrency)
+
+        workers = min(max_concurrency, len(terms))
+
+        if workers <= 1:
+            return [func(term) for term in terms]
+
+        # make sure every worker can keep its own connection open,
+        # otherwise connections beyond the pool size are closed after each request
+        HashiVaultSessionPool.ensure_pool_maxsize(client.session, workers)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(func, term) for term in terms]
+            try:
+                return [future.result() for future in futures]
+            except Exception:
+                for future in futures:
+                    future.cancel()
+                raise
+
     def _generate_retry_callback(self, retry_action):
         '''returns a Retry callback function for plugins'''
         def _on_retry(retry_obj):
-            if retry_obj.total > 0:
-                if retry_action == 'warn':
-                    display.warning('community.hashi_vault: %i %s remaining.' % (retry_obj.total, 'retry' if retry_obj.total == 1 else 'retries'))
-                else:
-                    pass
+            self._warn_retries_remaining(retry_action, retry_obj.total)
 
         return _on_retry
 
+    @staticmethod
+    def _warn_retries_remaining(retry_action, remaining):
+        if remaining > 0:
+            if retry_action == 'warn':
+                display.warning('community.hashi_vault: %i %s remaining.' % (remaining, 'retry' if remaining == 1 else 'retries'))
+            else:
+                pass
+
     def process_deprecations(self, collection_name='community.hashi_vault'):
         '''processes deprecations related to the collection'''
 
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# FOR INTERNAL COLLECTION USE ONLY
+# The interfaces in this file are meant for use within the community.hashi_vault collection
+# and may not remain stable to outside uses. Changes may be made in ANY release, even a bugfix release.
+# See also: https://github.com/ansible/community/issues/539#issuecomment-780839686
+# Please open an issue if you have questions about this.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import base64
+import hashlib
+import hmac
+import json
+import threading
+import time
+
+from ansible.errors import AnsibleError, AnsibleOptionsError
+from ansible.plugins.loader import cache_loader
+from ansible.utils.display import Display
+
+from ..module_utils._read_cache import HashiVaultReadCache
+
+display = Display()
+
+
+class HashiVaultSharedReadCache():
+    '''
+    A read cache that keeps responses in an Ansible cache plugin (like jsonfile or redis), so that they can be used
+    by other processes and later runs, with an in-memory HashiVaultReadCache in front of it.
+
+    Each entry is encrypted with a key derived from the token that read it, and kept under an id derived the same way,
+    so an entry can only be found and read with that token, and the cache plugin doesn't show which paths it holds.
+    Tokens are long and random, so unlike HashiVaultTokenCacheFile, there's no need for a slow key derivation.
+    Without a token, as with auth_method=none, there's no secret to derive a key from, so the cache can't be used.
+
+    Cache plugins have a single timeout for all of their entries, so the time each entry expires is kept with it.
+    '''
+
+    # the cache plugin objects that have been loaded, by their name and options, so that each is loaded once in a process
+    _backends = {}
+    _backends_lock = threading.Lock()
+
+    _clock = time.time
+
+    def __init__(self, memory, backend):
+        self.memory = memory
+        self.backend = backend
+
+    @classmethod
+    def from_plugin(cls, memory, name, connection=None, prefix=None, timeout=None):
+        '''returns a cache in front of the named cache plugin, which is loaded with the given options the first time'''
+        options = dict((k, v) for k, v in (('_uri', connection), ('_prefix', prefix), ('_timeout', timeout)) if v is not None)
+
+        with cls._backends_lock:
+            key = (name, tuple(sorted(options.items())))
+            backend = cls._backends.get(key)
+
+            if backend is None:
+                try:
+                    backend = cache_loader.get(name, **options)
+                except AnsibleError as e:
+                    raise AnsibleOptionsError("Unable to load the cache plugin '%s' (cache_plugin): %s" % (name, e)) from e
+
+                if backend is None:
+                    raise AnsibleOptionsError("Unable to load the cache plugin '%s' (cache_plugin)." % name)
+
+                cls._backends[key] = backend
+
+        return cls(memory, backend)
+
+    @staticmethod
+    def make_key(url, namespace, token, method, path, version=None):
+        '''returns a cache key for a request, which holds the token, to derive the id and encryption key of its entry'''
+        if not token:
+            raise AnsibleOptionsError(
+                "cache_plugin can't be used without a Vault token, which cached responses are encrypted with; for example with auth_method=none."
+            )
+
+        return (HashiVaultReadCache.make_key(url, namespace, token, method, path, version), token)
+
+    get_ttl = staticmethod(HashiVaultReadCache.get_ttl)
+
+    @staticmethod
+    def derive(token, key):
+        '''returns the id of the entry for key in the cache plugin, and the key it's encrypted with'''
+        if not token:
+            raise ValueError("A token is required to derive the keys of cache plugin entries.")
+
+        secret = token.encode('utf-8')
+
+        entry_id = hmac.new(secret, b'id\0' + key.encode('utf-8'), hashlib.sha256).hexdigest()
+        encryption_key = base64.urlsafe_b64encode(hmac.new(secret, b'key', hashlib.sha256).digest())
+
+        return entry_id, encryption_key
+
+    @staticmethod
+    def _get_fernet(key):
+        try:
+            from cryptography.fernet import Fernet
+        except ImportError:
+            raise AnsibleOptionsError("cryptography is required to keep cached responses in a cache plugin (cache_plugin).")
+
+        return Fernet(key)
+
+    def _warn(self, action, e):
+        display.warning("community.hashi_vault: failed to %s the cache plugin, continuing without it: %s" % (action, e))
+
+    def get(self, key):
+        '''returns the cached value for key, from memory or the cache plugin, or None if it's missing or expired'''
+        memory_key, token = key
+
+        value = self.memory.get(memory_key)
+        if value is not None:
+            return value
+
+        entry_id, encryption_key = self.derive(token, memory_key)
+
+        try:
+            entry = self.backend.get(entry_id)
+        except KeyError:
+            return None
+        except (AnsibleError, EnvironmentError) as e:
+            self._warn('read from', e)
+            return None
+
+        fernet = self._get_fernet(encryption_key)
+        from cryptography.fernet import InvalidToken
+
+        try:
+            ttl = float(entry['expires']) - self._clock()
+            if ttl <= 0:
+                return None
+
+            value = json.loads(fernet.decrypt(entry['data'].encode('ascii')))
+        except (InvalidToken, KeyError, TypeError, ValueError, AttributeError):
+            return None
+
+        self.memory.set(memory_key, value, ttl)
+
+        return value
+
+    def set(self, key, value, ttl):
+        '''caches a value for ttl seconds, in memory and in the cache plugin'''
+        memory_key, token = key
+
+        self.memory.set(memory_key, value, ttl)
+
+        if not ttl or ttl <= 0:
+            return
+
+        try:
+            data = json.dumps(value).encode('utf-8')
+        except (TypeError, ValueError):
+            return
+
+        entry_id, encryption_key = self.derive(token, memory_key)
+        entry = dict(expires=self._clock() + ttl, data=self._get_fernet(encryption_key).encrypt(data).decode('ascii'))
+
+        try:
+            self.backend.set(entry_id, entry)
+        except (AnsibleError, EnvironmentError) as e:
+            self._warn('write to', e)
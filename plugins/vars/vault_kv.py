@@ -0,0 +1,320 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+  name: vault_kv
+  version_added: 7.2.0
+  author:
+    - Ansible Project
+  short_description: Loads host and group variables from HashiCorp Vault's KV version 2 secret store
+  requirements:
+    - C(hvac) (L(Python library,https://hvac.readthedocs.io/en/stable/overview.html))
+    - For detailed requirements, see R(the collection requirements page,ansible_collections.community.hashi_vault.docsite.user_guide.requirements).
+    - Enabled in configuration, see the examples.
+  description:
+    - Loads the variables of inventory hosts and groups from secrets in HashiCorp Vault's KV version 2 secret store,
+      like C(host_vars) and C(group_vars) files. The keys of the secret for a host or group are the names of its variables.
+    - The path of the secret for each host and group is made from I(path_template).
+    - The first time that variables are needed, the secrets of every host and group in the inventory are read, with a single login,
+      up to I(max_concurrency) at a time. They're kept for the rest of the run, along with the version of each secret that was read,
+      so each secret is read only once, however many times its variables are used (but see I(cache_revalidate)).
+      Hosts and groups that are added to the inventory later are read the first time that their variables are needed.
+    - The options are read by the first call of the plugin in a process, and kept for the rest of it.
+    - A host or group that has no secret, or whose secret's latest version is deleted or destroyed, gets no variables from this plugin.
+    - Options can only be set with environment variables or in C(ansible.cfg), since variables aren't available to vars plugins.
+      Other than those listed below, they're the same settings that the collection's lookups use.
+  seealso:
+    - ref: community.hashi_vault.vault_kv2_get lookup <ansible_collections.community.hashi_vault.vault_kv2_get_lookup>
+      description: The official documentation for the C(community.hashi_vault.vault_kv2_get) lookup plugin.
+    - name: KV2 Secrets Engine
+      description: Documentation for the Vault KV secrets engine, version 2.
+      link: https://www.vaultproject.io/docs/secrets/kv/kv-v2
+  extends_documentation_fragment:
+    - ansible.builtin.vars_plugin_staging
+    - community.hashi_vault.connection
+    - community.hashi_vault.connection.plugins
+    - community.hashi_vault.auth
+    - community.hashi_vault.auth.plugins
+    - community.hashi_vault.stats.plugins
+    - community.hashi_vault.trace.plugins
+    - community.hashi_vault.token_cache
+    - community.hashi_vault.token_cache.plugins
+    - community.hashi_vault.engine_mount
+    - community.hashi_vault.concurrency
+    - community.hashi_vault.concurrency.plugins
+  options:
+    stage:
+      env:
+        - name: ANSIBLE_HASHI_VAULT_VARS_STAGE
+      ini:
+        - section: hashi_vault_collection
+          key: vars_stage
+    engine_mount_point:
+      default: secret
+      env:
+        - name: ANSIBLE_HASHI_VAULT_VARS_ENGINE_MOUNT_POINT
+      ini:
+        - section: hashi_vault_collection
+          key: vars_engine_mount_point
+    cache_revalidate:
+      description:
+        - Whether to check that the kept secrets of hosts and groups are still the current versions each time their variables are used,
+          so that a secret that's changed during the run is read again.
+        - The check is a smaller request for each secret that returns its current version but none of its data (see I(revalidate_with)),
+          made with a login for each use of the variables, up to I(max_concurrency) at a time. Set I(token_cache=true) to reuse the token from
+          the first login instead.
+        - Because the variables of a host can be used many times in each task, this adds many requests to a run,
+          so by default the secrets that were read are used for the rest of the run without checking them.
+        - If the check fails, for example because the token can't read the secret's metadata, the whole secret is read instead.
+      type: bool
+      default: false
+      env:
+        - name: ANSIBLE_HASHI_VAULT_VARS_CACHE_REVALIDATE
+      ini:
+        - section: hashi_vault_collection
+          key: vars_cache_revalidate
+    revalidate_with:
+      description:
+        - How to find the current version of a secret, when I(cache_revalidate=true).
+        - C(metadata) reads the secret's metadata, which needs the C(read) capability on C(<engine_mount_point>/metadata/<path>).
+        - C(subkeys) reads the top level keys of the secret, without their values, which needs the C(read) capability
+          on C(<engine_mount_point>/subkeys/<path>), and Vault 1.10 or later.
+      type: str
+      choices: [metadata, subkeys]
+      default: metadata
+      env:
+        - name: ANSIBLE_HASHI_VAULT_VARS_REVALIDATE_WITH
+      ini:
+        - section: hashi_vault_collection
+          key: vars_revalidate_with
+    path_template:
+      description:
+        - The path of the secret for each host and group, relative to I(engine_mount_point).
+        - C({name}) is replaced with the name of the host or group, and C({type}) with C(host) or C(group).
+      type: str
+      default: '{type}_vars/{name}'
+      env:
+        - name: ANSIBLE_HASHI_VAULT_VARS_PATH_TEMPLATE
+      ini:
+        - section: hashi_vault_collection
+          key: vars_path_template
+'''
+
+EXAMPLES = r'''
+# ansible.cfg
+# [defaults]
+# vars_plugins_enabled = ansible.builtin.host_group_vars, community.hashi_vault.vault_kv
+#
+# [hashi_vault_collection]
+# url = https://vault:8201
+# auth_method = approle
+# role_id = ...
+# max_concurrency = 10
+#
+# # reads the variables of host web1 from secret/ansible/host/web1, and those of group all from secret/ansible/group/all
+# vars_path_template = ansible/{type}/{name}
+
+# The secret's keys are the variable names, for example for group webservers:
+# vault kv put secret/group_vars/webservers http_port=8080 db_password=hunter2
+'''
+
+
+from ansible.errors import AnsibleError, AnsibleOptionsError
+from ansible.inventory.host import Host
+from ansible.plugins.vars import BaseVarsPlugin
+from ansible.utils.display import Display
+from ansible.utils.vars import combine_vars
+
+from ansible_collections.community.hashi_vault.plugins.plugin_utils._hashi_vault_plugin import HashiVaultPlugin
+from ansible_collections.community.hashi_vault.plugins.module_utils._hashi_vault_common import HashiVaultValueError
+from ansible_collections.community.hashi_vault.plugins.module_utils._kv2_version import HashiVaultKv2Version
+
+display = Display()
+
+
+class VarsModule(HashiVaultPlugin, BaseVarsPlugin):
+
+    # (url, namespace, mount, path_template), from options that can only be set in the environment and ansible.cfg,
+    # so they're processed by the first call in the process, and later calls don't have to
+    _settings = None
+
+    # how to check the version of a kept secret before its variables are used, or None to use them without checking
+    _revalidate_with = None
+
+    # (version, variables) of each secret that has been read, for the rest of the process, by (url, namespace, mount, path);
+    # the version is None for secrets that don't exist, which have no variables
+    _secrets = {}
+
+    # the key in _secrets of the secret of each host and group, by (settings, type, name)
+    _entity_secrets = {}
+
+    _options_processed = False
+
+    def get_vars(self, loader, path, entities, cache=True):
+        super(VarsModule, self).get_vars(loader, path, entities)
+
+        if not isinstance(entities, list):
+            entities = [entities]
+
+        settings = self._get_settings()
+        keys = [self._get_key(settings, entity) for entity in entities]
+
+        missing = [entity for entity, key in zip(entities, keys) if key not in self._entity_secrets]
+        read = self._load(settings, missing) if missing else set()
+
+        if VarsModule._revalidate_with is not None:
+            kept = set(self._entity_secrets[key] for key in keys) - read
+            if kept:
+                self._read(kept, revalidate=True)
+
+        data = {}
+        for key in keys:
+            data = combine_vars(data, self._secrets[self._entity_secrets[key]][1])
+
+        return data
+
+    def _process_options(self):
+        self.set_options()
+        try:
+            self.connection_options.process_connection_options()
+        except HashiVaultValueError as e:
+            raise AnsibleError(e)
+
+        self._options_processed = True
+
+    def _get_settings(self):
+        if VarsModule._settings is None:
+            self._process_options()
+            VarsModule._settings = (
+                self._options_adapter.get_option('url'),
+                self._options_adapter.get_option_default('namespace'),
+                self._options_adapter.get_option('engine_mount_point'),
+                self._options_adapter.get_option('path_template'),
+            )
+            if self._options_adapter.get_option_default('cache_revalidate', False):
+                VarsModule._revalidate_with = self._options_adapter.get_option_default('revalidate_with', 'metadata')
+
+        return VarsModule._settings
+
+    @staticmethod
+    def _get_key(settings, entity):
+        return (settings, 'host' if isinstance(entity, Host) else 'group', entity.name)
+
+    def _load(self, settings, entities):
+        '''
+        reads the secrets of entities, maps each of them to its secret, and returns the keys of the secrets that were read
+
+        The first time, the secrets of every host and group in the inventory are read at once,
+        so that later calls only have to look up the variables of the entities they're given.
+        '''
+        if not self._entity_secrets:
+            entities = self._get_inventory(entities)
+
+        url, namespace, mount, template = settings
+        paths = dict((self._get_key(settings, entity), self._get_path(template, entity)) for entity in entities)
+
+        missing = set(key for key in ((url, namespace, mount, p) for p in paths.values()) if key not in self._secrets)
+        if missing:
+            self._read(missing)
+
+        for key, secret_path in paths.items():
+            self._entity_secrets[key] = (url, namespace, mount, secret_path)
+
+        return missing
+
+    @staticmethod
+    def _get_path(template, entity):
+        try:
+            return template.format(type='host' if isinstance(entity, Host) else 'group', name=entity.name).strip('/')
+        except (KeyError, IndexError, ValueError) as e:
+            raise AnsibleOptionsError("Invalid path_template %r: %s" % (template, e))
+
+    @staticmethod
+    def _get_inventory(entities):
+        '''returns all of the hosts and groups in the inventory that entities are part of, including entities'''
+        groups = {}
+        hosts = {}
+
+        for entity in entities:
+            if isinstance(entity, Host):
+                hosts[entity.name] = entity
+                groups.update((group.name, group) for group in entity.get_groups())
+            else:
+                groups[entity.name] = entity
+                groups.update((group.name, group) for group in entity.get_ancestors())
+
+        # every group is a descendant of the all group, so this finds the whole inventory
+        for group in list(groups.values()):
+            groups.update((descendant.name, descendant) for descendant in group.get_descendants())
+            hosts.update((host.name, host) for host in group.get_hosts())
+
+        return list(hosts.values()) + list(groups.values())
+
+    def _read(self, secrets, revalidate=False):
+        '''
+        reads secrets, the keys in _secrets of secrets on the same mount, with one login, and up to max_concurrency at a time
+
+        With revalidate, each secret is only read again if its current version isn't the one that's kept.
+        '''
+        # only the first call in the process has its options processed already
+        if not self._options_processed:
+            self._process_options()
+
+        mount = next(iter(secrets))[2]
+        keys = sorted(secrets)
+        paths = [key[3] for key in keys]
+        kept = [self._secrets[key] for key in keys] if revalidate else [None] * len(keys)
+
+        attributes = {'ansible.plugin.type': 'vars', 'ansible.vars.secrets': len(paths), 'ansible.vars.revalidate': revalidate}
+        with self.trace_call(attributes):
+            results = self._read_secrets(mount, paths, kept)
+
+        for key, result in zip(keys, results):
+            self._secrets[key] = result
+
+        changed = sum(1 for result, old in zip(results, kept) if result is not old)
+        display.vvv("community.hashi_vault.vault_kv: read %i secret(s) from mount '%s'" % (changed, mount))
+
+    def _read_secrets(self, mount, paths, kept):
+        '''returns (version, variables) for the secret at each of paths, or the kept (version, variables) if that's still current'''
+        client_args = self.connection_options.get_hvac_connection_options()
+        client = self.helper.get_vault_client(**client_args)
+        hvac_exceptions = self.helper.get_hvac().exceptions
+
+        try:
+            self.authenticator.validate()
+            self.authenticator.authenticate(client)
+        except (NotImplementedError, HashiVaultValueError) as e:
+            raise AnsibleError(e)
+        except hvac_exceptions.VaultError as e:
+            # unlike a lookup's, errors from a vars plugin aren't wrapped with the name of the plugin
+            raise AnsibleError("community.hashi_vault.vault_kv failed to log in to Vault: %s" % e) from e
+
+        def _get(args):
+            path, secret = args
+            if secret is not None:
+                # if the version can't be checked, the full read will show why
+                try:
+                    current = HashiVaultKv2Version.read_current(client, path, mount, VarsModule._revalidate_with)
+                except hvac_exceptions.VaultError:
+                    pass
+                else:
+                    if (current['version'] if current else None) == secret[0]:
+                        return secret
+
+            try:
+                raw = client.secrets.kv.v2.read_secret_version(path=path, mount_point=mount)
+            except hvac_exceptions.Forbidden as e:
+                raise AnsibleError("Forbidden: Permission Denied to path ['%s']." % path) from e
+            except hvac_exceptions.InvalidPath:
+                # hosts and groups without a secret have no variables
+                return (None, {})
+
+            return (raw['data']['metadata']['version'], raw['data']['data'] or {})
+
+        return self.map_terms(client, _get, list(zip(paths, kept)))
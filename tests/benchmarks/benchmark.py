@@ -0,0 +1,389 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+'''
+Benchmarks the throughput and latency of the collection's lookups, and the cold start of a module,
+against the Vault stand-in server in tests/utils/vault_stand_in.py, so they can be run anywhere, with no network.
+
+Run it from the collection's directory, inside an ansible_collections/community/hashi_vault tree:
+
+    python tests/benchmarks/benchmark.py --output results.json
+
+By default each dimension is varied on its own, from a baseline case (of those values given) of 100 terms, token auth, no retries,
+one request at a time, and no cache: the number of terms, the auth method, retries, the concurrency settings, and caching.
+--full runs every combination of the values given instead.
+
+The results are a JSON document with the environment and, for each case, the time of each run, and the min, median, mean,
+and 95th percentile of those times. Given the results of an earlier run with --compare, cases whose median is slower
+by more than --tolerance are listed as regressions, and the exit status is 1 if there are any.
+'''
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import argparse
+import itertools
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+
+from datetime import datetime, timezone
+
+COLLECTION_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+COLLECTIONS_PATH = os.path.dirname(os.path.dirname(os.path.dirname(COLLECTION_ROOT)))
+
+# the term for each secret, by lookup
+TERMS = {
+    'vault_kv2_get': 'bench/%04i',
+    'vault_read': 'secret/data/bench/%04i',
+    'hashi_vault': 'secret/data/bench/%04i',
+}
+
+# the options each lookup has, of those that are benchmarked
+LOOKUP_OPTIONS = {
+    'vault_kv2_get': frozenset(['max_concurrency', 'concurrency_engine', 'cache']),
+    'vault_read': frozenset(['max_concurrency', 'concurrency_engine', 'cache']),
+    'hashi_vault': frozenset(),
+}
+
+# the token is that of the stand-in server
+AUTH = {
+    'token': dict(auth_method='token'),
+    'approle': dict(auth_method='approle', role_id='bench-role', secret_id='bench-secret'),
+    'userpass': dict(auth_method='userpass', username='bench', password='bench'),
+}
+
+RETRIES = {
+    'off': None,
+    'on': {'total': 3},
+    # a share of requests fail, and are retried without a backoff, to measure the cost of retrying
+    'faults': {'total': 10, 'backoff_factor': 0, 'status_forcelist': [500]},
+}
+
+FAULT_ERROR_RATE = 0.05
+
+# (concurrency_engine, max_concurrency)
+CONCURRENCY = {
+    'serial': ('threads', 1),
+    'threads': ('threads', 10),
+    'async': ('async', 10),
+}
+
+BASELINE = dict(terms=100, auth='token', retries='off', concurrency='serial', cache='off')
+
+SWEEPS = dict(
+    terms=[1, 10, 100, 1000, 5000],
+    auth=sorted(AUTH),
+    retries=sorted(RETRIES),
+    concurrency=sorted(CONCURRENCY),
+    cache=['off', 'on'],
+)
+
+
+def init_collection_loader():
+    '''makes the collection importable, for running outside of a test runner'''
+    if os.path.basename(os.path.dirname(os.path.dirname(COLLECTION_ROOT))) != 'ansible_collections':
+        raise SystemExit('The collection must be in an ansible_collections/community/hashi_vault directory to be benchmarked.')
+
+    from ansible.plugins.loader import init_plugin_loader
+    init_plugin_loader([COLLECTIONS_PATH])
+
+
+def is_supported(case):
+    options = LOOKUP_OPTIONS[case['lookup']]
+
+    if case['cache'] != 'off' and 'cache' not in options:
+        return False
+
+    engine, max_concurrency = CONCURRENCY[case['concurrency']]
+    if max_concurrency != 1 and 'max_concurrency' not in options:
+        return False
+    if engine != 'threads':
+        if 'concurrency_engine' not in options:
+            return False
+
+        from ansible_collections.community.hashi_vault.plugins.module_utils._async_engine import HAS_AIOHTTP
+        if not HAS_AIOHTTP:
+            return False
+
+    return True
+
+
+def get_cases(lookups, values, full=False):
+    '''returns the lookup cases to run, for every combination of values if full, otherwise varying one at a time from a baseline'''
+    if full:
+        names = sorted(values)
+        combos = [dict(zip(names, combo)) for combo in itertools.product(*(values[name] for name in names))]
+    else:
+        # the baseline value of a dimension is one of those given, so only the values given are run
+        baseline = dict((name, BASELINE[name] if BASELINE[name] in values[name] else values[name][0]) for name in values)
+        combos = []
+        for name in sorted(values):
+            for value in values[name]:
+                combo = dict(baseline, **{name: value})
+                if combo not in combos:
+                    combos.append(combo)
+
+    cases = [dict(combo, lookup=lookup) for lookup in lookups for combo in combos]
+    return [case for case in cases if is_supported(case)]
+
+
+def get_case_id(kind, params):
+    return ' '.join([kind] + ['%s=%s' % (key, params[key]) for key in sorted(params)])
+
+
+def summarize(timings):
+    '''returns the min, median, mean, and 95th percentile (by the nearest rank) of a list of seconds'''
+    ordered = sorted(timings)
+    count = len(ordered)
+    median = ordered[count // 2] if count % 2 else (ordered[count // 2 - 1] + ordered[count // 2]) / 2.0
+
+    return dict(
+        min=ordered[0],
+        median=median,
+        mean=sum(ordered) / count,
+        p95=ordered[max(0, int(math.ceil(0.95 * count)) - 1)],
+    )
+
+
+def setup_stand_in(stand_in, secrets):
+    stand_in.add_approle('bench-role', 'bench-secret')
+    stand_in.add_userpass('bench', 'bench')
+    for i in range(secrets):
+        stand_in.put_secret('secret', 'bench/%04i' % i, {'username': 'user%04i' % i, 'password': 'p' * 32})
+
+
+def reset_process():
+    '''clears the state kept by the collection in a process, like a new worker process would start with'''
+    from ansible_collections.community.hashi_vault.plugins.module_utils._hashi_vault_common import HashiVaultSessionPool
+    from ansible_collections.community.hashi_vault.plugins.module_utils._read_cache import HashiVaultReadCache
+    from ansible_collections.community.hashi_vault.plugins.module_utils._token_cache import HashiVaultTokenCache
+
+    HashiVaultSessionPool.clear()
+    HashiVaultReadCache.get_instance().clear()
+    HashiVaultTokenCache.clear()
+
+
+def run_lookup_case(stand_in, case, repeat):
+    '''
+    runs a lookup case repeat times, and returns its result
+
+    Each run gets a new instance of the lookup, like each evaluation of a template does, in a process reset by reset_process().
+    With the cache, an untimed run fills it first, and the process isn't reset between runs, so they measure reads from the cache.
+    '''
+    from ansible.plugins.loader import lookup_loader
+
+    engine, max_concurrency = CONCURRENCY[case['concurrency']]
+    options = LOOKUP_OPTIONS[case['lookup']]
+
+    kwargs = dict(url=stand_in.url, **AUTH[case['auth']])
+    if kwargs['auth_method'] == 'token':
+        kwargs['token'] = stand_in.root_token
+    if RETRIES[case['retries']] is not None:
+        kwargs.update(retries=RETRIES[case['retries']], retry_action='ignore')
+    if 'max_concurrency' in options:
+        kwargs['max_concurrency'] = max_concurrency
+    if 'concurrency_engine' in options:
+        kwargs['concurrency_engine'] = engine
+    if case['cache'] == 'on':
+        # the read cache is per token, so logins are cached too, for the token to be the same in each run
+        kwargs.update(cache=True, cache_ttl=3600, token_cache=True)
+
+    terms = [TERMS[case['lookup']] % i for i in range(case['terms'])]
+    cached = case['cache'] == 'on'
+
+    stand_in.error_rate = FAULT_ERROR_RATE if case['retries'] == 'faults' else 0
+    try:
+        timings = []
+        requests = []
+        reset_process()
+        for i in range(repeat + (1 if cached else 0)):
+            if not cached:
+                reset_process()
+
+            before = len(stand_in.requests)
+            start = time.perf_counter()
+
+            lookup = lookup_loader.get('community.hashi_vault.%s' % case['lookup'])
+            result = lookup.run(terms, variables={}, **kwargs)
+
+            elapsed = time.perf_counter() - start
+            if len(result) != len(terms):
+                raise RuntimeError('%s returned %i results for %i terms' % (case['lookup'], len(result), len(terms)))
+
+            if cached and i == 0:
+                continue
+
+            timings.append(elapsed)
+            requests.append(len(stand_in.requests) - before)
+    finally:
+        stand_in.error_rate = 0
+
+    seconds = summarize(timings)
+    return dict(
+        id=get_case_id('lookup', case),
+        kind='lookup',
+        params=case,
+        runs=len(timings),
+        timings=timings,
+        seconds=seconds,
+        terms_per_second=case['terms'] / seconds['median'] if seconds['median'] else None,
+        requests_per_run=summarize(requests)['median'],
+    )
+
+
+def run_module_case(stand_in, repeat, module='vault_kv2_get'):
+    '''
+    runs a module in a new Python process repeat times, as Ansible would run it on the controller, and returns its result
+
+    The module reads one secret with a token, so the time is mostly that of starting Python and importing the module and its dependencies.
+    '''
+    args = dict(ANSIBLE_MODULE_ARGS=dict(url=stand_in.url, auth_method='token', token=stand_in.root_token, path='bench/0000'))
+
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [COLLECTIONS_PATH, os.environ.get('PYTHONPATH')])))
+    command = [sys.executable, '-m', 'ansible_collections.community.hashi_vault.plugins.modules.%s' % module]
+
+    timings = []
+    with tempfile.NamedTemporaryFile('w', suffix='.json') as f:
+        json.dump(args, f)
+        f.flush()
+
+        for i in range(repeat):
+            start = time.perf_counter()
+            process = subprocess.run(command + [f.name], env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            timings.append(time.perf_counter() - start)
+
+            output = process.stdout.decode('utf-8', 'replace')
+            if process.returncode != 0 or json.loads(output[output.index('{'):]).get('failed'):
+                raise RuntimeError('%s failed: %s %s' % (module, output, process.stderr.decode('utf-8', 'replace')))
+
+    params = dict(module=module)
+    return dict(id=get_case_id('module', params), kind='module', params=params, runs=len(timings), timings=timings, seconds=summarize(timings))
+
+
+def run_python_startup_case(repeat):
+    '''measures starting Python with nothing to run, which is the floor of a module's cold start'''
+    timings = []
+    for i in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', 'pass'], check=True)
+        timings.append(time.perf_counter() - start)
+
+    return dict(id='python_startup', kind='python_startup', params={}, runs=len(timings), timings=timings, seconds=summarize(timings))
+
+
+def get_environment():
+    from importlib import metadata
+
+    def _version(name):
+        try:
+            return metadata.version(name)
+        except metadata.PackageNotFoundError:
+            return None
+
+    collection_version = None
+    try:
+        import yaml
+        with open(os.path.join(COLLECTION_ROOT, 'galaxy.yml')) as f:
+            collection_version = yaml.safe_load(f).get('version')
+    except (IOError, ImportError):
+        pass
+
+    return dict(
+        time=datetime.now(timezone.utc).isoformat(),
+        collection_version=collection_version,
+        python=platform.python_version(),
+        implementation=platform.python_implementation(),
+        platform=platform.platform(),
+        cpu_count=os.cpu_count(),
+        packages=dict((name, _version(name)) for name in ('ansible-core', 'hvac', 'requests', 'urllib3', 'aiohttp')),
+    )
+
+
+def compare(baseline, results, tolerance):
+    '''returns the results whose median is slower than that of the same case in baseline by more than tolerance (a fraction)'''
+    previous = dict((result['id'], result) for result in baseline.get('results', []))
+
+    regressions = []
+    for result in results:
+        before = previous.get(result['id'])
+        if before is None or not before['seconds']['median']:
+            continue
+
+        ratio = result['seconds']['median'] / before['seconds']['median']
+        if ratio > 1 + tolerance:
+            regressions.append(dict(id=result['id'], baseline=before['seconds']['median'], current=result['seconds']['median'], ratio=ratio))
+
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0], formatter_class=argparse.RawDescriptionHelpFormatter, epilog=__doc__)
+    parser.add_argument('--lookups', nargs='+', choices=sorted(TERMS), default=sorted(TERMS))
+    parser.add_argument('--terms', nargs='+', type=int, default=SWEEPS['terms'])
+    parser.add_argument('--auth', nargs='+', choices=sorted(AUTH), default=SWEEPS['auth'])
+    parser.add_argument('--retries', nargs='+', choices=sorted(RETRIES), default=SWEEPS['retries'])
+    parser.add_argument('--concurrency', nargs='+', choices=sorted(CONCURRENCY), default=SWEEPS['concurrency'])
+    parser.add_argument('--cache', nargs='+', choices=['off', 'on'], default=SWEEPS['cache'])
+    parser.add_argument('--full', action='store_true', help='run every combination of the values, rather than varying one at a time')
+    parser.add_argument('--repeat', type=int, default=5, help='the number of timed runs of each case')
+    parser.add_argument('--latency', type=float, default=0, help='the seconds the stand-in server waits before each response')
+    parser.add_argument('--no-module', action='store_true', help="don't measure the cold start of a module")
+    parser.add_argument('--output', help='the file to write the results to, rather than stdout')
+    parser.add_argument('--compare', metavar='RESULTS', help='the results of an earlier run, to find regressions against')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='how much slower (as a fraction) a case can be before it is a regression')
+    args = parser.parse_args(argv)
+
+    init_collection_loader()
+    warnings.simplefilter('ignore')
+
+    from ansible_collections.community.hashi_vault.tests.utils.vault_stand_in import VaultStandIn
+
+    values = dict(terms=args.terms, auth=args.auth, retries=args.retries, concurrency=args.concurrency, cache=args.cache)
+    cases = get_cases(args.lookups, values, full=args.full)
+
+    results = []
+    with VaultStandIn(latency=args.latency, seed=0) as stand_in:
+        setup_stand_in(stand_in, max([case['terms'] for case in cases] or [1]))
+
+        for i, case in enumerate(cases, 1):
+            sys.stderr.write('[%i/%i] %s\n' % (i, len(cases), get_case_id('lookup', case)))
+            results.append(run_lookup_case(stand_in, case, args.repeat))
+
+        if not args.no_module:
+            sys.stderr.write('module cold start\n')
+            results.append(run_python_startup_case(args.repeat))
+            results.append(run_module_case(stand_in, args.repeat))
+
+    document = dict(environment=get_environment(), settings=dict(repeat=args.repeat, latency=args.latency, full=args.full), results=results)
+
+    regressions = []
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(json.load(f), results, args.tolerance)
+        document['regressions'] = regressions
+
+        for regression in regressions:
+            sys.stderr.write('REGRESSION %(id)s: %(baseline).4fs -> %(current).4fs (x%(ratio).2f)\n' % regression)
+
+    output = json.dumps(document, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
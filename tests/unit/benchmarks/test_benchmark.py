@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+
+from ....tests.benchmarks import benchmark
+
+
+def _result(case_id, median):
+    return dict(id=case_id, seconds=dict(median=median))
+
+
+class TestBenchmark(object):
+
+    @pytest.mark.parametrize('timings,expected', [
+        ([3.0], dict(min=3.0, median=3.0, mean=3.0, p95=3.0)),
+        ([4.0, 1.0, 3.0, 2.0], dict(min=1.0, median=2.5, mean=2.5, p95=4.0)),
+        (list(range(1, 21)), dict(min=1, median=10.5, mean=10.5, p95=19)),
+    ])
+    def test_summarize(self, timings, expected):
+        assert benchmark.summarize(timings) == expected
+
+    def test_get_cases_sweep(self):
+        values = dict(terms=[1, 100], auth=['token', 'approle'], retries=['off'], concurrency=['serial', 'threads'], cache=['off', 'on'])
+
+        cases = benchmark.get_cases(['vault_kv2_get', 'hashi_vault'], values)
+
+        kv2 = [case for case in cases if case['lookup'] == 'vault_kv2_get']
+        assert len(kv2) == 5
+        assert dict(benchmark.BASELINE, lookup='vault_kv2_get') in kv2
+        assert all(sum(case[name] != benchmark.BASELINE[name] for name in values) <= 1 for case in kv2)
+
+        # hashi_vault has no cache or concurrency options
+        assert sorted((case['terms'], case['auth']) for case in cases if case['lookup'] == 'hashi_vault') == [(1, 'token'), (100, 'approle'), (100, 'token')]
+
+    def test_get_cases_baseline_given(self):
+        values = dict(terms=[5], auth=['approle'], retries=['off'], concurrency=['serial'], cache=['off'])
+
+        expected = dict(values, terms=5, auth='approle', retries='off', concurrency='serial', cache='off', lookup='vault_read')
+
+        assert benchmark.get_cases(['vault_read'], values) == [expected]
+
+    def test_get_cases_full(self):
+        values = dict(terms=[1, 10], auth=['token', 'userpass'], retries=['off', 'on'], concurrency=['serial'], cache=['off'])
+
+        assert len(benchmark.get_cases(['vault_read'], values, full=True)) == 8
+
+    def test_compare(self):
+        baseline = dict(results=[_result('a', 1.0), _result('b', 1.0), _result('c', 0)])
+        results = [_result('a', 1.1), _result('b', 1.5), _result('c', 1.0), _result('d', 9.0)]
+
+        assert benchmark.compare(baseline, results, 0.2) == [dict(id='b', baseline=1.0, current=1.5, ratio=1.5)]
+
+    @pytest.mark.parametrize('lookup', sorted(benchmark.TERMS))
+    @pytest.mark.parametrize('cache', ['off', 'on'])
+    def test_run_lookup_case(self, vault_stand_in, lookup, cache):
+        benchmark.setup_stand_in(vault_stand_in, 3)
+        case = dict(benchmark.BASELINE, lookup=lookup, terms=3, auth='approle', cache=cache)
+        if not benchmark.is_supported(case):
+            pytest.skip('%s does not support the cache' % lookup)
+
+        result = benchmark.run_lookup_case(vault_stand_in, case, 2)
+
+        assert result['id'] == benchmark.get_case_id('lookup', case)
+        assert result['runs'] == len(result['timings']) == 2
+        assert result['requests_per_run'] == (0 if cache == 'on' else 4)
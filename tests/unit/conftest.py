@@ -14,6 +14,11 @@ import pytest
 from .compat import mock
 
 from ...plugins.module_utils._authenticator import HashiVaultAuthenticator
+from ...plugins.module_utils._hashi_vault_common import HashiVaultSessionPool
+from ...plugins.module_utils._read_cache import HashiVaultReadCache
+from ...plugins.module_utils._token_cache import HashiVaultTokenCache
+
+from ..utils.vault_stand_in import VaultStandIn
 
 
 @pytest.fixture(autouse=True)
@@ -22,6 +27,27 @@ def skip_python():
         pytest.skip('Skipping on Python %s. community.hashi_vault supports Python 3.8 and higher.' % sys.version)
 
 
+@pytest.fixture(autouse=True)
+def clear_session_pool():
+    HashiVaultSessionPool.clear()
+    yield
+    HashiVaultSessionPool.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_read_cache():
+    HashiVaultReadCache.get_instance().clear()
+    yield
+    HashiVaultReadCache.get_instance().clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    HashiVaultTokenCache.clear()
+    yield
+    HashiVaultTokenCache.clear()
+
+
 @pytest.fixture
 def fixture_loader():
     def _loader(name, parse='json'):
@@ -51,13 +77,20 @@ def vault_client():
     return mock.MagicMock()
 
 
+@pytest.fixture
+def vault_stand_in():
+    '''a running VaultStandIn server, for tests that send real requests'''
+    with VaultStandIn() as stand_in:
+        yield stand_in
+
+
 @pytest.fixture
 def authenticator():
     authenticator = HashiVaultAuthenticator
-    authenticator.validate = mock.Mock(wraps=lambda: True)
-    authenticator.authenticate = mock.Mock(wraps=lambda client: 'throwaway')
 
-    return authenticator
+    with mock.patch.object(authenticator, 'validate', mock.Mock(wraps=lambda: True)):
+        with mock.patch.object(authenticator, 'authenticate', mock.Mock(wraps=lambda client: 'throwaway')):
+            yield authenticator
 
 
 @pytest.fixture
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+import os
+
+import pytest
+
+from ansible.plugins.loader import callback_loader
+
+from ...compat import mock
+
+from .....plugins.module_utils._request_stats import HashiVaultRequestStats
+
+
+ENV = 'ANSIBLE_HASHI_VAULT_STATS_FILE'
+
+
+def _request(path, latency=0.1, retries=0, when=100.0):
+    return dict(time=when, method='GET', path=path, status=200, latency=latency, retries=retries, bytes=2)
+
+
+def _task(name):
+    task = mock.Mock(action='community.hashi_vault.vault_read')
+    task.get_name.return_value = name
+    return task
+
+
+def _result(task, result):
+    return mock.Mock(_task=task, _result=result)
+
+
+@pytest.fixture
+def clean_env():
+    with mock.patch.dict(os.environ):
+        os.environ.pop(ENV, None)
+        yield
+
+
+@pytest.fixture
+def profile(clean_env):
+    callback = callback_loader.get('community.hashi_vault.vault_profile')
+    callback._display = mock.Mock()
+    return callback
+
+
+class TestVaultProfileCallback(object):
+
+    def test_temp_stats_file(self, profile):
+        profile.set_options()
+
+        path = os.environ[ENV]
+        assert os.path.exists(path)
+
+        HashiVaultRequestStats.write(path, [_request('secret/data/*')])
+        profile.v2_playbook_on_stats(None)
+
+        assert not os.path.exists(path)
+        assert ENV not in os.environ
+        profile._display.display.assert_any_call('requests: 1, logins: 0, retries: 0, cache hits: 0, cache misses: 0')
+
+    def test_temp_stats_file_set_again(self, profile):
+        profile.set_options()
+        path = os.environ[ENV]
+
+        # the exported temporary file is what stats_file comes from now
+        profile.set_options()
+
+        assert os.environ[ENV] == path
+        assert profile._stats_file == path
+
+        profile.v2_playbook_on_stats(None)
+
+        assert not os.path.exists(path)
+        assert ENV not in os.environ
+
+    def test_temp_stats_file_replaced(self, profile, tmp_path):
+        profile.set_options()
+        temp_path = os.environ[ENV]
+
+        path = str(tmp_path / 'stats.jsonl')
+        HashiVaultRequestStats.write(path, [_request('old/*')])
+        profile.set_options(direct={'stats_file': path})
+
+        # the temporary file is removed right away, and the configured file is never removed
+        assert not os.path.exists(temp_path)
+        assert ENV not in os.environ
+
+        profile.v2_playbook_on_stats(None)
+
+        assert os.path.exists(path)
+
+    def test_configured_stats_file(self, profile, tmp_path):
+        path = str(tmp_path / 'stats.jsonl')
+        HashiVaultRequestStats.write(path, [_request('old/*')])
+
+        profile.set_options(direct={'stats_file': path})
+        HashiVaultRequestStats.write(path, [_request('new/*')])
+
+        with open(path, 'a') as f:
+            f.write('not json\n')
+
+        profile.v2_playbook_on_stats(None)
+
+        assert [r['path'] for task, r in profile._records] == ['new/*']
+        assert os.path.exists(path)
+        assert ENV not in os.environ
+
+    def test_records_matched_to_tasks(self, profile, tmp_path):
+        path = str(tmp_path / 'stats.jsonl')
+        profile.set_options(direct={'stats_file': path})
+
+        with mock.patch('time.time', return_value=100.0):
+            profile.v2_playbook_on_task_start(_task('first'), False)
+        with mock.patch('time.time', return_value=200.0):
+            profile.v2_playbook_on_handler_task_start(_task('second'))
+
+        HashiVaultRequestStats.write(path, [_request('a/*', when=50.0), _request('b/*', when=150.0), _request('c/*', when=250.0)])
+        profile._read_stats_file()
+
+        assert [(task, r['path']) for task, r in profile._records] == [(None, 'a/*'), ('first', 'b/*'), ('second', 'c/*')]
+
+    def test_module_results(self, profile):
+        task = _task('module')
+
+        profile.v2_runner_on_ok(_result(task, {'_vault_stats': [_request('a/*')]}))
+        profile.v2_runner_on_failed(_result(task, {'results': [{'_vault_stats': [_request('b/*')]}, {'skipped': True}, 'bogus']}))
+        profile.v2_runner_on_ok(_result(task, {'changed': False}))
+
+        assert [(task, r['path']) for task, r in profile._records] == [('module', 'a/*'), ('module', 'b/*')]
+
+    @pytest.mark.parametrize('values,percentile,expected', [
+        ([1], 99, 1),
+        ([1, 2, 3, 4], 50, 2),
+        ([1, 2, 3, 4], 95, 4),
+        (list(range(1, 101)), 95, 95),
+        (list(range(1, 101)), 99, 99),
+    ])
+    def test_percentile(self, profile, values, percentile, expected):
+        assert profile._percentile(values, percentile) == expected
+
+    def test_summarize(self, profile):
+        profile._records = [
+            ('first', _request('auth/approle/login', latency=0.5)),
+            ('first', _request('secret/data/*', latency=0.1, retries=2)),
+            ('first', dict(time=100.0, path='secret/*', cache='miss')),
+            ('second', _request('secret/metadata/*', latency=0.3)),
+            ('second', dict(time=100.0, path='secret/*', cache='hit')),
+            (None, _request('sys/health', latency=0.2)),
+        ]
+
+        lines = profile.summarize()
+
+        assert lines[0] == 'requests: 4, logins: 1, retries: 2, cache hits: 1, cache misses: 1'
+        rows = dict((line.split()[0], line.split()[1:]) for line in lines[1:] if line and not line.startswith(('mount', 'task')))
+        assert rows['auth/approle'] == ['1', '0.500s', '0.500s', '0.500s']
+        assert rows['secret'] == ['2', '0.100s', '0.300s', '0.300s']
+        assert rows['sys'][0] == '1'
+        assert rows['first'][0] == '2'
+        assert rows['second'][0] == '1'
+        assert rows['(no'][1] == '1'
+
+    def test_summarize_empty(self, profile):
+        assert profile.summarize() == ['requests: 0, logins: 0, retries: 0, cache hits: 0, cache misses: 0']
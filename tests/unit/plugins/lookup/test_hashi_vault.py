@@ -16,6 +16,8 @@ from urllib.parse import urlparse
 from ansible_collections.community.hashi_vault.tests.unit.compat import mock
 
 from ansible_collections.community.hashi_vault.plugins.plugin_utils._hashi_vault_lookup_base import HashiVaultLookupBase
+from ansible_collections.community.hashi_vault.plugins.module_utils._authenticator import HashiVaultAuthenticator
+from ansible_collections.community.hashi_vault.plugins.module_utils._hashi_vault_common import HashiVaultHelper
 
 from requests.exceptions import ConnectionError
 
@@ -25,6 +27,26 @@ def hashi_vault_lookup_module():
     return lookup_loader.get('community.hashi_vault.hashi_vault')
 
 
+@pytest.fixture
+def fake_clients(mocker):
+    clients = []
+
+    def _new_client(**kwargs):
+        client = mock.MagicMock()
+        client.read.side_effect = lambda path: {'data': {'path': path}}
+        clients.append(client)
+        return client
+
+    mocker.patch.object(HashiVaultHelper, 'get_vault_client', side_effect=_new_client)
+
+    return clients
+
+
+@pytest.fixture
+def patch_authenticate(mocker):
+    return mocker.patch.object(HashiVaultAuthenticator, 'authenticate')
+
+
 class TestHashiVaultLookup(object):
 
     def test_is_hashi_vault_lookup_base(self, hashi_vault_lookup_module):
@@ -52,3 +74,21 @@ class TestHashiVaultLookup(object):
 
         assert str(host) in s_err, "host '%s' not found in exception: %r" % (host, str(e.value))
         assert str(port) in s_err, "port '%i' not found in exception: %r" % (port, str(e.value))
+
+    def test_one_login_per_option_set(self, hashi_vault_lookup_module, fake_clients, patch_authenticate):
+        terms = [
+            'secret/one:path',
+            'secret/two:path',
+            'secret/three:path token=other',
+            'secret/four:path',
+            'secret/five:path token=other',
+        ]
+
+        result = hashi_vault_lookup_module.run(terms, url='http://myvault', token='fake')
+
+        assert result == ['secret/one', 'secret/two', 'secret/three', 'secret/four', 'secret/five']
+        assert len(fake_clients) == 2
+        assert patch_authenticate.call_count == 2
+
+        assert fake_clients[0].read.call_args_list == [mock.call('secret/one'), mock.call('secret/two'), mock.call('secret/four')]
+        assert fake_clients[1].read.call_args_list == [mock.call('secret/three'), mock.call('secret/five')]
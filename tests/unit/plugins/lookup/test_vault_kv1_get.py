@@ -6,6 +6,7 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import copy
 import re
 import pytest
 
@@ -125,3 +126,59 @@ class TestVaultKv1GetLookup(object):
             assert path == match.group(1), "expected: %s\ngot: %s" % (match.group(1), path)
         except IndexError:
             pass
+
+    def test_vault_kv1_get_async(self, vault_kv1_get_lookup, minimal_vars, vault_client, vault_stand_in):
+        pytest.importorskip('aiohttp')
+
+        vault_stand_in.put_secret('kv', 'app/one', {'value': 1})
+        vault_stand_in.put_secret('kv', 'app/two', {'value': 2})
+
+        vault_client.url = vault_stand_in.url
+        vault_client.token = vault_stand_in.root_token
+        vault_client.adapter.namespace = None
+        variables = dict(minimal_vars, ansible_hashi_vault_url=vault_stand_in.url)
+
+        result = vault_kv1_get_lookup.run(
+            terms=['app/one', 'app/two'], variables=variables, engine_mount_point='kv', concurrency_engine='async', max_concurrency=2,
+        )
+
+        # the requests were sent by the async engine, not the hvac client
+        vault_client.secrets.kv.v1.read_secret.assert_not_called()
+        assert [r['secret'] for r in result] == [{'value': 1}, {'value': 2}]
+
+        with pytest.raises(AnsibleError, match=r"^Invalid or missing path \['app/nope'\]"):
+            vault_kv1_get_lookup.run(terms=['app/nope'], variables=variables, engine_mount_point='kv', concurrency_engine='async')
+
+    @pytest.mark.parametrize('max_concurrency', [1, 4])
+    def test_vault_kv1_get_recursive(self, vault_kv1_get_lookup, minimal_vars, kv1_get_response, vault_client, max_concurrency):
+        client = vault_client
+        tree = {'': ['app/', 'top'], 'app': ['db', 'gone']}
+
+        def _read(path, mount_point):
+            if path == 'app/gone':
+                raise hvac.exceptions.InvalidPath()
+            r = copy.deepcopy(kv1_get_response)
+            r['data'] = {'_path': path}
+            return r
+
+        client.secrets.kv.v1.list_secrets.side_effect = lambda path, mount_point: {'data': {'keys': tree[path]}}
+        client.secrets.kv.v1.read_secret.side_effect = _read
+
+        response = vault_kv1_get_lookup.run(terms=[''], variables=minimal_vars, recursive=True, max_concurrency=max_concurrency)
+
+        assert len(response) == 1
+        assert sorted(response[0]) == ['app/db', 'top']
+        for path, result in response[0].items():
+            assert result['secret'] == result['data'] == {'_path': path}
+
+        client.secrets.kv.v1.list_secrets.assert_has_calls([mock.call(path='', mount_point='kv'), mock.call(path='app', mount_point='kv')])
+
+    @pytest.mark.parametrize('exc,message', [
+        (hvac.exceptions.Forbidden, r"^Forbidden: Permission Denied to list path \['app'\]"),
+        (hvac.exceptions.InvalidPath, r"^Invalid or missing path \['app'\] to list"),
+    ])
+    def test_vault_kv1_get_recursive_list_exceptions(self, vault_kv1_get_lookup, minimal_vars, vault_client, exc, message):
+        vault_client.secrets.kv.v1.list_secrets.side_effect = exc()
+
+        with pytest.raises(AnsibleError, match=message):
+            vault_kv1_get_lookup.run(terms=['app'], variables=minimal_vars, recursive=True)
@@ -6,11 +6,12 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import copy
 import re
 import pytest
 
 from ansible.plugins.loader import lookup_loader
-from ansible.errors import AnsibleError
+from ansible.errors import AnsibleError, AnsibleOptionsError
 
 from ...compat import mock
 
@@ -129,3 +130,149 @@ class TestVaultKv2GetLookup(object):
             assert (version is not None) == (match.group(2) == str(version))
         except IndexError:
             pass
+
+    @pytest.mark.parametrize('version', [None, 1])
+    def test_vault_kv2_get_async(self, vault_kv2_get_lookup, minimal_vars, vault_client, vault_stand_in, version):
+        pytest.importorskip('aiohttp')
+
+        vault_stand_in.put_secret('secret', 'app/one', {'value': 1})
+        vault_stand_in.put_secret('secret', 'app/one', {'value': 2})
+        vault_stand_in.put_secret('secret', 'app/two', {'value': 3})
+
+        vault_client.url = vault_stand_in.url
+        vault_client.token = vault_stand_in.root_token
+        vault_client.adapter.namespace = None
+        variables = dict(minimal_vars, ansible_hashi_vault_url=vault_stand_in.url)
+
+        result = vault_kv2_get_lookup.run(terms=['app/one', 'app/two'], variables=variables, concurrency_engine='async', max_concurrency=2, version=version)
+
+        # the requests were sent by the async engine, not the hvac client
+        vault_client.secrets.kv.v2.read_secret_version.assert_not_called()
+        assert [r['secret'] for r in result] == [{'value': 2 if version is None else 1}, {'value': 3}]
+        assert [r['metadata']['version'] for r in result] == [2 if version is None else 1, 1]
+
+        with pytest.raises(AnsibleError, match=r"^Invalid or missing path \['app/nope'\] with secret version"):
+            vault_kv2_get_lookup.run(terms=['app/nope'], variables=variables, concurrency_engine='async')
+
+    @pytest.mark.parametrize('cache', [True, False])
+    def test_vault_kv2_get_cache(self, vault_kv2_get_lookup, minimal_vars, kv2_get_response, vault_client, cache):
+        client = vault_client
+        client.url = 'http://myvault'
+        client.token = 'throwaway'
+        client.adapter.namespace = None
+        client.secrets.kv.v2.read_secret_version.return_value = kv2_get_response
+
+        first = vault_kv2_get_lookup.run(terms=['fake1', 'fake1'], variables=minimal_vars, cache=cache)
+        second = vault_kv2_get_lookup.run(terms=['fake1'], variables=minimal_vars, cache=cache)
+
+        assert first[0] == first[1] == second[0]
+        assert first[0]['raw'] == kv2_get_response
+        assert client.secrets.kv.v2.read_secret_version.call_count == (1 if cache else 3)
+
+    def test_vault_kv2_get_cache_separates_versions(self, vault_kv2_get_lookup, minimal_vars, kv2_get_response, vault_client):
+        client = vault_client
+        client.url = 'http://myvault'
+        client.token = 'throwaway'
+        client.adapter.namespace = None
+        client.secrets.kv.v2.read_secret_version.return_value = kv2_get_response
+
+        vault_kv2_get_lookup.run(terms=['fake1'], variables=minimal_vars, cache=True, version=1)
+        vault_kv2_get_lookup.run(terms=['fake1'], variables=minimal_vars, cache=True, version=2)
+        vault_kv2_get_lookup.run(terms=['fake1'], variables=minimal_vars, cache=True, version=2)
+
+        assert client.secrets.kv.v2.read_secret_version.call_count == 2
+
+    @pytest.mark.parametrize('revalidate_with', ['metadata', 'subkeys'])
+    def test_vault_kv2_get_cache_revalidate(self, vault_kv2_get_lookup, minimal_vars, kv2_get_response, vault_client, revalidate_with):
+        client = vault_client
+        client.url = 'http://myvault'
+        client.token = 'throwaway'
+        client.adapter.namespace = None
+        client.secrets.kv.v2.read_secret_version.return_value = kv2_get_response
+
+        version = kv2_get_response['data']['metadata']['version']
+        with mock.patch('ansible_collections.community.hashi_vault.plugins.lookup.vault_kv2_get.HashiVaultKv2Version.is_current') as is_current:
+            is_current.return_value = True
+            first = vault_kv2_get_lookup.run(terms=['fake1'], variables=minimal_vars, cache=True, cache_revalidate=True, revalidate_with=revalidate_with)
+            second = vault_kv2_get_lookup.run(terms=['fake1'], variables=minimal_vars, cache=True, cache_revalidate=True, revalidate_with=revalidate_with)
+
+            assert first == second
+            assert client.secrets.kv.v2.read_secret_version.call_count == 1
+            is_current.assert_called_once_with(client, 'fake1', 'secret', version, revalidate_with)
+
+            # a newer version
+            is_current.return_value = False
+            vault_kv2_get_lookup.run(terms=['fake1'], variables=minimal_vars, cache=True, cache_revalidate=True, revalidate_with=revalidate_with)
+
+            assert client.secrets.kv.v2.read_secret_version.call_count == 2
+
+            # the version can't be checked
+            is_current.side_effect = hvac.exceptions.Forbidden
+            vault_kv2_get_lookup.run(terms=['fake1'], variables=minimal_vars, cache=True, cache_revalidate=True, revalidate_with=revalidate_with)
+
+            assert client.secrets.kv.v2.read_secret_version.call_count == 3
+
+    @pytest.mark.parametrize('options', [dict(cache_revalidate=False), dict(cache_revalidate=True, version=1)])
+    def test_vault_kv2_get_cache_no_revalidate(self, vault_kv2_get_lookup, minimal_vars, kv2_get_response, vault_client, options):
+        client = vault_client
+        client.url = 'http://myvault'
+        client.token = 'throwaway'
+        client.adapter.namespace = None
+        client.secrets.kv.v2.read_secret_version.return_value = kv2_get_response
+
+        with mock.patch('ansible_collections.community.hashi_vault.plugins.lookup.vault_kv2_get.HashiVaultKv2Version.is_current') as is_current:
+            vault_kv2_get_lookup.run(terms=['fake1'], variables=minimal_vars, cache=True, **options)
+            vault_kv2_get_lookup.run(terms=['fake1'], variables=minimal_vars, cache=True, **options)
+
+        is_current.assert_not_called()
+        assert client.secrets.kv.v2.read_secret_version.call_count == 1
+
+    @pytest.mark.parametrize('max_concurrency', [1, 4])
+    @pytest.mark.parametrize('term', ['app', 'app/'])
+    def test_vault_kv2_get_recursive(self, vault_kv2_get_lookup, minimal_vars, kv2_get_response, vault_client, max_concurrency, term):
+        client = vault_client
+        tree = {'app': ['db', 'api/', 'deleted'], 'app/api': ['key']}
+
+        def _read(path, version, mount_point):
+            if path == 'app/deleted':
+                raise hvac.exceptions.InvalidPath()
+            r = copy.deepcopy(kv2_get_response)
+            r['data']['data'] = {'_path': path}
+            return r
+
+        client.secrets.kv.v2.list_secrets.side_effect = lambda path, mount_point: {'data': {'keys': tree[path]}}
+        client.secrets.kv.v2.read_secret_version.side_effect = _read
+
+        response = vault_kv2_get_lookup.run(terms=[term], variables=minimal_vars, recursive=True, max_concurrency=max_concurrency, engine_mount_point='kv')
+
+        assert len(response) == 1
+        assert sorted(response[0]) == ['app/api/key', 'app/db']
+        for path, result in response[0].items():
+            assert result['secret'] == {'_path': path}
+            assert result['metadata'] == kv2_get_response['data']['metadata']
+
+        client.secrets.kv.v2.list_secrets.assert_has_calls([mock.call(path='app', mount_point='kv'), mock.call(path='app/api', mount_point='kv')])
+        assert client.secrets.kv.v2.read_secret_version.call_count == 3
+
+    @pytest.mark.parametrize('exc,message', [
+        (hvac.exceptions.Forbidden, r"^Forbidden: Permission Denied to list path \['app'\]"),
+        (hvac.exceptions.InvalidPath, r"^Invalid or missing path \['app'\] to list"),
+    ])
+    def test_vault_kv2_get_recursive_list_exceptions(self, vault_kv2_get_lookup, minimal_vars, vault_client, exc, message):
+        vault_client.secrets.kv.v2.list_secrets.side_effect = exc()
+
+        with pytest.raises(AnsibleError, match=message):
+            vault_kv2_get_lookup.run(terms=['app'], variables=minimal_vars, recursive=True)
+
+    def test_vault_kv2_get_recursive_read_forbidden(self, vault_kv2_get_lookup, minimal_vars, vault_client):
+        vault_client.secrets.kv.v2.list_secrets.return_value = {'data': {'keys': ['db']}}
+        vault_client.secrets.kv.v2.read_secret_version.side_effect = hvac.exceptions.Forbidden()
+
+        with pytest.raises(AnsibleError, match=r"^Forbidden: Permission Denied to path \['app/db'\]"):
+            vault_kv2_get_lookup.run(terms=['app'], variables=minimal_vars, recursive=True)
+
+    def test_vault_kv2_get_recursive_version(self, vault_kv2_get_lookup, minimal_vars, vault_client):
+        with pytest.raises(AnsibleOptionsError, match=r"version can't be used with recursive=true"):
+            vault_kv2_get_lookup.run(terms=['app'], variables=minimal_vars, recursive=True, version=2)
+
+        vault_client.secrets.kv.v2.list_secrets.assert_not_called()
@@ -9,7 +9,7 @@ __metaclass__ = type
 import pytest
 
 from ansible.plugins.loader import lookup_loader
-from ansible.errors import AnsibleError
+from ansible.errors import AnsibleError, AnsibleOptionsError
 
 from ...compat import mock
 
@@ -38,6 +38,25 @@ LIST_FIXTURES = [
 ]
 
 
+TREE = {
+    'secret/metadata': ['app/', 'other'],
+    'secret/metadata/app': ['db', 'old/', 'web/', 'key.pem'],
+    'secret/metadata/app/old': ['db'],
+    'secret/metadata/app/web': ['tmp', 'cert.pem', 'conf/'],
+    'secret/metadata/app/web/conf': ['main'],
+}
+
+
+@pytest.fixture
+def tree_client(vault_client):
+    def _list(path):
+        keys = TREE.get(path)
+        return None if keys is None else {'data': {'keys': keys}}
+
+    vault_client.list = mock.Mock(wraps=_list)
+    return vault_client
+
+
 @pytest.fixture(params=LIST_FIXTURES)
 def list_response(request, fixture_loader):
     return fixture_loader(request.param)
@@ -85,3 +104,65 @@ class TestVaultListLookup(object):
             r = response.pop(0)
             ins_p = r.pop('_path')
             assert p == ins_p, "expected '_path=%s' field was not found in response, got %r" % (p, ins_p)
+
+    @pytest.mark.parametrize('max_concurrency', [1, 4])
+    @pytest.mark.parametrize('term', ['secret/metadata', 'secret/metadata/'])
+    def test_vault_list_recursive(self, vault_list_lookup, minimal_vars, tree_client, max_concurrency, term):
+        response = vault_list_lookup.run(terms=[term], variables=minimal_vars, recursive=True, max_concurrency=max_concurrency)
+
+        assert response == [[
+            'secret/metadata/app/db',
+            'secret/metadata/app/key.pem',
+            'secret/metadata/app/old/db',
+            'secret/metadata/app/web/cert.pem',
+            'secret/metadata/app/web/conf/main',
+            'secret/metadata/app/web/tmp',
+            'secret/metadata/other',
+        ]]
+        assert tree_client.list.call_count == len(TREE)
+
+    @pytest.mark.parametrize('max_depth,expected', [
+        (1, ['secret/metadata/app/', 'secret/metadata/other']),
+        (2, [
+            'secret/metadata/app/db',
+            'secret/metadata/app/key.pem',
+            'secret/metadata/app/old/',
+            'secret/metadata/app/web/',
+            'secret/metadata/other',
+        ]),
+    ])
+    def test_vault_list_recursive_max_depth(self, vault_list_lookup, minimal_vars, tree_client, max_depth, expected):
+        response = vault_list_lookup.run(terms=['secret/metadata'], variables=minimal_vars, recursive=True, max_depth=max_depth)
+
+        assert response == [expected]
+        assert tree_client.list.call_count == max_depth
+
+    @pytest.mark.parametrize('include,exclude,expected,listed', [
+        (['*.pem'], [], ['app/key.pem', 'app/web/cert.pem'], 5),
+        ([], ['app/old/', '*/tmp'], ['app/db', 'app/key.pem', 'app/web/cert.pem', 'app/web/conf/main', 'other'], 4),
+        (['app/*'], ['app/web/*'], ['app/db', 'app/key.pem', 'app/old/db'], 3),
+    ])
+    def test_vault_list_recursive_filters(self, vault_list_lookup, minimal_vars, tree_client, include, exclude, expected, listed):
+        response = vault_list_lookup.run(terms=['secret/metadata'], variables=minimal_vars, recursive=True, include=include, exclude=exclude)
+
+        assert response == [['secret/metadata/' + path for path in expected]]
+        assert tree_client.list.call_count == listed
+
+    def test_vault_list_recursive_multiple_terms(self, vault_list_lookup, minimal_vars, tree_client):
+        response = vault_list_lookup.run(terms=['secret/metadata/app/web', 'secret/metadata/app/old'], variables=minimal_vars, recursive=True)
+
+        assert response == [
+            ['secret/metadata/app/web/cert.pem', 'secret/metadata/app/web/conf/main', 'secret/metadata/app/web/tmp'],
+            ['secret/metadata/app/old/db'],
+        ]
+
+    def test_vault_list_recursive_missing(self, vault_list_lookup, minimal_vars, tree_client):
+        with pytest.raises(AnsibleError, match=r"^The path 'missing' doesn't seem to exist"):
+            vault_list_lookup.run(terms=['missing'], variables=minimal_vars, recursive=True)
+
+    @pytest.mark.parametrize('max_depth', [0, -1])
+    def test_vault_list_recursive_invalid_max_depth(self, vault_list_lookup, minimal_vars, tree_client, max_depth):
+        with pytest.raises(AnsibleOptionsError, match=r'max_depth must be 1 or greater'):
+            vault_list_lookup.run(terms=['secret/metadata'], variables=minimal_vars, recursive=True, max_depth=max_depth)
+
+        tree_client.list.assert_not_called()
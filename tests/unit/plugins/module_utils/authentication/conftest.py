@@ -25,7 +25,8 @@ from ansible_collections.community.hashi_vault.plugins.module_utils._hashi_vault
 
 class HashiVaultAuthMethodFake(HashiVaultAuthMethodBase):
     NAME = 'fake'
-    OPTIONS = []
+    OPTIONS = ['password']
+    TOKEN_CACHE_SECRETS = ('password',)
 
     def __init__(self, option_adapter, warning_callback, deprecate_callback):
         super(HashiVaultAuthMethodFake, self).__init__(option_adapter, warning_callback, deprecate_callback)
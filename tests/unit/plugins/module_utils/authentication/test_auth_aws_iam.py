@@ -191,3 +191,17 @@ class TestAuthAwsIam(object):
             with mock.patch.object(boto_mocks.session, 'get_credentials', return_value=None):
                 with pytest.raises(HashiVaultValueError, match=r'No AWS credentials supplied or available'):
                     auth_aws_iam.validate()
+
+    def test_auth_aws_iam_token_cache_credentials(self, auth_aws_iam, boto_mocks, adapter, aws_access_key, aws_secret_key, aws_session_token):
+        adapter.set_option('aws_profile', 'my_aws_profile')
+
+        with mock.patch.dict('sys.modules', {'botocore': boto_mocks.botocore, 'boto3': boto_mocks.boto3}):
+            auth_aws_iam.validate()
+
+        credentials = auth_aws_iam.get_token_cache_credentials()
+
+        assert credentials['aws_profile'] == 'my_aws_profile'
+        assert credentials['aws_access_key'] == aws_access_key
+        assert credentials['aws_secret_key'] == aws_secret_key
+        assert credentials['aws_security_token'] == aws_session_token
+        assert auth_aws_iam.has_token_cache_secret(credentials)
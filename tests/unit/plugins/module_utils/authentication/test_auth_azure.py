@@ -222,3 +222,15 @@ class TestAuthAzure(object):
 
         params = auth_azure._auth_azure_login_params
         assert params['jwt'] == jwt
+
+    def test_auth_azure_token_cache_credentials(self, auth_azure, adapter):
+        adapter.set_options()
+
+        with mock.patch('azure.identity.ManagedIdentityCredential') as mocked_credential_class:
+            mocked_credential_class.return_value.get_token.return_value.token = 'jwt1'
+            auth_azure.validate()
+
+        credentials = auth_azure.get_token_cache_credentials()
+
+        assert credentials['jwt'] == 'jwt1'
+        assert auth_azure.has_token_cache_secret(credentials)
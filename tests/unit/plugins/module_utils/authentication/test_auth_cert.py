@@ -87,3 +87,26 @@ class TestAuthCert(object):
 
         assert response["auth"]["client_token"] == cert_login_response["auth"]["client_token"]
         assert (client.token == cert_login_response["auth"]["client_token"]) is use_token
+
+    def test_auth_cert_token_cache_credentials(self, auth_cert, adapter, tmp_path):
+        cert = tmp_path / "cert.pem"
+        key = tmp_path / "key.pem"
+        cert.write_text("CERT")
+        key.write_text("KEY1")
+        adapter.set_option("cert_auth_public_key", str(cert))
+        adapter.set_option("cert_auth_private_key", str(key))
+
+        first = auth_cert.get_token_cache_credentials()
+        assert first["cert_auth_private_key"] == {"path": str(key), "contents": "KEY1"}
+        assert auth_cert.has_token_cache_secret(first)
+
+        # a new key at the same path is a different login
+        key.write_text("KEY2")
+        assert auth_cert.get_token_cache_credentials() != first
+
+    def test_auth_cert_token_cache_credentials_missing_file(self, auth_cert, adapter, tmp_path):
+        adapter.set_option("cert_auth_public_key", str(tmp_path / "missing.pem"))
+        adapter.set_option("cert_auth_private_key", str(tmp_path / "missing.pem"))
+
+        with pytest.raises(HashiVaultValueError, match=r"^Unable to read cert_auth_public_key"):
+            auth_cert.get_token_cache_credentials()
@@ -8,7 +8,18 @@ __metaclass__ = type
 
 import pytest
 
+try:
+    import hvac
+except ImportError:
+    # python 2.6, which isn't supported anyway
+    pass
+
+from ansible_collections.community.hashi_vault.tests.unit.compat import mock
+
 from ......plugins.module_utils._authenticator import HashiVaultAuthenticator
+from ......plugins.module_utils._hashi_vault_common import HashiVaultValueError
+from ......plugins.module_utils._token_cache import HashiVaultTokenCache
+from ......plugins.module_utils._tracing import HashiVaultTracer
 
 
 @pytest.fixture
@@ -46,6 +57,18 @@ class TestHashiVaultAuthenticator(object):
 
         fake_auth_class.authenticate.assert_called_once_with(*args, **kwargs)
 
+    def test_authenticate_traced(self, authenticator, fake_auth_class):
+        authenticator.tracer = HashiVaultTracer()
+        authenticator.tracer.start('plugin')
+
+        authenticator.authenticate('client', use_token=False)
+        fake_auth_class.authenticate.assert_called_with('client', use_token=False)
+
+        root, login = authenticator.tracer.end()['resourceSpans'][0]['scopeSpans'][0]['spans']
+        assert login['name'] == 'login'
+        assert login['parentSpanId'] == root['spanId']
+        assert login['attributes'] == [{'key': 'vault.auth.method', 'value': {'stringValue': fake_auth_class.NAME}}]
+
     def test_authenticate_not_implemented(self, authenticator, fake_auth_class):
         with pytest.raises(NotImplementedError):
             authenticator.validate(method='missing')
@@ -56,6 +79,17 @@ class TestHashiVaultAuthenticator(object):
         for auth_method, obj in authenticator._selector.items():
             assert authenticator._get_method_object(method=auth_method) == obj
 
+    @pytest.mark.parametrize('auth_method', HashiVaultAuthenticator.ARGSPEC['auth_method']['choices'])
+    def test_get_method_object_lazy(self, adapter, warner, deprecator, auth_method):
+        authenticator = HashiVaultAuthenticator(adapter, warner, deprecator)
+        assert authenticator._selector == {}
+
+        obj = authenticator._get_method_object(method=auth_method)
+
+        assert obj.NAME == auth_method
+        assert authenticator._selector == {auth_method: obj}
+        assert authenticator._get_method_object(method=auth_method) is obj
+
     def test_get_method_object_missing(self, authenticator):
         with pytest.raises(NotImplementedError, match=r"auth method 'missing' is not implemented in HashiVaultAuthenticator"):
             authenticator._get_method_object(method='missing')
@@ -66,3 +100,109 @@ class TestHashiVaultAuthenticator(object):
         obj = authenticator._get_method_object()
 
         assert isinstance(obj, type(fake_auth_class))
+
+    @pytest.mark.parametrize('option_dict', [{'auth_method': 'fake', 'token_cache': True, 'url': 'http://vault'}])
+    def test_authenticate_token_cache(self, authenticator, fake_auth_class, client):
+        login = {'auth': {'client_token': 's.cached', 'lease_duration': 3600}}
+
+        with mock.patch.object(fake_auth_class, 'authenticate', return_value=login) as auth:
+            first = authenticator.authenticate(client)
+            client.token = None
+            second = authenticator.authenticate(client)
+
+        auth.assert_called_once_with(client, use_token=True)
+        assert first == second == login
+        assert client.token == 's.cached'
+
+    @pytest.mark.parametrize('option_dict', [{'auth_method': 'fake', 'token_cache': True, 'url': 'http://vault'}])
+    def test_authenticate_token_cache_no_use_token(self, authenticator, fake_auth_class, client):
+        login = {'auth': {'client_token': 's.cached', 'lease_duration': 3600}}
+
+        with mock.patch.object(fake_auth_class, 'authenticate', return_value=login) as auth:
+            authenticator.authenticate(client)
+            client.token = None
+            authenticator.authenticate(client, use_token=False)
+
+        auth.assert_called_once()
+        assert client.token is None
+
+    @pytest.mark.parametrize('option_dict', [{'auth_method': 'fake', 'token_cache': True, 'url': 'http://vault'}])
+    def test_authenticate_token_cache_keyed_by_url(self, authenticator, fake_auth_class):
+        login = {'auth': {'client_token': 's.cached', 'lease_duration': 3600}}
+
+        with mock.patch.object(fake_auth_class, 'authenticate', return_value=login) as auth:
+            authenticator.authenticate(hvac.Client(url='http://one'))
+            authenticator.authenticate(hvac.Client(url='http://two'))
+
+        assert auth.call_count == 2
+
+    @pytest.mark.parametrize('option_dict', [{'auth_method': 'fake', 'url': 'http://vault'}])
+    def test_authenticate_token_cache_disabled(self, authenticator, fake_auth_class, client):
+        login = {'auth': {'client_token': 's.cached', 'lease_duration': 3600}}
+
+        with mock.patch.object(fake_auth_class, 'authenticate', return_value=login) as auth:
+            authenticator.authenticate(client)
+            authenticator.authenticate(client)
+
+        assert auth.call_count == 2
+
+    @pytest.mark.parametrize('option_dict', [{'auth_method': 'fake', 'token_cache': True, 'url': 'http://vault', 'password': 'hunter2'}])
+    def test_authenticate_token_cache_file(self, authenticator, fake_auth_class, client, adapter, tmp_path):
+        adapter.set_option('token_cache_path', str(tmp_path / 'tokens.json'))
+        login = {'auth': {'client_token': 's.cached', 'lease_duration': 3600}}
+
+        with mock.patch.object(fake_auth_class, 'authenticate', return_value=login) as auth:
+            authenticator.authenticate(client)
+            HashiVaultTokenCache.clear()
+            client.token = None
+
+            with mock.patch.object(client.auth.token, 'lookup_self') as lookup_self:
+                response = authenticator.authenticate(client)
+
+        auth.assert_called_once()
+        lookup_self.assert_called_once()
+        assert response == login
+        assert client.token == 's.cached'
+
+    @pytest.mark.parametrize('option_dict', [{'auth_method': 'fake', 'token_cache': True, 'url': 'http://vault', 'password': 'hunter2'}])
+    def test_authenticate_token_cache_file_revoked(self, authenticator, fake_auth_class, client, adapter, tmp_path):
+        adapter.set_option('token_cache_path', str(tmp_path / 'tokens.json'))
+        revoked = {'auth': {'client_token': 's.revoked', 'lease_duration': 3600}}
+        login = {'auth': {'client_token': 's.new', 'lease_duration': 3600}}
+
+        with mock.patch.object(fake_auth_class, 'authenticate', side_effect=[revoked, login]) as auth:
+            authenticator.authenticate(client)
+            HashiVaultTokenCache.clear()
+
+            with mock.patch.object(client.auth.token, 'lookup_self', side_effect=hvac.exceptions.Forbidden):
+                response = authenticator.authenticate(client)
+
+        assert auth.call_count == 2
+        assert response == login
+
+    @pytest.mark.parametrize('option_dict', [{'auth_method': 'fake', 'token_cache': True, 'url': 'http://vault'}])
+    def test_authenticate_token_cache_file_no_secret(self, authenticator, fake_auth_class, client, adapter, tmp_path):
+        adapter.set_option('token_cache_path', str(tmp_path / 'tokens.json'))
+
+        with mock.patch.object(fake_auth_class, 'authenticate') as auth:
+            with pytest.raises(HashiVaultValueError, match=r"^token_cache_path can't be used with the fake auth method without password"):
+                authenticator.authenticate(client)
+
+        auth.assert_not_called()
+        assert not (tmp_path / 'tokens.json').exists()
+
+    @pytest.mark.parametrize('option_dict', [{'auth_method': 'fake', 'token_cache': True, 'url': 'http://vault', 'password': 'hunter2'}])
+    def test_authenticate_token_cache_credentials_changed(self, authenticator, fake_auth_class, client, adapter, tmp_path):
+        adapter.set_option('token_cache_path', str(tmp_path / 'tokens.json'))
+        login = {'auth': {'client_token': 's.cached', 'lease_duration': 3600}}
+
+        with mock.patch.object(fake_auth_class, 'authenticate', return_value=login) as auth:
+            authenticator.authenticate(client)
+            HashiVaultTokenCache.clear()
+            adapter.set_option('password', 'changed')
+
+            with mock.patch.object(client.auth.token, 'lookup_self') as lookup_self:
+                authenticator.authenticate(client)
+
+        assert auth.call_count == 2
+        lookup_self.assert_not_called()
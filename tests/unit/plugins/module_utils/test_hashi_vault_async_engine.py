@@ -0,0 +1,355 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+import socketserver
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip('aiohttp')
+
+import hvac  # noqa: E402
+
+from ansible_collections.community.hashi_vault.tests.unit.compat import mock  # noqa: E402
+
+from ansible_collections.community.hashi_vault.plugins.module_utils._hashi_vault_common import HashiVaultValueError  # noqa: E402
+from ansible_collections.community.hashi_vault.plugins.module_utils._request_stats import HashiVaultRequestStats  # noqa: E402
+from ansible_collections.community.hashi_vault.plugins.module_utils._tracing import HashiVaultTracer  # noqa: E402
+from ansible_collections.community.hashi_vault.plugins.module_utils._unix_socket import HashiVaultUnixSocketAdapter  # noqa: E402
+from ansible_collections.community.hashi_vault.plugins.module_utils._async_engine import (  # noqa: E402
+    HashiVaultAsyncEngine,
+    HashiVaultAsyncOperation,
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    '''
+    responds to each path with the next of the (status, body) or (status, body, headers) responses in server.responses,
+    repeating the last one, or with 200 and a description of the request if there are none
+    '''
+    protocol_version = 'HTTP/1.1'
+
+    def _respond(self):
+        server = self.server
+        with server.lock:
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+            request = dict(
+                method=self.command,
+                path=self.path,
+                token=self.headers.get('X-Vault-Token'),
+                namespace=self.headers.get('X-Vault-Namespace'),
+                wrap_ttl=self.headers.get('X-Vault-Wrap-TTL'),
+                body=json.loads(self.rfile.read(length) or 'null'),
+            )
+            server.requests.append(request)
+
+            time.sleep(server.delay)
+
+            responses = server.responses.get(self.path.split('?')[0])
+            headers = {}
+            if responses:
+                status, body, *extra = responses.pop(0) if len(responses) > 1 else responses[0]
+                if extra:
+                    headers = extra[0]
+            else:
+                status, body = 200, {'data': request}
+
+            data = b'' if body is None else json.dumps(body).encode('utf-8')
+
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(data)
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    do_GET = do_POST = do_LIST = _respond
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _configure(server):
+    server.lock = threading.Lock()
+    server.requests = []
+    server.responses = {}
+    server.delay = 0
+    server.in_flight = server.max_in_flight = 0
+    # requests that are cancelled disconnect early
+    server.handle_error = lambda request, client_address: None
+    return server
+
+
+def _serve(server):
+    thread = threading.Thread(target=server.serve_forever, kwargs=dict(poll_interval=0.01))
+    thread.start()
+    return thread
+
+
+@pytest.fixture
+def server():
+    server = _configure(ThreadingHTTPServer(('127.0.0.1', 0), _Handler))
+    server.daemon_threads = True
+    thread = _serve(server)
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+    thread.join(5)
+
+
+@pytest.fixture
+def engine(server):
+    return HashiVaultAsyncEngine('http://127.0.0.1:%i' % server.server_address[1], token='s.token', namespace='ns1', max_concurrency=3)
+
+
+class TestHashiVaultAsyncEngine(object):
+
+    def test_requires_aiohttp(self):
+        with mock.patch('ansible_collections.community.hashi_vault.plugins.module_utils._async_engine.HAS_AIOHTTP', False):
+            with pytest.raises(HashiVaultValueError, match='aiohttp'):
+                HashiVaultAsyncEngine('http://vault')
+
+    def test_invalid_max_concurrency(self):
+        with pytest.raises(HashiVaultValueError, match='max_concurrency'):
+            HashiVaultAsyncEngine('http://vault', max_concurrency=0)
+
+    def test_from_client(self):
+        client_args = dict(url='https://vault:8200', namespace='ns1', verify='/ca.pem', timeout=7, proxies={'https': 'http://proxy'})
+        client = hvac.Client(token='s.token', **client_args)
+
+        engine = HashiVaultAsyncEngine.from_client(client, client_args, max_concurrency=4)
+
+        assert engine.url == 'https://vault:8200'
+        assert engine.token == 's.token'
+        assert engine.namespace == 'ns1'
+        assert engine.verify == '/ca.pem'
+        assert engine.timeout == 7
+        assert engine.proxies == {'https': 'http://proxy'}
+        assert engine.max_concurrency == 4
+
+    def test_run_empty(self, engine):
+        assert engine.run([]) == []
+
+    def test_operations(self, engine, server):
+        results = engine.run([
+            HashiVaultAsyncOperation.read('secret//data/one'),
+            HashiVaultAsyncOperation.list('/secret/metadata'),
+            HashiVaultAsyncOperation.write('sys/wrapping/wrap', data={'a': 1}, wrap_ttl='60s'),
+        ])
+
+        assert [r['data']['method'] for r in results] == ['GET', 'LIST', 'POST']
+        assert [r['data']['path'] for r in results] == ['/v1/secret/data/one', '/v1/secret/metadata', '/v1/sys/wrapping/wrap']
+        assert all(r['data']['token'] == 's.token' and r['data']['namespace'] == 'ns1' for r in results)
+        assert results[2]['data']['body'] == {'a': 1}
+        assert results[2]['data']['wrap_ttl'] == '60s'
+        assert results[0]['data']['wrap_ttl'] is None
+
+    @pytest.mark.parametrize('operation,status,expected', [
+        (HashiVaultAsyncOperation.read('missing'), 404, None),
+        (HashiVaultAsyncOperation.list('missing'), 404, None),
+        (HashiVaultAsyncOperation.write('missing'), 204, None),
+    ])
+    def test_empty_results(self, engine, server, operation, status, expected):
+        server.responses['/v1/missing'] = [(status, None)]
+
+        assert engine.run([operation]) == [expected]
+
+    def test_read_params(self, engine, server):
+        results = engine.run([HashiVaultAsyncOperation.read('secret/data/one', params=dict(version=3))])
+
+        assert results[0]['data']['path'] == '/v1/secret/data/one?version=3'
+
+    def test_read_raise_on_missing(self, engine, server):
+        server.responses['/v1/missing'] = [(404, {'errors': []})]
+
+        with pytest.raises(hvac.exceptions.InvalidPath):
+            engine.run([HashiVaultAsyncOperation.read('missing', raise_on_missing=True)])
+
+    @pytest.mark.parametrize('operation,status,exception', [
+        (HashiVaultAsyncOperation.read('error'), 403, hvac.exceptions.Forbidden),
+        (HashiVaultAsyncOperation.read('error'), 400, hvac.exceptions.InvalidRequest),
+        (HashiVaultAsyncOperation.write('error'), 404, hvac.exceptions.InvalidPath),
+        (HashiVaultAsyncOperation.write('error'), 500, hvac.exceptions.InternalServerError),
+    ])
+    def test_errors(self, engine, server, operation, status, exception):
+        server.responses['/v1/error'] = [(status, {'errors': ['permission denied']})]
+
+        with pytest.raises(exception, match='permission denied'):
+            engine.run([operation])
+
+    def test_return_exceptions(self, engine, server):
+        server.responses['/v1/error'] = [(403, {'errors': ['permission denied']})]
+
+        results = engine.run([HashiVaultAsyncOperation.read('one'), HashiVaultAsyncOperation.read('error')], return_exceptions=True)
+
+        assert results[0]['data']['path'] == '/v1/one'
+        assert isinstance(results[1], hvac.exceptions.Forbidden)
+
+    def test_earliest_error_raised(self, engine, server):
+        server.responses['/v1/first'] = [(403, {'errors': ['first']})]
+        server.responses['/v1/second'] = [(400, {'errors': ['second']})]
+
+        with pytest.raises(hvac.exceptions.Forbidden, match='first'):
+            engine.run([HashiVaultAsyncOperation.read('first'), HashiVaultAsyncOperation.read('second')])
+
+    def test_max_concurrency(self, engine, server):
+        server.delay = 0.05
+
+        results = engine.run([HashiVaultAsyncOperation.read('item/%i' % i) for i in range(12)])
+
+        assert [r['data']['path'] for r in results] == ['/v1/item/%i' % i for i in range(12)]
+        assert 1 < server.max_in_flight <= 3
+
+    def test_retries(self, engine, server):
+        server.responses['/v1/flaky'] = [(503, {'errors': []}), (412, {'errors': []}), (200, {'data': {'ok': True}})]
+        engine.retries = {'total': 3, 'backoff_factor': 0, 'status_forcelist': [412, 503]}
+        engine.on_retry = mock.Mock()
+
+        assert engine.run([HashiVaultAsyncOperation.read('flaky')]) == [{'data': {'ok': True}}]
+        assert engine.on_retry.call_args_list == [mock.call(3), mock.call(2)]
+
+    def test_retries_retry_after(self, engine, server):
+        # retried like urllib3 does, even though 429 isn't in status_forcelist
+        server.responses['/v1/limited'] = [(429, {'errors': []}, {'Retry-After': '0'}), (200, {'data': {'ok': True}})]
+        server.responses['/v1/standby'] = [(429, {'errors': ['standby']})]
+        engine.retries = {'total': 3, 'backoff_factor': 0, 'status_forcelist': [503]}
+
+        assert engine.run([HashiVaultAsyncOperation.read('limited')]) == [{'data': {'ok': True}}]
+
+        with pytest.raises(hvac.exceptions.RateLimitExceeded):
+            engine.run([HashiVaultAsyncOperation.read('standby')])
+
+        assert [r['path'] for r in server.requests] == ['/v1/limited', '/v1/limited', '/v1/standby']
+
+    def test_retries_retry_after_not_respected(self, engine, server):
+        server.responses['/v1/limited'] = [(429, {'errors': []}, {'Retry-After': '0'}), (200, {'data': {'ok': True}})]
+        engine.retries = {'total': 3, 'backoff_factor': 0, 'status_forcelist': [503], 'respect_retry_after_header': False}
+
+        with pytest.raises(hvac.exceptions.RateLimitExceeded):
+            engine.run([HashiVaultAsyncOperation.read('limited')])
+
+        assert len(server.requests) == 1
+
+    def test_stats(self, engine, server):
+        server.responses['/v1/secret/data/flaky'] = [(503, {'errors': []}), (200, {'data': {'ok': True}})]
+        server.responses['/v1/secret/data/down'] = [(503, {'errors': []})]
+        server.responses['/v1/secret/data/denied'] = [(403, {'errors': []})]
+        engine.retries = {'total': 2, 'backoff_factor': 0, 'status_forcelist': [503]}
+        engine.stats = HashiVaultRequestStats()
+
+        engine.run([
+            HashiVaultAsyncOperation.read('secret/data/flaky'),
+            HashiVaultAsyncOperation.read('secret/data/down'),
+            HashiVaultAsyncOperation.read('secret/data/denied'),
+        ], return_exceptions=True)
+
+        records = sorted(engine.stats.get_records(), key=lambda r: r['status'])
+        assert [(r['path'], r['status'], r['retries']) for r in records] == [('secret/data/*', 200, 1), ('secret/data/*', 403, 0), ('secret/data/*', 503, 2)]
+        assert records[0]['bytes'] == len(json.dumps({'data': {'ok': True}}))
+
+    def test_tracer(self, engine, server):
+        server.responses['/v1/secret/data/flaky'] = [(503, {'errors': []}), (200, {'data': {'ok': True}})]
+        engine.retries = {'total': 1, 'backoff_factor': 0, 'status_forcelist': [503]}
+        engine.tracer = HashiVaultTracer()
+        engine.tracer.start('lookup')
+
+        engine.run([HashiVaultAsyncOperation.read('secret/data/flaky')])
+
+        root, request, retry = engine.tracer.end()['resourceSpans'][0]['scopeSpans'][0]['spans']
+        assert request['name'] == 'GET secret/data/*'
+        assert request['parentSpanId'] == root['spanId']
+        assert {'key': 'http.request.resend_count', 'value': {'intValue': '1'}} in request['attributes']
+        assert retry['parentSpanId'] == request['spanId']
+        assert {'key': 'http.response.status_code', 'value': {'intValue': '503'}} in retry['attributes']
+        assert int(request['startTimeUnixNano']) <= int(retry['startTimeUnixNano']) <= int(retry['endTimeUnixNano']) <= int(request['endTimeUnixNano'])
+
+    def test_retries_exhausted(self, engine, server):
+        server.responses['/v1/down'] = [(503, {'errors': ['sealed']})]
+        engine.retries = {'total': 2, 'backoff_factor': 0, 'status_forcelist': [503]}
+
+        with pytest.raises(hvac.exceptions.VaultDown, match='sealed'):
+            engine.run([HashiVaultAsyncOperation.read('down')])
+
+        assert len(server.requests) == 3
+
+    def test_retries_allowed_methods(self, engine, server):
+        server.responses['/v1/down'] = [(503, {'errors': ['sealed']})]
+        engine.retries = {'total': 2, 'backoff_factor': 0, 'status_forcelist': [503], 'allowed_methods': ['GET']}
+
+        with pytest.raises(hvac.exceptions.VaultDown):
+            engine.run([HashiVaultAsyncOperation.write('down')])
+
+        assert len(server.requests) == 1
+
+    def test_retry_deadline(self, engine, server):
+        server.responses['/v1/down'] = [(503, {'errors': ['sealed']})]
+        engine.retries = {'total': 100, 'backoff_factor': 0.01, 'status_forcelist': [503]}
+        engine.retry_deadline = 0.2
+
+        start = time.monotonic()
+        with pytest.raises(hvac.exceptions.VaultDown):
+            engine.run([HashiVaultAsyncOperation.read('down')])
+
+        assert time.monotonic() - start < 5
+        assert len(server.requests) < 100
+
+    def test_connection_error(self):
+        engine = HashiVaultAsyncEngine('http://127.0.0.1:1', retries={'total': 1, 'backoff_factor': 0})
+
+        with pytest.raises(Exception) as e:
+            engine.run([HashiVaultAsyncOperation.read('one')])
+
+        assert 'aiohttp' in type(e.value).__module__
+
+    @pytest.mark.parametrize('value,expected', [
+        (None, None),
+        ('3', 3.0),
+        ('-1', 0),
+        ('Wed, 21 Oct 2015 07:28:00 GMT', 0),
+        ('invalid', None),
+    ])
+    def test_get_retry_after(self, value, expected):
+        headers = {} if value is None else {'Retry-After': value}
+
+        assert HashiVaultAsyncEngine._get_retry_after(headers) == expected
+
+    def test_unix_socket(self, tmp_path):
+        class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+            daemon_threads = True
+
+        class _UnixHandler(_Handler):
+            def address_string(self):
+                return 'unix'
+
+        path = str(tmp_path / 'agent.sock')
+        server = _configure(_Server(path, _UnixHandler))
+        thread = _serve(server)
+
+        try:
+            engine = HashiVaultAsyncEngine(HashiVaultUnixSocketAdapter.from_unix_url('unix://' + path))
+            result = engine.run([HashiVaultAsyncOperation.read('secret/data/one')])
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join(5)
+
+        assert result[0]['data']['path'] == '/v1/secret/data/one'
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import os
+import stat
+
+import pytest
+
+from requests import Response, Session
+from requests.exceptions import ConnectionError
+
+from ansible_collections.community.hashi_vault.tests.unit.compat import mock
+
+from ansible_collections.community.hashi_vault.plugins.module_utils._circuit_breaker import (
+    HashiVaultCircuitBreaker,
+    HashiVaultCircuitBreakerAdapter,
+    HashiVaultCircuitOpenError,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_states():
+    HashiVaultCircuitBreaker._states = {}
+    yield
+    HashiVaultCircuitBreaker._states = {}
+
+
+@pytest.fixture
+def now():
+    with mock.patch.object(HashiVaultCircuitBreaker, '_clock', return_value=1000.0) as clock:
+        yield clock
+
+
+@pytest.fixture(autouse=True)
+def private_tempdir(tmp_path):
+    with mock.patch('tempfile.gettempdir', return_value=str(tmp_path)):
+        yield tmp_path
+
+
+@pytest.fixture(params=[False, True], ids=['process', 'shared'])
+def breaker(request):
+    return HashiVaultCircuitBreaker('https://vault:8200', threshold=3, cooldown=30, shared=request.param)
+
+
+def _fail(breaker, times):
+    for i in range(times):
+        breaker.before_request()
+        breaker.record_failure()
+
+
+class TestHashiVaultCircuitBreaker(object):
+
+    @pytest.mark.parametrize('url,expected', [
+        ('https://vault:8200/v1/secret/data/one', 'https://vault:8200'),
+        ('http://127.0.0.1/v1/sys/health?standbyok=true', 'http://127.0.0.1'),
+    ])
+    def test_get_address(self, url, expected):
+        assert HashiVaultCircuitBreaker.get_address(url) == expected
+
+    def test_opens_after_threshold(self, now, breaker):
+        _fail(breaker, 2)
+        assert not breaker.is_open()
+        breaker.before_request()
+
+        _fail(breaker, 1)
+        assert breaker.is_open()
+
+        with pytest.raises(HashiVaultCircuitOpenError, match=r'open after 3 consecutive failures.*another 30 seconds'):
+            breaker.before_request()
+
+    def test_open_error_is_connection_error(self):
+        assert issubclass(HashiVaultCircuitOpenError, ConnectionError)
+
+    def test_success_resets(self, now, breaker):
+        _fail(breaker, 2)
+        breaker.record_success()
+        _fail(breaker, 2)
+
+        assert not breaker.is_open()
+
+    def test_single_probe(self, now, breaker):
+        _fail(breaker, 3)
+
+        now.return_value = 1030.0
+        assert not breaker.is_open()
+
+        # the first request is the probe, the next ones wait for it
+        breaker.before_request()
+        with pytest.raises(HashiVaultCircuitOpenError, match='probe'):
+            breaker.before_request()
+
+        breaker.record_success()
+        breaker.before_request()
+        assert not breaker.is_open()
+
+    def test_failed_probe_reopens(self, now, breaker):
+        _fail(breaker, 3)
+
+        now.return_value = 1030.0
+        breaker.before_request()
+        breaker.record_failure()
+
+        assert breaker.is_open()
+        with pytest.raises(HashiVaultCircuitOpenError):
+            breaker.before_request()
+
+    def test_stuck_probe_replaced(self, now, breaker):
+        _fail(breaker, 3)
+
+        now.return_value = 1030.0
+        breaker.before_request()
+
+        now.return_value = 1060.0
+        breaker.before_request()
+
+    def test_addresses_separate(self, now, breaker):
+        _fail(breaker, 3)
+
+        other = HashiVaultCircuitBreaker('https://other:8200', threshold=3, shared=breaker.shared)
+        other.before_request()
+
+    def test_process_state_not_inherited(self, now):
+        breaker = HashiVaultCircuitBreaker('https://vault:8200', threshold=1)
+        _fail(breaker, 1)
+
+        with mock.patch('os.getpid', return_value=os.getpid() + 1):
+            assert not breaker.is_open()
+
+    def test_shared_state_file(self, now, private_tempdir):
+        breaker = HashiVaultCircuitBreaker('https://vault:8200', threshold=1, shared=True)
+        _fail(breaker, 1)
+
+        path = breaker.get_state_path()
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+        assert stat.S_IMODE(os.stat(os.path.dirname(path)).st_mode) == 0o700
+
+        # another process sees the same state
+        with mock.patch('os.getpid', return_value=os.getpid() + 1):
+            assert HashiVaultCircuitBreaker('https://vault:8200', threshold=1, shared=True).is_open()
+
+    def test_shared_state_insecure_directory(self, private_tempdir):
+        directory = private_tempdir / ('ansible-hashi-vault-%i' % os.getuid())
+        directory.mkdir()
+        directory.chmod(0o777)
+
+        with pytest.raises(OSError, match='only accessible'):
+            HashiVaultCircuitBreaker('https://vault:8200', threshold=1, shared=True).is_open()
+
+
+class TestHashiVaultCircuitBreakerAdapter(object):
+
+    @pytest.fixture
+    def session(self):
+        session = Session()
+        session.mount('https://', HashiVaultCircuitBreakerAdapter(dict(threshold=2, cooldown=30, shared=False)))
+        return session
+
+    @staticmethod
+    def _response(status):
+        response = Response()
+        response.status_code = status
+        response._content = b''
+        return response
+
+    @pytest.mark.parametrize('status,opens', [(200, False), (404, False), (500, False), (502, True), (503, True), (504, True)])
+    def test_statuses(self, now, session, status, opens):
+        with mock.patch('requests.adapters.HTTPAdapter.send', return_value=self._response(status)):
+            session.get('https://vault:8200/v1/secret')
+            session.get('https://vault:8200/v1/secret')
+
+        assert HashiVaultCircuitBreaker('https://vault:8200', threshold=2).is_open() is opens
+
+    def test_connection_errors(self, now, session):
+        with mock.patch('requests.adapters.HTTPAdapter.send', side_effect=ConnectionError('refused')) as send:
+            for i in range(2):
+                with pytest.raises(ConnectionError, match='refused'):
+                    session.get('https://vault:8200/v1/secret')
+
+            with pytest.raises(HashiVaultCircuitOpenError):
+                session.get('https://vault:8200/v1/secret')
+
+        assert send.call_count == 2
@@ -18,8 +18,17 @@ from ansible_collections.community.hashi_vault.plugins.module_utils._hashi_vault
 )
 
 from ansible_collections.community.hashi_vault.plugins.module_utils._connection_options import HashiVaultConnectionOptions
+from ansible_collections.community.hashi_vault.plugins.module_utils._circuit_breaker import HashiVaultCircuitBreakerAdapter
+from ansible_collections.community.hashi_vault.plugins.module_utils._ha_routing import HashiVaultHAAdapter
+from ansible_collections.community.hashi_vault.plugins.module_utils._tracing import HashiVaultTracer
+from ansible_collections.community.hashi_vault.plugins.module_utils._unix_socket import (
+    HashiVaultUnixSocketAdapter,
+    HashiVaultUnixSocketCircuitBreakerAdapter,
+)
 
 from requests import Session
+from urllib3.exceptions import MaxRetryError
+from urllib3.response import HTTPResponse
 
 
 CONNECTION_OPTIONS = {
@@ -31,6 +40,8 @@ CONNECTION_OPTIONS = {
     'timeout': None,
     'retries': None,
     'retry_action': 'warn',
+    'retry_deadline': None,
+    'circuit_breaker': None,
 }
 
 
@@ -185,6 +196,7 @@ class TestHashiVaultConnectionOptions(object):
         f_boolean_or_cacert = mocker.patch.object(connection_options, '_boolean_or_cacert')
         f_process_option_proxies = mocker.patch.object(connection_options, '_process_option_proxies')
         f_process_option_retries = mocker.patch.object(connection_options, '_process_option_retries')
+        f_process_option_circuit_breaker = mocker.patch.object(connection_options, '_process_option_circuit_breaker')
 
         # mock the adapter itself, so we can spy on adapter interactions
         # since we're mocking out the methods we expect to call, we shouldn't see any
@@ -198,6 +210,7 @@ class TestHashiVaultConnectionOptions(object):
         f_boolean_or_cacert.assert_called_once()
         f_process_option_proxies.assert_called_once()
         f_process_option_retries.assert_called_once()
+        f_process_option_circuit_breaker.assert_called_once()
 
         # aseert that the adapter had no interactions (because we mocked out everything we knew about)
         # the intention here is to catch a situation where process_connection_options has been modified
@@ -265,8 +278,215 @@ class TestHashiVaultConnectionOptions(object):
         with pytest.raises(NotImplementedError):
             connection_options.get_hvac_connection_options()
 
+    @pytest.mark.parametrize('opt_retries', [2, {'total': 3}])
+    def test_get_hvac_connection_options_reuses_session(self, connection_options, adapter, opt_retries):
+        adapter.set_option('retries', opt_retries)
+
+        connection_options.process_connection_options()
+        opts1 = connection_options.get_hvac_connection_options()
+        opts2 = connection_options.get_hvac_connection_options()
+
+        assert isinstance(opts1['session'], Session)
+        assert opts1['session'] is opts2['session']
+
+    def test_get_hvac_connection_options_separates_sessions(self, connection_options, adapter):
+        adapter.set_option('retries', 2)
+        connection_options.process_connection_options()
+        opts1 = connection_options.get_hvac_connection_options()
+
+        adapter.set_option('retries', 3)
+        connection_options.process_connection_options()
+        opts2 = connection_options.get_hvac_connection_options()
+
+        assert opts1['session'] is not opts2['session']
+
     def test_url_is_required(self, connection_options, adapter):
         adapter.set_option('url', None)
 
         with pytest.raises(HashiVaultValueError, match=r'Required option url was not set'):
             connection_options.process_connection_options()
+
+    # the Retry class used for retries
+
+    @pytest.fixture
+    def get_retry(self, connection_options, adapter):
+        def _get_retry(retries, retry_deadline=None):
+            adapter.set_option('retries', retries)
+            adapter.set_option('retry_deadline', retry_deadline)
+            connection_options.process_connection_options()
+            session = connection_options.get_hvac_connection_options()['session']
+            return session.get_adapter('https://vault').max_retries
+
+        return _get_retry
+
+    @staticmethod
+    def _fail(retry, times, status=503, headers=None):
+        for i in range(times):
+            retry = retry.increment(method='GET', url='/v1/secret', response=HTTPResponse(status=status, headers=headers))
+        return retry
+
+    def test_retry_deadline_not_an_hvac_option(self, connection_options, adapter):
+        adapter.set_option('retries', 2)
+        adapter.set_option('retry_deadline', 10)
+        connection_options.process_connection_options()
+
+        assert 'retry_deadline' not in connection_options.get_hvac_connection_options()
+
+    def test_retry_deadline_separates_sessions(self, connection_options, adapter):
+        adapter.set_option('retries', 2)
+        connection_options.process_connection_options()
+        opts1 = connection_options.get_hvac_connection_options()
+
+        adapter.set_option('retry_deadline', 10)
+        opts2 = connection_options.get_hvac_connection_options()
+
+        assert opts1['session'] is not opts2['session']
+
+    @pytest.mark.parametrize('failures,expected', [(0, 0), (1, 0.3), (2, 0.6), (3, 1.2), (10, 30)])
+    def test_retry_backoff_full_jitter(self, get_retry, failures, expected):
+        retry = self._fail(get_retry(20), failures)
+
+        with mock.patch('random.uniform', side_effect=lambda low, high: high / 2) as uniform:
+            backoff = retry.get_backoff_time()
+
+        if expected:
+            uniform.assert_called_once_with(0, pytest.approx(expected))
+            assert backoff == pytest.approx(expected / 2)
+        else:
+            assert backoff == 0
+
+    def test_retry_backoff_no_jitter(self, get_retry):
+        retry = self._fail(get_retry({'total': 5, 'backoff_factor': 1, 'backoff_max': 3}), 3)
+
+        with mock.patch('random.uniform') as uniform:
+            backoff = retry.get_backoff_time()
+
+        uniform.assert_not_called()
+        assert backoff == 3
+
+    @pytest.mark.parametrize('status,headers,expected', [
+        (429, {'Retry-After': '2'}, True),
+        (429, {}, False),
+        (503, {'Retry-After': '2'}, True),
+        (503, {}, True),
+    ])
+    def test_retry_retry_after_statuses(self, get_retry, status, headers, expected):
+        retry = get_retry(2)
+
+        assert retry.is_retry('GET', status, has_retry_after='Retry-After' in headers) is expected
+
+    def test_retry_sleep_retry_after(self, get_retry):
+        retry = self._fail(get_retry(5), 1)
+
+        with mock.patch('time.sleep') as sleep:
+            retry.sleep(HTTPResponse(status=429, headers={'Retry-After': '7'}))
+
+        sleep.assert_called_once_with(7)
+
+    def test_retry_deadline(self, get_retry):
+        retry = get_retry(100, retry_deadline=10)
+
+        with mock.patch('time.monotonic', return_value=1000.0) as monotonic:
+            retry = self._fail(retry, 1)
+            assert not retry.is_exhausted()
+
+            with mock.patch('time.sleep') as sleep:
+                retry.sleep(HTTPResponse(status=429, headers={'Retry-After': '60'}))
+            sleep.assert_called_once_with(10)
+
+            monotonic.return_value = 1010.0
+            assert retry.is_exhausted()
+
+            with pytest.raises(MaxRetryError):
+                self._fail(retry, 1, status=500)
+
+    def test_retry_recorded_for_tracing(self, get_retry):
+        HashiVaultTracer().request_hook('GET', '/v1/secret', {})
+
+        self._fail(get_retry(5), 2)
+
+        retries = HashiVaultTracer._pop_retries()
+        assert [(history.url, history.status) for when, history in retries] == [('/v1/secret', 503), ('/v1/secret', 503)]
+
+    # circuit_breaker
+
+    @pytest.mark.parametrize('opt_circuit_breaker,expected', [
+        (None, None),
+        (0, None),
+        ('0', None),
+        (3, {'threshold': 3, 'cooldown': 30, 'shared': False}),
+        ('7', {'threshold': 7, 'cooldown': 30, 'shared': False}),
+        ({}, {'threshold': 5, 'cooldown': 30, 'shared': False}),
+        ({'cooldown': '10', 'shared': 'yes'}, {'threshold': 5, 'cooldown': 10.0, 'shared': True}),
+        ('{"threshold": 2}', {'threshold': 2, 'cooldown': 30, 'shared': False}),
+    ])
+    def test_process_option_circuit_breaker(self, connection_options, predefined_options, adapter, opt_circuit_breaker, expected):
+        adapter.set_option('circuit_breaker', opt_circuit_breaker)
+
+        connection_options._process_option_circuit_breaker()
+
+        assert predefined_options['circuit_breaker'] == expected
+
+    @pytest.mark.parametrize('opt_circuit_breaker', [-1, {'threshold': 0}, {'other': 1}, [1], 'invalid'])
+    def test_process_option_circuit_breaker_invalid(self, connection_options, adapter, opt_circuit_breaker):
+        adapter.set_option('circuit_breaker', opt_circuit_breaker)
+
+        with pytest.raises((TypeError, ValueError)):
+            connection_options._process_option_circuit_breaker()
+
+    @pytest.mark.parametrize('opt_retries', [None, 2])
+    def test_get_hvac_connection_options_circuit_breaker(self, connection_options, adapter, opt_retries):
+        adapter.set_option('retries', opt_retries)
+        adapter.set_option('circuit_breaker', 3)
+        connection_options.process_connection_options()
+
+        opts = connection_options.get_hvac_connection_options()
+
+        assert 'circuit_breaker' not in opts
+
+        http_adapter = opts['session'].get_adapter('https://vault')
+        assert isinstance(http_adapter, HashiVaultCircuitBreakerAdapter)
+        assert http_adapter.circuit_breaker == {'threshold': 3, 'cooldown': 30, 'shared': False}
+        assert (http_adapter.max_retries.total == 2) is (opt_retries is not None)
+
+    # url with several nodes
+
+    @pytest.mark.parametrize('opt_circuit_breaker', [None, 3])
+    def test_get_hvac_connection_options_nodes(self, connection_options, adapter, opt_circuit_breaker):
+        adapter.set_option('url', 'https://vault-1:8200, https://vault-2:8200')
+        adapter.set_option('circuit_breaker', opt_circuit_breaker)
+        connection_options.process_connection_options()
+
+        opts = connection_options.get_hvac_connection_options()
+
+        assert opts['url'] == 'https://vault-1:8200'
+
+        http_adapter = opts['session'].get_adapter('https://vault-1:8200')
+        assert isinstance(http_adapter, HashiVaultHAAdapter)
+        assert http_adapter.router.nodes == ['https://vault-1:8200', 'https://vault-2:8200']
+        assert isinstance(http_adapter.adapter, HashiVaultCircuitBreakerAdapter) is (opt_circuit_breaker is not None)
+
+    def test_get_hvac_connection_options_single_node(self, connection_options, adapter):
+        adapter.set_option('url', 'https://vault:8200')
+        connection_options.process_connection_options()
+
+        opts = connection_options.get_hvac_connection_options()
+
+        assert opts['url'] == 'https://vault:8200'
+        assert 'session' not in opts
+
+    # unix socket url
+
+    @pytest.mark.parametrize('opt_circuit_breaker,expected_type', [
+        (None, HashiVaultUnixSocketAdapter),
+        (3, HashiVaultUnixSocketCircuitBreakerAdapter),
+    ])
+    def test_get_hvac_connection_options_unix_socket(self, connection_options, adapter, opt_circuit_breaker, expected_type):
+        adapter.set_option('url', 'unix:///run/vault-agent.sock')
+        adapter.set_option('circuit_breaker', opt_circuit_breaker)
+        connection_options.process_connection_options()
+
+        opts = connection_options.get_hvac_connection_options()
+
+        assert opts['url'] == 'http+unix://%2Frun%2Fvault-agent.sock'
+        assert type(opts['session'].get_adapter(opts['url'] + '/v1/sys/health')) is expected_type
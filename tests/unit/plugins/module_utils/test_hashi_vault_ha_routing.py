@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+
+from requests import Request, Response
+from requests.adapters import BaseAdapter
+from requests.exceptions import ConnectionError, ConnectTimeout, ReadTimeout
+
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+from ansible_collections.community.hashi_vault.tests.unit.compat import mock
+
+from ansible_collections.community.hashi_vault.plugins.module_utils._ha_routing import (
+    HashiVaultHAAdapter,
+    HashiVaultHARouter,
+)
+
+ACTIVE = 'https://vault-1:8200'
+STANDBY_A = 'https://vault-2:8200'
+STANDBY_B = 'https://vault-3:8200'
+NODES = [ACTIVE, STANDBY_A, STANDBY_B]
+
+ROLES = {
+    ACTIVE: HashiVaultHARouter.ACTIVE,
+    STANDBY_A: HashiVaultHARouter.PERFORMANCE_STANDBY,
+    STANDBY_B: HashiVaultHARouter.PERFORMANCE_STANDBY,
+}
+
+
+@pytest.fixture(autouse=True)
+def clear_roles():
+    HashiVaultHARouter._roles = {}
+    yield
+    HashiVaultHARouter._roles = {}
+
+
+def _response(status=200):
+    response = Response()
+    response.status_code = status
+    response._content = b'{}'
+    response._content_consumed = True
+    return response
+
+
+class _RecordingAdapter(BaseAdapter):
+    '''an adapter that records the URLs of requests, and responds to each with the result given for its node'''
+
+    def __init__(self, results=None):
+        super(_RecordingAdapter, self).__init__()
+        self.urls = []
+        self.results = results or {}
+
+    def send(self, request, **kwargs):
+        self.urls.append(request.url)
+        result = self.results.get(request.url.split('/v1/')[0], 200)
+        if isinstance(result, Exception):
+            raise result
+        return _response(result)
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def inner():
+    return _RecordingAdapter()
+
+
+@pytest.fixture
+def adapter(inner):
+    adapter = HashiVaultHAAdapter(NODES, inner)
+    with mock.patch.object(adapter, 'get_health', side_effect=lambda node, **kwargs: ROLES[node]):
+        yield adapter
+
+
+def _send(adapter, method='GET', path='/v1/secret/data/one'):
+    return adapter.send(Request(method, ACTIVE + path).prepare())
+
+
+def _connect_error():
+    return ConnectionError(MaxRetryError(None, '/', NewConnectionError(None, 'refused')))
+
+
+class TestHashiVaultHARouter(object):
+
+    @pytest.mark.parametrize('url,expected', [
+        (None, []),
+        ('https://vault:8200', ['https://vault:8200']),
+        ('https://vault-1:8200/, https://vault-2:8200,', ['https://vault-1:8200', 'https://vault-2:8200']),
+    ])
+    def test_parse_urls(self, url, expected):
+        assert HashiVaultHARouter.parse_urls(url) == expected
+
+    def test_get_stale(self):
+        router = HashiVaultHARouter(NODES)
+
+        with mock.patch.object(HashiVaultHARouter, '_clock', return_value=100.0):
+            assert router.get_stale() == NODES
+            router.set_role(ACTIVE, HashiVaultHARouter.ACTIVE)
+            assert router.get_stale() == [STANDBY_A, STANDBY_B]
+
+        with mock.patch.object(HashiVaultHARouter, '_clock', return_value=100.0 + HashiVaultHARouter.HEALTH_TTL):
+            assert router.get_stale() == NODES
+
+    @pytest.mark.parametrize('method', ['GET', 'LIST', 'HEAD'])
+    def test_get_candidates_read(self, method):
+        router = HashiVaultHARouter(NODES)
+        for node, role in ROLES.items():
+            router.set_role(node, role)
+
+        candidates = router.get_candidates(method)
+
+        assert sorted(candidates[:2]) == [STANDBY_A, STANDBY_B]
+        assert candidates[2] == ACTIVE
+
+    @pytest.mark.parametrize('method', ['POST', 'PUT', 'DELETE', 'PATCH'])
+    def test_get_candidates_write(self, method):
+        router = HashiVaultHARouter(NODES)
+        for node, role in ROLES.items():
+            router.set_role(node, role)
+
+        candidates = router.get_candidates(method)
+
+        assert candidates[0] == ACTIVE
+        assert sorted(candidates[1:]) == [STANDBY_A, STANDBY_B]
+
+    def test_get_candidates_order(self):
+        router = HashiVaultHARouter(['a', 'b', 'c', 'd', 'e'])
+        router.set_role('a', HashiVaultHARouter.UNAVAILABLE)
+        router.set_role('b', HashiVaultHARouter.STANDBY)
+        router.set_role('d', HashiVaultHARouter.ACTIVE)
+
+        assert router.get_candidates('GET') == ['d', 'c', 'e', 'b', 'a']
+
+    def test_roles_reset_in_child(self):
+        router = HashiVaultHARouter(NODES)
+        router.set_role(ACTIVE, HashiVaultHARouter.ACTIVE)
+
+        with mock.patch('os.getpid', return_value=-1):
+            assert router.get_role(ACTIVE) is None
+
+
+class TestHashiVaultHAAdapter(object):
+
+    @pytest.mark.parametrize('status,expected', [
+        (200, HashiVaultHARouter.ACTIVE),
+        (429, HashiVaultHARouter.STANDBY),
+        (473, HashiVaultHARouter.PERFORMANCE_STANDBY),
+        (472, HashiVaultHARouter.UNAVAILABLE),
+        (501, HashiVaultHARouter.UNAVAILABLE),
+        (503, HashiVaultHARouter.UNAVAILABLE),
+    ])
+    def test_get_health(self, inner, status, expected):
+        adapter = HashiVaultHAAdapter(NODES, inner)
+        health = _RecordingAdapter({ACTIVE: status})
+        adapter._health_adapter = health
+
+        assert adapter.get_health(ACTIVE, verify=False) == expected
+        assert health.urls == [ACTIVE + '/v1/sys/health']
+        assert inner.urls == []
+
+    def test_get_health_unreachable(self, inner):
+        adapter = HashiVaultHAAdapter(NODES, inner)
+        adapter._health_adapter = _RecordingAdapter({ACTIVE: ConnectTimeout('timed out')})
+
+        assert adapter.get_health(ACTIVE) == HashiVaultHARouter.UNAVAILABLE
+
+    def test_refresh_only_stale(self, adapter):
+        adapter.router.set_role(ACTIVE, HashiVaultHARouter.ACTIVE)
+        adapter.refresh()
+
+        assert sorted(c[0][0] for c in adapter.get_health.call_args_list) == [STANDBY_A, STANDBY_B]
+        assert adapter.router.get_stale() == []
+
+        adapter.refresh()
+        assert adapter.get_health.call_count == 2
+
+    def test_read_goes_to_standby(self, adapter, inner):
+        _send(adapter, path='/v1/secret/data/one?version=2')
+
+        assert len(inner.urls) == 1
+        assert inner.urls[0] in (STANDBY_A + '/v1/secret/data/one?version=2', STANDBY_B + '/v1/secret/data/one?version=2')
+
+    def test_write_goes_to_active(self, adapter, inner):
+        _send(adapter, method='POST')
+
+        assert inner.urls == [ACTIVE + '/v1/secret/data/one']
+
+    def test_other_url_not_routed(self, adapter, inner):
+        adapter.send(Request('GET', 'https://elsewhere/v1/secret/data/one').prepare())
+
+        assert inner.urls == ['https://elsewhere/v1/secret/data/one']
+        adapter.get_health.assert_not_called()
+
+    @pytest.mark.parametrize('error', [_connect_error(), ReadTimeout('timed out')])
+    def test_read_fails_over(self, adapter, inner, error):
+        inner.results = {STANDBY_A: error, STANDBY_B: error}
+
+        response = _send(adapter)
+
+        assert response.status_code == 200
+        assert inner.urls[-1] == ACTIVE + '/v1/secret/data/one'
+        assert adapter.router.get_role(STANDBY_A) == HashiVaultHARouter.UNAVAILABLE
+        assert adapter.router.get_role(STANDBY_B) == HashiVaultHARouter.UNAVAILABLE
+
+    def test_write_fails_over_when_unsent(self, adapter, inner):
+        inner.results = {ACTIVE: _connect_error()}
+
+        response = _send(adapter, method='POST')
+
+        assert response.status_code == 200
+        assert len(inner.urls) == 2
+
+    def test_write_not_resent(self, adapter, inner):
+        inner.results = {ACTIVE: ReadTimeout('timed out')}
+
+        with pytest.raises(ReadTimeout):
+            _send(adapter, method='POST')
+
+        assert inner.urls == [ACTIVE + '/v1/secret/data/one']
+
+    def test_sealed_fails_over(self, adapter, inner):
+        inner.results = {ACTIVE: 503}
+
+        response = _send(adapter, method='POST')
+
+        assert response.status_code == 200
+        assert len(inner.urls) == 2
+        assert adapter.router.get_role(ACTIVE) == HashiVaultHARouter.UNAVAILABLE
+
+    def test_last_node_error_returned(self, adapter, inner):
+        inner.results = dict((node, 503) for node in NODES)
+
+        assert _send(adapter).status_code == 503
+        assert len(inner.urls) == 3
+
+    def test_last_node_exception_raised(self, adapter, inner):
+        inner.results = dict((node, _connect_error()) for node in NODES)
+
+        with pytest.raises(ConnectionError):
+            _send(adapter)
+
+        assert len(inner.urls) == 3
@@ -15,7 +15,12 @@ from .....tests.unit.compat import mock
 from .....plugins.module_utils._hashi_vault_common import (
     HashiVaultHVACError,
     HashiVaultHelper,
+    HashiVaultSessionPool,
 )
+from .....plugins.module_utils._json_adapter import HashiVaultJSONAdapter
+from .....plugins.module_utils._ha_routing import HashiVaultHAAdapter
+from .....plugins.module_utils._ssl_context import HashiVaultHTTPAdapter
+from .....plugins.module_utils._unix_socket import HashiVaultUnixSocketAdapter
 
 
 @pytest.fixture
@@ -73,14 +78,26 @@ class TestHashiVaultHelper(object):
         assert hasattr(hvac_error, 'error')
         assert hasattr(hvac_error, 'msg')
 
+    def test_hashi_vault_helper_fails_when_hvac_not_installed(self):
+        with mock.patch.dict(sys.modules):
+            sys.modules.pop('hvac')
+            with mock.patch('ansible_collections.community.hashi_vault.plugins.module_utils._hashi_vault_common.find_spec', return_value=None):
+                with pytest.raises(HashiVaultHVACError) as hvac_import:
+                    HashiVaultHelper()
+
+        assert hvac_import.value.error == "No module named 'hvac'"
+
     def test_hashi_vault_helper_fails_when_hvac_not_available(self, hvac_fail_import_hook):
+        helper = HashiVaultHelper()
+
         with pytest.raises(HashiVaultHVACError) as hvac_import:
-            HashiVaultHelper()
+            helper.get_hvac()
         assert hvac_import.value.error == "test case module import failure"
 
     def test_hashi_vault_helper_uses_loaded_hvac(self, hvac_success_import_hook):
         client = HashiVaultHelper()
         assert hasattr(client, 'hvac')
+        assert client.get_hvac() is sys.modules['hvac']
 
     def test_get_vault_client_without_logout_explicit_token(self, hashi_vault_helper, vault_token):
         client = hashi_vault_helper.get_vault_client(token=vault_token)
@@ -96,3 +113,141 @@ class TestHashiVaultHelper(object):
         client = hashi_vault_helper.get_vault_client(hashi_vault_logout_inferred_token=True)
 
         assert client.token is None
+
+    def test_get_vault_client_reuses_pooled_session(self, hashi_vault_helper, vault_token):
+        client1 = hashi_vault_helper.get_vault_client(url='http://vault:8200', verify=False, token=vault_token)
+        client2 = hashi_vault_helper.get_vault_client(url='http://vault:8200', verify=False, token='other')
+
+        assert client1 is not client2
+        assert client1.session is client2.session
+        assert client1.token == vault_token
+        assert client2.token == 'other'
+
+    @pytest.mark.parametrize('other', [
+        dict(url='http://other:8200'),
+        dict(verify=True),
+        dict(verify='/tmp/fake'),
+        dict(proxies={'https': 'http://proxy'}),
+    ])
+    def test_get_vault_client_separates_pooled_sessions(self, hashi_vault_helper, vault_token, other):
+        base = dict(url='http://vault:8200', verify=False, token=vault_token)
+        client1 = hashi_vault_helper.get_vault_client(**base)
+
+        base.update(other)
+        client2 = hashi_vault_helper.get_vault_client(**base)
+
+        assert client1.session is not client2.session
+
+    @pytest.mark.parametrize('verify', [False, True, '/tmp/fake'])
+    def test_get_vault_client_pooled_session_keeps_verify(self, hashi_vault_helper, vault_token, verify):
+        client = hashi_vault_helper.get_vault_client(url='http://vault:8200', verify=verify, token=vault_token)
+
+        assert client.session.verify == verify
+        assert client.adapter._kwargs['verify'] == verify
+
+    def test_get_vault_client_adapter(self, hashi_vault_helper, vault_token):
+        client = hashi_vault_helper.get_vault_client(url='http://vault:8200', token=vault_token)
+
+        assert isinstance(client.adapter, HashiVaultJSONAdapter)
+
+    def test_get_vault_client_response_hooks(self, hashi_vault_helper, vault_token):
+        hook = mock.Mock()
+        hashi_vault_helper.response_hooks.append(hook)
+
+        client = hashi_vault_helper.get_vault_client(url='http://vault:8200', token=vault_token)
+
+        assert client.adapter.response_hooks == [hook]
+
+    def test_get_vault_client_explicit_adapter(self, hashi_vault_helper, vault_token):
+        from hvac.adapters import RawAdapter
+
+        client = hashi_vault_helper.get_vault_client(url='http://vault:8200', token=vault_token, adapter=RawAdapter)
+
+        assert type(client.adapter) is RawAdapter
+
+    def test_get_vault_client_explicit_session_not_pooled(self, hashi_vault_helper, vault_token):
+        session = mock.MagicMock()
+        session.verify = False
+
+        client = hashi_vault_helper.get_vault_client(url='http://vault:8200', verify=False, token=vault_token, session=session)
+
+        assert client.session is session
+        assert hashi_vault_helper.get_pooled_session(url='http://vault:8200', verify=False) is not session
+
+    def test_session_pool_new_process(self):
+        factory = mock.Mock(side_effect=lambda: mock.MagicMock())
+
+        session1 = HashiVaultSessionPool.get_session('key', factory)
+        assert HashiVaultSessionPool.get_session('key', factory) is session1
+
+        with mock.patch.object(os, 'getpid', return_value=-1):
+            session2 = HashiVaultSessionPool.get_session('key', factory)
+
+        assert session2 is not session1
+        assert factory.call_count == 2
+        session1.close.assert_not_called()
+
+    def test_session_pool_grow_keeps_connections(self):
+        from requests import Session
+
+        session = Session()
+        adapter = session.get_adapter('http://vault:8200')
+        pool = adapter.poolmanager.connection_from_url('http://vault:8200')
+        connection = pool._get_conn()
+        pool._put_conn(connection)
+
+        HashiVaultSessionPool.ensure_pool_maxsize(session, 16)
+
+        assert adapter._pool_maxsize == 16
+        assert adapter.poolmanager.connection_from_url('http://vault:8200') is pool
+        assert pool.pool.maxsize == pool.pool.qsize() == 16
+        assert connection in pool.pool.queue
+
+        # new pools get the new size too
+        assert adapter.poolmanager.connection_from_url('http://other:8200').pool.maxsize == 16
+
+        # it never shrinks
+        HashiVaultSessionPool.ensure_pool_maxsize(session, 4)
+        assert pool.pool.maxsize == 16
+
+    def test_session_pool_grow_ha_adapter(self):
+        from requests import Session
+
+        inner = HashiVaultHTTPAdapter()
+        adapter = HashiVaultHAAdapter(['http://vault1:8200', 'http://vault2:8200'], inner)
+        session = Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+
+        pool = inner.poolmanager.connection_from_url('http://vault1:8200')
+        connection = pool._get_conn()
+        pool._put_conn(connection)
+
+        HashiVaultSessionPool.ensure_pool_maxsize(session, 30)
+
+        assert inner._pool_maxsize == 30
+        assert inner.poolmanager.connection_from_url('http://vault1:8200') is pool
+        assert pool.pool.maxsize == 30
+        assert connection in pool.pool.queue
+
+    def test_session_pool_grow_unix_socket_adapter(self):
+        from requests import Session
+
+        adapter = HashiVaultUnixSocketAdapter()
+        session = Session()
+        session.mount(HashiVaultUnixSocketAdapter.SCHEME + '://', adapter)
+
+        url = HashiVaultUnixSocketAdapter.from_unix_url('unix:///run/vault-agent.sock') + '/v1/secret/data/one'
+        pool = adapter.get_connection(url)
+        connection = pool._get_conn()
+        pool._put_conn(connection)
+
+        HashiVaultSessionPool.ensure_pool_maxsize(session, 30)
+
+        assert adapter._pool_maxsize == 30
+        assert adapter.get_pools() == [pool]
+        assert pool.pool.maxsize == pool.pool.qsize() == 30
+        assert connection in pool.pool.queue
+
+        # new sockets get the new size too
+        assert adapter.get_connection(HashiVaultUnixSocketAdapter.from_unix_url('unix:///run/other.sock')).pool.maxsize == 30
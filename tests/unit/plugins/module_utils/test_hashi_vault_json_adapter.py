@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+
+from hvac import exceptions as hvac_exceptions
+from requests.models import Response
+
+from ansible_collections.community.hashi_vault.tests.unit.compat import mock
+
+from ansible_collections.community.hashi_vault.plugins.module_utils._json_adapter import HashiVaultJSONAdapter
+
+
+def _response(status_code, content=b'', content_type='application/json'):
+    response = Response()
+    response.status_code = status_code
+    response._content = content
+    response.headers['Content-Type'] = content_type
+    response.url = 'http://vault:8200/v1/secret/one'
+    return response
+
+
+@pytest.fixture
+def session():
+    session = mock.MagicMock()
+    session.verify = False
+    session.cert = session.proxies = None
+    return session
+
+
+@pytest.fixture
+def adapter(session):
+    return HashiVaultJSONAdapter(base_uri='http://vault:8200', token='s.token', session=session)
+
+
+class TestHashiVaultJSONAdapter(object):
+
+    @pytest.mark.parametrize('content', [b'{"data": {"a": 1}}', '{"data": {"a": 1}}'.encode('utf-16')])
+    def test_json(self, adapter, session, content):
+        session.request.return_value = _response(200, content)
+
+        assert adapter.get('/v1/secret/one') == {'data': {'a': 1}}
+
+    def test_no_content(self, adapter, session):
+        session.request.return_value = _response(204)
+
+        assert adapter.post('/v1/secret/one', json={'a': 1}) == {}
+
+    @pytest.mark.parametrize('status_code', [200, 202])
+    def test_unparsable(self, adapter, session, status_code):
+        response = session.request.return_value = _response(status_code, b'not json', 'text/plain')
+
+        assert adapter.get('/v1/secret/one') is response
+
+    def test_error(self, adapter, session):
+        session.request.return_value = _response(404, b'{"errors": []}')
+
+        with pytest.raises(hvac_exceptions.InvalidPath):
+            adapter.post('/v1/secret/one')
+
+    def test_wide_integers(self):
+        assert HashiVaultJSONAdapter.loads(b'{"a": 123456789012345678901234567890}') == {'a': 123456789012345678901234567890}
+
+    def test_request_hooks(self, adapter, session):
+        hook = mock.Mock(return_value={'cached': True})
+        adapter.request_hooks.append(hook)
+
+        assert adapter.get('/v1/secret/one', params={'version': 2}) == {'cached': True}
+
+        hook.assert_called_once_with('get', '/v1/secret/one', {'params': {'version': 2}})
+        session.request.assert_not_called()
+
+    def test_request_hooks_none(self, adapter, session):
+        adapter.request_hooks.append(mock.Mock(return_value=None))
+        session.request.return_value = _response(200, b'{}')
+
+        assert adapter.get('/v1/secret/one') == {}
+        session.request.assert_called_once()
+
+    def test_response_hooks(self, adapter, session):
+        existing = mock.Mock()
+        hook = mock.Mock()
+        adapter.response_hooks.append(hook)
+        session.request.return_value = _response(200, b'{}')
+
+        adapter.get('/v1/secret/one', hooks={'response': [existing]})
+
+        assert session.request.call_args[1]['hooks'] == {'response': [existing, hook]}
+
+    def test_no_response_hooks(self, adapter, session):
+        session.request.return_value = _response(200, b'{}')
+
+        adapter.get('/v1/secret/one')
+
+        assert 'hooks' not in session.request.call_args[1]
+
+    @pytest.mark.parametrize('response,expected', [
+        (None, ({}, False)),
+        ({'data': {}}, ({'data': {}}, False)),
+        ({}, ({}, False)),
+        (_response(204), ({}, False)),
+        (_response(200, b'not json'), (b'not json', True)),
+    ])
+    def test_get_data(self, response, expected):
+        assert HashiVaultJSONAdapter.get_data(response) == expected
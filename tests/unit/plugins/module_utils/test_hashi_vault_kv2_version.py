@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+
+from datetime import datetime, timezone
+
+from .....plugins.module_utils._kv2_version import HashiVaultKv2Version
+
+hvac = pytest.importorskip('hvac')
+
+
+@pytest.fixture
+def client(vault_stand_in):
+    vault_stand_in.enable_kv('kv')
+    vault_stand_in.put_secret('kv', 'app/certs', {'cert': 'x' * 10000, 'key': 'y' * 10000})
+    vault_stand_in.put_secret('kv', 'app/certs', {'cert': 'z' * 10000, 'key': 'y' * 10000})
+
+    return hvac.Client(url=vault_stand_in.url, token='root')
+
+
+@pytest.mark.parametrize('method', HashiVaultKv2Version.METHODS)
+class TestHashiVaultKv2Version(object):
+
+    def test_read_current(self, vault_stand_in, client, method):
+        metadata = HashiVaultKv2Version.read_current(client, 'app/certs', 'kv', method)
+
+        assert metadata['version'] == 2
+        assert metadata['deletion_time'] == ''
+        assert metadata['destroyed'] is False
+        assert 'custom_metadata' in metadata
+
+        # neither method reads the secret's data
+        assert ('GET', '/v1/kv/data/app/certs') not in vault_stand_in.requests
+
+    def test_is_current(self, client, method):
+        assert HashiVaultKv2Version.is_current(client, 'app/certs', 'kv', 2, method)
+        assert not HashiVaultKv2Version.is_current(client, 'app/certs', 'kv', 1, method)
+
+    def test_missing(self, client, method):
+        assert HashiVaultKv2Version.read_current(client, 'app/nope', 'kv', method) is None
+        assert not HashiVaultKv2Version.is_current(client, 'app/nope', 'kv', 1, method)
+
+    @pytest.mark.parametrize('change', ['delete', 'destroy'])
+    def test_deleted(self, client, method, change):
+        if change == 'delete':
+            client.secrets.kv.v2.delete_latest_version_of_secret(path='app/certs', mount_point='kv')
+        else:
+            client.secrets.kv.v2.destroy_secret_versions(path='app/certs', versions=[2], mount_point='kv')
+
+        assert HashiVaultKv2Version.read_current(client, 'app/certs', 'kv', method) is None
+        assert not HashiVaultKv2Version.is_current(client, 'app/certs', 'kv', 2, method)
+
+    def test_delete_version_after(self, vault_stand_in, method):
+        # every version written to a mount with delete_version_after gets a deletion_time in the future
+        vault_stand_in.enable_kv('expiring', delete_version_after=3600)
+        vault_stand_in.put_secret('expiring', 'app/token', {'token': 'x'})
+        client = hvac.Client(url=vault_stand_in.url, token='root')
+
+        metadata = HashiVaultKv2Version.read_current(client, 'app/token', 'expiring', method)
+
+        assert metadata['version'] == 1
+        assert metadata['deletion_time'] != ''
+        assert HashiVaultKv2Version.is_current(client, 'app/token', 'expiring', 1, method)
+
+        client.secrets.kv.v2.delete_latest_version_of_secret(path='app/token', mount_point='expiring')
+
+        assert HashiVaultKv2Version.read_current(client, 'app/token', 'expiring', method) is None
+
+    def test_forbidden(self, vault_stand_in, client, method):
+        vault_stand_in.fail(403)
+
+        with pytest.raises(hvac.exceptions.Forbidden):
+            HashiVaultKv2Version.read_current(client, 'app/certs', 'kv', method)
+
+
+@pytest.mark.parametrize('metadata,deleted', [
+    (dict(deletion_time='', destroyed=False), False),
+    (dict(deletion_time='2026-01-01T00:00:00.123456789Z', destroyed=False), True),
+    (dict(deletion_time='2026-06-01T12:00:00+02:00', destroyed=False), True),
+    (dict(deletion_time='2026-06-01T12:00:01Z', destroyed=False), False),
+    (dict(deletion_time='2999-01-01T00:00:00.5Z', destroyed=False), False),
+    (dict(deletion_time='2999-01-01T00:00:00Z', destroyed=True), True),
+    (dict(deletion_time='', destroyed=True), True),
+    (dict(deletion_time='not a time', destroyed=False), True),
+])
+def test_is_deleted(metadata, deleted):
+    now = datetime(2026, 6, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+    assert HashiVaultKv2Version.is_deleted(metadata, now) is deleted
+
+
+def test_parse_time():
+    expected = datetime(2018, 3, 22, 2, 36, 43, 986212, tzinfo=timezone.utc)
+
+    assert HashiVaultKv2Version.parse_time('2018-03-22T02:36:43.986212308Z') == expected
+
+
+def test_invalid_method():
+    with pytest.raises(ValueError, match=r"^method must be one of metadata, subkeys, got: 'data'$"):
+        HashiVaultKv2Version.read_current(None, 'app/certs', 'kv', 'data')
@@ -117,3 +117,58 @@ class TestHashiVaultModule:
 
         # Ensure extra parameters are included in the argument spec
         assert 'extra_param' in argspec
+
+    @pytest.mark.parametrize('stats', [True, False])
+    def test_stats(self, generate_argspec, stats):
+        with set_module_args({'stats': stats}):
+            module = HashiVaultModule(argument_spec=generate_argspec)
+
+        if stats:
+            assert module.request_stats.response_hook in module.helper.response_hooks
+            module.request_stats.record('GET', 'http://vault:8200/v1/secret/data/one', 200, 0.1)
+        else:
+            assert module.request_stats is None
+            assert module.helper.response_hooks == []
+
+        with mock.patch('ansible.module_utils.basic.AnsibleModule.exit_json') as exit_json:
+            module.exit_json(changed=False)
+
+        result = exit_json.call_args[1]
+
+        if stats:
+            assert [r['path'] for r in result['_vault_stats']] == ['secret/data/*']
+        else:
+            assert '_vault_stats' not in result
+
+    @pytest.mark.parametrize('trace_file', [None, 'traces.jsonl'])
+    @pytest.mark.parametrize('fail', [False, True])
+    def test_trace_file(self, generate_argspec, tmp_path, trace_file, fail):
+        path = None if trace_file is None else str(tmp_path / trace_file)
+
+        with set_module_args({'trace_file': path}):
+            module = HashiVaultModule(argument_spec=generate_argspec)
+
+        if path is None:
+            assert module.tracer is None
+            assert module.helper.request_hooks == []
+        else:
+            assert module.tracer.started
+            assert module.tracer.response_hook in module.helper.response_hooks
+            assert module.authenticator.tracer is module.tracer
+            module.tracer.record_request('GET', 'http://vault:8200/v1/secret/data/one', 200, 1, 2)
+
+        with mock.patch('ansible.module_utils.basic.AnsibleModule.exit_json'):
+            with mock.patch('ansible.module_utils.basic.AnsibleModule.fail_json'):
+                if fail:
+                    module.fail_json(msg='permission denied')
+                else:
+                    module.exit_json(changed=False)
+
+        if path is None:
+            assert list(tmp_path.iterdir()) == []
+        else:
+            with open(path) as f:
+                spans = [json.loads(line) for line in f][0]['resourceSpans'][0]['scopeSpans'][0]['spans']
+
+            assert [span['name'] for span in spans[1:]] == ['GET secret/data/*']
+            assert spans[0]['status'] == ({'code': 2, 'message': 'permission denied'} if fail else {})
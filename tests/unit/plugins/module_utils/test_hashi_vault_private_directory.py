@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import os
+import stat
+
+import pytest
+
+from .....plugins.module_utils._private_directory import get_private_directory
+from .....tests.unit.compat import mock
+
+
+@pytest.fixture
+def tempdir(tmp_path):
+    with mock.patch('tempfile.gettempdir', return_value=str(tmp_path)):
+        yield tmp_path
+
+
+def test_get_private_directory(tempdir):
+    directory = get_private_directory()
+
+    assert directory == str(tempdir / ('ansible-hashi-vault-%i' % os.getuid()))
+    assert stat.S_IMODE(os.stat(directory).st_mode) == 0o700
+
+    # an existing directory is reused
+    assert get_private_directory() == directory
+
+
+def test_get_private_directory_insecure(tempdir):
+    directory = tempdir / ('ansible-hashi-vault-%i' % os.getuid())
+    directory.mkdir()
+    directory.chmod(0o755)
+
+    with pytest.raises(OSError, match='only accessible'):
+        get_private_directory()
+
+
+def test_get_private_directory_symlink(tempdir):
+    target = tempdir / 'elsewhere'
+    target.mkdir(mode=0o700)
+    (tempdir / ('ansible-hashi-vault-%i' % os.getuid())).symlink_to(target)
+
+    with pytest.raises(OSError, match='only accessible'):
+        get_private_directory()
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.community.hashi_vault.plugins.module_utils._read_cache import HashiVaultReadCache
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def read_cache(clock):
+    return HashiVaultReadCache(max_entries=3, max_bytes=1000, clock=clock)
+
+
+class TestHashiVaultReadCache(object):
+
+    def test_get_instance_is_shared(self):
+        assert HashiVaultReadCache.get_instance() is HashiVaultReadCache.get_instance()
+
+    def test_make_key_hides_token(self):
+        key = HashiVaultReadCache.make_key('http://vault', None, 's.supersecret', 'read', 'secret/one')
+
+        assert 's.supersecret' not in key
+        assert key != HashiVaultReadCache.make_key('http://vault', None, 's.other', 'read', 'secret/one')
+
+    @pytest.mark.parametrize('args', [
+        ('http://other', None, 'token', 'read', 'secret/one', None),
+        ('http://vault', 'ns1', 'token', 'read', 'secret/one', None),
+        ('http://vault', None, 'token', 'list', 'secret/one', None),
+        ('http://vault', None, 'token', 'read', 'secret/two', None),
+        ('http://vault', None, 'token', 'read', 'secret/one', 2),
+    ])
+    def test_make_key_distinct(self, args):
+        assert HashiVaultReadCache.make_key('http://vault', None, 'token', 'read', 'secret/one', None) != HashiVaultReadCache.make_key(*args)
+
+    @pytest.mark.parametrize('response,ttl,expected', [
+        ({'lease_duration': 0}, 60, 60),
+        ({'lease_duration': 30}, 60, 30),
+        ({'lease_duration': 2764800}, 60, 60),
+        ({'lease_duration': 30}, None, 30),
+        ({}, 60, 60),
+        ({'lease_duration': None}, 60, 60),
+    ])
+    def test_get_ttl(self, response, ttl, expected):
+        assert HashiVaultReadCache.get_ttl(response, ttl) == expected
+
+    def test_get_missing(self, read_cache):
+        assert read_cache.get('missing') is None
+
+    def test_get_returns_copy(self, read_cache):
+        value = {'data': {'a': 1}}
+        read_cache.set('key', value, ttl=10)
+
+        cached = read_cache.get('key')
+        cached['data']['a'] = 2
+
+        assert read_cache.get('key') == {'data': {'a': 1}}
+
+    def test_expiry(self, read_cache, clock):
+        read_cache.set('key', {'a': 1}, ttl=10)
+
+        clock.now += 9
+        assert read_cache.get('key') == {'a': 1}
+
+        clock.now += 1
+        assert read_cache.get('key') is None
+        assert len(read_cache) == 0
+        assert read_cache.size == 0
+
+    @pytest.mark.parametrize('ttl', [None, 0, -1])
+    def test_no_ttl_not_cached(self, read_cache, ttl):
+        read_cache.set('key', {'a': 1}, ttl=ttl)
+
+        assert read_cache.get('key') is None
+
+    def test_unserializable_not_cached(self, read_cache):
+        read_cache.set('key', {'a': object()}, ttl=10)
+
+        assert read_cache.get('key') is None
+
+    def test_evicts_least_recently_used_by_count(self, read_cache):
+        for key in ('one', 'two', 'three'):
+            read_cache.set(key, {'key': key}, ttl=10)
+
+        read_cache.get('one')
+        read_cache.set('four', {'key': 'four'}, ttl=10)
+
+        assert len(read_cache) == 3
+        assert read_cache.get('two') is None
+        assert read_cache.get('one') is not None
+        assert read_cache.get('three') is not None
+        assert read_cache.get('four') is not None
+
+    def test_evicts_by_bytes(self, read_cache):
+        big = {'value': 'x' * 400}
+
+        read_cache.set('one', big, ttl=10)
+        read_cache.set('two', big, ttl=10)
+        read_cache.set('three', big, ttl=10)
+
+        assert read_cache.size <= 1000
+        assert read_cache.get('one') is None
+        assert read_cache.get('two') is not None
+        assert read_cache.get('three') is not None
+
+    def test_too_big_not_cached(self, read_cache):
+        read_cache.set('key', {'value': 'x' * 1000}, ttl=10)
+
+        assert read_cache.get('key') is None
+        assert read_cache.size == 0
+
+    def test_replace_entry(self, read_cache):
+        read_cache.set('key', {'value': 'x' * 100}, ttl=10)
+        read_cache.set('key', {'value': 'y'}, ttl=10)
+
+        assert len(read_cache) == 1
+        assert read_cache.get('key') == {'value': 'y'}
+        assert read_cache.size == len(b'{"value": "y"}')
+
+    def test_configure_evicts(self, read_cache):
+        for key in ('one', 'two', 'three'):
+            read_cache.set(key, {'key': key}, ttl=10)
+
+        read_cache.configure(max_entries=1)
+
+        assert len(read_cache) == 1
+        assert read_cache.get('three') is not None
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import datetime
+import json
+import os
+import stat
+
+import pytest
+
+from requests import Request
+from requests.models import Response
+
+from ansible_collections.community.hashi_vault.tests.unit.compat import mock
+
+from ansible_collections.community.hashi_vault.plugins.module_utils._request_stats import HashiVaultRequestStats
+
+
+def _response(method='GET', url='http://vault:8200/v1/secret/data/one', status_code=200, content=b'{}', elapsed=0.25, retries=None):
+    response = Response()
+    response.request = Request(method, url).prepare()
+    response.status_code = status_code
+    response._content = content
+    response.elapsed = datetime.timedelta(seconds=elapsed)
+    response.raw = mock.Mock(retries=retries)
+    return response
+
+
+class TestHashiVaultRequestStats(object):
+
+    @pytest.mark.parametrize('url,expected', [
+        ('http://vault:8200/v1/secret/data/app', 'secret/data/*'),
+        ('http://vault:8200/v1/secret/data/team/app/db?version=2', 'secret/data/*'),
+        ('http://vault:8200/v1/secret/metadata/app/', 'secret/metadata/*'),
+        ('http://vault:8200/v1/kv/app', 'kv/*'),
+        ('http://vault:8200/v1/auth/approle/login', 'auth/approle/login'),
+        ('http://vault:8200/v1/auth/userpass/login/someone', 'auth/userpass/login/*'),
+        ('http://vault:8200/v1/auth/token/lookup-self', 'auth/token/lookup-self'),
+        ('http://vault:8200/v1/database/creds/readonly', 'database/creds/*'),
+        ('http://vault:8200/v1/sys/policy/admins', 'sys/policy/*'),
+        ('http://vault:8200/v1/sys/health', 'sys/health'),
+        ('http+unix://%2Frun%2Fvault-agent.sock/v1/secret/data/app', 'secret/data/*'),
+    ])
+    def test_get_path_template(self, url, expected):
+        assert HashiVaultRequestStats.get_path_template(url) == expected
+
+    def test_record(self):
+        on_record = mock.Mock()
+        stats = HashiVaultRequestStats(on_record=on_record)
+
+        with mock.patch('time.time', return_value=100.0):
+            record = stats.record('get', 'http://vault:8200/v1/secret/data/app', 200, 0.5, retries=1, size=10)
+
+        assert record == dict(time=99.5, method='GET', path='secret/data/*', status=200, latency=0.5, retries=1, bytes=10)
+        assert stats.get_records() == [record]
+        on_record.assert_called_once_with(record)
+
+    def test_record_cache(self):
+        on_record = mock.Mock()
+        stats = HashiVaultRequestStats(on_record=on_record)
+
+        with mock.patch('time.time', return_value=100.0):
+            hit = stats.record_cache('secret/data/app', hit=True)
+            miss = stats.record_cache('secret/data/app', hit=False)
+
+        assert hit == dict(time=100.0, path='secret/data/*', cache='hit')
+        assert miss['cache'] == 'miss'
+        assert stats.get_records() == [hit, miss]
+        assert on_record.call_count == 2
+
+    def test_disabled(self):
+        enabled = mock.Mock(return_value=None)
+        stats = HashiVaultRequestStats(enabled=enabled)
+
+        assert stats.record('GET', 'http://vault:8200/v1/secret/data/app', 200, 0.5) is None
+        assert stats.record_cache('secret/data/app', hit=True) is None
+        stats.response_hook(_response())
+        assert stats.get_records() == []
+
+        enabled.return_value = '/tmp/stats.jsonl'
+        assert stats.record('GET', 'http://vault:8200/v1/secret/data/app', 200, 0.5) is not None
+        assert len(stats.get_records()) == 1
+
+    def test_pop_records(self):
+        stats = HashiVaultRequestStats()
+        record = stats.record('GET', 'http://vault:8200/v1/secret/data/app', 200, 0.5)
+
+        assert stats.pop_records() == [record]
+        assert stats.get_records() == []
+        assert stats.pop_records() == []
+
+    @pytest.mark.parametrize('path,expected', [
+        ('secret/data/*', 'secret'),
+        ('auth/approle/login', 'auth/approle'),
+        ('sys/health', 'sys'),
+        ('kv', 'kv'),
+        ('', ''),
+    ])
+    def test_get_mount(self, path, expected):
+        assert HashiVaultRequestStats.get_mount(path) == expected
+
+    def test_response_hook(self):
+        stats = HashiVaultRequestStats()
+        retries = mock.Mock(history=(mock.Mock(), mock.Mock()))
+
+        stats.response_hook(_response('POST', status_code=403, content=b'{"errors": []}', elapsed=0.1, retries=retries))
+
+        record = stats.get_records()[0]
+        assert record['method'] == 'POST'
+        assert record['path'] == 'secret/data/*'
+        assert record['status'] == 403
+        assert record['latency'] == 0.1
+        assert record['retries'] == 2
+        assert record['bytes'] == 14
+
+    def test_response_hook_without_retries(self):
+        stats = HashiVaultRequestStats()
+
+        stats.response_hook(_response(content=None))
+
+        assert stats.get_records()[0]['retries'] == 0
+        assert stats.get_records()[0]['bytes'] == 0
+
+    def test_write(self, tmp_path):
+        path = str(tmp_path / 'stats.jsonl')
+
+        HashiVaultRequestStats.write(path, [{'a': 1}])
+        HashiVaultRequestStats.write(path, [{'b': 2}, {'c': 3}])
+        HashiVaultRequestStats.write(path, [])
+
+        with open(path) as f:
+            assert [json.loads(line) for line in f] == [{'a': 1}, {'b': 2}, {'c': 3}]
+
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
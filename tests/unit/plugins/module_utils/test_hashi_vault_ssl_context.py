@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import datetime
+import os
+import ssl
+import threading
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from requests import Request, Session
+from requests.exceptions import SSLError
+from requests.utils import DEFAULT_CA_BUNDLE_PATH
+
+from ansible_collections.community.hashi_vault.tests.unit.compat import mock
+
+from ansible_collections.community.hashi_vault.plugins.module_utils._ssl_context import (
+    HashiVaultHTTPAdapter,
+    HashiVaultSSLContextCache,
+)
+
+
+def _make_cert(common_name, issuer=None, issuer_key=None, is_ca=False):
+    '''returns a (certificate, key) pair, in PEM format, signed by issuer or self-signed'''
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, common_name)])
+    now = datetime.datetime.now(datetime.timezone.utc)
+
+    builder = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(issuer.subject if issuer is not None else name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(x509.BasicConstraints(ca=is_ca, path_length=None), critical=True)
+    )
+    if not is_ca:
+        builder = builder.add_extension(x509.SubjectAlternativeName([x509.DNSName(common_name)]), critical=False)
+
+    cert = builder.sign(issuer_key or key, hashes.SHA256())
+
+    return cert, key, (
+        cert.public_bytes(serialization.Encoding.PEM),
+        key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()),
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    HashiVaultSSLContextCache.clear()
+    yield
+    HashiVaultSSLContextCache.clear()
+
+
+@pytest.fixture
+def pki(tmp_path):
+    '''writes a CA, a server certificate it signed, and an unrelated CA, and returns their paths'''
+    pytest.importorskip('cryptography')
+
+    ca_cert, ca_key, (ca_pem, dummy) = _make_cert('Test CA', is_ca=True)
+    dummy, dummy, (server_pem, server_key_pem) = _make_cert('localhost', issuer=ca_cert, issuer_key=ca_key)
+    dummy, dummy, (other_pem, dummy) = _make_cert('Other CA', is_ca=True)
+
+    paths = {}
+    files = (
+        ('ca', ca_pem),
+        ('server', server_pem),
+        ('server_key', server_key_pem),
+        ('server_combined', server_pem + server_key_pem),
+        ('other_ca', other_pem),
+    )
+    for name, data in files:
+        paths[name] = str(tmp_path / ('%s.pem' % name))
+        with open(paths[name], 'wb') as f:
+            f.write(data)
+
+    return paths
+
+
+@pytest.fixture
+def https_url(pki):
+    class _Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header('Content-Length', '2')
+            self.end_headers()
+            self.wfile.write(b'{}')
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    server.daemon_threads = True
+    server.handle_error = lambda request, client_address: None
+
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(pki['server'], pki['server_key'])
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+
+    thread = threading.Thread(target=server.serve_forever, kwargs=dict(poll_interval=0.01))
+    thread.start()
+
+    yield 'https://localhost:%i' % server.server_address[1]
+
+    server.shutdown()
+    server.server_close()
+    thread.join(5)
+
+
+@pytest.fixture
+def session():
+    session = Session()
+    adapter = HashiVaultHTTPAdapter()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    yield session
+    session.close()
+
+
+class TestHashiVaultSSLContextCache(object):
+
+    def test_same_context(self, pki):
+        context = HashiVaultSSLContextCache.get(pki['ca'])
+
+        assert HashiVaultSSLContextCache.get(pki['ca']) is context
+        assert HashiVaultSSLContextCache.get(pki['other_ca']) is not context
+
+    def test_loads_once(self, pki):
+        with mock.patch.object(ssl.SSLContext, 'load_verify_locations') as load:
+            for i in range(3):
+                HashiVaultSSLContextCache.get(pki['ca'])
+
+        load.assert_called_once_with(cafile=pki['ca'])
+
+    def test_directory(self, tmp_path):
+        with mock.patch.object(ssl.SSLContext, 'load_verify_locations') as load:
+            HashiVaultSSLContextCache.get(str(tmp_path))
+
+        load.assert_called_once_with(capath=str(tmp_path))
+
+    @pytest.mark.parametrize('cert', ['server_combined', ('server', 'server_key')])
+    def test_client_cert(self, pki, cert):
+        cert = pki[cert] if isinstance(cert, str) else tuple(pki[c] for c in cert)
+
+        context = HashiVaultSSLContextCache.get(pki['ca'], cert)
+
+        assert context is not HashiVaultSSLContextCache.get(pki['ca'])
+        assert context is HashiVaultSSLContextCache.get(pki['ca'], cert)
+
+    def test_changed_bundle(self, pki):
+        context = HashiVaultSSLContextCache.get(pki['ca'])
+
+        stat = os.stat(pki['ca'])
+        os.utime(pki['ca'], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+        assert HashiVaultSSLContextCache.get(pki['ca']) is not context
+
+    @pytest.mark.parametrize('ca,cert,match', [
+        ('missing', None, 'CA certificate bundle'),
+        ('ca', 'missing', 'certificate file'),
+        ('ca', ('server', 'missing'), 'key file'),
+    ])
+    def test_missing_files(self, pki, tmp_path, ca, cert, match):
+        def _path(name):
+            return pki.get(name, str(tmp_path / name))
+
+        if cert is not None:
+            cert = _path(cert) if isinstance(cert, str) else tuple(_path(c) for c in cert)
+
+        with pytest.raises(OSError, match=match):
+            HashiVaultSSLContextCache.get(_path(ca), cert)
+
+
+class TestHashiVaultHTTPAdapter(object):
+
+    @pytest.mark.parametrize('verify', [True, 'ca'])
+    def test_pool_kwargs(self, pki, verify):
+        verify = pki[verify] if isinstance(verify, str) else verify
+        adapter = HashiVaultHTTPAdapter()
+        request = Request('GET', 'https://vault:8200/v1/sys/health').prepare()
+
+        host_params, pool_kwargs = adapter.build_connection_pool_key_attributes(request, verify)
+
+        assert pool_kwargs['ssl_context'] is HashiVaultSSLContextCache.get(DEFAULT_CA_BUNDLE_PATH if verify is True else verify)
+        assert pool_kwargs['cert_reqs'] == 'CERT_REQUIRED'
+        assert 'ca_certs' not in pool_kwargs
+        assert 'ca_cert_dir' not in pool_kwargs
+
+    @pytest.mark.parametrize('url,verify', [
+        ('http://vault:8200/v1/sys/health', True),
+        ('https://vault:8200/v1/sys/health', False),
+    ])
+    def test_pool_kwargs_without_context(self, url, verify):
+        adapter = HashiVaultHTTPAdapter()
+        request = Request('GET', url).prepare()
+
+        host_params, pool_kwargs = adapter.build_connection_pool_key_attributes(request, verify)
+
+        assert 'ssl_context' not in pool_kwargs
+
+    def test_request(self, pki, https_url, session):
+        for i in range(3):
+            response = session.get(https_url, verify=pki['ca'], timeout=5, headers={'Connection': 'close'})
+            assert response.status_code == 200
+
+        pool = session.get_adapter(https_url).get_connection_with_tls_context(Request('GET', https_url).prepare(), pki['ca'])
+
+        assert pool.conn_kw['ssl_context'] is HashiVaultSSLContextCache.get(pki['ca'])
+        assert pool.ca_certs is None
+        assert pool.cert_reqs == 'CERT_REQUIRED'
+
+    def test_request_untrusted(self, pki, https_url, session):
+        with pytest.raises(SSLError):
+            session.get(https_url, verify=pki['other_ca'], timeout=5)
+
+    def test_request_without_verify(self, https_url, session):
+        response = session.get(https_url, verify=False, timeout=5)
+
+        assert response.status_code == 200
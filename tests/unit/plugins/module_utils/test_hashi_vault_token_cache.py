@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.community.hashi_vault.tests.unit.compat import mock
+
+from ansible_collections.community.hashi_vault.plugins.module_utils._token_cache import HashiVaultTokenCache
+
+
+def _login(token='s.token', lease_duration=3600, **kwargs):
+    auth = dict(client_token=token, lease_duration=lease_duration)
+    auth.update(kwargs)
+    return {'auth': auth}
+
+
+@pytest.fixture
+def now():
+    with mock.patch.object(HashiVaultTokenCache, '_clock', return_value=1000.0) as clock:
+        yield clock
+
+
+class TestHashiVaultTokenCache(object):
+
+    def test_make_key_hides_options(self):
+        key = HashiVaultTokenCache.make_key('userpass', 'http://vault', None, {'password': 'supersecret'})
+
+        assert 'supersecret' not in key
+
+    @pytest.mark.parametrize('args', [
+        ('ldap', 'http://vault', None, {'username': 'one'}),
+        ('userpass', 'http://other', None, {'username': 'one'}),
+        ('userpass', 'http://vault', 'ns1', {'username': 'one'}),
+        ('userpass', 'http://vault', None, {'username': 'two'}),
+    ])
+    def test_make_key_distinct(self, args):
+        assert HashiVaultTokenCache.make_key('userpass', 'http://vault', None, {'username': 'one'}) != HashiVaultTokenCache.make_key(*args)
+
+    @pytest.mark.parametrize('response,expected', [
+        (_login(lease_duration=3600), 1000 + 3600 - 360),
+        (_login(lease_duration=30), 1000 + 30 - 5),
+        (_login(lease_duration=0), float('inf')),
+        (_login(lease_duration=5), None),
+        (_login(num_uses=3), None),
+        ({'auth': None}, None),
+        ({'data': {}}, None),
+        (None, None),
+    ])
+    def test_get_expiry(self, now, response, expected):
+        assert HashiVaultTokenCache.get_expiry(response) == expected
+
+    def test_set_get(self, now):
+        key = HashiVaultTokenCache.make_key('userpass', 'http://vault', None, {})
+        HashiVaultTokenCache.set(key, _login())
+
+        assert HashiVaultTokenCache.get(key) == _login()
+        assert HashiVaultTokenCache.get('other') is None
+
+    def test_get_returns_copy(self, now):
+        HashiVaultTokenCache.set('key', _login())
+        HashiVaultTokenCache.get('key')['auth']['client_token'] = 'changed'
+
+        assert HashiVaultTokenCache.get('key') == _login()
+
+    def test_set_uncacheable(self, now):
+        HashiVaultTokenCache.set('key', _login(num_uses=1))
+
+        assert HashiVaultTokenCache.get('key') is None
+
+    def test_expired(self, now):
+        HashiVaultTokenCache.set('key', _login(lease_duration=100))
+
+        now.return_value = 1000.0 + 89
+        assert HashiVaultTokenCache.get('key') is not None
+
+        now.return_value = 1000.0 + 90
+        assert HashiVaultTokenCache.get('key') is None
+
+    def test_remove_clear(self, now):
+        HashiVaultTokenCache.set('one', _login())
+        HashiVaultTokenCache.set('two', _login())
+
+        HashiVaultTokenCache.remove('one')
+        HashiVaultTokenCache.remove('missing')
+
+        assert HashiVaultTokenCache.get('one') is None
+        assert HashiVaultTokenCache.get('two') is not None
+
+        HashiVaultTokenCache.clear()
+
+        assert HashiVaultTokenCache.get('two') is None
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+import os
+import stat
+
+import pytest
+
+from ansible_collections.community.hashi_vault.tests.unit.compat import mock
+
+from ansible_collections.community.hashi_vault.plugins.module_utils._token_cache_file import HashiVaultTokenCacheFile
+
+
+LOGIN = ('ldap', 'http://vault', None, {'username': 'user', 'password': 'supersecret', 'mount_point': None})
+RESPONSE = {'auth': {'client_token': 's.token', 'lease_duration': 3600}}
+
+
+@pytest.fixture(autouse=True)
+def fast_kdf():
+    with mock.patch.object(HashiVaultTokenCacheFile, 'KDF_ITERATIONS', 10):
+        yield
+
+
+@pytest.fixture
+def now():
+    with mock.patch.object(HashiVaultTokenCacheFile, '_clock', return_value=1000.0) as clock:
+        yield clock
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / 'cache' / 'tokens.json')
+
+
+@pytest.fixture
+def cache_file(cache_path):
+    return HashiVaultTokenCacheFile(cache_path)
+
+
+class TestHashiVaultTokenCacheFile(object):
+
+    def test_missing_file(self, cache_file):
+        assert cache_file.get(LOGIN) == (None, None)
+        cache_file.remove(LOGIN)
+
+        assert not os.path.exists(cache_file.path)
+
+    def test_set_get(self, now, cache_file):
+        cache_file.set(LOGIN, RESPONSE, 2000.0)
+
+        assert cache_file.get(LOGIN) == (RESPONSE, 2000.0)
+
+    def test_never_expires(self, now, cache_file):
+        cache_file.set(LOGIN, RESPONSE, float('inf'))
+
+        assert cache_file.get(LOGIN) == (RESPONSE, float('inf'))
+
+    def test_persists(self, now, cache_file, cache_path):
+        cache_file.set(LOGIN, RESPONSE, 2000.0)
+
+        assert HashiVaultTokenCacheFile(cache_path).get(LOGIN) == (RESPONSE, 2000.0)
+
+    def test_file_is_private_and_encrypted(self, now, cache_file):
+        cache_file.set(LOGIN, RESPONSE, 2000.0)
+
+        assert stat.S_IMODE(os.stat(cache_file.path).st_mode) == 0o600
+
+        with open(cache_file.path) as f:
+            content = f.read()
+
+        for secret in ('s.token', 'supersecret', 'ldap', 'http://vault'):
+            assert secret not in content
+
+    def test_other_login(self, now, cache_file):
+        cache_file.set(LOGIN, RESPONSE, 2000.0)
+
+        other = LOGIN[:3] + (dict(LOGIN[3], password='wrong'),)
+
+        assert cache_file.get(other) == (None, None)
+
+    def test_expired(self, now, cache_file):
+        cache_file.set(LOGIN, RESPONSE, 1500.0)
+        now.return_value = 1500.0
+
+        assert cache_file.get(LOGIN) == (None, None)
+
+    def test_set_prunes_expired(self, now, cache_file):
+        other = LOGIN[:3] + (dict(LOGIN[3], username='other'),)
+
+        cache_file.set(LOGIN, RESPONSE, 1500.0)
+        now.return_value = 1500.0
+        cache_file.set(other, RESPONSE, 3000.0)
+
+        with open(cache_file.path) as f:
+            assert len(json.load(f)['entries']) == 1
+
+    def test_remove(self, now, cache_file):
+        cache_file.set(LOGIN, RESPONSE, 2000.0)
+        cache_file.remove(LOGIN)
+
+        assert cache_file.get(LOGIN) == (None, None)
+
+    @pytest.mark.parametrize('content', ['', 'not json', '[]', '{"version": 99, "salt": "", "entries": {}}'])
+    def test_unreadable_file(self, now, cache_file, content):
+        os.makedirs(os.path.dirname(cache_file.path))
+        with open(cache_file.path, 'w') as f:
+            f.write(content)
+
+        assert cache_file.get(LOGIN) == (None, None)
+
+        cache_file.set(LOGIN, RESPONSE, 2000.0)
+
+        assert cache_file.get(LOGIN) == (RESPONSE, 2000.0)
+
+    def test_tampered_entry(self, now, cache_file):
+        cache_file.set(LOGIN, RESPONSE, 2000.0)
+
+        with open(cache_file.path) as f:
+            data = json.load(f)
+        for entry in data['entries'].values():
+            entry['data'] = entry['data'][:-4] + 'AAAA'
+        with open(cache_file.path, 'w') as f:
+            json.dump(data, f)
+
+        assert cache_file.get(LOGIN) == (None, None)
@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import datetime
+import json
+import os
+import stat
+
+import pytest
+
+from requests import Request
+from requests.models import Response
+from urllib3.util.retry import RequestHistory
+
+from ansible_collections.community.hashi_vault.tests.unit.compat import mock
+
+from ansible_collections.community.hashi_vault.plugins.module_utils._tracing import HashiVaultTracer
+
+
+TRACE_ID = '0af7651916cd43dd8448eb211c80319c'
+PARENT_ID = 'b7ad6b7169203331'
+
+
+def _response(method='GET', url='http://vault:8200/v1/secret/data/one', status_code=200, content=b'{}', elapsed=0.25):
+    response = Response()
+    response.request = Request(method, url).prepare()
+    response.status_code = status_code
+    response._content = content
+    response.elapsed = datetime.timedelta(seconds=elapsed)
+    return response
+
+
+def _spans(document):
+    return document['resourceSpans'][0]['scopeSpans'][0]['spans']
+
+
+def _attributes(span):
+    return dict((a['key'], list(a['value'].values())[0]) for a in span['attributes'])
+
+
+@pytest.fixture
+def tracer():
+    HashiVaultTracer._pop_retries()
+    return HashiVaultTracer()
+
+
+class TestHashiVaultTracer(object):
+
+    @pytest.mark.parametrize('traceparent,expected', [
+        ('00-%s-%s-01' % (TRACE_ID, PARENT_ID), (TRACE_ID, PARENT_ID)),
+        (' 00-%s-%s-00 ' % (TRACE_ID.upper(), PARENT_ID), (TRACE_ID, PARENT_ID)),
+        ('00-%s-%s-01' % ('0' * 32, PARENT_ID), (None, None)),
+        ('00-%s-%s-01' % (TRACE_ID, '0' * 16), (None, None)),
+        ('00-%s-01' % TRACE_ID, (None, None)),
+        ('', (None, None)),
+        (None, (None, None)),
+    ])
+    def test_parse_traceparent(self, traceparent, expected):
+        assert HashiVaultTracer.parse_traceparent(traceparent) == expected
+
+    def test_not_started(self, tracer):
+        assert not tracer.started
+        assert tracer.end() is None
+        assert tracer.record_request('GET', 'http://vault:8200/v1/sys/health', 200, 1, 2) is None
+
+        with tracer.span('login') as span:
+            assert span is None
+
+    def test_trace(self, tracer):
+        on_end = tracer.on_end = mock.Mock()
+
+        tracer.start('community.hashi_vault.vault_read', {'ansible.plugin.type': 'lookup', 'ansible.lookup.terms': 2})
+        assert tracer.started
+
+        with tracer.span('login', {'vault.auth.method': 'approle'}):
+            tracer.record_request('post', 'http://vault:8200/v1/auth/approle/login', 200, 10, 20, size=5)
+
+        tracer.record_request('GET', 'http://vault:8200/v1/secret/data/app', 403, 30, 40)
+
+        document = tracer.end()
+        on_end.assert_called_once_with(document)
+        assert not tracer.started
+
+        resource = document['resourceSpans'][0]['resource']
+        assert _attributes(resource) == {'process.pid': str(os.getpid()), 'service.name': 'community.hashi_vault'}
+        assert document['resourceSpans'][0]['scopeSpans'][0]['scope'] == {'name': 'community.hashi_vault'}
+
+        root, login, login_request, read = _spans(document)
+
+        assert len(set(span['traceId'] for span in (root, login, login_request, read))) == 1
+        assert len(root['traceId']) == 32
+        assert len(root['spanId']) == 16
+        assert 'parentSpanId' not in root
+        assert root['name'] == 'community.hashi_vault.vault_read'
+        assert root['kind'] == HashiVaultTracer.SPAN_KIND_INTERNAL
+        assert _attributes(root) == {'ansible.plugin.type': 'lookup', 'ansible.lookup.terms': '2'}
+        assert int(root['endTimeUnixNano']) >= int(root['startTimeUnixNano'])
+        assert root['status'] == {}
+
+        assert login['parentSpanId'] == root['spanId']
+        assert _attributes(login) == {'vault.auth.method': 'approle'}
+
+        assert login_request['parentSpanId'] == login['spanId']
+        assert login_request['name'] == 'POST auth/approle/login'
+        assert login_request['kind'] == HashiVaultTracer.SPAN_KIND_CLIENT
+        assert (login_request['startTimeUnixNano'], login_request['endTimeUnixNano']) == ('10', '20')
+        assert _attributes(login_request) == {
+            'http.request.method': 'POST',
+            'url.template': 'auth/approle/login',
+            'http.response.status_code': '200',
+            'http.response.body.size': '5',
+        }
+
+        assert read['parentSpanId'] == root['spanId']
+        assert read['name'] == 'GET secret/data/*'
+        assert read['status'] == {'code': HashiVaultTracer.STATUS_CODE_ERROR, 'message': '403'}
+
+    def test_traceparent(self, tracer):
+        tracer.start('module', traceparent='00-%s-%s-01' % (TRACE_ID, PARENT_ID))
+
+        root = _spans(tracer.end())[0]
+        assert root['traceId'] == TRACE_ID
+        assert root['parentSpanId'] == PARENT_ID
+
+    def test_errors(self, tracer):
+        tracer.start('module')
+
+        with pytest.raises(RuntimeError):
+            with tracer.span('login'):
+                raise RuntimeError('permission denied')
+
+        root, login = _spans(tracer.end(error='failed'))
+        assert root['status'] == {'code': HashiVaultTracer.STATUS_CODE_ERROR, 'message': 'failed'}
+        assert login['status'] == {'code': HashiVaultTracer.STATUS_CODE_ERROR, 'message': 'permission denied'}
+
+    def test_start_resets(self, tracer):
+        tracer.start('first')
+        tracer.record_request('GET', 'http://vault:8200/v1/sys/health', 200, 1, 2)
+        first = _spans(tracer.end())
+
+        tracer.start('second')
+        second = _spans(tracer.end())
+
+        assert len(first) == 2
+        assert [span['name'] for span in second] == ['second']
+        assert first[0]['traceId'] != second[0]['traceId']
+
+    def test_record_request_attempts(self, tracer):
+        tracer.start('lookup')
+        error = ConnectionError('refused')
+        tracer.record_request('GET', 'http://vault:8200/v1/kv/app', 200, 100, 400, attempts=[(100, 150, None, error), (200, 250, 503, None)])
+
+        root, request, first, second = _spans(tracer.end())
+
+        assert _attributes(request)['http.request.resend_count'] == '2'
+        assert request['status'] == {}
+
+        assert first['parentSpanId'] == second['parentSpanId'] == request['spanId']
+        assert first['name'] == second['name'] == 'retry'
+        assert (first['startTimeUnixNano'], first['endTimeUnixNano']) == ('100', '150')
+        assert _attributes(first) == {'vault.retry.attempt': '1', 'error.type': 'ConnectionError'}
+        assert first['status'] == {'code': HashiVaultTracer.STATUS_CODE_ERROR, 'message': 'refused'}
+        assert _attributes(second) == {'vault.retry.attempt': '2', 'http.response.status_code': '503'}
+        assert second['status'] == {'code': HashiVaultTracer.STATUS_CODE_ERROR, 'message': '503'}
+
+    def test_response_hook(self, tracer):
+        tracer.start('lookup')
+
+        history = (RequestHistory('GET', '/v1/secret/data/one', None, 503, None),)
+        tracer.request_hook('GET', '/v1/secret/data/one', {})
+        with mock.patch('time.time_ns', return_value=1000000000):
+            HashiVaultTracer.record_retry(())
+            HashiVaultTracer.record_retry(history)
+        with mock.patch('time.time_ns', return_value=2000000000):
+            tracer.response_hook(_response(content=b'{"a": 1}', elapsed=1.5))
+
+        root, request, retry = _spans(tracer.end())
+
+        assert (request['startTimeUnixNano'], request['endTimeUnixNano']) == ('500000000', '2000000000')
+        assert _attributes(request)['http.response.body.size'] == '8'
+        assert _attributes(request)['http.request.resend_count'] == '1'
+        assert (retry['startTimeUnixNano'], retry['endTimeUnixNano']) == ('500000000', '1000000000')
+        assert _attributes(retry)['http.response.status_code'] == '503'
+
+        assert HashiVaultTracer._pop_retries() == []
+
+    def test_request_hook_clears_retries(self, tracer):
+        tracer.start('lookup')
+
+        HashiVaultTracer.record_retry((RequestHistory('GET', '/v1/down', ConnectionError(), None, None),))
+        assert tracer.request_hook('GET', '/v1/secret/data/one', {}) is None
+        tracer.response_hook(_response())
+
+        root, request = _spans(tracer.end())
+        assert 'http.request.resend_count' not in _attributes(request)
+
+    def test_retries_not_recorded_without_request_hook(self, tracer):
+        HashiVaultTracer.record_retry((RequestHistory('GET', '/v1/down', ConnectionError(), None, None),))
+
+        assert HashiVaultTracer._pop_retries() == []
+
+    def test_start_time(self, tracer):
+        tracer.start('lookup', start=100)
+
+        with mock.patch('time.time_ns', return_value=200):
+            root, = _spans(tracer.end())
+
+        assert (root['startTimeUnixNano'], root['endTimeUnixNano']) == ('100', '200')
+
+    def test_write(self, tracer, tmp_path):
+        path = str(tmp_path / 'traces.jsonl')
+
+        tracer.start('first')
+        HashiVaultTracer.write(path, tracer.end())
+        tracer.start('second')
+        HashiVaultTracer.write(path, tracer.end())
+
+        with open(path) as f:
+            documents = [json.loads(line) for line in f]
+
+        assert [_spans(document)[0]['name'] for document in documents] == ['first', 'second']
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+import socketserver
+import threading
+
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+from requests import Session
+from requests.exceptions import ConnectionError
+
+from ansible_collections.community.hashi_vault.plugins.module_utils._unix_socket import (
+    HashiVaultUnixSocketAdapter,
+    HashiVaultUnixSocketCircuitBreakerAdapter,
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def _respond(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = json.dumps({
+            'method': self.command,
+            'path': self.path,
+            'host': self.headers.get('Host'),
+            'token': self.headers.get('X-Vault-Token'),
+            'body': self.rfile.read(length).decode('utf-8'),
+        }).encode('utf-8')
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_LIST = _respond
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    path = str(tmp_path / 'agent.sock')
+    server = _Server(path, _Handler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+
+    yield path
+
+    server.shutdown()
+    server.server_close()
+    thread.join(5)
+
+
+@pytest.fixture
+def session():
+    session = Session()
+    session.mount(HashiVaultUnixSocketAdapter.SCHEME + '://', HashiVaultUnixSocketAdapter())
+    yield session
+    session.close()
+
+
+class TestHashiVaultUnixSocketAdapter(object):
+
+    @pytest.mark.parametrize('url,expected', [
+        (None, None),
+        ('https://vault:8200', None),
+        ('unix:///run/vault-agent.sock', 'http+unix://%2Frun%2Fvault-agent.sock'),
+        ('unix:///run/vault-agent.sock/', 'http+unix://%2Frun%2Fvault-agent.sock'),
+    ])
+    def test_from_unix_url(self, url, expected):
+        assert HashiVaultUnixSocketAdapter.from_unix_url(url) == expected
+
+    def test_get_socket_path(self):
+        assert HashiVaultUnixSocketAdapter.get_socket_path('http+unix://%2Frun%2Fvault-agent.sock/v1/sys/health') == '/run/vault-agent.sock'
+
+    def test_request(self, socket_path, session):
+        url = HashiVaultUnixSocketAdapter.from_unix_url('unix://' + socket_path)
+
+        response = session.get(url + '/v1/secret/data/one', params={'version': 2}, headers={'X-Vault-Token': 's.token'}, timeout=5)
+
+        assert response.status_code == 200
+        assert response.json() == {
+            'method': 'GET',
+            'path': '/v1/secret/data/one?version=2',
+            'host': 'localhost',
+            'token': 's.token',
+            'body': '',
+        }
+
+    def test_request_body_and_reuse(self, socket_path, session):
+        url = HashiVaultUnixSocketAdapter.from_unix_url('unix://' + socket_path)
+        adapter = session.get_adapter(url)
+
+        for i in range(3):
+            response = session.post(url + '/v1/secret/data/one', json={'i': i}, timeout=5)
+            assert json.loads(response.json()['body']) == {'i': i}
+
+        assert len(adapter._pools) == 1
+        assert adapter._pools[socket_path].num_connections == 1
+
+    def test_missing_socket(self, tmp_path, session):
+        url = HashiVaultUnixSocketAdapter.from_unix_url('unix://' + str(tmp_path / 'missing.sock'))
+
+        with pytest.raises(ConnectionError, match='missing.sock'):
+            session.get(url + '/v1/sys/health', timeout=5)
+
+    def test_circuit_breaker(self, tmp_path, session):
+        adapter = HashiVaultUnixSocketCircuitBreakerAdapter({'threshold': 1, 'cooldown': 30, 'shared': False})
+        session.mount(HashiVaultUnixSocketAdapter.SCHEME + '://', adapter)
+        url = HashiVaultUnixSocketAdapter.from_unix_url('unix://' + str(tmp_path / 'missing.sock'))
+
+        with pytest.raises(ConnectionError, match='missing.sock'):
+            session.get(url + '/v1/sys/health', timeout=5)
+
+        with pytest.raises(ConnectionError, match='circuit breaker'):
+            session.get(url + '/v1/sys/health', timeout=5)
@@ -151,3 +151,60 @@ class TestModuleVaultKv2Get():
             assert (opt_version is not None) == (match.group(2) == str(opt_version))
         except IndexError:
             pass
+
+    @pytest.mark.parametrize('patch_ansible_module', [_combined_options(cached_version=2)], indirect=True)
+    def test_vault_kv2_get_cached_version_unchanged(self, vault_client, capfd):
+        client = vault_client
+        client.secrets.kv.v2.read_secret_metadata.return_value = {
+            'data': {'current_version': 2, 'custom_metadata': None, 'versions': {'2': {'created_time': 'x', 'deletion_time': '', 'destroyed': False}}},
+        }
+
+        with pytest.raises(SystemExit) as e:
+            vault_kv2_get.main()
+
+        out, err = capfd.readouterr()
+        result = json.loads(out)
+
+        assert e.value.code == 0, "result: %r" % (result,)
+        assert result['unchanged'] is True
+        assert result['metadata']['version'] == 2
+        for k in ('raw', 'data', 'secret'):
+            assert k not in result
+
+        client.secrets.kv.v2.read_secret_metadata.assert_called_once_with(path='endpoint', mount_point='secret')
+        client.secrets.kv.v2.read_secret_version.assert_not_called()
+
+    @pytest.mark.parametrize('metadata_effect', [
+        {'return_value': {'data': {'current_version': 3, 'versions': {'3': {'deletion_time': '', 'destroyed': False}}}}},
+        {'return_value': {'data': {'current_version': 2, 'versions': {'2': {'deletion_time': '2022-04-21T15:56:58Z', 'destroyed': False}}}}},
+        {'side_effect': hvac.exceptions.Forbidden},
+    ], ids=['newer', 'deleted', 'forbidden'])
+    @pytest.mark.parametrize('patch_ansible_module', [_combined_options(cached_version=2)], indirect=True)
+    def test_vault_kv2_get_cached_version_changed(self, vault_client, kv2_get_response, metadata_effect, capfd):
+        client = vault_client
+        client.secrets.kv.v2.read_secret_metadata.configure_mock(**metadata_effect)
+        client.secrets.kv.v2.read_secret_version.return_value = kv2_get_response
+
+        with pytest.raises(SystemExit) as e:
+            vault_kv2_get.main()
+
+        out, err = capfd.readouterr()
+        result = json.loads(out)
+
+        assert e.value.code == 0, "result: %r" % (result,)
+        assert result['unchanged'] is False
+        assert result['raw'] == kv2_get_response
+
+        client.secrets.kv.v2.read_secret_version.assert_called_once_with(path='endpoint', mount_point='secret', version=None)
+
+    @pytest.mark.parametrize('patch_ansible_module', [_combined_options(cached_version=2, version=2)], indirect=True)
+    def test_vault_kv2_get_cached_version_with_version(self, vault_client, capfd):
+        with pytest.raises(SystemExit) as e:
+            vault_kv2_get.main()
+
+        out, err = capfd.readouterr()
+        result = json.loads(out)
+
+        assert e.value.code != 0, "result: %r" % (result,)
+        assert 'mutually exclusive' in result['msg']
+        vault_client.secrets.kv.v2.read_secret_version.assert_not_called()
@@ -0,0 +1,378 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import base64
+import json
+import os
+import stat
+import threading
+import time
+
+import pytest
+import requests
+
+from ......plugins.module_utils._hashi_vault_common import HashiVaultOptionAdapter
+from ......plugins.plugin_utils._hashi_vault_broker import (
+    HashiVaultBroker,
+    HashiVaultBrokerAdapter,
+    HashiVaultBrokerConnectionOptions,
+    HashiVaultBrokerError,
+)
+from ......tests.unit.compat import mock
+
+
+def _result(data, status=200):
+    return dict(status=status, reason='OK', headers={'Content-Type': 'application/json'}, body=base64.b64encode(json.dumps(data).encode()).decode())
+
+
+def _envelope(method='GET', url='http://vault:8200/v1/secret/data/one', cache=None, token='s.token', shareable=True):
+    return dict(method=method, url=url, headers={'X-Vault-Token': token}, body=None, verify=True, cache=cache, shareable=shareable)
+
+
+@pytest.fixture
+def broker(tmp_path):
+    return HashiVaultBroker(str(tmp_path / 'broker.sock'), idle_timeout=None)
+
+
+@pytest.fixture
+def running_broker(broker):
+    thread = threading.Thread(target=broker.serve)
+    thread.start()
+
+    deadline = time.monotonic() + 5
+    while not HashiVaultBroker.ping(broker.socket_path):
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+    yield broker
+
+    broker.idle_timeout = 0
+    thread.join(5)
+
+
+class TestHashiVaultBroker(object):
+
+    @pytest.mark.parametrize('method,url,expected', [
+        ('POST', 'http://vault/v1/auth/approle/login', True),
+        ('POST', 'http://vault/v1/auth/userpass/login/user', True),
+        ('PUT', 'http://vault/v1/auth/ldap/login/user', True),
+        ('POST', 'http://vault/v1/secret/data/login', False),
+        ('POST', 'http://vault/v1/auth/token/create', False),
+        ('GET', 'http://vault/v1/auth/approle/login', False),
+    ])
+    def test_is_login(self, method, url, expected):
+        assert HashiVaultBroker.is_login(method, url) is expected
+
+    def test_make_key_hides_token(self):
+        key = HashiVaultBroker.make_key(_envelope(token='s.supersecret'))
+
+        assert 's.supersecret' not in key
+        assert key != HashiVaultBroker.make_key(_envelope(token='s.other'))
+
+    @pytest.mark.parametrize('envelope,expected_calls', [
+        (_envelope(), 1),
+        (_envelope(method='LIST'), 1),
+        (_envelope(method='POST', url='http://vault/v1/auth/approle/login'), 1),
+        (_envelope(method='POST', url='http://vault/v1/secret/data/one'), 5),
+        (_envelope(method='DELETE'), 5),
+        (_envelope(shareable=False), 5),
+        (_envelope(url='http://vault/v1/database/creds/app'), 5),
+        (_envelope(url='http://vault/v1/aws/sts/deploy'), 5),
+        (_envelope(url='http://vault/v1/auth/token/lookup-self'), 5),
+    ])
+    def test_handle_coalesces_in_flight(self, broker, envelope, expected_calls):
+        release = threading.Event()
+        calls = []
+
+        def _perform(env):
+            calls.append(env)
+            release.wait(5)
+            return _result({'data': {'a': 1}})
+
+        results = []
+        with mock.patch.object(broker, 'perform', side_effect=_perform):
+            threads = [threading.Thread(target=lambda: results.append(broker.handle(dict(envelope)))) for i in range(5)]
+            for thread in threads:
+                thread.start()
+
+            deadline = time.monotonic() + 5
+            while len(calls) < expected_calls and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            release.set()
+            for thread in threads:
+                thread.join(5)
+
+        assert len(calls) == expected_calls
+        assert results == [_result({'data': {'a': 1}})] * 5
+        assert broker._inflight == {}
+
+    def test_handle_different_tokens_not_coalesced(self, broker):
+        with mock.patch.object(broker, 'perform', return_value=_result({})) as perform:
+            broker.handle(_envelope(token='one'))
+            broker.handle(_envelope(token='two'))
+
+        assert perform.call_count == 2
+
+    def test_handle_error_shared(self, broker):
+        with mock.patch.object(broker, 'perform', side_effect=RuntimeError('boom')):
+            with pytest.raises(RuntimeError):
+                broker.handle(_envelope())
+
+        assert broker._inflight == {}
+
+    @pytest.mark.parametrize('cache,expected_calls', [
+        (None, 2),
+        ({'ttl': None, 'token': True}, 2),
+        ({'ttl': 60, 'token': False}, 1),
+    ])
+    def test_handle_read_cache(self, broker, cache, expected_calls):
+        with mock.patch.object(broker, 'perform', return_value=_result({'data': {}})) as perform:
+            broker.handle(_envelope(cache=cache))
+            broker.handle(_envelope(cache=cache))
+
+        assert perform.call_count == expected_calls
+
+    @pytest.mark.parametrize('envelope', [
+        _envelope(cache={'ttl': 60}, shareable=False),
+        _envelope(cache={'ttl': 60}, url='http://vault/v1/database/creds/app'),
+        _envelope(cache={'ttl': 60}, url='http://vault/v1/auth/token/lookup-self'),
+    ])
+    def test_handle_read_cache_unshareable(self, broker, envelope):
+        with mock.patch.object(broker, 'perform', return_value=_result({'data': {}})) as perform:
+            broker.handle(dict(envelope))
+            broker.handle(dict(envelope))
+
+        assert perform.call_count == 2
+
+    def test_handle_read_cache_not_error(self, broker):
+        with mock.patch.object(broker, 'perform', return_value=_result({'errors': []}, status=404)) as perform:
+            broker.handle(_envelope(cache={'ttl': 60}))
+            broker.handle(_envelope(cache={'ttl': 60}))
+
+        assert perform.call_count == 2
+
+    @pytest.mark.parametrize('login,cache,expected_calls', [
+        ({'auth': {'client_token': 's.t', 'lease_duration': 3600}}, {'token': True}, 1),
+        ({'auth': {'client_token': 's.t', 'lease_duration': 3600}}, {'ttl': 60, 'token': False}, 2),
+        ({'auth': {'client_token': 's.t', 'lease_duration': 3600, 'num_uses': 1}}, {'token': True}, 2),
+    ])
+    def test_handle_login_cache(self, broker, login, cache, expected_calls):
+        envelope = _envelope(method='POST', url='http://vault/v1/auth/approle/login', cache=cache)
+
+        with mock.patch.object(broker, 'perform', return_value=_result(login)) as perform:
+            broker.handle(dict(envelope))
+            broker.handle(dict(envelope))
+
+        assert perform.call_count == expected_calls
+
+    def test_should_exit_idle(self, broker):
+        assert not broker._should_exit()
+
+        broker.idle_timeout = 0
+        assert broker._should_exit()
+
+    def test_should_exit_owner_gone(self, broker):
+        broker.owner_pid = os.getpid()
+        assert not broker._should_exit()
+
+        with mock.patch('os.kill', side_effect=OSError(3, 'No such process')):
+            assert broker._should_exit()
+
+    def test_get_owner_pid_controller(self):
+        assert HashiVaultBroker.get_owner_pid() == os.getpid()
+
+    def test_get_owner_pid_worker(self):
+        parent = mock.Mock(pid=1234)
+
+        with mock.patch('multiprocessing.parent_process', return_value=parent):
+            assert HashiVaultBroker.get_owner_pid() == 1234
+
+    def test_get_socket_path(self, tmp_path):
+        with mock.patch('tempfile.gettempdir', return_value=str(tmp_path)):
+            path = HashiVaultBroker.get_socket_path(1234)
+
+        directory = os.path.dirname(path)
+
+        assert path.endswith('broker-1234.sock')
+        assert stat.S_IMODE(os.stat(directory).st_mode) == 0o700
+
+    def test_get_socket_path_insecure(self, tmp_path):
+        directory = tmp_path / ('ansible-hashi-vault-%i' % os.getuid())
+        directory.mkdir()
+        directory.chmod(0o777)
+
+        with mock.patch('tempfile.gettempdir', return_value=str(tmp_path)):
+            with pytest.raises(HashiVaultBrokerError, match='only accessible'):
+                HashiVaultBroker.get_socket_path(1234)
+
+    def test_ensure_started_running(self, running_broker):
+        with mock.patch.object(HashiVaultBroker, 'spawn') as spawn:
+            HashiVaultBroker.ensure_started(running_broker.socket_path, 60, 1)
+
+        spawn.assert_not_called()
+
+    def test_ensure_started_times_out(self, tmp_path):
+        with mock.patch.object(HashiVaultBroker, 'spawn') as spawn:
+            with pytest.raises(HashiVaultBrokerError, match="didn't start"):
+                HashiVaultBroker.ensure_started(str(tmp_path / 'broker.sock'), 60, 1, start_timeout=0)
+
+        spawn.assert_called_once_with(str(tmp_path / 'broker.sock'), 60, 1)
+
+
+class TestHashiVaultBrokerAdapter(object):
+
+    @pytest.fixture
+    def session(self, running_broker):
+        session = requests.Session()
+        session.mount('http://', HashiVaultBrokerAdapter(running_broker.socket_path, cache={'ttl': 60}))
+        return session
+
+    def test_round_trip(self, running_broker, session):
+        with mock.patch.object(running_broker, 'perform', return_value=_result({'data': {'a': 1}})) as perform:
+            response = session.get('http://vault:8200/v1/secret/data/one', headers={'X-Vault-Token': 's.token'}, timeout=(5, 10))
+
+        assert response.status_code == 200
+        assert response.json() == {'data': {'a': 1}}
+        assert response.headers['content-type'] == 'application/json'
+
+        envelope = perform.call_args[0][0]
+        assert envelope['method'] == 'GET'
+        assert envelope['headers']['X-Vault-Token'] == 's.token'
+        assert envelope['timeout'] == [5, 10]
+        assert envelope['cache'] == {'ttl': 60}
+        assert envelope['shareable'] is False
+
+    def test_shareable(self, running_broker, session):
+        with mock.patch.object(running_broker, 'perform', return_value=_result({})) as perform:
+            with HashiVaultBrokerAdapter.shareable():
+                session.get('http://vault:8200/v1/secret/data/one')
+            session.get('http://vault:8200/v1/secret/data/two')
+
+        assert [c[0][0]['shareable'] for c in perform.call_args_list] == [True, False]
+
+    @pytest.mark.parametrize('timeout,retries,nodes,expected', [
+        (None, None, None, 60),
+        ((5, 10), None, None, 45),
+        (10, {'total': 2, 'backoff_factor': 1}, None, 63),
+        (10, {'total': 20, 'backoff_factor': 100}, None, 210 + 100 + 120 * 19 + 30),
+        (10, {'total': 2, 'deadline': 100}, None, 140),
+        (10, None, ['http://one', 'http://two'], 50),
+    ])
+    def test_exchange_timeout(self, timeout, retries, nodes, expected):
+        adapter = HashiVaultBrokerAdapter('/nowhere', retries=retries, nodes=nodes)
+
+        assert adapter.get_exchange_timeout(timeout) == expected
+
+    def test_unresponsive_broker(self, tmp_path):
+        import socket
+
+        # a socket that accepts connections, but never answers
+        path = str(tmp_path / 'stuck.sock')
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(path)
+        server.listen(1)
+
+        session = requests.Session()
+        session.mount('http://', HashiVaultBrokerAdapter(path))
+
+        try:
+            with mock.patch.object(HashiVaultBrokerAdapter, 'EXCHANGE_MARGIN', 0):
+                with pytest.raises(requests.exceptions.ConnectionError, match='Vault broker'):
+                    session.get('http://vault:8200/v1/secret/data/one', timeout=0.2)
+        finally:
+            server.close()
+
+    def test_body(self, running_broker, session):
+        with mock.patch.object(running_broker, 'perform', return_value=_result({})) as perform:
+            session.post('http://vault:8200/v1/secret/data/one', json={'data': {'a': 1}})
+
+        assert json.loads(base64.b64decode(perform.call_args[0][0]['body'])) == {'data': {'a': 1}}
+
+    @pytest.mark.parametrize('error_type,exception', [
+        ('ReadTimeout', requests.exceptions.ReadTimeout),
+        ('ConnectionError', requests.exceptions.ConnectionError),
+        ('SSLError', requests.exceptions.SSLError),
+    ])
+    def test_error(self, running_broker, session, error_type, exception):
+        with mock.patch.object(running_broker, 'perform', return_value=dict(error='failed', error_type=error_type)):
+            with pytest.raises(exception, match='failed'):
+                session.get('http://vault:8200/v1/secret/data/one')
+
+    def test_no_broker(self, tmp_path):
+        session = requests.Session()
+        session.mount('http://', HashiVaultBrokerAdapter(str(tmp_path / 'missing.sock')))
+
+        with pytest.raises(requests.exceptions.ConnectionError, match='Vault broker'):
+            session.get('http://vault:8200/v1/secret/data/one')
+
+
+class TestHashiVaultBrokerConnectionOptions(object):
+
+    @pytest.fixture
+    def options(self):
+        return {
+            'url': 'http://vault:8200',
+            'proxies': None,
+            'namespace': None,
+            'validate_certs': None,
+            'ca_cert': None,
+            'timeout': None,
+            'retries': None,
+            'retry_action': 'warn',
+            'retry_deadline': None,
+            'circuit_breaker': None,
+            'broker': True,
+            'broker_idle_timeout': 30,
+            'cache': True,
+            'cache_ttl': 60,
+            'token_cache': False,
+        }
+
+    @pytest.fixture
+    def connection_options(self, options):
+        return HashiVaultBrokerConnectionOptions(HashiVaultOptionAdapter.from_dict(options), lambda retry_action: None)
+
+    def test_broker_disabled(self, options, connection_options):
+        options['broker'] = False
+        connection_options.process_connection_options()
+
+        with mock.patch.object(HashiVaultBroker, 'ensure_started') as ensure_started:
+            hvopts = connection_options.get_hvac_connection_options()
+
+        ensure_started.assert_not_called()
+        assert 'session' not in hvopts
+
+    def test_broker_enabled(self, tmp_path, connection_options):
+        connection_options.process_connection_options()
+
+        with mock.patch('tempfile.gettempdir', return_value=str(tmp_path)):
+            with mock.patch.object(HashiVaultBroker, 'ensure_started') as ensure_started:
+                hvopts = connection_options.get_hvac_connection_options()
+                again = connection_options.get_hvac_connection_options()
+
+        socket_path = ensure_started.call_args[0][0]
+        ensure_started.assert_called_with(socket_path, 30, os.getpid())
+
+        adapter = hvopts['session'].get_adapter('https://vault:8200')
+        assert isinstance(adapter, HashiVaultBrokerAdapter)
+        assert adapter.socket_path == socket_path
+        assert adapter.cache['ttl'] == 60
+        assert adapter.cache['token'] is False
+        assert again['session'] is hvopts['session']
+
+    def test_broker_nodes(self, tmp_path, options, connection_options):
+        options['url'] = 'http://vault-1:8200,http://vault-2:8200'
+        connection_options.process_connection_options()
+
+        with mock.patch('tempfile.gettempdir', return_value=str(tmp_path)):
+            with mock.patch.object(HashiVaultBroker, 'ensure_started'):
+                hvopts = connection_options.get_hvac_connection_options()
+
+        assert hvopts['url'] == 'http://vault-1:8200'
+        assert hvopts['session'].get_adapter('http://vault-1:8200').nodes == ['http://vault-1:8200', 'http://vault-2:8200']
@@ -6,6 +6,11 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import json
+import os
+import subprocess
+import sys
+import threading
 import pytest
 
 from re import escape as re_escape
@@ -15,6 +20,11 @@ from ansible.plugins.lookup import LookupBase
 
 from ......plugins.plugin_utils._hashi_vault_plugin import HashiVaultPlugin
 from ......plugins.plugin_utils._hashi_vault_lookup_base import HashiVaultLookupBase
+from ......plugins.module_utils._async_engine import HashiVaultAsyncEngine, HashiVaultAsyncOperation
+from ......plugins.module_utils._read_cache import HashiVaultReadCache
+from ......plugins.module_utils._request_stats import HashiVaultRequestStats
+from ......plugins.plugin_utils._hashi_vault_broker import HashiVaultBrokerAdapter
+from ......tests.unit.compat import mock
 
 
 @pytest.fixture
@@ -22,9 +32,47 @@ def hashi_vault_lookup_module():
     return FakeLookupModule()
 
 
+@pytest.fixture
+def max_concurrency(mocker, hashi_vault_lookup_module, request):
+    mocker.patch.object(hashi_vault_lookup_module._options_adapter, 'get_option_default', return_value=request.param)
+    return request.param
+
+
+@pytest.fixture
+def options(mocker, hashi_vault_lookup_module):
+    opts = {}
+    mocker.patch.object(
+        hashi_vault_lookup_module._options_adapter, 'get_option_default',
+        side_effect=lambda key, default=None: opts.get(key, default)
+    )
+    return opts
+
+
+@pytest.fixture
+def client():
+    client = mock.MagicMock()
+    client.url = 'http://vault:8200'
+    client.token = 's.token'
+    client.adapter.namespace = None
+    return client
+
+
+@pytest.fixture
+def client_args(mocker, hashi_vault_lookup_module):
+    args = dict(url='http://vault:8200', verify='/ca.pem', timeout=7, proxies={'http': 'http://proxy:3128'})
+    mocker.patch.object(hashi_vault_lookup_module.connection_options, 'get_hvac_connection_options', return_value=args)
+    return args
+
+
 class FakeLookupModule(HashiVaultLookupBase):
     def run(self, terms, variables=None, **kwargs):
-        pass
+        if kwargs.get('fail'):
+            raise AnsibleError('failed')
+
+        self.tracer.record_request('GET', 'http://vault:8200/v1/secret/data/%s' % terms[0], 200, 1, 2)
+        for term in terms:
+            self.request_stats.record('GET', 'http://vault:8200/v1/secret/data/%s' % term, 200, 0.1)
+        return list(terms)
 
 
 class TestHashiVaultLookupBase(object):
@@ -34,7 +82,53 @@ class TestHashiVaultLookupBase(object):
 
     def test_is_ansible_lookup_base(self, hashi_vault_lookup_module):
         assert issubclass(type(hashi_vault_lookup_module), LookupBase)
-        hashi_vault_lookup_module.run([])  # run this for "coverage"
+        hashi_vault_lookup_module.run(['a'])  # run this for "coverage"
+
+    @pytest.mark.parametrize('fail', [False, True])
+    def test_run_is_traced(self, hashi_vault_lookup_module, options, tmp_path, fail):
+        options.update(trace_file=str(tmp_path / 'traces.jsonl'))
+        on_end = hashi_vault_lookup_module.tracer.on_end = mock.Mock()
+        traceparent = '00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01'
+
+        with mock.patch.dict('os.environ', {'TRACEPARENT': traceparent}):
+            if fail:
+                with pytest.raises(AnsibleError):
+                    hashi_vault_lookup_module.run(['a', 'b'], fail=True)
+            else:
+                assert hashi_vault_lookup_module.run(['a', 'b']) == ['a', 'b']
+
+        assert not hashi_vault_lookup_module.tracer.started
+
+        spans = on_end.call_args[0][0]['resourceSpans'][0]['scopeSpans'][0]['spans']
+        root = spans[0]
+        assert root['traceId'] == '0af7651916cd43dd8448eb211c80319c'
+        assert root['parentSpanId'] == 'b7ad6b7169203331'
+        assert {'key': 'ansible.lookup.terms', 'value': {'intValue': '2'}} in root['attributes']
+
+        if fail:
+            assert len(spans) == 1
+            assert root['status']['message'] == 'failed'
+        else:
+            assert [span['name'] for span in spans[1:]] == ['GET secret/data/*']
+            assert root['status'] == {}
+
+    @pytest.mark.parametrize('stats_file', [None, 'stats.jsonl'])
+    def test_run_writes_request_stats(self, hashi_vault_lookup_module, options, tmp_path, stats_file):
+        if stats_file is not None:
+            options.update(stats_file=str(tmp_path / stats_file))
+
+        with mock.patch.object(HashiVaultRequestStats, 'write') as write:
+            hashi_vault_lookup_module.run(['a', 'b'])
+            hashi_vault_lookup_module.run(['c'])
+
+        # once for each call, with all of its records, or not at all without a stats_file
+        if stats_file is None:
+            write.assert_not_called()
+        else:
+            assert [[r['path'] for r in c[0][1]] for c in write.call_args_list] == [['secret/data/*'] * 2, ['secret/data/*']]
+            assert all(c[0][0] == options['stats_file'] for c in write.call_args_list)
+
+        assert hashi_vault_lookup_module.request_stats.get_records() == []
 
     @pytest.mark.parametrize(
         'term,unqualified',
@@ -87,3 +181,309 @@ class TestHashiVaultLookupBase(object):
 
         with pytest.raises(AnsibleOptionsError, match=expected_match):
             hashi_vault_lookup_module.parse_kev_term(term, plugin_name='fake', first_unqualified=dup_key)
+
+    @pytest.mark.parametrize('max_concurrency', [None, 1, 2, 10], indirect=True)
+    def test_map_terms_keeps_order(self, hashi_vault_lookup_module, max_concurrency):
+        terms = ['term%i' % i for i in range(20)]
+
+        result = hashi_vault_lookup_module.map_terms(mock.MagicMock(), lambda term: term.upper(), terms)
+
+        assert result == [term.upper() for term in terms]
+
+    @pytest.mark.parametrize('max_concurrency', [4], indirect=True)
+    def test_map_terms_runs_concurrently(self, hashi_vault_lookup_module, max_concurrency):
+        barrier = threading.Barrier(4, timeout=10)
+        threads = set()
+
+        def _func(term):
+            barrier.wait()
+            threads.add(threading.get_ident())
+            return term
+
+        result = hashi_vault_lookup_module.map_terms(mock.MagicMock(), _func, ['a', 'b', 'c', 'd'])
+
+        assert result == ['a', 'b', 'c', 'd']
+        assert len(threads) == 4
+
+    @pytest.mark.parametrize('max_concurrency', [1, 3], indirect=True)
+    def test_map_terms_raises_first_error(self, hashi_vault_lookup_module, max_concurrency):
+        def _func(term):
+            if term.startswith('bad'):
+                raise AnsibleError("failed on %s" % term)
+            return term
+
+        with pytest.raises(AnsibleError, match=r'^failed on bad1$'):
+            hashi_vault_lookup_module.map_terms(mock.MagicMock(), _func, ['good1', 'bad1', 'good2', 'bad2'])
+
+    @pytest.mark.parametrize('max_concurrency', [0, -1], indirect=True)
+    def test_map_terms_invalid_max_concurrency(self, hashi_vault_lookup_module, max_concurrency):
+        with pytest.raises(AnsibleOptionsError, match=r'max_concurrency must be 1 or greater'):
+            hashi_vault_lookup_module.map_terms(mock.MagicMock(), lambda term: term, ['a'])
+
+    @pytest.mark.parametrize('max_concurrency', [16], indirect=True)
+    def test_map_terms_grows_connection_pool(self, hashi_vault_lookup_module, max_concurrency):
+        from requests import Session
+
+        client = mock.MagicMock()
+        client.session = Session()
+
+        hashi_vault_lookup_module.map_terms(client, lambda term: term, ['t%i' % i for i in range(20)])
+
+        for adapter in client.session.adapters.values():
+            assert adapter._pool_maxsize == 16
+
+    @pytest.mark.parametrize('max_concurrency', [1, 4], indirect=True)
+    @pytest.mark.parametrize('prefix,expected', [
+        ('', ['a/b/c', 'a/d', 'a/e/f/g', 'h']),
+        ('a/', ['a/b/c', 'a/d', 'a/e/f/g']),
+        ('a/e', ['a/e/f/g']),
+    ])
+    def test_list_tree(self, hashi_vault_lookup_module, max_concurrency, prefix, expected):
+        tree = {
+            '': ['a/', 'h'],
+            'a': ['e/', 'd', 'b/'],
+            'a/b': ['c'],
+            'a/e': ['f/'],
+            'a/e/f': ['g'],
+        }
+        listed = []
+
+        def _list(path):
+            listed.append(path)
+            return tree[path]
+
+        def _list_folders(folders):
+            return hashi_vault_lookup_module.map_terms(mock.MagicMock(), _list, folders)
+
+        assert hashi_vault_lookup_module.list_tree(_list_folders, prefix) == expected
+        assert sorted(listed) == sorted(path for path in tree if path.startswith(prefix.rstrip('/')))
+
+    @pytest.mark.parametrize('max_depth,skipped,expected', [
+        (1, [], ['a/', 'h']),
+        (2, [], ['a/b/', 'a/d', 'a/e/', 'h']),
+        (None, ['a/e/'], ['a/b/c', 'a/d', 'h']),
+        (2, ['a/b/'], ['a/d', 'a/e/', 'h']),
+    ])
+    def test_list_tree_depth_and_skip(self, hashi_vault_lookup_module, max_depth, skipped, expected):
+        tree = {
+            '': ['a/', 'h'],
+            'a': ['e/', 'd', 'b/'],
+            'a/b': ['c'],
+            'a/e': ['f/'],
+            'a/e/f': ['g'],
+        }
+        calls = []
+
+        def _list_folders(folders):
+            calls.append(folders)
+            return [tree[folder] for folder in folders]
+
+        result = hashi_vault_lookup_module.list_tree(_list_folders, '', max_depth=max_depth, skip=lambda path: path in skipped)
+
+        assert result == expected
+        assert len(calls) <= (max_depth or len(calls))
+        assert not any(folder + '/' in skipped for folders in calls for folder in folders)
+
+    def _handle(self, term, get_result):
+        try:
+            return (term, get_result())
+        except KeyError as e:
+            return (term, 'error: %s' % e)
+
+    def test_map_requests_threads(self, hashi_vault_lookup_module, options, client):
+        fetch = mock.Mock(side_effect=lambda term: term.upper())
+
+        with mock.patch.object(HashiVaultAsyncEngine, 'run') as run:
+            result = hashi_vault_lookup_module.map_requests(client, ['a', 'b'], fetch, HashiVaultAsyncOperation.read, self._handle)
+
+        run.assert_not_called()
+        assert result == [('a', 'A'), ('b', 'B')]
+
+    def test_map_requests_async(self, hashi_vault_lookup_module, options, client, client_args):
+        options.update(concurrency_engine='async', max_concurrency=5)
+        fetch = mock.Mock()
+
+        with mock.patch.object(HashiVaultAsyncEngine, 'run', return_value=[{'a': 1}, KeyError('bad')]) as run:
+            result = hashi_vault_lookup_module.map_requests(client, ['a', 'b'], fetch, HashiVaultAsyncOperation.list, self._handle)
+
+        fetch.assert_not_called()
+        assert result == [('a', {'a': 1}), ('b', "error: 'bad'")]
+
+        operations = run.call_args[0][0]
+        assert [(o.method, o.path) for o in operations] == [('LIST', 'a'), ('LIST', 'b')]
+        assert run.call_args[1] == {'return_exceptions': True}
+
+    def test_map_requests_async_cache(self, hashi_vault_lookup_module, options, client, client_args, tmp_path):
+        options.update(concurrency_engine='async', cache=True, cache_ttl=60, stats_file=str(tmp_path / 'stats.jsonl'))
+        HashiVaultReadCache.get_instance().clear()
+
+        try:
+            with mock.patch.object(HashiVaultAsyncEngine, 'run', side_effect=lambda ops, **kwargs: [{'path': o.path} for o in ops]) as run:
+                hashi_vault_lookup_module.map_requests(client, ['a'], None, HashiVaultAsyncOperation.read, self._handle, cache_method='read')
+                result = hashi_vault_lookup_module.map_requests(client, ['a', 'b'], None, HashiVaultAsyncOperation.read, self._handle, cache_method='read')
+        finally:
+            HashiVaultReadCache.get_instance().clear()
+
+        assert result == [('a', {'path': 'a'}), ('b', {'path': 'b'})]
+        assert [[o.path for o in c[0][0]] for c in run.call_args_list] == [['a'], ['b']]
+        assert [r['cache'] for r in hashi_vault_lookup_module.request_stats.get_records()] == ['miss', 'hit', 'miss']
+
+    def test_map_requests_threads_cache_stats(self, hashi_vault_lookup_module, options, client, tmp_path):
+        options.update(cache=True, cache_ttl=60, stats_file=str(tmp_path / 'stats.jsonl'))
+        HashiVaultReadCache.get_instance().clear()
+
+        try:
+            for i in range(2):
+                hashi_vault_lookup_module.map_requests(client, ['secret/data/a'], lambda term: {'path': term}, None, self._handle, cache_method='read')
+        finally:
+            HashiVaultReadCache.get_instance().clear()
+
+        records = hashi_vault_lookup_module.request_stats.get_records()
+        assert [(r['path'], r['cache']) for r in records] == [('secret/data/*', 'miss'), ('secret/data/*', 'hit')]
+
+    @pytest.mark.parametrize('cache', [True, False])
+    def test_cached_read_shareable(self, hashi_vault_lookup_module, options, client, cache):
+        options.update(cache=cache, cache_ttl=60)
+        HashiVaultReadCache.get_instance().clear()
+
+        def _fetch():
+            return {'shareable': getattr(HashiVaultBrokerAdapter._local, 'shareable', False)}
+
+        try:
+            first = hashi_vault_lookup_module.cached_read(client, 'read', 'secret/data/a', _fetch)
+            # a stale result isn't shared, since the broker may hold the same stale result
+            stale = hashi_vault_lookup_module.cached_read(client, 'read', 'secret/data/a', _fetch, revalidate=lambda cached: False)
+        finally:
+            HashiVaultReadCache.get_instance().clear()
+
+        assert first == {'shareable': cache}
+        assert stale == {'shareable': False}
+        assert not getattr(HashiVaultBrokerAdapter._local, 'shareable', False)
+
+    def test_cached_read_revalidate(self, hashi_vault_lookup_module, options, client, tmp_path):
+        options.update(cache=True, cache_ttl=60, stats_file=str(tmp_path / 'stats.jsonl'))
+        HashiVaultReadCache.get_instance().clear()
+        fetch = mock.Mock(side_effect=[{'version': 1}, {'version': 2}])
+        revalidate = mock.Mock(side_effect=[True, False])
+
+        try:
+            with mock.patch.object(hashi_vault_lookup_module, '_set_read_cache', wraps=hashi_vault_lookup_module._set_read_cache) as set_read_cache:
+                results = [
+                    hashi_vault_lookup_module.cached_read(client, 'read', 'secret/data/a', fetch, revalidate=revalidate)
+                    for i in range(3)
+                ]
+        finally:
+            HashiVaultReadCache.get_instance().clear()
+
+        assert results == [{'version': 1}, {'version': 1}, {'version': 2}]
+        assert revalidate.call_args_list == [mock.call({'version': 1}), mock.call({'version': 1})]
+        assert fetch.call_count == 2
+
+        # the revalidated result is cached again, to renew it
+        assert [c[0][2] for c in set_read_cache.call_args_list] == [{'version': 1}, {'version': 1}, {'version': 2}]
+        assert [r['cache'] for r in hashi_vault_lookup_module.request_stats.get_records()] == ['miss', 'hit', 'miss']
+
+    @pytest.mark.parametrize('engine', ['threads', 'async'])
+    def test_map_requests_cache_path_revalidate(self, hashi_vault_lookup_module, options, client, client_args, tmp_path, engine):
+        options.update(concurrency_engine=engine, cache=True, cache_ttl=60, stats_file=str(tmp_path / 'stats.jsonl'))
+        fetch = mock.Mock(side_effect=lambda term: {'path': term})
+        current = {'a': True, 'b': False}
+
+        def _map():
+            with mock.patch.object(HashiVaultAsyncEngine, 'run', side_effect=lambda ops, **kwargs: [fetch(o.path) for o in ops]):
+                return hashi_vault_lookup_module.map_requests(
+                    client, ['a', 'b'], fetch, HashiVaultAsyncOperation.read, self._handle,
+                    cache_method='read', cache_path=lambda term: 'kv/' + term, version=2, revalidate=lambda term, result: current[term],
+                )
+
+        HashiVaultReadCache.get_instance().clear()
+        try:
+            _map()
+            result = _map()
+        finally:
+            HashiVaultReadCache.get_instance().clear()
+
+        assert result == [('a', {'path': 'a'}), ('b', {'path': 'b'})]
+        # b isn't current, so it's read again
+        assert [c[0][0] for c in fetch.call_args_list] == ['a', 'b', 'b']
+
+        records = hashi_vault_lookup_module.request_stats.get_records()
+        assert [r['cache'] for r in records] == ['miss', 'miss', 'hit', 'miss']
+
+    @pytest.mark.parametrize('engine', ['threads', 'async'])
+    def test_map_requests_cache_plugin(self, hashi_vault_lookup_module, options, client, client_args, tmp_path, engine):
+        options.update(
+            concurrency_engine=engine, cache=True, cache_ttl=60, stats_file=str(tmp_path / 'stats.jsonl'),
+            cache_plugin='ansible.builtin.jsonfile', cache_plugin_connection=str(tmp_path), cache_plugin_prefix='hv_',
+        )
+        fetch = mock.Mock(side_effect=lambda term: {'path': term})
+
+        try:
+            with mock.patch.object(HashiVaultAsyncEngine, 'run', side_effect=lambda ops, **kwargs: [{'path': o.path} for o in ops]) as run:
+                for i in range(2):
+                    # as if each call were in a new process, with nothing cached in memory
+                    HashiVaultReadCache.get_instance().clear()
+                    result = hashi_vault_lookup_module.map_requests(client, ['a'], fetch, HashiVaultAsyncOperation.read, self._handle, cache_method='read')
+        finally:
+            HashiVaultReadCache.get_instance().clear()
+
+        assert result == [('a', {'path': 'a'})]
+        assert fetch.call_count + sum(len(c[0][0]) for c in run.call_args_list) == 1
+        assert [r['cache'] for r in hashi_vault_lookup_module.request_stats.get_records()] == ['miss', 'hit']
+        assert [f.name for f in tmp_path.iterdir() if f.name.startswith('hv_')]
+
+    def test_cached_read_cache_plugin_without_token(self, hashi_vault_lookup_module, options, client, tmp_path):
+        options.update(cache=True, cache_plugin='ansible.builtin.jsonfile', cache_plugin_connection=str(tmp_path))
+        client.token = None
+        fetch = mock.Mock()
+
+        with pytest.raises(AnsibleOptionsError, match="cache_plugin can't be used without a Vault token"):
+            hashi_vault_lookup_module.cached_read(client, 'read', 'secret/data/a', fetch)
+
+        fetch.assert_not_called()
+        assert list(tmp_path.iterdir()) == []
+
+    def test_get_async_engine(self, hashi_vault_lookup_module, options, client, client_args):
+        options.update(retries={'total': 3}, retry_deadline=10, max_concurrency=7)
+
+        engine = hashi_vault_lookup_module.get_async_engine(client)
+
+        assert engine.url == 'http://vault:8200'
+        # from the processed connection options, rather than the client's internals
+        assert engine.verify == '/ca.pem'
+        assert engine.timeout == 7
+        assert engine.proxies == {'http': 'http://proxy:3128'}
+        assert engine.retries == {'total': 3}
+        assert engine.retry_deadline == 10
+        assert engine.max_concurrency == 7
+        # only while there's a trace
+        assert engine.tracer is None
+
+    @pytest.mark.parametrize('opts,match', [
+        (dict(url='http://vault1:8200, http://vault2:8200'), 'a url with multiple addresses'),
+        (dict(broker=True), 'broker'),
+        (dict(circuit_breaker={'threshold': 5}), 'circuit_breaker'),
+    ])
+    def test_get_async_engine_unsupported(self, hashi_vault_lookup_module, options, client, opts, match):
+        options.update(opts)
+
+        with pytest.raises(AnsibleOptionsError, match="async concurrency engine can't be used with %s" % match):
+            hashi_vault_lookup_module.get_async_engine(client)
+
+    def test_get_async_engine_unavailable(self, hashi_vault_lookup_module, options, client, client_args):
+        with mock.patch('ansible_collections.community.hashi_vault.plugins.module_utils._async_engine.HAS_AIOHTTP', False):
+            with pytest.raises(AnsibleOptionsError, match='aiohttp'):
+                hashi_vault_lookup_module.get_async_engine(client)
+
+    def test_imports_are_lazy(self):
+        # in a new process, since hvac and aiohttp are already imported in this one
+        collections_path = os.path.abspath(os.path.join(os.path.dirname(__file__), *(['..'] * 8)))
+        code = (
+            'import sys, json; '
+            'import ansible_collections.community.hashi_vault.plugins.lookup.vault_read; '
+            'print(json.dumps([name for name in ("hvac", "aiohttp") if name in sys.modules]))'
+        )
+
+        output = subprocess.check_output([sys.executable, '-c', code], env=dict(os.environ, PYTHONPATH=collections_path))
+
+        assert json.loads(output) == []
@@ -6,7 +6,8 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
-import builtins
+import json
+import sys
 
 import pytest
 
@@ -25,18 +26,11 @@ def hashi_vault_plugin():
 
 
 @pytest.fixture
-def hvac_fail_import_hook():
-    original_import = builtins.__import__
-
-    def _mock(name: str, *args, **kwargs):
-        if name == 'hvac':
-            raise ImportError('test case module import failure')
-        return original_import(name, *args, **kwargs)
-
-    with mock.patch.object(builtins, '__import__', _mock):
-        yield
-
-    builtins.__import__ = original_import
+def hvac_not_installed():
+    with mock.patch.dict(sys.modules):
+        sys.modules.pop('hvac')
+        with mock.patch('ansible_collections.community.hashi_vault.plugins.module_utils._hashi_vault_common.find_spec', return_value=None):
+            yield
 
 
 class TestHashiVaultPlugin(object):
@@ -47,7 +41,7 @@ class TestHashiVaultPlugin(object):
     def test_has_option_adapter(self, hashi_vault_plugin):
         assert hasattr(hashi_vault_plugin, '_options_adapter') and issubclass(type(hashi_vault_plugin._options_adapter), HashiVaultOptionAdapter)
 
-    def test_raises_ansible_error_when_hvac_missing(self, hvac_fail_import_hook):
+    def test_raises_ansible_error_when_hvac_missing(self, hvac_not_installed):
         with pytest.raises(AnsibleError) as hvac_import:
             HashiVaultPlugin()
         assert hvac_import.value._message.startswith("Failed to import the required Python library (hvac) on")
@@ -55,3 +49,98 @@ class TestHashiVaultPlugin(object):
     # TODO: remove when deprecate() is no longer needed
     def test_has_process_deprecations(self, hashi_vault_plugin):
         assert hasattr(hashi_vault_plugin, 'process_deprecations') and callable(hashi_vault_plugin.process_deprecations)
+
+    def test_request_stats_hook(self, hashi_vault_plugin):
+        assert hashi_vault_plugin.request_stats.response_hook in hashi_vault_plugin.helper.response_hooks
+
+    @pytest.mark.parametrize('stats_file', [None, 'stats.jsonl'])
+    def test_request_stats_file(self, hashi_vault_plugin, tmp_path, stats_file):
+        path = None if stats_file is None else str(tmp_path / stats_file)
+
+        with mock.patch.object(hashi_vault_plugin._options_adapter, 'get_option_default', return_value=path):
+            hashi_vault_plugin.request_stats.record('GET', 'http://vault:8200/v1/secret/data/one', 200, 0.1)
+            hashi_vault_plugin.request_stats.record('GET', 'http://vault:8200/v1/secret/data/two', 200, 0.1)
+
+            # nothing is written until the end of the call
+            assert list(tmp_path.iterdir()) == []
+
+            hashi_vault_plugin._write_request_stats()
+
+        assert hashi_vault_plugin.request_stats.get_records() == []
+
+        if path is None:
+            assert list(tmp_path.iterdir()) == []
+        else:
+            with open(path) as f:
+                records = [json.loads(line) for line in f]
+
+            assert len(records) == 2
+            assert records[0]['path'] == 'secret/data/*'
+            assert 'plugin' in records[0]
+            assert 'pid' in records[0]
+
+    def test_trace_call_without_trace_file(self, hashi_vault_plugin):
+        with mock.patch.object(hashi_vault_plugin._options_adapter, 'get_option_default', return_value=None):
+            with hashi_vault_plugin.trace_call({}):
+                assert not hashi_vault_plugin.tracer.started
+                assert hashi_vault_plugin.helper.request_hooks == []
+                assert hashi_vault_plugin.tracer.response_hook not in hashi_vault_plugin.helper.response_hooks
+                assert hashi_vault_plugin.authenticator.tracer is None
+
+    @pytest.mark.parametrize('fail', [False, True])
+    def test_trace_call(self, hashi_vault_plugin, tmp_path, fail):
+        path = str(tmp_path / 'traces.jsonl')
+
+        with mock.patch.object(hashi_vault_plugin._options_adapter, 'get_option_default', return_value=path):
+            with pytest.raises(ValueError) if fail else mock.MagicMock():
+                with hashi_vault_plugin.trace_call({'ansible.plugin.type': 'test'}):
+                    assert hashi_vault_plugin.tracer.started
+                    assert hashi_vault_plugin.tracer.request_hook in hashi_vault_plugin.helper.request_hooks
+                    assert hashi_vault_plugin.tracer.response_hook in hashi_vault_plugin.helper.response_hooks
+                    assert hashi_vault_plugin.authenticator.tracer is hashi_vault_plugin.tracer
+                    if fail:
+                        raise ValueError('failed')
+
+        assert not hashi_vault_plugin.tracer.started
+        assert hashi_vault_plugin.helper.request_hooks == []
+        assert hashi_vault_plugin.tracer.response_hook not in hashi_vault_plugin.helper.response_hooks
+        assert hashi_vault_plugin.authenticator.tracer is None
+
+        with open(path) as f:
+            root = json.loads(f.read())['resourceSpans'][0]['scopeSpans'][0]['spans'][0]
+
+        assert root['status'] == ({'code': 2, 'message': 'failed'} if fail else {})
+
+    def test_trace_call_started_by_set_options(self, hashi_vault_plugin, tmp_path):
+        options = {}
+
+        with mock.patch.object(hashi_vault_plugin._options_adapter, 'get_option_default', side_effect=lambda key, default=None: options.get(key, default)):
+            with mock.patch.object(AnsiblePlugin, 'set_options'):
+                with hashi_vault_plugin.trace_call({}):
+                    assert not hashi_vault_plugin.tracer.started
+
+                    options['trace_file'] = str(tmp_path / 'traces.jsonl')
+                    hashi_vault_plugin.set_options(direct={'trace_file': options['trace_file']})
+
+                    assert hashi_vault_plugin.tracer.started
+
+                # outside of a call, nothing is traced
+                hashi_vault_plugin.set_options()
+                assert not hashi_vault_plugin.tracer.started
+
+    @pytest.mark.parametrize('trace_file', [None, 'traces.jsonl'])
+    def test_trace_file(self, hashi_vault_plugin, tmp_path, trace_file):
+        path = None if trace_file is None else str(tmp_path / trace_file)
+
+        hashi_vault_plugin.tracer.start('plugin')
+        with mock.patch.object(hashi_vault_plugin._options_adapter, 'get_option_default', return_value=path):
+            hashi_vault_plugin.tracer.end()
+
+        if path is None:
+            assert list(tmp_path.iterdir()) == []
+        else:
+            with open(path) as f:
+                documents = [json.loads(line) for line in f]
+
+            assert len(documents) == 1
+            assert documents[0]['resourceSpans'][0]['scopeSpans'][0]['spans'][0]['name'] == 'plugin'
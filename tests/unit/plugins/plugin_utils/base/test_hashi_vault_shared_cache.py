@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import os
+
+import pytest
+
+from ansible.errors import AnsibleError, AnsibleOptionsError
+
+from ......plugins.module_utils._read_cache import HashiVaultReadCache
+from ......plugins.plugin_utils._hashi_vault_shared_cache import HashiVaultSharedReadCache
+from ......tests.unit.compat import mock
+
+
+@pytest.fixture(autouse=True)
+def clear_backends():
+    HashiVaultSharedReadCache._backends.clear()
+    yield
+    HashiVaultSharedReadCache._backends.clear()
+
+
+@pytest.fixture
+def clock():
+    clock = mock.Mock(return_value=1000.0)
+    with mock.patch.object(HashiVaultSharedReadCache, '_clock', clock):
+        yield clock
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    return str(tmp_path / 'cache')
+
+
+@pytest.fixture
+def make_cache(cache_dir):
+    def _make_cache():
+        # a new in-memory cache each time, like another worker process, or a later run
+        return HashiVaultSharedReadCache.from_plugin(HashiVaultReadCache(), 'ansible.builtin.jsonfile', connection=cache_dir, prefix='hv_', timeout=60)
+
+    return _make_cache
+
+
+def _key(token='s.token', path='secret/data/one'):
+    return HashiVaultSharedReadCache.make_key(url='http://vault:8200', namespace=None, token=token, method='read', path=path)
+
+
+class TestHashiVaultSharedReadCache(object):
+
+    def test_shared_between_caches(self, make_cache, clock):
+        value = {'data': {'password': 'hunter2'}}
+
+        make_cache().set(_key(), value, 30)
+
+        other = make_cache()
+        assert other.get(_key()) == value
+        assert other.get(_key(path='secret/data/two')) is None
+
+        # once read from the cache plugin, it's in memory too
+        other.backend = None
+        assert other.get(_key()) == value
+
+    def test_encrypted_at_rest(self, make_cache, cache_dir, clock):
+        make_cache().set(_key(), {'data': {'password': 'hunter2'}}, 30)
+
+        contents = ''
+        for entry in os.scandir(cache_dir):
+            with open(entry.path) as f:
+                contents += f.read()
+
+        assert contents
+        for plain in ('hunter2', 'password', 'secret/data/one', 's.token', 'vault:8200'):
+            assert plain not in contents
+
+    def test_other_token(self, make_cache, clock):
+        make_cache().set(_key(), {'data': {}}, 30)
+
+        assert make_cache().get(_key(token='s.other')) is None
+
+    @pytest.mark.parametrize('entry', [
+        {'expires': 2000.0, 'data': 'garbage'},
+        {'expires': 2000.0},
+        {'data': 'garbage'},
+        'garbage',
+    ])
+    def test_invalid_entry(self, make_cache, clock, entry):
+        cache = make_cache()
+        entry_id, encryption_key = cache.derive('s.token', _key()[0])
+        cache.backend.set(entry_id, entry)
+
+        assert make_cache().get(_key()) is None
+
+    @pytest.mark.parametrize('token', [None, ''])
+    def test_no_token(self, token):
+        with pytest.raises(AnsibleOptionsError, match="cache_plugin can't be used without a Vault token"):
+            _key(token=token)
+
+        with pytest.raises(ValueError):
+            HashiVaultSharedReadCache.derive(token, 'key')
+
+    def test_expires(self, make_cache, clock):
+        make_cache().set(_key(), {'data': {}}, 30)
+
+        clock.return_value = 1029.0
+        assert make_cache().get(_key()) == {'data': {}}
+
+        clock.return_value = 1030.0
+        assert make_cache().get(_key()) is None
+
+    @pytest.mark.parametrize('ttl', [None, 0, -1])
+    def test_not_cached_without_ttl(self, make_cache, clock, ttl):
+        cache = make_cache()
+        cache.set(_key(), {'data': {}}, ttl)
+
+        assert cache.backend.keys() == []
+        assert cache.get(_key()) is None
+
+    def test_unserializable(self, make_cache, clock):
+        cache = make_cache()
+        cache.set(_key(), {'data': object()}, 30)
+
+        assert cache.backend.keys() == []
+
+    def test_backend_loaded_once(self, make_cache):
+        assert make_cache().backend is make_cache().backend
+
+    @pytest.mark.parametrize('exc', [AnsibleError('unreachable'), OSError('unreachable')])
+    def test_backend_read_error(self, make_cache, clock, exc):
+        cache = make_cache()
+        cache.backend = mock.Mock()
+        cache.backend.get.side_effect = exc
+
+        with mock.patch('ansible_collections.community.hashi_vault.plugins.plugin_utils._hashi_vault_shared_cache.display') as display:
+            assert cache.get(_key()) is None
+
+        display.warning.assert_called_once()
+        assert 'unreachable' in display.warning.call_args[0][0]
+
+    @pytest.mark.parametrize('exc', [AnsibleError('unreachable'), OSError('unreachable')])
+    def test_backend_write_error(self, make_cache, clock, exc):
+        cache = make_cache()
+        cache.backend = mock.Mock()
+        cache.backend.set.side_effect = exc
+
+        with mock.patch('ansible_collections.community.hashi_vault.plugins.plugin_utils._hashi_vault_shared_cache.display') as display:
+            cache.set(_key(), {'data': {}}, 30)
+
+        display.warning.assert_called_once()
+        assert 'unreachable' in display.warning.call_args[0][0]
+
+        # it's still cached in memory
+        assert cache.get(_key()) == {'data': {}}
+
+    def test_unknown_plugin(self):
+        with pytest.raises(AnsibleOptionsError, match=r"^Unable to load the cache plugin 'community\.hashi_vault\.nope' \(cache_plugin\)"):
+            HashiVaultSharedReadCache.from_plugin(HashiVaultReadCache(), 'community.hashi_vault.nope')
+
+    def test_memory_hit(self, make_cache, clock):
+        cache = make_cache()
+        cache.memory.set(_key()[0], {'data': 'memory'}, 30)
+        cache.backend = mock.Mock()
+
+        assert cache.get(_key()) == {'data': 'memory'}
+        cache.backend.get.assert_not_called()
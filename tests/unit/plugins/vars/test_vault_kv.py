@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+
+from ansible.errors import AnsibleError, AnsibleOptionsError
+from ansible.inventory.data import InventoryData
+from ansible.plugins.loader import vars_loader
+from ansible.plugins.vars import BaseVarsPlugin
+
+from ...compat import mock
+from .....plugins.plugin_utils._hashi_vault_plugin import HashiVaultPlugin
+
+hvac = pytest.importorskip('hvac')
+
+
+def _reset(cls):
+    # the settings and variables are kept for the whole process
+    cls._settings = None
+    cls._revalidate_with = None
+    cls._secrets.clear()
+    cls._entity_secrets.clear()
+
+
+@pytest.fixture
+def vault_kv_vars():
+    plugin = vars_loader.get('community.hashi_vault.vault_kv')
+    _reset(type(plugin))
+    yield plugin
+    _reset(type(plugin))
+
+
+@pytest.fixture
+def inventory():
+    inventory = InventoryData()
+    inventory.add_group('web')
+    inventory.add_group('db')
+    inventory.add_host('web1', group='web')
+    inventory.add_host('web2', group='web')
+    inventory.add_host('db1', group='db')
+    inventory.reconcile_inventory()
+    return inventory
+
+
+@pytest.fixture
+def stand_in(vault_stand_in, monkeypatch):
+    monkeypatch.setenv('ANSIBLE_HASHI_VAULT_ADDR', vault_stand_in.url)
+    monkeypatch.setenv('ANSIBLE_HASHI_VAULT_AUTH_METHOD', 'token')
+    monkeypatch.setenv('ANSIBLE_HASHI_VAULT_TOKEN', vault_stand_in.root_token)
+
+    vault_stand_in.put_secret('secret', 'group_vars/all', {'from_all': 1, 'shared': 'all'})
+    vault_stand_in.put_secret('secret', 'group_vars/web', {'port': 8080, 'shared': 'web'})
+    vault_stand_in.put_secret('secret', 'host_vars/web1', {'shared': 'web1'})
+
+    return vault_stand_in
+
+
+def _reads(stand_in):
+    return [path for method, path in stand_in.requests if method == 'GET' and path.startswith('secret/data/')]
+
+
+class TestVaultKvVars(object):
+
+    def test_vault_kv_is_plugin(self, vault_kv_vars):
+        assert isinstance(vault_kv_vars, HashiVaultPlugin)
+        assert isinstance(vault_kv_vars, BaseVarsPlugin)
+
+    @pytest.mark.parametrize('max_concurrency', ['1', '4'])
+    def test_vault_kv_reads_inventory_once(self, vault_kv_vars, inventory, stand_in, monkeypatch, max_concurrency):
+        monkeypatch.setenv('ANSIBLE_HASHI_VAULT_MAX_CONCURRENCY', max_concurrency)
+
+        assert vault_kv_vars.get_vars(None, '/fake', [inventory.hosts['web1']]) == {'shared': 'web1'}
+
+        # every host and group was read with the first call
+        assert sorted(_reads(stand_in)) == [
+            'secret/data/group_vars/all',
+            'secret/data/group_vars/db',
+            'secret/data/group_vars/ungrouped',
+            'secret/data/group_vars/web',
+            'secret/data/host_vars/db1',
+            'secret/data/host_vars/web1',
+            'secret/data/host_vars/web2',
+        ]
+
+        del stand_in.requests[:]
+
+        assert vault_kv_vars.get_vars(None, '/fake', [inventory.groups['all'], inventory.groups['web']]) == {
+            'from_all': 1,
+            'port': 8080,
+            'shared': 'web',
+        }
+        assert vault_kv_vars.get_vars(None, '/other', inventory.hosts['db1']) == {}
+        assert stand_in.requests == []
+
+    def test_vault_kv_later_calls_look_up_entities(self, vault_kv_vars, inventory, stand_in):
+        vault_kv_vars.get_vars(None, '/fake', [inventory.hosts['web1']])
+        del stand_in.requests[:]
+
+        # each call gets a new instance of the plugin, which doesn't process its options or walk the inventory again
+        plugin = vars_loader.get('community.hashi_vault.vault_kv')
+        with mock.patch.object(HashiVaultPlugin, 'set_options') as set_options:
+            with mock.patch.object(type(plugin), '_get_inventory') as get_inventory:
+                assert plugin.get_vars(None, '/fake', [inventory.groups['web'], inventory.hosts['web2']]) == {'port': 8080, 'shared': 'web'}
+
+        set_options.assert_not_called()
+        get_inventory.assert_not_called()
+        assert stand_in.requests == []
+
+    def test_vault_kv_kept_without_revalidate(self, vault_kv_vars, inventory, stand_in):
+        vault_kv_vars.get_vars(None, '/fake', [inventory.groups['web']])
+        stand_in.put_secret('secret', 'group_vars/web', {'port': 8443})
+        del stand_in.requests[:]
+
+        assert vault_kv_vars.get_vars(None, '/fake', [inventory.groups['web']]) == {'port': 8080, 'shared': 'web'}
+        assert stand_in.requests == []
+
+    @pytest.mark.parametrize('revalidate_with', ['metadata', 'subkeys'])
+    def test_vault_kv_revalidate(self, vault_kv_vars, inventory, stand_in, monkeypatch, revalidate_with):
+        monkeypatch.setenv('ANSIBLE_HASHI_VAULT_VARS_CACHE_REVALIDATE', 'true')
+        monkeypatch.setenv('ANSIBLE_HASHI_VAULT_VARS_REVALIDATE_WITH', revalidate_with)
+
+        vault_kv_vars.get_vars(None, '/fake', [inventory.hosts['web1']])
+        stand_in.put_secret('secret', 'group_vars/web', {'port': 8443})
+        stand_in.put_secret('secret', 'host_vars/web2', {'shared': 'web2'})
+        del stand_in.requests[:]
+
+        plugin = vars_loader.get('community.hashi_vault.vault_kv')
+        entities = [inventory.groups['all'], inventory.groups['web'], inventory.hosts['web1'], inventory.hosts['web2']]
+        assert plugin.get_vars(None, '/fake', entities) == {'from_all': 1, 'port': 8443, 'shared': 'web2'}
+
+        # every secret is checked, but only the ones that changed or were created are read again
+        checks = [path for method, path in stand_in.requests if path.startswith('secret/%s/' % revalidate_with)]
+        assert sorted(checks) == [
+            'secret/%s/group_vars/all' % revalidate_with,
+            'secret/%s/group_vars/web' % revalidate_with,
+            'secret/%s/host_vars/web1' % revalidate_with,
+            'secret/%s/host_vars/web2' % revalidate_with,
+        ]
+        assert sorted(_reads(stand_in)) == ['secret/data/group_vars/web', 'secret/data/host_vars/web2']
+
+        del stand_in.requests[:]
+
+        # the secrets that were read again are kept for the hosts and groups that share them
+        assert plugin.get_vars(None, '/fake', [inventory.hosts['web2']]) == {'shared': 'web2'}
+        assert _reads(stand_in) == []
+
+    def test_vault_kv_revalidate_deleted(self, vault_kv_vars, inventory, stand_in, monkeypatch):
+        monkeypatch.setenv('ANSIBLE_HASHI_VAULT_VARS_CACHE_REVALIDATE', 'true')
+
+        vault_kv_vars.get_vars(None, '/fake', [inventory.hosts['web1']])
+        client = hvac.Client(url=stand_in.url, token=stand_in.root_token)
+        client.secrets.kv.v2.delete_latest_version_of_secret(path='host_vars/web1')
+
+        assert vault_kv_vars.get_vars(None, '/fake', [inventory.hosts['web1']]) == {}
+
+    def test_vault_kv_revalidate_check_fails(self, vault_kv_vars, inventory, stand_in, monkeypatch):
+        monkeypatch.setenv('ANSIBLE_HASHI_VAULT_VARS_CACHE_REVALIDATE', 'true')
+
+        vault_kv_vars.get_vars(None, '/fake', [inventory.groups['web']])
+        stand_in.fail(403, path='secret/metadata/group_vars/web')
+        del stand_in.requests[:]
+
+        assert vault_kv_vars.get_vars(None, '/fake', [inventory.groups['web']]) == {'port': 8080, 'shared': 'web'}
+        assert _reads(stand_in) == ['secret/data/group_vars/web']
+
+    def test_vault_kv_url_required(self, vault_kv_vars, inventory, stand_in, monkeypatch):
+        monkeypatch.delenv('ANSIBLE_HASHI_VAULT_ADDR')
+        monkeypatch.delenv('VAULT_ADDR', raising=False)
+
+        with pytest.raises(AnsibleError, match=r'^Required option url was not set'):
+            vault_kv_vars.get_vars(None, '/fake', [inventory.hosts['web1']])
+
+    def test_vault_kv_reads_new_entities(self, vault_kv_vars, inventory, stand_in):
+        vault_kv_vars.get_vars(None, '/fake', [inventory.groups['all']])
+
+        inventory.add_host('web3', group='web')
+        inventory.reconcile_inventory()
+        stand_in.put_secret('secret', 'host_vars/web3', {'shared': 'web3'})
+        del stand_in.requests[:]
+
+        assert vault_kv_vars.get_vars(None, '/fake', [inventory.hosts['web3']]) == {'shared': 'web3'}
+        assert _reads(stand_in) == ['secret/data/host_vars/web3']
+
+    def test_vault_kv_path_template(self, vault_kv_vars, inventory, stand_in, monkeypatch):
+        monkeypatch.setenv('ANSIBLE_HASHI_VAULT_VARS_ENGINE_MOUNT_POINT', 'other')
+        monkeypatch.setenv('ANSIBLE_HASHI_VAULT_VARS_PATH_TEMPLATE', 'ansible/{type}/{name}/')
+        stand_in.enable_kv('other')
+        stand_in.put_secret('other', 'ansible/host/db1', {'role': 'primary'})
+
+        assert vault_kv_vars.get_vars(None, '/fake', [inventory.hosts['db1']]) == {'role': 'primary'}
+        assert 'other/data/ansible/group/all' in [path for method, path in stand_in.requests]
+
+    @pytest.mark.parametrize('template', ['{kind}/{name}', '{0}', '{name'])
+    def test_vault_kv_invalid_path_template(self, vault_kv_vars, inventory, stand_in, monkeypatch, template):
+        monkeypatch.setenv('ANSIBLE_HASHI_VAULT_VARS_PATH_TEMPLATE', template)
+
+        with pytest.raises(AnsibleOptionsError, match=r'^Invalid path_template'):
+            vault_kv_vars.get_vars(None, '/fake', [inventory.hosts['db1']])
+
+        assert stand_in.requests == []
+
+    def test_vault_kv_deleted_secret(self, vault_kv_vars, inventory, stand_in):
+        client = hvac.Client(url=stand_in.url, token=stand_in.root_token)
+        client.secrets.kv.v2.delete_latest_version_of_secret(path='host_vars/web1')
+
+        assert vault_kv_vars.get_vars(None, '/fake', [inventory.groups['web'], inventory.hosts['web1']]) == {'port': 8080, 'shared': 'web'}
+
+    def test_vault_kv_forbidden(self, vault_kv_vars, inventory, stand_in):
+        stand_in.fail(403, path='secret/data/group_vars/db')
+
+        with pytest.raises(AnsibleError, match=r"^Forbidden: Permission Denied to path \['group_vars/db'\]"):
+            vault_kv_vars.get_vars(None, '/fake', [inventory.hosts['web1']])
+
+    def test_vault_kv_login_failure(self, vault_kv_vars, inventory, stand_in, monkeypatch):
+        monkeypatch.setenv('ANSIBLE_HASHI_VAULT_AUTH_METHOD', 'approle')
+        monkeypatch.setenv('ANSIBLE_HASHI_VAULT_ROLE_ID', 'nope')
+        monkeypatch.setenv('ANSIBLE_HASHI_VAULT_SECRET_ID', 'nope')
+
+        with pytest.raises(AnsibleError, match=r'^community.hashi_vault.vault_kv failed to log in to Vault: '):
+            vault_kv_vars.get_vars(None, '/fake', [inventory.hosts['web1']])
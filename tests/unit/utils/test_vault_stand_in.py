@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import time
+
+import pytest
+
+import hvac
+import requests
+
+from ansible.plugins.loader import lookup_loader
+
+from ....tests.utils.vault_stand_in import VaultStandIn
+
+
+@pytest.fixture
+def client(vault_stand_in):
+    return hvac.Client(url=vault_stand_in.url, token=VaultStandIn.ROOT_TOKEN)
+
+
+class TestVaultStandIn(object):
+
+    @pytest.mark.parametrize('role,status', [('active', 200), ('standby', 429), ('performance_standby', 473)])
+    def test_health(self, vault_stand_in, role, status):
+        vault_stand_in.role = role
+
+        response = requests.get(vault_stand_in.url + '/v1/sys/health')
+
+        assert response.status_code == status
+        assert response.json()['sealed'] is False
+        assert response.json()['performance_standby'] is (role == 'performance_standby')
+
+    def test_sealed(self, vault_stand_in, client):
+        vault_stand_in.sealed = True
+
+        assert requests.get(vault_stand_in.url + '/v1/sys/health').json()['sealed'] is True
+        with pytest.raises(hvac.exceptions.VaultDown):
+            client.read('secret/data/app')
+
+        vault_stand_in.sealed = False
+        assert client.read('secret/data/app') is None
+
+    def test_token(self, vault_stand_in, client):
+        assert client.auth.token.lookup_self()['data']['policies'] == ['root']
+
+        client.token = 'bogus'
+        with pytest.raises(hvac.exceptions.Forbidden):
+            client.auth.token.lookup_self()
+        with pytest.raises(hvac.exceptions.Forbidden):
+            client.read('secret/data/app')
+
+    def test_approle(self, vault_stand_in, client):
+        vault_stand_in.add_approle('role', 'secret', policies=['app'])
+
+        response = client.auth.approle.login(role_id='role', secret_id='secret')
+        assert response['auth']['policies'] == ['app']
+        assert client.auth.token.lookup_self()['data']['id'] == response['auth']['client_token']
+
+        with pytest.raises(hvac.exceptions.InvalidRequest):
+            client.auth.approle.login(role_id='role', secret_id='wrong')
+
+    def test_userpass(self, vault_stand_in, client):
+        vault_stand_in.add_userpass('user', 'pass')
+
+        response = client.auth.userpass.login(username='user', password='pass')
+        assert response['auth']['metadata'] == {'username': 'user'}
+
+        with pytest.raises(hvac.exceptions.InvalidRequest):
+            client.auth.userpass.login(username='nobody', password='pass')
+
+    def test_kv2(self, vault_stand_in, client):
+        kv = client.secrets.kv.v2
+
+        assert kv.create_or_update_secret('app/db', {'password': 'one'})['data']['version'] == 1
+        kv.create_or_update_secret('app/db', {'password': 'two', 'nested': {'a': 1}}, cas=1)
+        kv.create_or_update_secret('app/api', {'key': 'k'})
+        vault_stand_in.put_secret('secret', 'other', {'x': 'y'})
+
+        latest = kv.read_secret_version('app/db', raise_on_deleted_version=True)['data']
+        assert latest['data'] == {'password': 'two', 'nested': {'a': 1}}
+        assert latest['metadata']['version'] == 2
+        assert kv.read_secret_version('app/db', version=1, raise_on_deleted_version=True)['data']['data'] == {'password': 'one'}
+
+        with pytest.raises(hvac.exceptions.InvalidRequest, match='check-and-set'):
+            kv.create_or_update_secret('app/db', {'password': 'three'}, cas=1)
+
+        assert kv.list_secrets('')['data']['keys'] == ['app/', 'other']
+        assert kv.list_secrets('app')['data']['keys'] == ['api', 'db']
+        assert client.list('secret/metadata/app')['data']['keys'] == ['api', 'db']
+        with pytest.raises(hvac.exceptions.InvalidPath):
+            kv.list_secrets('missing')
+
+        metadata = kv.read_secret_metadata('app/db')['data']
+        assert metadata['current_version'] == 2
+        assert sorted(metadata['versions']) == ['1', '2']
+
+        subkeys = client.adapter.get('/v1/secret/subkeys/app/db')['data']
+        assert subkeys['subkeys'] == {'password': None, 'nested': {'a': None}}
+
+        kv.delete_latest_version_of_secret('app/db')
+        with pytest.raises(hvac.exceptions.InvalidPath):
+            kv.read_secret_version('app/db', raise_on_deleted_version=True)
+        assert kv.read_secret_version('app/db', raise_on_deleted_version=False)['data']['data'] is None
+
+        kv.undelete_secret_versions('app/db', versions=[2])
+        assert kv.read_secret_version('app/db', raise_on_deleted_version=True)['data']['data']['password'] == 'two'
+
+        kv.delete_secret_versions('app/db', versions=[1])
+        kv.destroy_secret_versions('app/db', versions=[2])
+        assert kv.read_secret_metadata('app/db')['data']['versions']['2']['destroyed'] is True
+
+        kv.delete_metadata_and_all_versions('app/db')
+        with pytest.raises(hvac.exceptions.InvalidPath):
+            kv.read_secret_metadata('app/db')
+
+    def test_kv1(self, vault_stand_in, client):
+        kv = client.secrets.kv.v1
+
+        kv.create_or_update_secret('app/db', {'password': 'one'}, mount_point='kv')
+        kv.create_or_update_secret('app/api', {'key': 'k'}, mount_point='kv')
+
+        assert kv.read_secret('app/db', mount_point='kv')['data'] == {'password': 'one'}
+        assert client.read('kv/app/db')['data'] == {'password': 'one'}
+        assert kv.list_secrets('app', mount_point='kv')['data']['keys'] == ['api', 'db']
+
+        kv.delete_secret('app/db', mount_point='kv')
+        with pytest.raises(hvac.exceptions.InvalidPath):
+            kv.read_secret('app/db', mount_point='kv')
+
+    def test_database_static_creds(self, vault_stand_in, client):
+        vault_stand_in.add_static_role('app', 'app-user', 'app-pass')
+
+        creds = client.secrets.database.get_static_credentials('app')['data']
+        assert (creds['username'], creds['password']) == ('app-user', 'app-pass')
+
+        with pytest.raises(hvac.exceptions.InvalidRequest):
+            client.secrets.database.get_static_credentials('missing')
+
+    @pytest.mark.parametrize('status,exception', [
+        (500, hvac.exceptions.InternalServerError),
+        (429, hvac.exceptions.RateLimitExceeded),
+        (503, hvac.exceptions.VaultDown),
+    ])
+    def test_fail(self, vault_stand_in, client, status, exception):
+        vault_stand_in.put_secret('secret', 'app', {'a': 1})
+        vault_stand_in.fail(status, count=2, retry_after=3 if status == 429 else None)
+
+        for i in range(2):
+            with pytest.raises(exception):
+                client.read('secret/data/app')
+
+        assert client.read('secret/data/app')['data']['data'] == {'a': 1}
+
+    def test_fail_path(self, vault_stand_in, client):
+        vault_stand_in.put_secret('kv', 'app', {'a': 1})
+        vault_stand_in.fail(500, path='/secret/')
+
+        assert client.read('kv/app')['data'] == {'a': 1}
+        with pytest.raises(hvac.exceptions.InternalServerError):
+            client.read('secret/data/app')
+        assert client.read('secret/data/app') is None
+
+    def test_retry_after(self, vault_stand_in):
+        vault_stand_in.fail(429, retry_after=3)
+
+        response = requests.get(vault_stand_in.url + '/v1/secret/data/app', headers={'X-Vault-Token': 'root'})
+        assert response.status_code == 429
+        assert response.headers['Retry-After'] == '3'
+
+    @pytest.mark.parametrize('error_rate,rate_limit_rate,expected', [(1, 0, 500), (0, 1, 429), (0, 0, 404)])
+    def test_fault_rates(self, vault_stand_in, error_rate, rate_limit_rate, expected):
+        vault_stand_in.error_rate = error_rate
+        vault_stand_in.rate_limit_rate = rate_limit_rate
+
+        response = requests.get(vault_stand_in.url + '/v1/secret/data/app', headers={'X-Vault-Token': 'root'})
+        assert response.status_code == expected
+
+        # sys/health reports the state of the server, without faults
+        assert requests.get(vault_stand_in.url + '/v1/sys/health').status_code == 200
+
+    def test_fault_rates_seeded(self):
+        def _statuses():
+            stand_in = VaultStandIn(error_rate=0.3, rate_limit_rate=0.3, seed=42)
+            return [stand_in.handle('GET', 'secret/data/app', {}, {}, 'root')[0] for i in range(20)]
+
+        statuses = _statuses()
+        assert statuses == _statuses()
+        assert set(statuses) == set([404, 429, 500])
+
+    def test_latency(self, vault_stand_in, client):
+        vault_stand_in.latency = (0.05, 0.06)
+
+        start = time.monotonic()
+        assert client.read('secret/data/app') is None
+
+        assert time.monotonic() - start >= 0.05
+
+    def test_requests(self, vault_stand_in, client):
+        client.read('kv/app')
+        client.list('secret/metadata/')
+
+        assert vault_stand_in.requests == [('GET', 'kv/app'), ('LIST', 'secret/metadata')]
+
+    def test_lookup_with_retries(self, vault_stand_in):
+        vault_stand_in.add_approle('role', 'secret')
+        vault_stand_in.put_secret('secret', 'app/db', {'password': 'p'})
+        vault_stand_in.fail(503, count=2, path='secret/')
+
+        lookup = lookup_loader.get('community.hashi_vault.vault_kv2_get')
+        result = lookup.run(
+            ['app/db'], url=vault_stand_in.url, auth_method='approle', role_id='role', secret_id='secret',
+            retries={'total': 3, 'backoff_factor': 0, 'status_forcelist': [503]},
+        )
+
+        assert result[0]['secret'] == {'password': 'p'}
+        assert [r for r in vault_stand_in.requests if r[1] != 'auth/approle/login'] == [('GET', 'secret/data/app/db')] * 3
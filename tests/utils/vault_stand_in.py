@@ -0,0 +1,637 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+'''
+A lightweight stand-in for a Vault server, for tests and benchmarks that can't use a real Vault.
+
+It implements just enough of the Vault HTTP API for the collection's plugins and modules, with state kept in memory:
+
+- KV version 1 and 2 secrets engines: read, write, list, and delete (and for version 2, metadata, subkeys, and deleting,
+  undeleting, and destroying versions)
+- token, approle, and userpass auth methods: login, and token lookup-self
+- sys/health
+- database secrets engine static credentials
+
+Faults can be injected: a delay before each response, a share of responses that are 500 errors or 429 rate limits,
+and a sealed state in which every request gets a 503.
+
+It only uses the Python standard library, so it can also be run on its own:
+
+    python tests/utils/vault_stand_in.py --port 8200 --latency 0.005 --error-rate 0.01
+
+With no options it listens on 127.0.0.1:8200, with the root token "root", a KV version 2 engine at secret/,
+a KV version 1 engine at kv/, a database engine at database/, and the auth methods at auth/approle/ and auth/userpass/.
+'''
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import argparse
+import json
+import random
+import threading
+import time
+import uuid
+
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+def _now(offset=0):
+    return (datetime.now(timezone.utc) + timedelta(seconds=offset)).strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+
+
+def _deleted(version):
+    # like Vault, a deletion_time in the future (from delete_version_after) doesn't make a version deleted yet
+    return version['destroyed'] or (version['deletion_time'] and version['deletion_time'] <= _now())
+
+
+def _subkeys(data, depth=0, level=1):
+    if not isinstance(data, dict):
+        return None
+    if depth and level > depth:
+        return None
+    return dict((key, _subkeys(value, depth, level + 1)) for key, value in data.items())
+
+
+class VaultStandInError(Exception):
+    '''an error response, with its status and errors'''
+    def __init__(self, status, *errors, **kwargs):
+        super(VaultStandInError, self).__init__(status, errors)
+        self.status = status
+        self.errors = list(errors)
+        self.data = kwargs.get('data')
+        self.headers = kwargs.get('headers') or {}
+
+
+class _KV1():
+    def __init__(self):
+        self.secrets = {}
+
+    def handle(self, stand_in, method, path, body, query):
+        if method == 'LIST':
+            return stand_in.list_keys(self.secrets, path)
+
+        if method == 'GET':
+            if path not in self.secrets:
+                raise VaultStandInError(404)
+            return dict(data=self.secrets[path])
+
+        if method in ('POST', 'PUT'):
+            self.secrets[path] = body
+            return None
+
+        if method == 'DELETE':
+            self.secrets.pop(path, None)
+            return None
+
+        raise VaultStandInError(405)
+
+
+class _KV2():
+    def __init__(self, max_versions=0, delete_version_after=0):
+        self.max_versions = max_versions
+        self.delete_version_after = delete_version_after
+        self.secrets = {}
+
+    @staticmethod
+    def _version_metadata(version):
+        return dict((key, version[key]) for key in ('created_time', 'deletion_time', 'destroyed'))
+
+    def _metadata(self, secret, number):
+        return dict(self._version_metadata(secret['versions'][number]), custom_metadata=secret['custom_metadata'], version=number)
+
+    def _get_version(self, path, query):
+        secret = self.secrets.get(path)
+        if secret is None:
+            raise VaultStandInError(404)
+
+        number = int(query.get('version') or 0) or secret['current_version']
+        if number not in secret['versions']:
+            raise VaultStandInError(404)
+
+        return secret, number
+
+    def handle(self, stand_in, method, path, body, query):
+        kind, sep, path = path.partition('/')
+        if not sep and kind != 'metadata':
+            raise VaultStandInError(404)
+
+        if kind == 'data':
+            return self._data(method, path, body, query)
+        if kind == 'metadata':
+            return self._metadata_endpoint(stand_in, method, path, body)
+        if kind == 'subkeys' and method == 'GET':
+            secret, number = self._get_version(path, query)
+            version = secret['versions'][number]
+            if version['data'] is None:
+                raise VaultStandInError(404)
+            return dict(data=dict(subkeys=_subkeys(version['data'], int(query.get('depth') or 0)), metadata=self._metadata(secret, number)))
+        if kind in ('delete', 'undelete', 'destroy') and method in ('POST', 'PUT'):
+            return self._versions(kind, path, body)
+
+        raise VaultStandInError(404)
+
+    def _data(self, method, path, body, query):
+        if method == 'GET':
+            secret, number = self._get_version(path, query)
+            version = secret['versions'][number]
+            if _deleted(version):
+                # like Vault, the metadata of a deleted version comes with the 404
+                raise VaultStandInError(404, data=dict(errors=[], data=dict(data=None, metadata=self._metadata(secret, number))))
+            return dict(data=dict(data=version['data'], metadata=self._metadata(secret, number)))
+
+        if method in ('POST', 'PUT'):
+            secret = self.secrets.setdefault(path, dict(
+                versions={}, current_version=0, oldest_version=0, created_time=_now(), updated_time=None, custom_metadata=None,
+            ))
+
+            cas = (body.get('options') or {}).get('cas')
+            if cas is not None and int(cas) != secret['current_version']:
+                raise VaultStandInError(400, 'check-and-set parameter did not match the current version')
+
+            number = secret['current_version'] + 1
+            deletion_time = _now(self.delete_version_after) if self.delete_version_after else ''
+            secret['versions'][number] = dict(data=body.get('data') or {}, created_time=_now(), deletion_time=deletion_time, destroyed=False)
+            secret['current_version'] = number
+            secret['updated_time'] = secret['versions'][number]['created_time']
+            if not secret['oldest_version']:
+                secret['oldest_version'] = number
+
+            if self.max_versions:
+                for old in sorted(secret['versions'])[:-self.max_versions]:
+                    del secret['versions'][old]
+                secret['oldest_version'] = min(secret['versions'])
+
+            return dict(data=self._metadata(secret, number))
+
+        if method == 'DELETE':
+            secret = self.secrets.get(path)
+            if secret is not None:
+                secret['versions'][secret['current_version']]['deletion_time'] = _now()
+            return None
+
+        raise VaultStandInError(405)
+
+    def _metadata_endpoint(self, stand_in, method, path, body):
+        if method == 'LIST':
+            return stand_in.list_keys(self.secrets, path)
+
+        if method == 'GET':
+            secret = self.secrets.get(path)
+            if secret is None:
+                raise VaultStandInError(404)
+            versions = dict((str(number), self._version_metadata(version)) for number, version in secret['versions'].items())
+            return dict(data=dict(
+                cas_required=False,
+                created_time=secret['created_time'],
+                current_version=secret['current_version'],
+                custom_metadata=secret['custom_metadata'],
+                delete_version_after='%ds' % self.delete_version_after,
+                max_versions=self.max_versions,
+                oldest_version=secret['oldest_version'],
+                updated_time=secret['updated_time'],
+                versions=versions,
+            ))
+
+        if method in ('POST', 'PUT'):
+            secret = self.secrets.get(path)
+            if secret is not None and 'custom_metadata' in body:
+                secret['custom_metadata'] = body['custom_metadata']
+            return None
+
+        if method == 'DELETE':
+            self.secrets.pop(path, None)
+            return None
+
+        raise VaultStandInError(405)
+
+    def _versions(self, kind, path, body):
+        secret = self.secrets.get(path)
+        if secret is None:
+            return None
+
+        for number in body.get('versions') or []:
+            version = secret['versions'].get(int(number))
+            if version is None:
+                continue
+            if kind == 'delete':
+                version['deletion_time'] = version['deletion_time'] if _deleted(version) else _now()
+            elif kind == 'undelete' and not version['destroyed']:
+                version['deletion_time'] = ''
+            elif kind == 'destroy':
+                version['destroyed'] = True
+                version['data'] = None
+
+        return None
+
+
+class _Database():
+    def __init__(self):
+        self.static_roles = {}
+
+    def handle(self, stand_in, method, path, body, query):
+        kind, sep, name = path.partition('/')
+
+        if kind == 'static-creds' and method == 'GET':
+            role = self.static_roles.get(name)
+            if role is None:
+                raise VaultStandInError(400, 'unknown role: %s' % name)
+            return dict(data=dict(
+                username=role['username'],
+                password=role['password'],
+                last_vault_rotation=role['last_vault_rotation'],
+                rotation_period=role['rotation_period'],
+                ttl=role['rotation_period'],
+            ))
+
+        if kind == 'static-roles' and method == 'LIST':
+            return stand_in.list_keys(self.static_roles, '')
+
+        raise VaultStandInError(404)
+
+
+class VaultStandIn():
+    '''
+    A stand-in Vault server, running in a thread.
+
+    :param latency: seconds to wait before each response, or a (min, max) tuple to wait a random time between them
+    :param error_rate: the share (from 0 to 1) of requests that get a 500 response
+    :param rate_limit_rate: the share (from 0 to 1) of requests that get a 429 response, with a Retry-After header of retry_after
+    :param sealed: whether the server is sealed, so that every request gets a 503 response; it can be changed while the server runs
+    :param role: the role the server reports from sys/health: active, standby, or performance_standby
+    :param seed: a seed for the random choices of latency and faults, to make them repeatable
+
+    Faults aren't injected into sys/health, which reports the state of the server instead.
+    fail() forces the responses to the next requests, whatever the rates are.
+    '''
+
+    ROOT_TOKEN = 'root'
+
+    HEALTH_STATUSES = {
+        'active': 200,
+        'standby': 429,
+        'performance_standby': 473,
+    }
+
+    def __init__(
+        self, host='127.0.0.1', port=0, latency=0, error_rate=0, rate_limit_rate=0, retry_after=0,
+        sealed=False, role='active', seed=None, root_token=ROOT_TOKEN,
+    ):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.sealed = sealed
+        self.role = role
+
+        self._random = random.Random(seed)
+        self._lock = threading.RLock()
+        self._forced = []
+        self._server = None
+        self._thread = None
+
+        # the method and path (without /v1/ or the query) of each request, in the order they were received
+        self.requests = []
+
+        self.root_token = root_token
+        self.tokens = {}
+        self.add_token(root_token, policies=['root'])
+
+        self.approle_roles = {}
+        self.userpass_users = {}
+
+        self.mounts = {}
+        self.enable_kv('secret', version=2)
+        self.enable_kv('kv', version=1)
+        self.mounts['database'] = _Database()
+
+    @property
+    def url(self):
+        return 'http://%s:%i' % (self.host, self.port)
+
+    def start(self):
+        '''starts the server in a thread, and returns its URL'''
+        self._server = ThreadingHTTPServer((self.host, self.port), _Handler)
+        self._server.daemon_threads = True
+        self._server.stand_in = self
+        self.port = self._server.server_address[1]
+
+        self._thread = threading.Thread(target=self._server.serve_forever, kwargs=dict(poll_interval=0.05), name='vault-stand-in')
+        self._thread.daemon = True
+        self._thread.start()
+
+        return self.url
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    # setup
+
+    def enable_kv(self, mount, version=2, max_versions=0, delete_version_after=0):
+        '''enables a KV secrets engine; delete_version_after is in seconds, with 0 (the default) never deleting versions'''
+        self.mounts[mount.strip('/')] = _KV2(max_versions, delete_version_after) if version == 2 else _KV1()
+
+    def add_token(self, token=None, policies=None, ttl=0):
+        '''adds a token that's accepted by the server, and returns it'''
+        token = token or 'hvs.' + uuid.uuid4().hex
+        with self._lock:
+            self.tokens[token] = dict(
+                accessor=uuid.uuid4().hex, policies=list(policies or ['default']), ttl=ttl, issue_time=_now(),
+            )
+        return token
+
+    def add_approle(self, role_id, secret_id, policies=None):
+        self.approle_roles[role_id] = dict(secret_id=secret_id, policies=policies or ['default'])
+
+    def add_userpass(self, username, password, policies=None):
+        self.userpass_users[username] = dict(password=password, policies=policies or ['default'])
+
+    def add_static_role(self, name, username, password, rotation_period=86400, mount='database'):
+        self.mounts[mount].static_roles[name] = dict(
+            username=username, password=password, rotation_period=rotation_period, last_vault_rotation=_now(),
+        )
+
+    def put_secret(self, mount, path, data):
+        '''writes a secret to a KV mount, as a client would'''
+        engine = self.mounts[mount]
+        with self._lock:
+            if isinstance(engine, _KV2):
+                return engine.handle(self, 'POST', 'data/' + path, dict(data=data), {})
+            return engine.handle(self, 'POST', path, data, {})
+
+    # faults
+
+    def fail(self, status, count=1, retry_after=None, path=None):
+        '''
+        makes the next count requests (other than to sys/health) get a response with status
+
+        If path is given, only requests to paths that start with it (below /v1/) are failed.
+        '''
+        with self._lock:
+            self._forced.extend([(status, retry_after, path)] * count)
+
+    def _get_fault(self, path):
+        with self._lock:
+            for i, (status, retry_after, prefix) in enumerate(self._forced):
+                if prefix is None or path.startswith(prefix.strip('/')):
+                    del self._forced[i]
+                    return status, retry_after
+
+            if self.sealed:
+                return 503, None
+
+            roll = self._random.random()
+            if roll < self.error_rate:
+                return 500, None
+            if roll < self.error_rate + self.rate_limit_rate:
+                return 429, self.retry_after
+
+        return None
+
+    def _get_latency(self):
+        if isinstance(self.latency, (tuple, list)):
+            with self._lock:
+                return self._random.uniform(*self.latency)
+        return self.latency
+
+    # requests
+
+    @staticmethod
+    def list_keys(items, prefix):
+        '''returns the response to a LIST of the names in items below prefix, like those of a KV engine'''
+        prefix = prefix.strip('/')
+        if prefix:
+            prefix += '/'
+
+        keys = set()
+        for name in items:
+            if name.startswith(prefix):
+                rest = name[len(prefix):]
+                head, sep, tail = rest.partition('/')
+                keys.add(head + sep)
+
+        if not keys:
+            raise VaultStandInError(404)
+
+        return dict(data=dict(keys=sorted(keys)))
+
+    def _login(self, policies, metadata=None):
+        token = self.add_token(policies=policies, ttl=3600)
+        info = self.tokens[token]
+        return dict(auth=dict(
+            client_token=token,
+            accessor=info['accessor'],
+            policies=info['policies'],
+            token_policies=info['policies'],
+            metadata=metadata,
+            lease_duration=3600,
+            renewable=True,
+            entity_id='',
+            token_type='service',
+            orphan=True,
+        ))
+
+    def _lookup_self(self, token):
+        info = self.tokens[token]
+        return dict(data=dict(
+            accessor=info['accessor'],
+            id=token,
+            issue_time=info['issue_time'],
+            policies=info['policies'],
+            ttl=info['ttl'],
+            renewable=bool(info['ttl']),
+            type='service',
+        ))
+
+    def _auth(self, method, path, body, token):
+        mount, sep, rest = path.partition('/')
+
+        if mount == 'token' and rest == 'lookup-self' and method in ('GET', 'POST'):
+            if token not in self.tokens:
+                raise VaultStandInError(403, 'permission denied')
+            return self._lookup_self(token)
+
+        if mount == 'approle' and rest == 'login' and method in ('POST', 'PUT'):
+            role = self.approle_roles.get(body.get('role_id'))
+            if role is None or role['secret_id'] != body.get('secret_id'):
+                raise VaultStandInError(400, 'invalid role or secret ID')
+            return self._login(role['policies'], dict(role_name=body.get('role_id')))
+
+        if mount == 'userpass' and rest.startswith('login/') and method in ('POST', 'PUT'):
+            username = rest[len('login/'):]
+            user = self.userpass_users.get(username)
+            if user is None or user['password'] != body.get('password'):
+                raise VaultStandInError(400, 'invalid username or password')
+            return self._login(user['policies'], dict(username=username))
+
+        raise VaultStandInError(404)
+
+    def health(self):
+        '''returns the status and body of a sys/health response'''
+        body = dict(
+            initialized=True,
+            sealed=self.sealed,
+            standby=self.role != 'active',
+            performance_standby=self.role == 'performance_standby',
+            replication_performance_mode='disabled',
+            replication_dr_mode='disabled',
+            server_time_utc=int(time.time()),
+            version='1.15.0+stand-in',
+            cluster_name='vault-stand-in',
+        )
+        return (503 if self.sealed else self.HEALTH_STATUSES[self.role]), body
+
+    def handle(self, method, path, body, query, token):
+        '''returns the status, response data, and headers of a request to the path below /v1/'''
+        with self._lock:
+            self.requests.append((method, path))
+
+        if path == 'sys/health':
+            status, data = self.health()
+            return status, data, {}
+
+        fault = self._get_fault(path)
+
+        latency = self._get_latency()
+        if latency > 0:
+            time.sleep(latency)
+
+        if fault is not None:
+            status, retry_after = fault
+            headers = {} if retry_after is None else {'Retry-After': str(retry_after)}
+            errors = {503: ['Vault is sealed'], 429: ['rate limit quota exceeded']}.get(status, ['internal error'])
+            return status, dict(errors=errors), headers
+
+        try:
+            if path.startswith('auth/'):
+                data = self._auth(method, path[len('auth/'):], body, token)
+            else:
+                if token not in self.tokens:
+                    raise VaultStandInError(403, 'permission denied')
+
+                mount, sep, rest = path.partition('/')
+                engine = self.mounts.get(mount)
+                if engine is None:
+                    raise VaultStandInError(404, 'no handler for route "%s"' % path)
+
+                with self._lock:
+                    data = engine.handle(self, method, rest, body, query)
+        except VaultStandInError as e:
+            return e.status, (e.data if e.data is not None else dict(errors=e.errors)), e.headers
+
+        if data is None:
+            return 204, None, {}
+
+        response = dict(request_id=str(uuid.uuid4()), lease_id='', renewable=False, lease_duration=0, wrap_info=None, warnings=None, auth=None)
+        response.update(data)
+        return 200, response, {}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    server_version = 'VaultStandIn'
+
+    # headers and bodies are written separately, so without this, keep-alive connections would wait on delayed ACKs
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def _handle(self):
+        url = urlsplit(self.path)
+        query = dict((key, values[-1]) for key, values in parse_qs(url.query).items())
+
+        length = int(self.headers.get('Content-Length') or 0)
+        raw = self.rfile.read(length) if length else b''
+        try:
+            body = json.loads(raw) if raw else {}
+        except ValueError:
+            body = {}
+
+        method = self.command
+        if method == 'GET' and query.get('list', '').lower() == 'true':
+            method = 'LIST'
+
+        path = url.path
+        if not path.startswith('/v1/'):
+            status, data, headers = 404, dict(errors=[]), {}
+        else:
+            status, data, headers = self.server.stand_in.handle(
+                'GET' if method == 'HEAD' else method, path[len('/v1/'):].strip('/'), body, query, self.headers.get('X-Vault-Token'),
+            )
+
+        payload = b'' if data is None or method == 'HEAD' else json.dumps(data).encode('utf-8')
+
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        if data is not None:
+            self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_HEAD = do_POST = do_PUT = do_DELETE = do_LIST = _handle
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Runs a stand-in Vault server.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8200)
+    parser.add_argument('--root-token', default=VaultStandIn.ROOT_TOKEN)
+    parser.add_argument('--latency', type=float, nargs='+', default=[0], metavar='SECONDS', help='a delay, or the min and max of a random delay')
+    parser.add_argument('--error-rate', type=float, default=0)
+    parser.add_argument('--rate-limit-rate', type=float, default=0)
+    parser.add_argument('--retry-after', type=int, default=0)
+    parser.add_argument('--sealed', action='store_true')
+    parser.add_argument('--role', choices=sorted(VaultStandIn.HEALTH_STATUSES), default='active')
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('--approle', action='append', default=[], metavar='ROLE_ID:SECRET_ID')
+    parser.add_argument('--userpass', action='append', default=[], metavar='USERNAME:PASSWORD')
+    parser.add_argument('--secret', action='append', default=[], metavar='MOUNT/PATH=JSON', help='a secret to write at startup')
+    args = parser.parse_args()
+
+    stand_in = VaultStandIn(
+        host=args.host, port=args.port, root_token=args.root_token,
+        latency=args.latency[0] if len(args.latency) == 1 else tuple(args.latency[:2]),
+        error_rate=args.error_rate, rate_limit_rate=args.rate_limit_rate, retry_after=args.retry_after,
+        sealed=args.sealed, role=args.role, seed=args.seed,
+    )
+
+    for pair in args.approle:
+        stand_in.add_approle(*pair.split(':', 1))
+    for pair in args.userpass:
+        stand_in.add_userpass(*pair.split(':', 1))
+    for secret in args.secret:
+        path, value = secret.split('=', 1)
+        mount, path = path.split('/', 1)
+        stand_in.put_secret(mount, path, json.loads(value))
+
+    print('Vault stand-in listening on %s' % stand_in.start())
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        stand_in.stop()
+
+
+if __name__ == '__main__':
+    main()